@@ -0,0 +1,118 @@
+"""convert_face_embedding_to_binary
+
+Revision ID: 5c1f7e9a2b34
+Revises: acc4b22be154
+Create Date: 2026-10-16 09:00:00.000000
+
+Converts personal_info.face_embedding from JSON (a list of floats or a base64
+string of JSON) to the compact binary format of app.utilities.embedding_codec.
+Existing rows are converted in keyset-ordered batches. If any row cannot be
+converted the migration fails before dropping the old column, and since
+PostgreSQL DDL is transactional the table is left unchanged.
+"""
+from alembic import op
+import sqlalchemy as sa
+import base64
+import json
+import logging
+
+from app.utilities import embedding_codec
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1f7e9a2b34'
+down_revision = 'acc4b22be154'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _decode_legacy(value):
+    """Decode a legacy JSON embedding (list or base64 string of JSON)."""
+    if isinstance(value, str):
+        # Raw JSON text, as returned by drivers without a JSON codec
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+    if isinstance(value, str):
+        value = json.loads(base64.b64decode(value.encode()).decode())
+    return value
+
+
+def _convert(source_column: str, target_column: str, convert) -> None:
+    """
+    Copy every non-null embedding from one column to another in batches.
+    
+    Raises:
+        RuntimeError: If any embedding cannot be converted, after every row has
+        been tried, so the caller does not drop the source column
+    """
+    conn = op.get_bind()
+    select_batch = sa.text(
+        f"SELECT candidate_id, {source_column} AS embedding, face_embedding_model "
+        f"FROM personal_info "
+        f"WHERE {source_column} IS NOT NULL AND candidate_id > :last_id "
+        f"ORDER BY candidate_id LIMIT :limit"
+    )
+    update_row = sa.text(
+        f"UPDATE personal_info SET {target_column} = :embedding WHERE candidate_id = :candidate_id"
+    )
+    
+    last_id = ""
+    failed = []
+    while True:
+        rows = conn.execute(select_batch, {"last_id": last_id, "limit": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            try:
+                updates.append({
+                    "candidate_id": row.candidate_id,
+                    "embedding": convert(row.embedding, row.face_embedding_model or "")
+                })
+            except Exception as e:
+                logger.error(f"Cannot convert face embedding of candidate {row.candidate_id}: {e}")
+                failed.append(row.candidate_id)
+        if updates:
+            conn.execute(update_row, updates)
+        last_id = rows[-1].candidate_id
+    
+    if failed:
+        raise RuntimeError(
+            f"{len(failed)} face embeddings in {source_column} could not be converted "
+            f"(candidates {', '.join(failed[:20])}{', ...' if len(failed) > 20 else ''}); "
+            f"fix or clear them and run the migration again"
+        )
+
+
+def upgrade() -> None:
+    """Apply the database changes in this migration"""
+    op.alter_column('personal_info', 'face_embedding', new_column_name='face_embedding_json')
+    op.add_column('personal_info', sa.Column('face_embedding', sa.LargeBinary(), nullable=True, comment='Vector đặc trưng khuôn mặt dạng nhị phân (header + float32/float16/int8)'))
+    
+    _convert(
+        'face_embedding_json',
+        'face_embedding',
+        lambda value, model: embedding_codec.encode_embedding(_decode_legacy(value), model=model)
+    )
+    
+    op.drop_column('personal_info', 'face_embedding_json')
+
+
+def downgrade() -> None:
+    """Revert the database changes in this migration"""
+    op.alter_column('personal_info', 'face_embedding', new_column_name='face_embedding_binary')
+    op.add_column('personal_info', sa.Column('face_embedding', sa.JSON(), nullable=True, comment='Vector đặc trưng khuôn mặt được mã hóa dưới dạng JSON'))
+    
+    _convert(
+        'face_embedding_binary',
+        'face_embedding',
+        lambda value, model: json.dumps(embedding_codec.decode_embedding(bytes(value))[0].tolist())
+    )
+    
+    op.drop_column('personal_info', 'face_embedding_binary')
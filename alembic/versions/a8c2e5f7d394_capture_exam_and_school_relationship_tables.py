@@ -0,0 +1,47 @@
+"""capture_exam_and_school_relationship_tables
+
+Revision ID: a8c2e5f7d394
+Revises: f3a6d1c8b592
+Create Date: 2026-10-17 09:00:00.000000
+
+Extends the incremental sync to the tables behind the INCLUDES_SUBJECT,
+HELD_AT and OFFERS_MAJOR relationships: exam_subject, exam_location_mapping
+and school_major. Adds the change-time indexes their change streams read by,
+and record_sync_relationship_deletion() triggers that store the owning exam or
+school when one of their rows is deleted.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c2e5f7d394'
+down_revision = 'f3a6d1c8b592'
+branch_labels = None
+depends_on = None
+
+# (relationship stream, table, primary key, SQL giving the owner ID of the deleted row $1)
+RELATIONSHIP_TABLES = [
+    ("exam.exam_subject", "exam_subject", "exam_subject_id", "SELECT ($1).exam_id"),
+    ("exam.exam_location_mapping", "exam_location_mapping", "mapping_id", "SELECT ($1).exam_id"),
+    ("school.school_major", "school_major", "school_major_id", "SELECT ($1).school_id"),
+]
+
+
+def upgrade() -> None:
+    """Apply the database changes in this migration"""
+    for stream, table, key_column, parent_query in RELATIONSHIP_TABLES:
+        op.execute(
+            f"CREATE INDEX ix_{table}_sync_changed_at ON {table} "
+            f"((COALESCE(updated_at, created_at)), {key_column})"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_sync_relationship_deletion AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION record_sync_relationship_deletion('{stream}', '{parent_query}')"
+        )
+
+
+def downgrade() -> None:
+    """Revert the database changes in this migration"""
+    for _, table, _, _ in RELATIONSHIP_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_relationship_deletion ON {table}")
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_sync_changed_at")
@@ -0,0 +1,109 @@
+"""add_incremental_sync_tables
+
+Revision ID: b7e3c2d94a61
+Revises: 5c1f7e9a2b34
+Create Date: 2026-10-16 12:00:00.000000
+
+Adds the state used by the incremental PostgreSQL to Neo4j sync:
+- sync_checkpoint, the durable per-stream progress of the sync
+- sync_deletion, filled by a DELETE trigger on every synchronized table
+- Expression indexes on COALESCE(updated_at, created_at) so that reading the
+  rows changed since a checkpoint does not scan whole tables
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3c2d94a61'
+down_revision = '5c1f7e9a2b34'
+branch_labels = None
+depends_on = None
+
+# (entity type, table, primary key) of every table synchronized as Neo4j nodes
+ENTITY_TABLES = [
+    ("subject", "subject", "subject_id"),
+    ("school", "school", "school_id"),
+    ("major", "major", "major_id"),
+    ("management_unit", "management_unit", "unit_id"),
+    ("exam_location", "exam_location", "location_id"),
+    ("exam_room", "exam_room", "room_id"),
+    ("exam", "exam", "exam_id"),
+    ("candidate", "candidate", "candidate_id"),
+    ("exam_schedule", "exam_schedule", "exam_schedule_id"),
+    ("score", "exam_score", "exam_score_id"),
+    ("score_review", "score_review", "score_review_id"),
+    ("achievement", "achievement", "achievement_id"),
+    ("award", "award", "award_id"),
+    ("certificate", "certificate", "certificate_id"),
+    ("credential", "candidate_credential", "credential_id"),
+    ("degree", "degree", "degree_id"),
+    ("recognition", "recognition", "recognition_id"),
+]
+
+# (table, primary key) of tables whose changes only re-sync candidate relationships
+DEPENDENT_TABLES = [
+    ("personal_info", "candidate_id"),
+    ("education_history", "education_history_id"),
+    ("candidate_exam", "candidate_exam_id"),
+    ("candidate_exam_subject", "candidate_exam_subject_id"),
+]
+
+
+def upgrade() -> None:
+    """Apply the database changes in this migration"""
+    op.create_table(
+        'sync_checkpoint',
+        sa.Column('stream', sa.String(length=100), nullable=False),
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_key', sa.String(length=60), nullable=True),
+        sa.Column('last_deletion_id', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('stream')
+    )
+    op.create_table(
+        'sync_deletion',
+        sa.Column('deletion_id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('entity_type', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', sa.String(length=60), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('deletion_id')
+    )
+    op.create_index('ix_sync_deletion_entity_type_deletion_id', 'sync_deletion', ['entity_type', 'deletion_id'])
+    
+    # Trigger arguments: entity type, primary key column
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_sync_deletion() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO sync_deletion (entity_type, entity_id)
+            VALUES (TG_ARGV[0], to_jsonb(OLD) ->> TG_ARGV[1]);
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    
+    for entity_type, table, key_column in ENTITY_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_sync_deletion AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION record_sync_deletion('{entity_type}', '{key_column}')"
+        )
+    
+    for table, key_column in [(table, key_column) for _, table, key_column in ENTITY_TABLES] + DEPENDENT_TABLES:
+        op.execute(
+            f"CREATE INDEX ix_{table}_sync_changed_at ON {table} "
+            f"((COALESCE(updated_at, created_at)), {key_column})"
+        )
+
+
+def downgrade() -> None:
+    """Revert the database changes in this migration"""
+    for table, _ in [(table, key_column) for _, table, key_column in ENTITY_TABLES] + DEPENDENT_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_sync_changed_at")
+    
+    for _, table, _ in ENTITY_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_deletion ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_sync_deletion()")
+    
+    op.drop_index('ix_sync_deletion_entity_type_deletion_id', table_name='sync_deletion')
+    op.drop_table('sync_deletion')
+    op.drop_table('sync_checkpoint')
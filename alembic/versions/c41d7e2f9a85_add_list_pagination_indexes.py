@@ -0,0 +1,32 @@
+"""add_list_pagination_indexes
+
+Revision ID: c41d7e2f9a85
+Revises: b7e3c2d94a61
+Create Date: 2026-10-16 14:00:00.000000
+
+Adds the index used by keyset pagination of the score review list, which is
+ordered by (created_at, score_review_id) newest first. The other paginated
+lists are ordered by their primary key and need no extra index.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d7e2f9a85'
+down_revision = 'b7e3c2d94a61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the database changes in this migration"""
+    op.create_index(
+        'ix_score_review_created_at_score_review_id',
+        'score_review',
+        ['created_at', 'score_review_id']
+    )
+
+
+def downgrade() -> None:
+    """Revert the database changes in this migration"""
+    op.drop_index('ix_score_review_created_at_score_review_id', table_name='score_review')
@@ -0,0 +1,83 @@
+"""add_candidate_search_keys
+
+Revision ID: d5a8f3b1c720
+Revises: c41d7e2f9a85
+Create Date: 2026-10-16 16:00:00.000000
+
+Adds accent-insensitive search keys to candidates:
+- search_name, the unaccented, lowercased, whitespace-collapsed full name,
+  indexed with text_pattern_ops for prefix (LIKE 'key%') matches
+- search_tokens, the name parts, GIN-indexed for containment matches
+Existing rows are backfilled in batches. Their updated_at is bumped so the
+next incremental sync writes the keys to the Candidate nodes as well.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utilities.search_text import name_tokens, search_key
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a8f3b1c720'
+down_revision = 'c41d7e2f9a85'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Apply the database changes in this migration"""
+    op.add_column('candidate', sa.Column('search_name', sa.String(length=100), nullable=True,
+                                         comment='Họ tên đã bỏ dấu, viết thường và chuẩn hóa khoảng trắng'))
+    op.add_column('candidate', sa.Column('search_tokens', postgresql.ARRAY(sa.String()), nullable=True,
+                                         comment='Các phần của họ tên đã bỏ dấu và viết thường'))
+    
+    # Folding is done in Python so the keys match the ones the application writes
+    connection = op.get_bind()
+    last_id = ''
+    while True:
+        rows = connection.execute(
+            sa.text("""
+                SELECT candidate_id, full_name FROM candidate
+                WHERE candidate_id > :last_id
+                ORDER BY candidate_id
+                LIMIT :limit
+            """),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+        connection.execute(
+            sa.text("""
+                UPDATE candidate
+                SET search_name = :search_name, search_tokens = :search_tokens, updated_at = now()
+                WHERE candidate_id = :candidate_id
+            """).bindparams(sa.bindparam('search_tokens', type_=postgresql.ARRAY(sa.String()))),
+            [
+                {
+                    "candidate_id": candidate_id,
+                    "search_name": search_key(full_name),
+                    "search_tokens": name_tokens(full_name)
+                }
+                for candidate_id, full_name in rows
+            ]
+        )
+        last_id = rows[-1][0]
+    
+    op.create_index(
+        'ix_candidate_search_name',
+        'candidate',
+        ['search_name'],
+        postgresql_ops={'search_name': 'text_pattern_ops'}
+    )
+    op.create_index('ix_candidate_search_tokens', 'candidate', ['search_tokens'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Revert the database changes in this migration"""
+    op.drop_index('ix_candidate_search_tokens', table_name='candidate')
+    op.drop_index('ix_candidate_search_name', table_name='candidate')
+    op.drop_column('candidate', 'search_tokens')
+    op.drop_column('candidate', 'search_name')
@@ -0,0 +1,46 @@
+"""make_score_review_created_at_not_null
+
+Revision ID: d5b8f1a3c627
+Revises: a8c2e5f7d394
+Create Date: 2026-10-17 11:00:00.000000
+
+The score review list pages on (created_at, score_review_id) newest first. A
+NULL created_at fails the keyset comparison, so rows without one were never
+reached past the first page. Backfills the missing values, from the last
+update or the request date where known, and makes the column NOT NULL.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b8f1a3c627'
+down_revision = 'a8c2e5f7d394'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the database changes in this migration"""
+    op.execute(
+        "UPDATE score_review SET created_at = COALESCE(updated_at, request_date::timestamptz, now()) "
+        "WHERE created_at IS NULL"
+    )
+    op.alter_column(
+        'score_review',
+        'created_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_server_default=sa.text('now()'),
+        nullable=False
+    )
+
+
+def downgrade() -> None:
+    """Revert the database changes in this migration"""
+    op.alter_column(
+        'score_review',
+        'created_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_server_default=sa.text('now()'),
+        nullable=True
+    )
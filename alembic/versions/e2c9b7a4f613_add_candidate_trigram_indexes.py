@@ -0,0 +1,46 @@
+"""add_candidate_trigram_indexes
+
+Revision ID: e2c9b7a4f613
+Revises: d5a8f3b1c720
+Create Date: 2026-10-16 17:00:00.000000
+
+Enables pg_trgm and adds GIN trigram indexes for the similarity mode of
+candidate search. The indexes cover the normalized name (search_name), the
+candidate ID and the ID number, so that substring (LIKE '%term%') and fuzzy
+(word similarity) matches do not scan the tables.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c9b7a4f613'
+down_revision = 'd5a8f3b1c720'
+branch_labels = None
+depends_on = None
+
+# (index, table, column)
+TRIGRAM_INDEXES = [
+    ("ix_candidate_search_name_trgm", "candidate", "search_name"),
+    ("ix_candidate_candidate_id_trgm", "candidate", "candidate_id"),
+    ("ix_personal_info_id_number_trgm", "personal_info", "id_number"),
+]
+
+
+def upgrade() -> None:
+    """Apply the database changes in this migration"""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table,
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Revert the database changes in this migration"""
+    for index_name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name=table)
+    # The extension is left installed; other objects may depend on it
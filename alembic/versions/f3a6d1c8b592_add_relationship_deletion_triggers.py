@@ -0,0 +1,68 @@
+"""add_relationship_deletion_triggers
+
+Revision ID: f3a6d1c8b592
+Revises: e2c9b7a4f613
+Create Date: 2026-10-16 21:00:00.000000
+
+Records deletions of rows that only back candidate relationships, so the
+incremental sync can drop the edges they produced. Deleting an exam
+registration, an education history, a registered subject or a degree stores
+the candidate's ID in sync_deletion under a relationship stream name such as
+"candidate.candidate_exam"; the sync then deletes that candidate's edges of
+the affected types and merges them again from the current rows.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a6d1c8b592'
+down_revision = 'e2c9b7a4f613'
+branch_labels = None
+depends_on = None
+
+# (relationship stream, table, SQL giving the candidate ID of the deleted row $1)
+RELATIONSHIP_TABLES = [
+    ("candidate.education_history", "education_history", "SELECT ($1).candidate_id"),
+    ("candidate.candidate_exam", "candidate_exam", "SELECT ($1).candidate_id"),
+    (
+        "candidate.candidate_exam_subject", "candidate_exam_subject",
+        "SELECT candidate_id FROM candidate_exam WHERE candidate_exam_id = ($1).candidate_exam_id"
+    ),
+    (
+        "candidate.degree", "degree",
+        "SELECT candidate_id FROM education_history WHERE education_history_id = ($1).education_history_id"
+    ),
+]
+
+
+def upgrade() -> None:
+    """Apply the database changes in this migration"""
+    # Trigger arguments: relationship stream, candidate ID query. The parent row
+    # may already be gone when a delete cascades; nothing is recorded then, and
+    # the parent's own trigger covers the candidate
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_sync_relationship_deletion() RETURNS trigger AS $$
+        DECLARE
+            parent_id text;
+        BEGIN
+            EXECUTE TG_ARGV[1] INTO parent_id USING OLD;
+            IF parent_id IS NOT NULL THEN
+                INSERT INTO sync_deletion (entity_type, entity_id) VALUES (TG_ARGV[0], parent_id);
+            END IF;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for stream, table, parent_query in RELATIONSHIP_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_sync_relationship_deletion AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION record_sync_relationship_deletion('{stream}', '{parent_query}')"
+        )
+
+
+def downgrade() -> None:
+    """Revert the database changes in this migration"""
+    for _, table, _ in RELATIONSHIP_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_relationship_deletion ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_sync_relationship_deletion()")
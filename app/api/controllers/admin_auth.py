@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import jwt
+import uuid
 import passlib.hash
 from sqlalchemy import select, and_
 import pytz
@@ -46,7 +47,8 @@ def create_jwt_token(data: AdminTokenData, expires_delta: Optional[timedelta] =
     else:
         expire = datetime.now(pytz.UTC) + timedelta(minutes=30)  # Default 30 minutes
     
-    to_encode.update({"exp": expire})
+    # The token ID keys the principal cache used by the authentication middleware
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     
     # Create JWT token
     encoded_jwt = jwt.encode(
@@ -6,8 +6,9 @@ exams, schools, and other administrative tasks. All endpoints in this router
 require admin authentication.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status, Path, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Path, UploadFile, File, Form
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict, Any
 import uuid
@@ -17,15 +18,21 @@ import logging
 import os
 import tempfile
 import asyncio
+import json
+import zipfile
 
 from app.infrastructure.database.connection import get_db
+from app.infrastructure.database.pagination import InvalidCursorError
 from app.infrastructure.ontology.neo4j_connection import get_neo4j
 from app.infrastructure.cache.redis_connection import get_redis
+from app.config import settings
 from app.repositories.candidate_repository import CandidateRepository
 from app.graph_repositories.candidate_graph_repository import CandidateGraphRepository
 from app.services.candidate_service import CandidateService
 from app.services.id_service import generate_model_id
 from app.services.sync.main_sync_service import MainSyncService, EntityType
+from app.services.sync.sync_job_manager import SyncJobConflict, sync_job_manager
+from app.services.graph_sync_queue import graph_sync_queue
 from app.services.import_excel import import_excel_data
 from app.api.dto.candidate import (
     CandidateCreate, 
@@ -40,9 +47,13 @@ from app.api.dto.dashboard import DashboardStats
 from app.api.controllers.admin_auth import admin_login, admin_register
 from app.domain.models.invitation import Invitation
 from app.services.dashboard_service import DashboardService
-from app.services.image_storage_service import ImageStorageService
+from app.services.image_storage_service import BatchUploadTooLarge, ImageStorageService
 from app.services.image_processing_service import ImageProcessingService
 from app.api.dependencies.image_processing import get_image_processor
+from app.infrastructure.face_index import face_index
+from app.infrastructure.face_index.ivf_index import IVFFaceIndex
+from app.infrastructure.face_model import inference_executor
+from app.services.face_index_service import face_index_rebuild_job, face_index_snapshot_writer
 
 logger = logging.getLogger(__name__)
 
@@ -177,26 +188,62 @@ async def create_candidate(
 
 @router.get("/candidates", response_model=List[CandidateResponse], summary="List Candidates")
 async def get_candidates(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     admin: dict = Depends(get_current_admin),
     candidate_service: CandidateService = Depends(get_candidate_service)
 ):
     """
     List candidates in the system.
     
-    This endpoint returns a list of candidates with pagination.
+    This endpoint returns a list of candidates ordered by ID, with pagination.
+    When another page may follow, its cursor is returned in the X-Next-Cursor
+    header; passing it as `cursor` reads deep pages without skipping rows.
     
     Args:
+        response: The outgoing response, for the cursor header
         skip: The number of candidates to skip
         limit: The number of candidates to return
+        cursor: Cursor from the previous page's X-Next-Cursor header, used instead of skip
         admin: The authenticated admin user (from dependency)
         candidate_service: The CandidateService instance (from dependency)
         
     Returns:
         list: List of candidates
     """
-    return await candidate_service.get_all_candidates(skip=skip, limit=limit)
+    try:
+        candidates, next_cursor = await candidate_service.get_candidates_page(skip=skip, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return candidates
+
+@router.get("/candidates/export", summary="Export Candidates")
+async def export_candidates(
+    admin: dict = Depends(get_current_admin),
+    candidate_service: CandidateService = Depends(get_candidate_service)
+):
+    """
+    Export all candidates with their personal information.
+    
+    Candidates are read from the database in chunks ordered by ID and streamed
+    back as they are read, so the export does not hold the whole table in memory.
+    
+    Args:
+        admin: The authenticated admin user (from dependency)
+        candidate_service: The CandidateService instance (from dependency)
+        
+    Returns:
+        StreamingResponse: Newline-delimited JSON, one candidate per line
+    """
+    async def stream_candidates():
+        async for candidates in candidate_service.stream_candidates(chunk_size=settings.SYNC_BATCH_SIZE):
+            yield "".join(json.dumps(candidate, default=str) + "\n" for candidate in candidates)
+    
+    return StreamingResponse(stream_candidates(), media_type="application/x-ndjson")
 
 @router.get("/candidates/{candidate_id}", response_model=CandidateDetailResponse, summary="Get Candidate Details")
 async def get_candidate(
@@ -374,119 +421,100 @@ async def list_invitations(
         for inv in invitations
     ]
 
-@router.post("/sync/neo4j", response_model=dict, summary="Synchronize Data to Neo4j")
+async def submit_sync_job(mode: str, limit: Optional[int], admin: dict, entity_type: Optional[str] = None) -> dict:
+    """
+    Submit a background sync job, translating an invalid request into HTTP 400
+    and a conflict into HTTP 409.
+    
+    Args:
+        mode: Sync mode
+        limit: Optional limit on the number of entities per type
+        admin: Admin user information
+        entity_type: Optional entity type to restrict a relationships job to
+        
+    Returns:
+        dict: The accepted job
+    """
+    try:
+        job = await sync_job_manager.submit(mode, limit=limit, submitted_by=admin.get("sub"), entity_type=entity_type)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except SyncJobConflict as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "active_job_id": e.active_job_id}
+        )
+    scope = f" for {entity_type}" if entity_type else ""
+    return {
+        "status": "accepted",
+        "message": f"{mode.capitalize()} synchronization job submitted{scope}",
+        "job_id": job["job_id"],
+        "job": job
+    }
+
+@router.post("/sync/neo4j", response_model=dict, status_code=status.HTTP_202_ACCEPTED, summary="Synchronize Data to Neo4j")
 async def synchronize_to_neo4j(
-    sync_mode: str = "full",  # Options: "full", "nodes", "relationships"
+    sync_mode: str = "full",  # Options: "full", "nodes", "relationships", "incremental", "drift", "repair"
     limit: Optional[int] = None,
-    db: AsyncSession = Depends(get_db),
-    neo4j = Depends(get_neo4j),
     admin: dict = Depends(get_current_admin)
 ):
     """
     Đồng bộ dữ liệu từ PostgreSQL sang Neo4j knowledge graph.
     
-    Endpoint này sẽ đồng bộ các node hoặc mối quan hệ tùy theo mode được chọn.
+    Endpoint này tạo một job chạy nền và trả về ngay job_id; theo dõi tiến độ qua
+    GET /sync/neo4j/jobs/{job_id}. Chỉ một job đồng bộ được chạy tại một thời điểm.
     
     Args:
         sync_mode: Chế độ đồng bộ hóa:
                   - "full": Đồng bộ cả nodes và relationships (mặc định)
                   - "nodes": Chỉ đồng bộ nodes
                   - "relationships": Chỉ đồng bộ relationships
+                  - "incremental": Chỉ đồng bộ các thay đổi (thêm, sửa, xóa) kể từ lần đồng bộ incremental trước
+                  - "drift": Chỉ báo cáo độ lệch giữa PostgreSQL và Neo4j, không ghi gì
+                  - "repair": Báo cáo độ lệch và đồng bộ lại đúng các bản ghi bị lệch
         
         limit: Giới hạn số lượng thực thể xử lý cho mỗi loại
     """
-    # Validate sync_mode
-    valid_modes = ["full", "nodes", "relationships"]
-    if sync_mode not in valid_modes:
-        return {
-            "status": "error",
-            "message": f"Invalid sync mode: {sync_mode}. Valid modes are: {', '.join(valid_modes)}"
-        }
-    
-    try:
-        sync_service = MainSyncService(session=db, driver=neo4j._driver)
-        results = {}
-        
-        # Handle different sync modes
-        if sync_mode == "full":
-            # First sync all nodes
-            node_results = await sync_service.sync_all_nodes(limit=limit)
-            
-            # Then sync all relationships
-            relationship_results = await sync_service.sync_all_relationships(limit=limit)
-            
-            # Combine results
-            results = {
-                "nodes": node_results,
-                "relationships": relationship_results
-            }
-            
-            message = "Full synchronization completed (nodes and relationships)"
-                
-        elif sync_mode == "nodes":
-            # Only synchronize nodes
-            results = await sync_service.sync_all_nodes(limit=limit)
-            message = "Node synchronization completed"
-                
-        elif sync_mode == "relationships":
-            # Only synchronize relationships
-            results = await sync_service.sync_all_relationships(limit=limit)
-            message = "Relationship synchronization completed"
-        
-        return {
-            "status": "success",
-            "message": message,
-            "results": results
-        }
-    except Exception as e:
-        logger.error(f"Error during Neo4j synchronization: {e}", exc_info=True)
-        return {
-            "status": "error",
-            "message": f"Error during synchronization: {str(e)}",
-            "results": {}
-        }
+    # An invalid sync_mode is rejected with 400 by submit_sync_job
+    return await submit_sync_job(sync_mode, limit, admin)
 
-@router.post("/sync/neo4j/nodes", response_model=dict, summary="Synchronize Only Nodes to Neo4j")
-async def synchronize_only_nodes(
-    limit: Optional[int] = None,
+@router.get("/sync/neo4j/incremental", response_model=dict, summary="Incremental Sync Checkpoints")
+async def get_incremental_sync_status(
     db: AsyncSession = Depends(get_db),
     neo4j = Depends(get_neo4j),
     admin: dict = Depends(get_current_admin)
+):
+    """
+    Lấy checkpoint của từng luồng thay đổi trong đồng bộ incremental,
+    cùng với trạng thái hàng đợi đồng bộ nền (write-behind) của worker này.
+    """
+    sync_service = MainSyncService(session=db, driver=neo4j._driver)
+    return {
+        "status": "success",
+        "checkpoints": await sync_service.incremental_sync_service.get_status(),
+        "write_behind": graph_sync_queue.stats()
+    }
+
+@router.post("/sync/neo4j/nodes", response_model=dict, status_code=status.HTTP_202_ACCEPTED, summary="Synchronize Only Nodes to Neo4j")
+async def synchronize_only_nodes(
+    limit: Optional[int] = None,
+    admin: dict = Depends(get_current_admin)
 ):
     """
     Đồng bộ chỉ các node từ PostgreSQL sang Neo4j, không đồng bộ quan hệ.
     
     Endpoint này là bước 1 trong quy trình đồng bộ 2 bước: đầu tiên tạo tất cả các node,
     sau đó mới tạo các mối quan hệ. Cách tiếp cận này giúp tránh lỗi tham chiếu
-    khi tạo mối quan hệ giữa các node chưa tồn tại.
+    khi tạo mối quan hệ giữa các node chưa tồn tại. Việc đồng bộ chạy nền dưới dạng job.
     
     Args:
         limit: Giới hạn số lượng thực thể xử lý cho mỗi loại
     """
-    try:
-        sync_service = MainSyncService(session=db, driver=neo4j._driver)
-        
-        # Synchronize all nodes
-        results = await sync_service.sync_all_nodes(limit=limit)
-        
-        return {
-            "status": "success",
-            "message": "Node synchronization completed",
-            "results": results
-        }
-    except Exception as e:
-        logger.error(f"Error during Neo4j node synchronization: {e}", exc_info=True)
-        return {
-            "status": "error",
-            "message": f"Error during node synchronization: {str(e)}",
-            "results": {}
-        }
+    return await submit_sync_job("nodes", limit, admin)
 
-@router.post("/sync/neo4j/relationships", response_model=dict, summary="Synchronize Only Relationships to Neo4j")
+@router.post("/sync/neo4j/relationships", response_model=dict, status_code=status.HTTP_202_ACCEPTED, summary="Synchronize Only Relationships to Neo4j")
 async def synchronize_only_relationships(
     limit: Optional[int] = None,
-    db: AsyncSession = Depends(get_db),
-    neo4j = Depends(get_neo4j),
     admin: dict = Depends(get_current_admin)
 ):
     """
@@ -494,35 +522,71 @@ async def synchronize_only_relationships(
     
     Endpoint này là bước 2 trong quy trình đồng bộ 2 bước. Nó giả định rằng
     tất cả các node đã được tạo trước đó và chỉ đồng bộ các mối quan hệ giữa chúng.
+    Việc đồng bộ chạy nền dưới dạng job.
     
     Args:
         limit: Giới hạn số lượng thực thể xử lý cho mỗi loại
     """
-    try:
-        sync_service = MainSyncService(session=db, driver=neo4j._driver)
-        
-        # Synchronize all relationships
-        results = await sync_service.sync_all_relationships(limit=limit)
-        
-        return {
-            "status": "success",
-            "message": "Relationship synchronization completed",
-            "results": results
-        }
-    except Exception as e:
-        logger.error(f"Error during Neo4j relationship synchronization: {e}", exc_info=True)
-        return {
-            "status": "error",
-            "message": f"Error during relationship synchronization: {str(e)}",
-            "results": {}
-        }
+    return await submit_sync_job("relationships", limit, admin)
+
+@router.post("/sync/neo4j/drift", response_model=dict, status_code=status.HTTP_202_ACCEPTED, summary="Check Neo4j Drift")
+async def check_neo4j_drift(
+    repair: bool = False,
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Kiểm tra độ lệch giữa PostgreSQL và Neo4j mà không cần đồng bộ toàn bộ.
+    
+    Mỗi bảng được chia thành các bucket theo ID; hai phía so sánh số lượng, checksum
+    của ID và thời điểm cập nhật của từng bucket, và chỉ các bucket bị lệch mới được
+    so sánh từng bản ghi. Kết quả (số bản ghi thiếu, thừa, cũ theo từng bucket) nằm
+    trong kết quả của job. Việc kiểm tra chạy nền dưới dạng job.
+    
+    Args:
+        repair: Nếu True, đồng bộ lại các bản ghi thiếu hoặc cũ và xóa các node thừa
+    """
+    return await submit_sync_job("repair" if repair else "drift", None, admin)
+
+@router.get("/sync/neo4j/jobs/active", response_model=dict, summary="Get Active Sync Job")
+async def get_active_sync_job(
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Lấy job đồng bộ đang chạy, nếu có.
+    """
+    return {"job": await sync_job_manager.get_active()}
 
-@router.post("/sync/neo4j/entity/{entity_type}/relationships", response_model=dict, summary="Synchronize Relationships for a Specific Entity Type")
+@router.get("/sync/neo4j/jobs/{job_id}", response_model=dict, summary="Get Sync Job Status")
+async def get_sync_job(
+    job_id: str = Path(..., description="Sync job ID"),
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Lấy trạng thái của một job đồng bộ: tiến độ theo từng loại entity,
+    tốc độ xử lý (rows/s), thời gian còn lại ước tính và kết quả khi hoàn thành.
+    """
+    job = await sync_job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Sync job {job_id} not found")
+    return job
+
+@router.post("/sync/neo4j/jobs/{job_id}/cancel", response_model=dict, status_code=status.HTTP_202_ACCEPTED, summary="Cancel Sync Job")
+async def cancel_sync_job(
+    job_id: str = Path(..., description="Sync job ID"),
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Hủy một job đồng bộ đang chạy. Dữ liệu đã ghi vào Neo4j được giữ lại.
+    """
+    job = await sync_job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Sync job {job_id} not found")
+    return job
+
+@router.post("/sync/neo4j/entity/{entity_type}/relationships", response_model=dict, status_code=status.HTTP_202_ACCEPTED, summary="Synchronize Relationships for a Specific Entity Type")
 async def synchronize_entity_relationships(
     entity_type: str = Path(..., description="Entity type (score, subject, candidate, etc.)"),
     limit: Optional[int] = None,
-    db: AsyncSession = Depends(get_db),
-    neo4j = Depends(get_neo4j),
     admin: dict = Depends(get_current_admin)
 ):
     """
@@ -530,45 +594,13 @@ async def synchronize_entity_relationships(
     
     Endpoint này cho phép đồng bộ mối quan hệ chỉ cho một loại entity được chỉ định,
     giúp kiểm tra và debug quá trình đồng bộ cho từng loại dữ liệu riêng biệt.
+    Việc đồng bộ chạy nền dưới dạng job và không chạy song song với job đồng bộ khác.
     
     Args:
         entity_type: Loại entity cần đồng bộ (score, subject, exam, candidate, etc.)
         limit: Giới hạn số lượng entity xử lý
     """
-    try:
-        # Kiểm tra entity_type là một giá trị hợp lệ
-        valid_entity_types = [
-            "subject", "score", "score_review", "exam", "candidate", 
-            "achievement", "award", "certificate", "credential", "degree", 
-            "exam_location", "exam_room", "exam_schedule", "major", 
-            "management_unit", "recognition", "school"
-        ]
-        
-        entity_type_lower = entity_type.lower()
-        if entity_type_lower not in valid_entity_types:
-            return {
-                "status": "error",
-                "message": f"Invalid entity type: {entity_type}. Valid types are: {', '.join(valid_entity_types)}"
-            }
-            
-        sync_service = MainSyncService(session=db, driver=neo4j._driver)
-        
-        # Synchronize relationships for the specific entity type
-        # EntityType là Literal nên chỉ cần truyền string
-        results = await sync_service.sync_all_relationships(entity_type=entity_type_lower, limit=limit)
-        
-        return {
-            "status": "success",
-            "message": f"Relationship synchronization completed for {entity_type}",
-            "results": results
-        }
-    except Exception as e:
-        logger.error(f"Error during entity relationship synchronization: {e}", exc_info=True)
-        return {
-            "status": "error",
-            "message": f"Error during relationship synchronization for {entity_type}: {str(e)}",
-            "results": {}
-        }
+    return await submit_sync_job("relationships", limit, admin, entity_type=entity_type.lower())
 
 @router.post("/import/excel", summary="Import data from Excel file")
 async def import_excel(
@@ -719,6 +751,166 @@ async def upload_candidate_image(
             detail=f"Error uploading image: {str(e)}"
     )
 
+@router.get("/face-index", summary="Face Index Status")
+async def get_face_index_status(
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Get the state of this worker's face search index.
+    
+    Args:
+        admin: Admin user information
+        
+    Returns:
+        dict: Index statistics, inference load and the outcome of the last background rebuild
+    """
+    return {
+        "index": face_index.stats(),
+        "inference": inference_executor.stats(),
+        "rebuild_job": {
+            "running": face_index_rebuild_job.is_running,
+            "interval_seconds": face_index_rebuild_job.interval_seconds,
+            "last_result": face_index_rebuild_job.last_result,
+            "last_error": face_index_rebuild_job.last_error
+        },
+        "snapshot_writer": {
+            "last_version": face_index_snapshot_writer.last_version,
+            "last_error": face_index_snapshot_writer.last_error
+        }
+    }
+
+@router.post("/face-index/rebuild", status_code=status.HTTP_202_ACCEPTED, summary="Rebuild Face Index")
+async def rebuild_face_index(
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Schedule an immediate background rebuild of the face search index.
+    
+    The index is reloaded from the database, retrained if approximate, and
+    published as a new on-disk snapshot version that the other workers map.
+    
+    Args:
+        admin: Admin user information
+        
+    Returns:
+        dict: Confirmation message
+    """
+    face_index_rebuild_job.trigger()
+    return {"message": "Face index rebuild scheduled"}
+
+@router.get("/face-index/recall", summary="Measure Face Index Recall")
+async def get_face_index_recall(
+    sample_size: int = 100,
+    top_k: int = 10,
+    nprobe: Optional[int] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Measure recall of approximate face search against exact brute-force search.
+    
+    Use this to tune FACE_INDEX_IVF_NPROBE: higher values raise recall and latency.
+    
+    Args:
+        sample_size: Number of query embeddings to sample
+        top_k: Number of neighbours compared per query
+        nprobe: Number of inverted lists to probe, defaults to the configured value
+        admin: Admin user information
+        
+    Returns:
+        dict: Mean recall@k and mean latency of exact and approximate search
+    """
+    if not isinstance(face_index, IVFFaceIndex):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Recall is only defined for the approximate (ivf) face index backend"
+        )
+    if not face_index.is_loaded:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Face index has not been loaded yet"
+        )
+    return await asyncio.to_thread(
+        face_index.evaluate_recall,
+        sample_size=sample_size,
+        top_k=top_k,
+        nprobe=nprobe
+    )
+
+@router.post("/candidates/images/batch", summary="Batch Upload Candidate Images")
+async def upload_candidate_images_batch(
+    images: List[UploadFile] = File(..., description="Image files, or zip archives of images, named by candidate ID"),
+    image_type: str = Form(..., description="Type of image (id_card, candidate_card, direct_face)"),
+    source: str = Form(..., description="Source of the image (upload, camera, etc.)"),
+    admin: dict = Depends(get_current_admin),
+    storage_service: ImageStorageService = Depends(get_image_storage_service)
+):
+    """
+    Upload images for many candidates in one request.
+    
+    Each file is named after its candidate, e.g. `C2025313786.jpg` or
+    `C2025313786_front.jpg`; zip archives of such files are expanded. Faces are
+    embedded in micro-batches and one JSON line per image is streamed back as
+    soon as it is stored, followed by a summary line.
+    
+    Args:
+        images: Image files or zip archives
+        image_type: Type of image (id_card, candidate_card, direct_face)
+        source: Source of the image (upload, camera, etc.)
+        admin: Admin user information
+        storage_service: Image storage service
+        
+    Returns:
+        StreamingResponse: Newline-delimited JSON results
+    """
+    valid_image_types = ["id_card", "candidate_card", "direct_face"]
+    if image_type not in valid_image_types:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid image type. Must be one of: {', '.join(valid_image_types)}"
+        )
+    
+    valid_sources = ["upload", "camera"]
+    if source not in valid_sources:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid source. Must be one of: {', '.join(valid_sources)}"
+        )
+    
+    try:
+        items = await storage_service.read_batch_uploads(images)
+    except zipfile.BadZipFile:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid zip archive"
+        )
+    except BatchUploadTooLarge as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No images found in the upload"
+        )
+    
+    async def stream_results():
+        succeeded = 0
+        async for result in storage_service.save_images_batch(items, image_type, source):
+            if result["status"] == "success":
+                succeeded += 1
+            yield json.dumps(result) + "\n"
+        yield json.dumps({
+            "summary": {
+                "total": len(items),
+                "succeeded": succeeded,
+                "failed": len(items) - succeeded
+            }
+        }) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 @router.get("/candidates/{candidate_id}/images/{image_type}", summary="Get Candidate Image URL")
 async def get_candidate_image(
     candidate_id: str = Path(..., description="ID of the candidate"),
@@ -9,6 +9,8 @@ from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.connection import get_db
+from app.infrastructure.database.counting import CountStrategy
+from app.infrastructure.database.pagination import InvalidCursorError
 from app.api.dto.candidate_exam_subject import (
     CandidateExamSubjectCreate,
     CandidateExamSubjectUpdate,
@@ -57,11 +59,16 @@ async def get_candidate_exam_subject_registrations(
     candidate_exam_id: Optional[str] = Query(None, description="Filter by candidate exam ID"),
     exam_subject_id: Optional[str] = Query(None, description="Filter by exam subject ID"),
     status: Optional[RegistrationStatusEnum] = Query(None, description="Filter by registration status"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor; replaces skip"),
+    count_strategy: Optional[CountStrategy] = Query(None, description="How to compute total: exact, estimate or cached"),
     service: CandidateExamSubjectService = Depends(get_candidate_exam_subject_service)
 ):
     """
     Retrieve a list of candidate exam subject registrations with pagination and optional filtering.
     
+    Registrations are ordered by ID. To read deep pages, pass the next_cursor of
+    each response as the cursor of the following request instead of raising skip.
+    
     Args:
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
@@ -71,27 +78,36 @@ async def get_candidate_exam_subject_registrations(
         candidate_exam_id: Filter by candidate exam ID
         exam_subject_id: Filter by exam subject ID
         status: Filter by status
+        cursor: Cursor from the previous page's next_cursor, used instead of skip
+        count_strategy: How to compute total, LIST_COUNT_STRATEGY by default
         service: CandidateExamSubjectService instance
         
     Returns:
         List of candidate exam subject registrations
     """
-    registrations, total = await service.get_all_registrations(
-        skip=skip, 
-        limit=limit,
-        candidate_id=candidate_id,
-        exam_id=exam_id,
-        subject_id=subject_id,
-        candidate_exam_id=candidate_exam_id,
-        exam_subject_id=exam_subject_id,
-        status=status.value if status else None
-    )
+    try:
+        registrations, total, next_cursor = await service.get_all_registrations(
+            skip=skip, 
+            limit=limit,
+            candidate_id=candidate_id,
+            exam_id=exam_id,
+            subject_id=subject_id,
+            candidate_exam_id=candidate_exam_id,
+            exam_subject_id=exam_subject_id,
+            status=status.value if status else None,
+            cursor=cursor,
+            count_strategy=count_strategy
+        )
+    except InvalidCursorError as e:
+        # `status` is the registration status filter here, not fastapi.status
+        raise HTTPException(status_code=400, detail=str(e))
     
     return CandidateExamSubjectListResponse(
         items=registrations,
         total=total,
         page=skip // limit + 1 if limit > 0 else 1,
-        size=limit
+        size=limit,
+        next_cursor=next_cursor
     )
 
 @router.get("/{candidate_exam_subject_id}", response_model=CandidateExamSubjectDetailResponse, summary="Get Candidate Exam Subject Registration")
@@ -18,7 +18,7 @@ from app.api.dto.candidate import (
 )
 from app.api.dto.education_history import EducationHistoryResponse
 # from app.api.dto.candidate_exam import ExamHistoryResponse, SubjectScore
-from app.repositories.candidate_repository import CandidateRepository
+from app.repositories.candidate_repository import CandidateRepository, CandidateSearchMode
 from app.services.candidate_service import CandidateService
 
 router = APIRouter(
@@ -111,24 +111,27 @@ async def search_candidates(
     q: str = Query(..., min_length=1, description="Search keyword"),
     skip: int = Query(0, ge=0, description="Number of records to skip (for pagination)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    mode: CandidateSearchMode = Query(CandidateSearchMode.AUTO, description="Matching mode: keys, similarity or auto (keys, then similarity when nothing matches)"),
     service: CandidateService = Depends(get_candidate_service)
 ):
     """
     Search candidates by keyword.
     
-    This endpoint searches for candidates based on name or personal information.
+    This endpoint searches for candidates based on name or personal information,
+    in PostgreSQL only.
     
     Args:
         q: Search keyword
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
+        mode: Matching mode
         service: CandidateService (injected)
         
     Returns:
         List[CandidateResponse]: List of candidates matching the keyword
     """
     try:
-        candidates = await service.search_candidates(q, skip, limit)
+        candidates = await service.search_candidates(q, skip, limit, mode)
         return candidates
     except Exception as e:
         raise HTTPException(
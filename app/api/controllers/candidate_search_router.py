@@ -22,6 +22,7 @@ from app.api.dto.candidate_search import (
     CandidateSearchRequest
 )
 from app.graph_repositories.search.candidate_search_repository import CandidateSearchRepository
+from app.repositories.candidate_repository import CandidateRepository
 from app.services.search.candidate_search_service import CandidateSearchService
 
 router = APIRouter(
@@ -45,7 +46,7 @@ async def get_candidate_search_service(
         CandidateSearchService: Service instance
     """
     search_repo = CandidateSearchRepository(neo4j)
-    return CandidateSearchService(search_repo)
+    return CandidateSearchService(search_repo, fallback_repo=CandidateRepository(db))
 
 @router.get("/candidates", response_model=CandidateSearchResult, summary="Tìm kiếm thí sinh")
 async def search_candidates(
@@ -10,6 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 
 from app.infrastructure.database.connection import get_db
+from app.infrastructure.database.counting import CountStrategy
+from app.infrastructure.database.pagination import InvalidCursorError
 from app.api.dto.exam_score import (
     ExamScoreCreate,
     ExamScoreUpdate,
@@ -69,11 +71,16 @@ async def get_exam_scores(
     max_score: Optional[float] = Query(None, description="Filter by maximum score"),
     score_date: Optional[date] = Query(None, description="Filter by score date"),
     graded_by: Optional[str] = Query(None, description="Filter by grader ID"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor; replaces skip"),
+    count_strategy: Optional[CountStrategy] = Query(None, description="How to compute total: exact, estimate or cached"),
     service: ExamScoreService = Depends(get_exam_score_service)
 ):
     """
     Retrieve a list of exam scores with pagination and optional filtering.
     
+    Scores are ordered by ID. To read deep pages, pass the next_cursor of each
+    response as the cursor of the following request instead of raising skip.
+    
     Args:
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
@@ -86,30 +93,39 @@ async def get_exam_scores(
         max_score: Filter by maximum score
         score_date: Filter by score date (YYYY-MM-DD)
         graded_by: Filter by grader ID
+        cursor: Cursor from the previous page's next_cursor, used instead of skip
+        count_strategy: How to compute total, LIST_COUNT_STRATEGY by default
         service: ExamScoreService instance
         
     Returns:
         List of exam scores
     """
-    scores, total = await service.get_all_scores(
-        skip=skip, 
-        limit=limit,
-        search=search,
-        candidate_id=candidate_id,
-        exam_id=exam_id,
-        subject_id=subject_id,
-        status=status.value if status else None,
-        min_score=min_score,
-        max_score=max_score,
-        score_date=score_date.isoformat() if score_date else None,
-        graded_by=graded_by
-    )
+    try:
+        scores, total, next_cursor = await service.get_all_scores(
+            skip=skip, 
+            limit=limit,
+            search=search,
+            candidate_id=candidate_id,
+            exam_id=exam_id,
+            subject_id=subject_id,
+            status=status.value if status else None,
+            min_score=min_score,
+            max_score=max_score,
+            score_date=score_date.isoformat() if score_date else None,
+            graded_by=graded_by,
+            cursor=cursor,
+            count_strategy=count_strategy
+        )
+    except InvalidCursorError as e:
+        # `status` is the score status filter here, not fastapi.status
+        raise HTTPException(status_code=400, detail=str(e))
     
     return ExamScoreListResponse(
         items=scores,
         total=total,
         page=skip // limit + 1 if limit > 0 else 1,
-        size=limit
+        size=limit,
+        next_cursor=next_cursor
     )
 
 @router.get("/{score_id}", response_model=ExamScoreDetailResponse, summary="Get Exam Score")
@@ -21,7 +21,8 @@ from app.services.health_service import (
     check_all_services, 
     check_postgres, 
     check_neo4j, 
-    check_redis
+    check_redis,
+    check_face_model
 )
 
 router = APIRouter(
@@ -114,4 +115,27 @@ async def redis_health(redis_client = Depends(get_redis)):
         "status": "up",
         "timestamp": datetime.now().isoformat(),
         "message": "Redis connection is healthy"
-    } 
\ No newline at end of file
+    } 
+
+@router.get("/face-model", summary="Face Model Readiness Check")
+async def face_model_health():
+    """
+    Check whether the face analysis model is loaded and ready for inference.
+    
+    Returns:
+        dict: Face model readiness status
+    """
+    result = check_face_model()
+    
+    if result["status"] != "up":
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Face model is not ready: {result.get('error') or result['status']}"
+        )
+    
+    return {
+        "status": "up",
+        "timestamp": datetime.now().isoformat(),
+        "message": "Face model is loaded",
+        "details": result
+    }
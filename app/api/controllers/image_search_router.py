@@ -49,7 +49,7 @@ async def search_by_face(
         image_data = await image.read()
         
         # Process image to get face embedding
-        result = repository.image_processor.process_image(image_data, "direct_face")
+        result = await repository.image_processor.process_image_async(image_data, "direct_face")
         
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -62,6 +62,8 @@ async def search_by_face(
         
         return matches
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in search_by_face: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -89,7 +91,7 @@ async def update_face_embedding(
         image_data = await image.read()
         
         # Process image to get face embedding
-        result = repository.image_processor.process_image(image_data, source)
+        result = await repository.image_processor.process_image_async(image_data, source)
         
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -107,6 +109,8 @@ async def update_face_embedding(
         
         return {"message": "Face embedding updated successfully"}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in update_face_embedding: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -11,6 +11,8 @@ from datetime import datetime, date
 import logging
 
 from app.infrastructure.database.connection import get_db
+from app.infrastructure.database.counting import CountStrategy
+from app.infrastructure.database.pagination import InvalidCursorError
 from app.api.dto.score_review import (
     ScoreReviewCreate,
     ScoreReviewUpdate,
@@ -59,11 +61,16 @@ async def get_score_reviews(
     review_date_to: Optional[date] = Query(None, description="Filter by review date to"),
     created_after: Optional[date] = Query(None, description="Filter by reviews created after date"),
     created_before: Optional[date] = Query(None, description="Filter by reviews created before date"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor; replaces skip"),
+    count_strategy: Optional[CountStrategy] = Query(None, description="How to compute total: exact, estimate or cached"),
     service: ScoreReviewService = Depends(get_score_review_service)
 ):
     """
     Retrieve a list of score reviews with pagination and optional filtering.
     
+    Reviews are listed newest first. To read deep pages, pass the next_cursor of
+    each response as the cursor of the following request instead of raising skip.
+    
     Args:
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
@@ -76,30 +83,38 @@ async def get_score_reviews(
         review_date_to: Filter by review date to
         created_after: Filter by reviews created after date
         created_before: Filter by reviews created before date
+        cursor: Cursor from the previous page's next_cursor, used instead of skip
+        count_strategy: How to compute total, LIST_COUNT_STRATEGY by default
         service: ScoreReviewService instance
         
     Returns:
         List of score reviews
     """
-    reviews, total = await service.get_all_reviews(
-        skip=skip, 
-        limit=limit,
-        search=search,
-        review_status=review_status,
-        score_id=score_id,
-        request_date_from=request_date_from.isoformat() if request_date_from else None,
-        request_date_to=request_date_to.isoformat() if request_date_to else None,
-        review_date_from=review_date_from.isoformat() if review_date_from else None,
-        review_date_to=review_date_to.isoformat() if review_date_to else None,
-        created_after=created_after.isoformat() if created_after else None,
-        created_before=created_before.isoformat() if created_before else None
-    )
+    try:
+        reviews, total, next_cursor = await service.get_all_reviews(
+            skip=skip, 
+            limit=limit,
+            search=search,
+            review_status=review_status,
+            score_id=score_id,
+            request_date_from=request_date_from.isoformat() if request_date_from else None,
+            request_date_to=request_date_to.isoformat() if request_date_to else None,
+            review_date_from=review_date_from.isoformat() if review_date_from else None,
+            review_date_to=review_date_to.isoformat() if review_date_to else None,
+            created_after=created_after.isoformat() if created_after else None,
+            created_before=created_before.isoformat() if created_before else None,
+            cursor=cursor,
+            count_strategy=count_strategy
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     return ScoreReviewListResponse(
         items=reviews,
         total=total,
         page=skip // limit + 1 if limit > 0 else 1,
-        size=limit
+        size=limit,
+        next_cursor=next_cursor
     )
 
 @router.get("/{score_review_id}", response_model=ScoreReviewDetailResponse, summary="Get Score Review")
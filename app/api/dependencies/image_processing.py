@@ -4,8 +4,16 @@ Image Processing Dependencies module.
 This module provides FastAPI dependencies for image processing services.
 """
 
+from functools import lru_cache
 from app.services.image_processing_service import ImageProcessingService
 
-def get_image_processor():
-    """Dependency to get image processing service instance."""
-    return ImageProcessingService() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_image_processor() -> ImageProcessingService:
+    """
+    Dependency to get the shared image processing service instance.
+    
+    The service and its face model are created once per worker process.
+    FastAPI runs this synchronous dependency in its thread pool, so a lazy
+    first load does not block the event loop.
+    """
+    return ImageProcessingService()
@@ -73,6 +73,7 @@ class CandidateExamSubjectListResponse(BaseModel):
     total: int
     page: int
     size: int
+    next_cursor: Optional[str] = None
     
     class Config:
         from_attributes = True
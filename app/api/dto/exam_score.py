@@ -72,4 +72,5 @@ class ExamScoreListResponse(BaseModel):
     items: List[ExamScoreDetailResponse]
     total: int = Field(..., description="Total number of exam scores")
     page: int = Field(..., description="Current page number")
-    size: int = Field(..., description="Number of items per page") 
\ No newline at end of file
+    size: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, if there may be one")
\ No newline at end of file
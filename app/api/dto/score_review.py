@@ -150,6 +150,7 @@ class ScoreReviewListResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Number of records per page")
     pages: int = Field(1, description="Total number of pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, if there may be one")
 
     @field_validator('pages', mode='after')
     @classmethod
@@ -11,9 +11,10 @@ from typing import Optional
 import logging as python_logging
 
 from app.api.middleware.logging import LoggingMiddleware
-from app.api.middleware.rate_limiter import RateLimiterMiddleware
+from app.api.middleware.rate_limiter import RateLimiterMiddleware, parse_rate_limit, parse_rate_limit_rules
 from app.api.middleware.authentication import AdminAuthenticationMiddleware
 from app.infrastructure.cache.redis_connection import RedisCache
+from app.config import settings
 
 logger = python_logging.getLogger("api")
 
@@ -49,11 +50,15 @@ def register_middleware(app: FastAPI, redis_cache: Optional[RedisCache] = None):
     # This limits request rates to prevent abuse
     if redis_cache:
         logger.info("Registering Rate Limiter middleware")
+        default_limit = parse_rate_limit("default", settings.RATE_LIMIT_DEFAULT)
         app.add_middleware(
             RateLimiterMiddleware,
             redis_cache=redis_cache,
-            requests_limit=100,  # Adjust based on your requirements
-            window_seconds=60    # 1 minute window
+            requests_limit=default_limit.requests,
+            window_seconds=default_limit.window_seconds,
+            route_limits=parse_rate_limit_rules(settings.RATE_LIMIT_ROUTE_RULES),
+            role_limits=parse_rate_limit_rules(settings.RATE_LIMIT_ROLE_RULES),
+            local_cache_size=settings.RATE_LIMIT_LOCAL_CACHE_SIZE
         )
     else:
         logger.warning("Redis connection not available. Rate Limiter middleware not registered.")
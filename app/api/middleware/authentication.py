@@ -22,7 +22,8 @@ from app.domain.models.permission import Permission
 from app.domain.models.user import User
 from app.domain.models.security_log import SecurityLog
 from app.services.id_service import generate_model_id
-from app.infrastructure.cache.redis_connection import get_redis
+from app.infrastructure.cache.auth_principal_cache import auth_principal_cache
+from app.services.security_log_writer import security_log_writer
 from sqlalchemy import select, text
 
 class AdminAuthenticationMiddleware(BaseHTTPMiddleware):
@@ -125,19 +126,6 @@ class AdminAuthenticationMiddleware(BaseHTTPMiddleware):
         # Extract token from header
         token = auth_header.replace(f"{self.token_prefix} ", "")
         
-        # Check if token is blacklisted
-        try:
-            redis_client = await get_redis()
-            if await redis_client.exists(f"blacklist:{token}"):
-                self.logger.warning(f"Attempted use of blacklisted token for path: {path}")
-                raise HTTPException(
-                    status_code=401, 
-                    detail="Token has been revoked",
-                    headers={"WWW-Authenticate": "Bearer"}
-                )
-        except Exception as e:
-            self.logger.error(f"Error checking token blacklist: {str(e)}")
-        
         try:
             # Decode and validate JWT token
             payload = jwt.decode(
@@ -149,70 +137,51 @@ class AdminAuthenticationMiddleware(BaseHTTPMiddleware):
             user_id = payload.get("sub")
             role = payload.get("role")
             
-            # Get database connection
-            db = None
-            try:
-                db_gen = get_db()
-                db = await anext(db_gen)
-                
-                # Get user from database to ensure account is still active and has correct role
-                user_query = select(User).where(User.user_id == user_id)
-                user_result = await db.execute(user_query)
-                user = user_result.scalar_one_or_none()
-                
-                if not user:
-                    self.logger.warning(f"Token references non-existent user: {user_id}")
-                    raise HTTPException(status_code=401, detail="Invalid user")
-                
-                if not user.is_active:
+            # Check the blacklist and the principal cache in one Redis round trip
+            token_id = auth_principal_cache.token_id(token, payload)
+            blacklisted, principal = await auth_principal_cache.lookup(token, token_id)
+            if blacklisted:
+                self.logger.warning(f"Attempted use of blacklisted token for path: {path}")
+                raise HTTPException(
+                    status_code=401, 
+                    detail="Token has been revoked",
+                    headers={"WWW-Authenticate": "Bearer"}
+                )
+            
+            if principal is None:
+                principal = await self._load_principal(user_id, request)
+                if principal is not None:
+                    await auth_principal_cache.store(token_id, principal)
+            
+            if principal is None:
+                # Continue with token data if the database is unavailable
+                permissions = payload.get("permissions", [])
+            else:
+                if not principal["is_active"]:
                     self.logger.warning(f"Deactivated user attempted access: {user_id}")
                     raise HTTPException(status_code=401, detail="Account is inactive")
                 
                 # Verify role is either admin or super_admin
-                if user.role not in ["admin", "super_admin"]:
+                if principal["role"] not in ["admin", "super_admin"]:
                     self.logger.warning(f"Non-admin user attempted to access admin path: {path}")
                     raise HTTPException(
                         status_code=403, 
                         detail="Admin access required"
                     )
-                
-                # Fetch permissions from database for the role
-                permissions = []
-                if user.role_id:
-                    permissions_result = await db.execute(text("""
-                        SELECT p.name 
-                        FROM permissions p
-                        JOIN role_permissions rp ON p.permission_id = rp.permission_id
-                        WHERE rp.role_id = :role_id
-                    """), {"role_id": user.role_id})
-                    
-                    permissions = [row[0] for row in permissions_result]
-                
-                # Log successful authentication
-                log_entry = SecurityLog(
-                    log_id=generate_model_id("SecurityLog"),
-                    user_id=user_id,
-                    action="auth_success",
-                    ip_address=request.client.host,
-                    user_agent=request.headers.get("User-Agent", ""),
-                    description=f"User authenticated successfully for {path}",
-                    request_id=request.scope.get("aws.request_id", ""),
-                    success=True
-                )
-                db.add(log_entry)
-                await db.commit()
-                
-                # Update user last login
-                user.last_login = datetime.utcnow()
-                user.last_login_ip = request.client.host
-                await db.commit()
-            except Exception as db_error:
-                self.logger.error(f"Database error during authentication: {str(db_error)}")
-                # Continue with token data if DB error
-                permissions = payload.get("permissions", [])
-            finally:
-                if db:
-                    await db.close()
+                permissions = principal["permissions"]
+            
+            # Log successful authentication without waiting for the insert
+            security_log_writer.log(SecurityLog(
+                log_id=generate_model_id("SecurityLog"),
+                user_id=user_id,
+                action="auth_success",
+                ip_address=request.client.host if request.client else None,
+                user_agent=request.headers.get("User-Agent", ""),
+                description=f"User authenticated successfully for {path}",
+                request_id=request.scope.get("aws.request_id", ""),
+                timestamp=datetime.utcnow(),
+                success=True
+            ))
             
             # Extract admin user information from token payload
             user_data = {
@@ -251,6 +220,70 @@ class AdminAuthenticationMiddleware(BaseHTTPMiddleware):
         # Call the next middleware or route handler
         return await call_next(request)
 
+    async def _load_principal(self, user_id: str, request: Request) -> Optional[Dict[str, Any]]:
+        """
+        Load the user's active flag, role and permissions from the database.
+        
+        This runs once per token per cache lifetime and also records the
+        user's last login time and address.
+        
+        Args:
+            user_id: User ID from the token
+            request: The HTTP request
+            
+        Returns:
+            Optional[Dict[str, Any]]: The principal, or None if the database is unavailable
+            
+        Raises:
+            HTTPException: If the user does not exist
+        """
+        db = None
+        try:
+            db_gen = get_db()
+            db = await anext(db_gen)
+            
+            # Get user from database to ensure account is still active and has correct role
+            user_query = select(User).where(User.user_id == user_id)
+            user_result = await db.execute(user_query)
+            user = user_result.scalar_one_or_none()
+            
+            if not user:
+                self.logger.warning(f"Token references non-existent user: {user_id}")
+                raise HTTPException(status_code=401, detail="Invalid user")
+            
+            # Fetch permissions from database for the role
+            permissions = []
+            if user.role_id:
+                permissions_result = await db.execute(text("""
+                    SELECT p.name 
+                    FROM permissions p
+                    JOIN role_permissions rp ON p.permission_id = rp.permission_id
+                    WHERE rp.role_id = :role_id
+                """), {"role_id": user.role_id})
+                
+                permissions = [row[0] for row in permissions_result]
+            
+            # Update user last login
+            user.last_login = datetime.utcnow()
+            user.last_login_ip = request.client.host if request.client else None
+            await db.commit()
+            
+            return {
+                "user_id": user.user_id,
+                "is_active": bool(user.is_active),
+                "role": user.role,
+                "role_id": user.role_id,
+                "permissions": permissions
+            }
+        except HTTPException:
+            raise
+        except Exception as db_error:
+            self.logger.error(f"Database error during authentication: {str(db_error)}")
+            return None
+        finally:
+            if db:
+                await db.close()
+
 # Helper function to use in API endpoints for permission checks
 def has_permission(request: Request, permission: str) -> bool:
     """
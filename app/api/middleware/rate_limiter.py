@@ -4,31 +4,111 @@ Rate limiting middleware module.
 This module provides a configurable rate limiting middleware for FastAPI that
 restricts the number of requests a client can make within a specific time window.
 It helps protect the API from abuse, DoS attacks, and ensures fair resource usage.
+
+Limits use a sliding window counter evaluated by a single Lua script, so each
+request costs one atomic Redis round trip. Clients that were just rejected are
+remembered in-process and turned away without contacting Redis until their
+window allows them again.
 """
 
-from fastapi import Request, Response, HTTPException
+from fastapi import Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import math
 import time
 import logging
+import jwt
+from app.config import settings
 from app.infrastructure.cache.redis_connection import RedisCache
 
+# Sliding window counter: the previous fixed window is weighted by how much of
+# it still overlaps the sliding window. The request is only counted if allowed.
+# KEYS: current window counter, previous window counter
+# ARGV: limit, window length in seconds, weight of the previous window
+# Returns: {allowed (0/1), previous window count, current window count}
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local weight = tonumber(ARGV[3])
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if previous * weight + current >= limit then
+    return {0, previous, current}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], window * 2)
+end
+return {1, previous, current}
+"""
+
+
+class RateLimit(NamedTuple):
+    """A request limit per time window; a limit of 0 disables limiting."""
+    name: str
+    requests: int
+    window_seconds: int
+
+
+def parse_rate_limit(name: str, value: str) -> RateLimit:
+    """
+    Parse a limit written as "<requests>/<window seconds>", e.g. "100/60".
+    
+    Args:
+        name: Name of the rule, used in Redis keys and logs
+        value: Limit specification
+    
+    Returns:
+        RateLimit: The parsed limit
+    
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    requests, _, window = value.strip().partition("/")
+    return RateLimit(name, int(requests), int(window or 60))
+
+
+def parse_rate_limit_rules(value: str) -> Dict[str, RateLimit]:
+    """
+    Parse comma-separated "<key>=<requests>/<window seconds>" rules.
+    
+    Args:
+        value: Rules such as "/api/v1/search=300/60,/api/v1/admin=50/60"
+    
+    Returns:
+        Dict[str, RateLimit]: Limits by key (route prefix or role)
+    """
+    rules = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        key, _, limit = item.partition("=")
+        rules[key.strip()] = parse_rate_limit(key.strip(), limit)
+    return rules
+
+
 class RateLimiterMiddleware(BaseHTTPMiddleware):
     """
-    Middleware for implementing rate limiting based on client IP address.
+    Middleware for implementing rate limiting per client and route.
     
-    Uses Redis to track and limit the number of requests from each client
-    within a configurable time window. When limits are exceeded, returns
-    a 429 Too Many Requests response.
+    Clients are identified by the user ID of a valid bearer token, or by IP
+    address otherwise. The applicable limit is, in order of precedence, the
+    longest matching route rule, the rule for the client's role, or the
+    default limit. Each rule keeps its own counters. When limits are exceeded,
+    returns a 429 Too Many Requests response.
     """
     
     def __init__(
-        self, 
-        app: ASGIApp, 
+        self,
+        app: ASGIApp,
         redis_cache: RedisCache,
         requests_limit: int = 1000,
-        window_seconds: int = 60
+        window_seconds: int = 60,
+        route_limits: Optional[Dict[str, RateLimit]] = None,
+        role_limits: Optional[Dict[str, RateLimit]] = None,
+        local_cache_size: int = 10000
     ):
         """
         Initialize the rate limiting middleware.
@@ -38,85 +118,172 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
             redis_cache: Redis cache instance for storing rate limit data
             requests_limit: Maximum number of requests allowed in the time window
             window_seconds: Time window in seconds for rate limiting
+            route_limits: Limits by path prefix
+            role_limits: Limits by role of the authenticated user
+            local_cache_size: Maximum number of clients remembered as blocked in-process
         """
         super().__init__(app)
         self.redis_cache = redis_cache
         self.requests_limit = requests_limit
         self.window_seconds = window_seconds
+        self.default_limit = RateLimit("default", requests_limit, window_seconds)
+        # Longest prefixes first so the most specific rule wins
+        self.route_limits: List[Tuple[str, RateLimit]] = sorted(
+            (route_limits or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.role_limits = role_limits or {}
+        self.local_cache_size = local_cache_size
+        # Monotonic time until which a bucket is known to be over its limit
+        self._blocked_until: Dict[str, float] = {}
         self.logger = logging.getLogger("api")
-
+    
     async def dispatch(self, request: Request, call_next):
         """
         Process the request and apply rate limiting.
         
         This method:
-        1. Extracts the client IP address
-        2. Increments the request counter for that IP in Redis
-        3. Checks if the client has exceeded their rate limit
+        1. Identifies the client and the limit that applies to the request
+        2. Rejects clients this worker recently saw over the limit, without Redis
+        3. Atomically checks and counts the request in Redis
         4. Either blocks the request or forwards it to the next middleware
         
         Args:
             request: The incoming HTTP request
             call_next: The next middleware or endpoint in the chain
-            
+        
         Returns:
             Response: The HTTP response or a 429 Too Many Requests error
-            
-        Raises:
-            HTTPException: When rate limit is exceeded
         """
         # Skip rate limiting for specific endpoints if needed
         if request.url.path in ["/docs", "/redoc", "/openapi.json"]:
             return await call_next(request)
-            
-        # Get client IP address
-        client_ip = request.client.host if request.client else "unknown"
         
-        # Create Redis key for this client
-        redis_key = f"rate_limit:{client_ip}"
+        client, role = self._identify(request)
+        limit = self._resolve_limit(request.url.path, role)
+        if limit.requests <= 0:
+            return await call_next(request)
         
-        # Get current count for this client
-        current_count = await self.redis_cache.get(redis_key)
+        bucket = f"{limit.name}:{client}"
         
-        if current_count is None:
-            # First request from this client in this window
-            await self.redis_cache.set(redis_key, 1, ex=self.window_seconds)
-            current_count = 1
-        else:
-            # Increment the request counter
-            current_count = int(current_count) + 1
-            await self.redis_cache.set(redis_key, current_count, ex=self.window_seconds)
-        
-        # Check if rate limit is exceeded
-        if current_count > self.requests_limit:
-            # Calculate time until reset
-            ttl = await self.redis_cache.ttl(redis_key)
-            
-            # Log rate limit exceeded
+        # Local pre-check: a bucket rejected moments ago is still over its limit
+        blocked_until = self._blocked_until.get(bucket)
+        if blocked_until is not None:
+            retry_after = blocked_until - time.monotonic()
+            if retry_after > 0:
+                return self._reject(limit, retry_after)
+            del self._blocked_until[bucket]
+        
+        allowed, remaining, retry_after = await self._check(bucket, limit)
+        if not allowed:
+            self._remember_blocked(bucket, retry_after)
             self.logger.warning(
-                f"Rate limit exceeded for {client_ip}: {current_count} requests. "
-                f"Limit: {self.requests_limit} per {self.window_seconds} seconds."
-            )
-            
-            # Return rate limit exceeded response
-            response = JSONResponse(
-                content={"detail": "Rate limit exceeded. Try again later."},
-                status_code=429
+                f"Rate limit exceeded for {client} on {request.url.path}. "
+                f"Limit: {limit.requests} per {limit.window_seconds} seconds."
             )
-            
-            # Add rate limit headers to response
-            response.headers["X-RateLimit-Limit"] = str(self.requests_limit)
-            response.headers["X-RateLimit-Remaining"] = "0"
-            response.headers["X-RateLimit-Reset"] = str(ttl)
-            response.headers["Retry-After"] = str(ttl)
-            
-            return response
+            return self._reject(limit, retry_after)
         
         # Process the request normally if within limits
         response = await call_next(request)
         
         # Add rate limit headers to successful responses
-        response.headers["X-RateLimit-Limit"] = str(self.requests_limit)
-        response.headers["X-RateLimit-Remaining"] = str(self.requests_limit - current_count)
+        response.headers["X-RateLimit-Limit"] = str(limit.requests)
+        if remaining is not None:
+            response.headers["X-RateLimit-Remaining"] = str(remaining)
+        
+        return response
+    
+    async def _check(self, bucket: str, limit: RateLimit) -> Tuple[bool, Optional[int], float]:
+        """
+        Count a request against a bucket in one atomic Redis call.
+        
+        Args:
+            bucket: Rule name and client identity
+            limit: The applicable limit
+        
+        Returns:
+            Tuple of (allowed, remaining requests, seconds until a request would be allowed).
+            Requests are allowed when Redis is unavailable.
+        """
+        now = time.time()
+        window = limit.window_seconds
+        index = int(now // window)
+        elapsed = now - index * window
+        weight = 1.0 - elapsed / window
+        # Hash tag keeps both windows of a bucket in the same cluster slot
+        keys = [f"rate_limit:{{{bucket}}}:{index}", f"rate_limit:{{{bucket}}}:{index - 1}"]
+        
+        result = await self.redis_cache.run_script(
+            SLIDING_WINDOW_SCRIPT, keys, [limit.requests, window, weight]
+        )
+        if result is None:
+            # Fail open: an unavailable cache must not take the API down
+            return True, None, 0.0
+        
+        allowed, previous, current = (int(value) for value in result)
+        estimated = previous * weight + current
+        if allowed:
+            return True, max(0, int(limit.requests - estimated)), 0.0
+        
+        # Time until the weighted previous window has decayed enough for one request
+        if current >= limit.requests or previous == 0:
+            retry_after = window - elapsed
+        else:
+            retry_after = min(window - elapsed, (estimated - limit.requests + 1) * window / previous)
+        return False, 0, max(retry_after, 0.001)
+    
+    def _identify(self, request: Request) -> Tuple[str, Optional[str]]:
+        """
+        Identify the client of a request.
+        
+        The token signature is verified but the account is not looked up; a
+        forged or expired token simply falls back to IP-based limiting.
+        
+        Returns:
+            Tuple of (client identity, role or None)
+        """
+        auth_header = request.headers.get("Authorization", "")
+        if auth_header.startswith("Bearer "):
+            try:
+                payload = jwt.decode(auth_header[7:], settings.SECRET_KEY, algorithms=["HS256"])
+                if payload.get("sub"):
+                    return f"user:{payload['sub']}", payload.get("role")
+            except jwt.InvalidTokenError:
+                pass
+        client_ip = request.client.host if request.client else "unknown"
+        return f"ip:{client_ip}", None
+    
+    def _resolve_limit(self, path: str, role: Optional[str]) -> RateLimit:
+        """Select the limit for a path and role."""
+        for prefix, limit in self.route_limits:
+            if path.startswith(prefix):
+                return limit
+        if role and role in self.role_limits:
+            return self.role_limits[role]
+        return self.default_limit
+    
+    def _remember_blocked(self, bucket: str, retry_after: float) -> None:
+        """Record a rejected bucket so this worker can reject it locally."""
+        now = time.monotonic()
+        if len(self._blocked_until) >= self.local_cache_size:
+            self._blocked_until = {
+                key: until for key, until in self._blocked_until.items() if until > now
+            }
+            if len(self._blocked_until) >= self.local_cache_size:
+                return
+        self._blocked_until[bucket] = now + retry_after
+    
+    def _reject(self, limit: RateLimit, retry_after: float) -> JSONResponse:
+        """Build the 429 response for a rejected request."""
+        retry_seconds = str(max(1, math.ceil(retry_after)))
+        response = JSONResponse(
+            content={"detail": "Rate limit exceeded. Try again later."},
+            status_code=429
+        )
+        
+        # Add rate limit headers to response
+        response.headers["X-RateLimit-Limit"] = str(limit.requests)
+        response.headers["X-RateLimit-Remaining"] = "0"
+        response.headers["X-RateLimit-Reset"] = retry_seconds
+        response.headers["Retry-After"] = retry_seconds
         
-        return response 
\ No newline at end of file
+        return response
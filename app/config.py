@@ -83,6 +83,76 @@ class Settings(BaseSettings):
     REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
     REDIS_PASSWORD: Optional[str] = os.getenv("REDIS_PASSWORD", "")
     
+    # Rate limiting settings ("<requests>/<window seconds>"; 0 requests = unlimited)
+    RATE_LIMIT_DEFAULT: str = os.getenv("RATE_LIMIT_DEFAULT", "100/60")
+    RATE_LIMIT_ROUTE_RULES: str = os.getenv("RATE_LIMIT_ROUTE_RULES", "")  # e.g. "/api/v1/search=300/60,/api/v1/admin/candidates/images/batch=10/60"
+    RATE_LIMIT_ROLE_RULES: str = os.getenv("RATE_LIMIT_ROLE_RULES", "")  # e.g. "admin=1000/60,super_admin=0/60"
+    RATE_LIMIT_LOCAL_CACHE_SIZE: int = int(os.getenv("RATE_LIMIT_LOCAL_CACHE_SIZE", "10000"))
+    
+    # Admin authentication settings
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "60"))  # 0 = disabled
+    SECURITY_LOG_BATCH_SIZE: int = int(os.getenv("SECURITY_LOG_BATCH_SIZE", "100"))
+    SECURITY_LOG_FLUSH_SECONDS: float = float(os.getenv("SECURITY_LOG_FLUSH_SECONDS", "1"))
+    SECURITY_LOG_QUEUE_SIZE: int = int(os.getenv("SECURITY_LOG_QUEUE_SIZE", "10000"))
+    
+    # Candidate info cache settings
+    CANDIDATE_INFO_CACHE_TTL_SECONDS: int = int(os.getenv("CANDIDATE_INFO_CACHE_TTL_SECONDS", "300"))  # 0 = disabled
+    CANDIDATE_INFO_CACHE_MISS_TTL_SECONDS: int = int(os.getenv("CANDIDATE_INFO_CACHE_MISS_TTL_SECONDS", "60"))
+    CANDIDATE_INFO_CACHE_LOCK_SECONDS: int = int(os.getenv("CANDIDATE_INFO_CACHE_LOCK_SECONDS", "10"))
+    CANDIDATE_INFO_CACHE_WAIT_SECONDS: float = float(os.getenv("CANDIDATE_INFO_CACHE_WAIT_SECONDS", "2"))
+    
+    # List count settings
+    LIST_COUNT_STRATEGY: str = os.getenv("LIST_COUNT_STRATEGY", "exact")  # exact, estimate or cached
+    LIST_COUNT_CACHE_TTL_SECONDS: int = int(os.getenv("LIST_COUNT_CACHE_TTL_SECONDS", "30"))
+    
+    # Candidate search settings
+    CANDIDATE_SEARCH_COUNT_CACHE_TTL_SECONDS: int = int(os.getenv("CANDIDATE_SEARCH_COUNT_CACHE_TTL_SECONDS", "60"))  # 0 = disabled
+    
+    # Neo4j sync settings
+    SYNC_BATCH_SIZE: int = int(os.getenv("SYNC_BATCH_SIZE", "1000"))
+    SYNC_CONCURRENCY: int = int(os.getenv("SYNC_CONCURRENCY", "4"))  # entity types synchronized at once
+    SYNC_INCREMENTAL_LAG_SECONDS: int = int(os.getenv("SYNC_INCREMENTAL_LAG_SECONDS", "60"))  # changes newer than this wait for the next run
+    SYNC_JOB_TTL_SECONDS: int = int(os.getenv("SYNC_JOB_TTL_SECONDS", "604800"))
+    SYNC_JOB_LOCK_SECONDS: int = int(os.getenv("SYNC_JOB_LOCK_SECONDS", "60"))  # a job without a heartbeat for this long is interrupted
+    SYNC_JOB_HEARTBEAT_SECONDS: float = float(os.getenv("SYNC_JOB_HEARTBEAT_SECONDS", "2"))
+    SYNC_DRIFT_BUCKET_SIZE: int = int(os.getenv("SYNC_DRIFT_BUCKET_SIZE", "1000"))  # rows per bucket compared by drift reports
+    GRAPH_SYNC_QUEUE_ENABLED: bool = os.getenv("GRAPH_SYNC_QUEUE_ENABLED", "True").lower() == "true"  # apply repository writes to Neo4j in the background
+    GRAPH_SYNC_QUEUE_WINDOW_SECONDS: float = float(os.getenv("GRAPH_SYNC_QUEUE_WINDOW_SECONDS", "2"))
+    GRAPH_SYNC_QUEUE_BATCH_SIZE: int = int(os.getenv("GRAPH_SYNC_QUEUE_BATCH_SIZE", "500"))
+    GRAPH_SYNC_QUEUE_SIZE: int = int(os.getenv("GRAPH_SYNC_QUEUE_SIZE", "10000"))
+    
+    # Face model settings
+    FACE_MODEL_NAME: str = os.getenv("FACE_MODEL_NAME", "buffalo_l")
+    FACE_MODEL_DET_SIZE: int = int(os.getenv("FACE_MODEL_DET_SIZE", "640"))
+    FACE_MODEL_MODULES: str = os.getenv("FACE_MODEL_MODULES", "detection,recognition")  # empty = whole model pack
+    FACE_MODEL_PRELOAD: bool = os.getenv("FACE_MODEL_PRELOAD", "True").lower() == "true"
+    FACE_MODEL_WARMUP: bool = os.getenv("FACE_MODEL_WARMUP", "True").lower() == "true"
+    FACE_INFERENCE_WORKERS: int = int(os.getenv("FACE_INFERENCE_WORKERS", "2"))
+    FACE_INFERENCE_QUEUE_SIZE: int = int(os.getenv("FACE_INFERENCE_QUEUE_SIZE", "16"))
+    FACE_INFERENCE_TIMEOUT_SECONDS: float = float(os.getenv("FACE_INFERENCE_TIMEOUT_SECONDS", "30"))
+    FACE_INFERENCE_INTRA_OP_THREADS: int = int(os.getenv("FACE_INFERENCE_INTRA_OP_THREADS", "0"))  # 0 = cores / workers
+    FACE_BATCH_MAX_SIZE: int = int(os.getenv("FACE_BATCH_MAX_SIZE", "16"))
+    FACE_BATCH_MAX_WAIT_MS: int = int(os.getenv("FACE_BATCH_MAX_WAIT_MS", "20"))
+    FACE_BATCH_MAX_IMAGES: int = int(os.getenv("FACE_BATCH_MAX_IMAGES", "500"))
+    FACE_BATCH_MAX_IMAGE_BYTES: int = int(os.getenv("FACE_BATCH_MAX_IMAGE_BYTES", str(10 * 1024 * 1024)))
+    FACE_BATCH_MAX_TOTAL_BYTES: int = int(os.getenv("FACE_BATCH_MAX_TOTAL_BYTES", str(512 * 1024 * 1024)))  # after unzipping
+    
+    # Face search settings
+    FACE_EMBEDDING_DIMENSION: int = int(os.getenv("FACE_EMBEDDING_DIMENSION", "512"))
+    FACE_EMBEDDING_STORAGE_DTYPE: str = os.getenv("FACE_EMBEDDING_STORAGE_DTYPE", "float32")  # float32, float16 or int8
+    FACE_INDEX_REFRESH_SECONDS: int = int(os.getenv("FACE_INDEX_REFRESH_SECONDS", "300"))
+    FACE_SEARCH_MAX_RESULTS: int = int(os.getenv("FACE_SEARCH_MAX_RESULTS", "50"))
+    FACE_INDEX_BACKEND: str = os.getenv("FACE_INDEX_BACKEND", "ivf")  # "exact" or "ivf"
+    FACE_INDEX_IVF_LISTS: int = int(os.getenv("FACE_INDEX_IVF_LISTS", "0"))  # 0 = 4 * sqrt(size)
+    FACE_INDEX_IVF_NPROBE: int = int(os.getenv("FACE_INDEX_IVF_NPROBE", "16"))
+    FACE_INDEX_IVF_MIN_SIZE: int = int(os.getenv("FACE_INDEX_IVF_MIN_SIZE", "50000"))
+    FACE_INDEX_IVF_TRAIN_SAMPLE: int = int(os.getenv("FACE_INDEX_IVF_TRAIN_SAMPLE", "100000"))
+    FACE_INDEX_IVF_TRAIN_ITERATIONS: int = int(os.getenv("FACE_INDEX_IVF_TRAIN_ITERATIONS", "10"))
+    FACE_INDEX_SNAPSHOT_DIR: str = os.getenv("FACE_INDEX_SNAPSHOT_DIR", "data/face_index")  # empty = no snapshots
+    FACE_INDEX_SNAPSHOT_DEBOUNCE_SECONDS: float = float(os.getenv("FACE_INDEX_SNAPSHOT_DEBOUNCE_SECONDS", "30"))
+    FACE_INDEX_SNAPSHOT_POLL_SECONDS: float = float(os.getenv("FACE_INDEX_SNAPSHOT_POLL_SECONDS", "5"))
+    FACE_INDEX_REBUILD_INTERVAL_SECONDS: int = int(os.getenv("FACE_INDEX_REBUILD_INTERVAL_SECONDS", "3600"))
+
     # Logging settings
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE_PATH: str = os.getenv("LOG_FILE_PATH", "logs/app.log")
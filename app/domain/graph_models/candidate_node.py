@@ -1,5 +1,6 @@
 import logging
 from app.infrastructure.ontology.ontology import CLASSES, RELATIONSHIPS
+from app.utilities.search_text import name_tokens, search_key
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,10 @@ class CandidateNode:
         self.full_name = full_name
         self.name = full_name  # Thêm thuộc tính 'name' cho nhất quán với các node khác
         
+        # Khóa tìm kiếm đã bỏ dấu, viết thường, dùng cho tìm kiếm và sắp xếp theo tên
+        self.search_name = search_key(full_name)
+        self.search_tokens = name_tokens(full_name)
+        
         # Thuộc tính bổ sung cho truy vấn - tùy chọn
         self.birth_date = birth_date
         self.gender = gender  # Thêm trường gender
@@ -60,6 +65,8 @@ class CandidateNode:
             c.candidate_name = $candidate_name,
             c.full_name = $full_name,
             c.name = $name,
+            c.search_name = $search_name,
+            c.search_tokens = $search_tokens,
             c.birth_date = $birth_date,
             c.id_number = $id_number,
             c.phone_number = $phone_number,
@@ -78,6 +85,8 @@ class CandidateNode:
             c.candidate_name = $candidate_name,
             c.full_name = $full_name,
             c.name = $name,
+            c.search_name = $search_name,
+            c.search_tokens = $search_tokens,
             c.birth_date = $birth_date,
             c.id_number = $id_number,
             c.phone_number = $phone_number,
@@ -117,6 +126,8 @@ class CandidateNode:
             "candidate_name": self.candidate_name,
             "full_name": self.full_name,
             "name": self.name,
+            "search_name": self.search_name,
+            "search_tokens": self.search_tokens,
             "birth_date": self.birth_date,
             "id_number": self.id_number,
             "phone_number": self.phone_number,
@@ -35,4 +35,8 @@ from app.domain.models.role import Role
 from app.domain.models.permission import Permission
 from app.domain.models.role_permission import RolePermission
 from app.domain.models.security_log import SecurityLog
-from app.domain.models.two_factor_backup import TwoFactorBackup
\ No newline at end of file
+from app.domain.models.two_factor_backup import TwoFactorBackup
+
+# Incremental Neo4j sync state
+from app.domain.models.sync_checkpoint import SyncCheckpoint
+from app.domain.models.sync_deletion import SyncDeletion
\ No newline at end of file
@@ -5,11 +5,13 @@ This module defines the Candidate model, which represents the basic information
 about candidates in the system.
 """
 
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship, validates
 from app.infrastructure.database.connection import Base
 from app.services.id_service import generate_model_id
+from app.utilities.search_text import name_tokens, search_key
 
 class Candidate(Base):
     """
@@ -19,6 +21,8 @@ class Candidate(Base):
     
     candidate_id = Column(String(20), primary_key=True, index=True)
     full_name = Column(String(100), nullable=False)
+    search_name = Column(String(100), nullable=True, comment="Họ tên đã bỏ dấu, viết thường và chuẩn hóa khoảng trắng")
+    search_tokens = Column(ARRAY(String), nullable=True, comment="Các phần của họ tên đã bỏ dấu và viết thường")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -28,6 +32,18 @@ class Candidate(Base):
     candidate_exams = relationship("CandidateExam", back_populates="candidate")
     credentials = relationship("CandidateCredential", back_populates="candidate")
     
+    __table_args__ = (
+        # Prefix search on the normalized name (LIKE 'key%')
+        Index("ix_candidate_search_name", "search_name", postgresql_ops={"search_name": "text_pattern_ops"}),
+        # Name part search (search_tokens @> ARRAY[...])
+        Index("ix_candidate_search_tokens", "search_tokens", postgresql_using="gin"),
+        # Substring and similarity search (pg_trgm)
+        Index("ix_candidate_search_name_trgm", "search_name", postgresql_using="gin",
+              postgresql_ops={"search_name": "gin_trgm_ops"}),
+        Index("ix_candidate_candidate_id_trgm", "candidate_id", postgresql_using="gin",
+              postgresql_ops={"candidate_id": "gin_trgm_ops"}),
+    )
+    
     @validates('candidate_id')
     def validate_id(self, key, id_value):
         """Validate and generate ID if not provided."""
@@ -35,5 +51,12 @@ class Candidate(Base):
             return generate_model_id("Candidate")
         return id_value
     
+    @validates('full_name')
+    def validate_full_name(self, key, full_name):
+        """Keep the normalized search keys in step with the name."""
+        self.search_name = search_key(full_name)
+        self.search_tokens = name_tokens(full_name)
+        return full_name
+    
     def __repr__(self):
         return f"<Candidate(candidate_id='{self.candidate_id}', full_name='{self.full_name}')>" 
\ No newline at end of file
@@ -5,7 +5,7 @@ This module defines the PersonalInfo model for storing detailed personal informa
 about candidates, including contact information and identification details.
 """
 
-from sqlalchemy import Column, String, Date, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, String, Date, ForeignKey, DateTime, LargeBinary, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.infrastructure.database.connection import Base
@@ -32,7 +32,7 @@ class PersonalInfo(Base):
     face_recognition_data_url = Column(String)
     
     # Face embedding fields
-    face_embedding = Column(JSON, nullable=True, comment="Vector đặc trưng khuôn mặt được mã hóa dưới dạng JSON")
+    face_embedding = Column(LargeBinary, nullable=True, comment="Vector đặc trưng khuôn mặt dạng nhị phân (header + float32/float16/int8)")
     face_embedding_model = Column(String(50), nullable=True, comment="Tên mô hình được sử dụng để tạo embedding")
     face_embedding_date = Column(DateTime(timezone=True), nullable=True, comment="Thời điểm tạo embedding")
     face_embedding_source = Column(String(20), nullable=True, comment="Nguồn ảnh (id_card, candidate_card, direct_face)")
@@ -43,5 +43,11 @@ class PersonalInfo(Base):
     # Relationship to Candidate
     candidate = relationship("Candidate", back_populates="personal_info")
     
+    __table_args__ = (
+        # Substring search on ID numbers (pg_trgm)
+        Index("ix_personal_info_id_number_trgm", "id_number", postgresql_using="gin",
+              postgresql_ops={"id_number": "gin_trgm_ops"}),
+    )
+    
     def __repr__(self):
         return f"<PersonalInfo(candidate_id='{self.candidate_id}', id_number='{self.id_number}')>" 
\ No newline at end of file
@@ -5,7 +5,7 @@ This module defines the ScoreReview model for tracking requests to review
 and potentially adjust candidate exam scores.
 """
 
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, DECIMAL, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, DECIMAL, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship, validates
 from app.infrastructure.database.connection import Base
@@ -20,6 +20,10 @@ class ScoreReview(Base):
     of the review process.
     """
     __tablename__ = "score_review"
+    __table_args__ = (
+        # Keyset pagination of the newest-first review list
+        Index("ix_score_review_created_at_score_review_id", "created_at", "score_review_id"),
+    )
     
     score_review_id = Column(String(60), primary_key=True, index=True)
     score_id = Column(String(60), ForeignKey("exam_score.exam_score_id"), nullable=False)
@@ -31,7 +35,7 @@ class ScoreReview(Base):
     review_date = Column(Date)
     additional_info = Column(Text)
     score_review_metadata = Column(JSON)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationship
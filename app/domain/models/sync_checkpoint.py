@@ -0,0 +1,29 @@
+"""
+Sync Checkpoint model module.
+
+This module defines the SyncCheckpoint model, which records how far the
+incremental PostgreSQL to Neo4j sync has progressed through each change stream.
+"""
+
+from sqlalchemy import Column, String, DateTime, BigInteger
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.connection import Base
+
+class SyncCheckpoint(Base):
+    """
+    Progress of one incremental sync change stream.
+    
+    Rows changed after (changed_at, last_key) and deletions after
+    last_deletion_id have not been pushed to Neo4j yet.
+    """
+    __tablename__ = "sync_checkpoint"
+    
+    stream = Column(String(100), primary_key=True)
+    changed_at = Column(DateTime(timezone=True), nullable=True)
+    last_key = Column(String(60), nullable=True)
+    last_deletion_id = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<SyncCheckpoint(stream='{self.stream}', changed_at='{self.changed_at}', last_key='{self.last_key}')>"
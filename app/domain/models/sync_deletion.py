@@ -0,0 +1,133 @@
+"""
+Sync Deletion model module.
+
+This module defines the SyncDeletion model. Rows are written by a database
+trigger whenever a synchronized entity is deleted, so the incremental sync
+can remove the matching Neo4j nodes, or whenever a row backing an entity's
+relationships is deleted, so the sync can rebuild those relationships.
+
+The triggers and the change-time indexes read by the incremental sync are
+created by the Alembic migrations, and also attached to the metadata here so
+that a schema built by init_db with create_all has them too.
+"""
+
+from sqlalchemy import Column, String, DateTime, BigInteger, DDL, Index, event
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.connection import Base
+
+class SyncDeletion(Base):
+    """
+    Deleted entity waiting to be removed from Neo4j.
+    
+    Filled by the record_sync_deletion() and record_sync_relationship_deletion()
+    triggers, never by application code. For the latter, entity_type is a
+    relationship stream name such as "candidate.candidate_exam" and entity_id
+    is the entity whose relationships must be rebuilt.
+    """
+    __tablename__ = "sync_deletion"
+    __table_args__ = (
+        Index("ix_sync_deletion_entity_type_deletion_id", "entity_type", "deletion_id"),
+    )
+    
+    deletion_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(String(60), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<SyncDeletion(entity_type='{self.entity_type}', entity_id='{self.entity_id}')>"
+
+
+# (entity type, table, primary key) of every table synchronized as Neo4j nodes
+ENTITY_TABLES = [
+    ("subject", "subject", "subject_id"),
+    ("school", "school", "school_id"),
+    ("major", "major", "major_id"),
+    ("management_unit", "management_unit", "unit_id"),
+    ("exam_location", "exam_location", "location_id"),
+    ("exam_room", "exam_room", "room_id"),
+    ("exam", "exam", "exam_id"),
+    ("candidate", "candidate", "candidate_id"),
+    ("exam_schedule", "exam_schedule", "exam_schedule_id"),
+    ("score", "exam_score", "exam_score_id"),
+    ("score_review", "score_review", "score_review_id"),
+    ("achievement", "achievement", "achievement_id"),
+    ("award", "award", "award_id"),
+    ("certificate", "certificate", "certificate_id"),
+    ("credential", "candidate_credential", "credential_id"),
+    ("degree", "degree", "degree_id"),
+    ("recognition", "recognition", "recognition_id"),
+]
+
+# (table, primary key) of tables whose changes only re-sync relationships
+DEPENDENT_TABLES = [
+    ("personal_info", "candidate_id"),
+    ("education_history", "education_history_id"),
+    ("candidate_exam", "candidate_exam_id"),
+    ("candidate_exam_subject", "candidate_exam_subject_id"),
+    ("exam_subject", "exam_subject_id"),
+    ("exam_location_mapping", "mapping_id"),
+    ("school_major", "school_major_id"),
+]
+
+# (relationship stream, table, SQL giving the owner ID of the deleted row $1)
+RELATIONSHIP_TABLES = [
+    ("candidate.education_history", "education_history", "SELECT ($1).candidate_id"),
+    ("candidate.candidate_exam", "candidate_exam", "SELECT ($1).candidate_id"),
+    (
+        "candidate.candidate_exam_subject", "candidate_exam_subject",
+        "SELECT candidate_id FROM candidate_exam WHERE candidate_exam_id = ($1).candidate_exam_id"
+    ),
+    (
+        "candidate.degree", "degree",
+        "SELECT candidate_id FROM education_history WHERE education_history_id = ($1).education_history_id"
+    ),
+    ("exam.exam_subject", "exam_subject", "SELECT ($1).exam_id"),
+    ("exam.exam_location_mapping", "exam_location_mapping", "SELECT ($1).exam_id"),
+    ("school.school_major", "school_major", "SELECT ($1).school_id"),
+]
+
+SYNC_CAPTURE_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION record_sync_deletion() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO sync_deletion (entity_type, entity_id)
+        VALUES (TG_ARGV[0], to_jsonb(OLD) ->> TG_ARGV[1]);
+        RETURN OLD;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION record_sync_relationship_deletion() RETURNS trigger AS $$
+    DECLARE
+        parent_id text;
+    BEGIN
+        EXECUTE TG_ARGV[1] INTO parent_id USING OLD;
+        IF parent_id IS NOT NULL THEN
+            INSERT INTO sync_deletion (entity_type, entity_id) VALUES (TG_ARGV[0], parent_id);
+        END IF;
+        RETURN OLD;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    *(
+        f"CREATE TRIGGER {table}_sync_deletion AFTER DELETE ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION record_sync_deletion('{entity_type}', '{key_column}')"
+        for entity_type, table, key_column in ENTITY_TABLES
+    ),
+    *(
+        f"CREATE TRIGGER {table}_sync_relationship_deletion AFTER DELETE ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION record_sync_relationship_deletion('{stream}', '{parent_query}')"
+        for stream, table, parent_query in RELATIONSHIP_TABLES
+    ),
+    *(
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_sync_changed_at ON {table} "
+        f"((COALESCE(updated_at, created_at)), {key_column})"
+        for table, key_column in [(table, key_column) for _, table, key_column in ENTITY_TABLES] + DEPENDENT_TABLES
+    ),
+]
+
+# Runs once create_all has built every table the triggers reference
+for statement in SYNC_CAPTURE_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))
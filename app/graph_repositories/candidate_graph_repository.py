@@ -137,6 +137,31 @@ class CandidateGraphRepository:
             print(f"Error deleting candidate from Neo4j: {e}")
             return False
     
+    async def delete_relationships(self, candidate_id, relationship_types):
+        """
+        Delete a candidate's outgoing relationships of the given types.
+        
+        Args:
+            candidate_id: ID of the candidate
+            relationship_types: Relationship type names to delete
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        query = """
+        MATCH (c:Candidate {candidate_id: $candidate_id})-[r]->()
+        WHERE type(r) IN $relationship_types
+        DELETE r
+        """
+        params = {"candidate_id": candidate_id, "relationship_types": list(relationship_types)}
+        
+        try:
+            await self.neo4j.execute_query(query, params)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting relationships of candidate {candidate_id}: {e}")
+            return False
+    
     async def add_studies_at_relationship(self, candidate_id, school_id, relationship_data=None):
         """
         Create a STUDIES_AT relationship between a candidate and a school.
@@ -138,6 +138,31 @@ class ExamGraphRepository:
             print(f"Error deleting exam from Neo4j: {e}")
             return False
     
+    async def delete_relationships(self, exam_id, relationship_types):
+        """
+        Delete an exam's outgoing relationships of the given types.
+        
+        Args:
+            exam_id: ID of the exam
+            relationship_types: Relationship type names to delete
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        query = """
+        MATCH (e:Exam {exam_id: $exam_id})-[r]->()
+        WHERE type(r) IN $relationship_types
+        DELETE r
+        """
+        params = {"exam_id": exam_id, "relationship_types": list(relationship_types)}
+        
+        try:
+            await self.neo4j.execute_query(query, params)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting relationships of exam {exam_id}: {e}")
+            return False
+    
     async def add_includes_subject_relationship(self, exam_id, subject_id, relationship_data=None):
         """
         Create a relationship between an exam and a subject.
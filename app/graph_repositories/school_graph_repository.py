@@ -127,6 +127,31 @@ class SchoolGraphRepository:
             logger.error(f"Error deleting school from Neo4j: {e}")
             return False
     
+    async def delete_relationships(self, school_id, relationship_types):
+        """
+        Delete a school's outgoing relationships of the given types.
+        
+        Args:
+            school_id: ID of the school
+            relationship_types: Relationship type names to delete
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        query = """
+        MATCH (s:School {school_id: $school_id})-[r]->()
+        WHERE type(r) IN $relationship_types
+        DELETE r
+        """
+        params = {"school_id": school_id, "relationship_types": list(relationship_types)}
+        
+        try:
+            await self.neo4j.execute_query(query, params)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting relationships of school {school_id}: {e}")
+            return False
+    
     async def add_offers_major_relationship(self, school_id, major_id, start_year=None):
         """
         Create a relationship between a school and a major.
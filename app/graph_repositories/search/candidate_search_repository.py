@@ -4,14 +4,32 @@ Candidate Search Repository Module.
 Module này cung cấp các truy vấn tìm kiếm thí sinh trong Neo4j graph database.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import date
 
+from app.config import settings
 from app.domain.graph_models.candidate_node import CandidateNode
+from app.infrastructure.cache.redis_connection import redis_cache
+from app.infrastructure.ontology.initialization import CANDIDATE_FULLTEXT_INDEX
+from app.utilities.search_text import FULLTEXT_STOP_WORDS, escape_lucene, name_tokens, search_terms
 
 logger = logging.getLogger(__name__)
 
+COUNT_KEY_PREFIX = "candidate_search_count"
+
+# Tiêu chí tìm kiếm văn bản và các thuộc tính được đánh chỉ mục full-text tương ứng
+FULLTEXT_CRITERIA = {
+    "full_name": ["full_name"],
+    "id_number": ["id_number"],
+    "phone_number": ["phone_number"],
+    "email": ["email"],
+    "address": ["address", "primary_address", "secondary_address"]
+}
+
 class CandidateSearchRepository:
     """Repository for searching candidate information in Neo4j."""
     
@@ -24,6 +42,11 @@ class CandidateSearchRepository:
         """
         Tìm kiếm thí sinh theo nhiều tiêu chí.
         
+        Các tiêu chí văn bản (họ tên, số căn cước, số điện thoại, email, địa chỉ) được
+        tìm qua chỉ mục full-text, không phân biệt hoa thường và dấu tiếng Việt; kết quả
+        được sắp xếp theo điểm phù hợp của chỉ mục. Khi không có tiêu chí văn bản nào,
+        truy vấn duyệt các node Candidate như trước.
+        
         Args:
             search_criteria: Dictionary chứa các tiêu chí tìm kiếm
             page: Số trang
@@ -31,6 +54,9 @@ class CandidateSearchRepository:
             
         Returns:
             Tuple gồm danh sách thí sinh và tổng số kết quả
+            
+        Raises:
+            Exception: Khi truy vấn Neo4j thất bại
         """
         try:
             # Tính toán skip dựa trên page và page_size
@@ -39,52 +65,44 @@ class CandidateSearchRepository:
             # Lấy tham số case_sensitive, mặc định là False
             case_sensitive = search_criteria.get("case_sensitive", False)
             
-            # Xây dựng truy vấn Cypher
-            query = """
+            fulltext_query = self._build_fulltext_query(search_criteria)
+            if fulltext_query:
+                # Lấy các node khớp từ chỉ mục full-text cùng điểm phù hợp
+                source = """
+            CALL db.index.fulltext.queryNodes($index_name, $fulltext_query) YIELD node AS c, score
+            WHERE c:OntologyInstance
+            """
+            else:
+                source = """
             MATCH (c:Candidate:OntologyInstance)
-            WHERE 
+            WITH c, 0.0 AS score
+            WHERE true
+            """
+            
+            # Phần truy vấn chung của truy vấn trang kết quả và truy vấn đếm
+            match_query = source + """
               // Tìm kiếm gần đúng mã thí sinh
-              ($candidate_id IS NULL OR 
-               CASE WHEN $case_sensitive 
-                    THEN c.candidate_id CONTAINS $candidate_id
-                    ELSE toLower(c.candidate_id) CONTAINS toLower($candidate_id)
-               END)
-              // Tìm kiếm gần đúng số căn cước
-              AND ($id_number IS NULL OR 
-                   CASE WHEN $case_sensitive 
-                        THEN c.id_number CONTAINS $id_number
-                        ELSE toLower(c.id_number) CONTAINS toLower($id_number)
-                   END)
-              // Tìm kiếm gần đúng họ tên
-              AND ($full_name IS NULL OR 
+              AND ($candidate_id IS NULL OR 
                    CASE WHEN $case_sensitive 
-                        THEN c.full_name CONTAINS $full_name
-                        ELSE toLower(c.full_name) CONTAINS toLower($full_name)
+                        THEN c.candidate_id CONTAINS $candidate_id
+                        ELSE toLower(c.candidate_id) CONTAINS toLower($candidate_id)
                    END)
               AND ($birth_date IS NULL OR c.birth_date = $birth_date)
-              // Tìm kiếm gần đúng số điện thoại
-              AND ($phone_number IS NULL OR 
-                   CASE WHEN $case_sensitive 
-                        THEN c.phone_number CONTAINS $phone_number
-                        ELSE toLower(c.phone_number) CONTAINS toLower($phone_number)
-                   END)
-              // Tìm kiếm gần đúng email
-              AND ($email IS NULL OR 
-                   CASE WHEN $case_sensitive 
-                        THEN c.email CONTAINS $email
-                        ELSE toLower(c.email) CONTAINS toLower($email)
-                   END)
-              // Tìm kiếm gần đúng địa chỉ
-              AND ($address IS NULL OR 
-                   CASE WHEN $case_sensitive THEN
-                        (c.address CONTAINS $address OR 
-                         c.primary_address CONTAINS $address OR 
-                         c.secondary_address CONTAINS $address)
-                   ELSE
-                        (toLower(c.address) CONTAINS toLower($address) OR 
-                         toLower(c.primary_address) CONTAINS toLower($address) OR 
-                         toLower(c.secondary_address) CONTAINS toLower($address))
-                   END)
+              // Các phần tên trùng stop word (như "An", "Tô") không có trong chỉ mục
+              // full-text, nên được so với các phần tên đã chuẩn hóa của node
+              AND all(term IN $name_stop_terms WHERE term IN c.search_tokens)
+              // Chỉ mục full-text không phân biệt hoa thường, nên khi cần phân biệt
+              // thì lọc thêm trên các node đã khớp
+              AND (NOT $case_sensitive OR (
+                   ($id_number IS NULL OR c.id_number CONTAINS $id_number)
+                   AND ($full_name IS NULL OR c.full_name CONTAINS $full_name)
+                   AND ($phone_number IS NULL OR c.phone_number CONTAINS $phone_number)
+                   AND ($email IS NULL OR c.email CONTAINS $email)
+                   AND ($address IS NULL OR 
+                        c.address CONTAINS $address OR 
+                        c.primary_address CONTAINS $address OR 
+                        c.secondary_address CONTAINS $address)
+              ))
             
             // Tìm theo mã số trong kỳ thi
             OPTIONAL MATCH (c)-[r:ATTENDS_EXAM]->(e:Exam)
@@ -108,27 +126,31 @@ class CandidateSearchRepository:
                        ELSE toLower(s.school_id) CONTAINS toLower($school_id)
                   END
               
-            WITH c, COUNT(DISTINCT e) as exam_count, COUNT(DISTINCT s) as school_count
+            WITH c, score, COUNT(DISTINCT e) as exam_count, COUNT(DISTINCT s) as school_count
             WHERE 
               (($registration_number IS NULL AND $exam_id IS NULL) OR exam_count > 0)
               AND ($school_id IS NULL OR school_count > 0)
+            """
             
-            WITH c, count(*) as total
-            // Sắp xếp theo độ phù hợp và tên
-            ORDER BY 
-              CASE 
-                WHEN $candidate_id IS NOT NULL AND c.candidate_id CONTAINS $candidate_id THEN 0
-                WHEN $id_number IS NOT NULL AND c.id_number CONTAINS $id_number THEN 1
-                WHEN $full_name IS NOT NULL AND toLower(c.full_name) CONTAINS toLower($full_name) THEN 2
-                ELSE 3 
-              END,
-              c.full_name
+            # Sắp xếp theo điểm phù hợp của chỉ mục full-text, rồi theo tên; ORDER BY
+            # đi kèm LIMIT nên Neo4j chỉ giữ top-k dòng thay vì sắp xếp toàn bộ
+            page_query = match_query + """
+            RETURN c
+            ORDER BY score DESC, c.search_name
             SKIP $skip LIMIT $limit
-            RETURN c, total
+            """
+            count_query = match_query + """
+            RETURN count(c) as total
             """
             
             # Tham số truy vấn
             params = {
+                "index_name": CANDIDATE_FULLTEXT_INDEX,
+                "fulltext_query": fulltext_query,
+                "name_stop_terms": [
+                    term for term in name_tokens(search_criteria.get("full_name"))
+                    if term in FULLTEXT_STOP_WORDS
+                ],
                 "candidate_id": search_criteria.get("candidate_id"),
                 "id_number": search_criteria.get("id_number"),
                 "full_name": search_criteria.get("full_name"),
@@ -144,29 +166,149 @@ class CandidateSearchRepository:
                 "limit": page_size
             }
             
-            # Thực thi truy vấn
-            result = await self.neo4j.execute_query(query, params)
-            
-            candidates = []
-            total = 0
-            
-            # Xử lý kết quả
-            if result and len(result) > 0:
-                for record in result:
-                    candidate_node = record[0]
-                    if not total and len(record) > 1:
-                        total = record[1]
-                    
-                    # Chuyển đổi Node thành dictionary
-                    candidate_dict = dict(candidate_node.items())
-                    candidates.append(candidate_dict)
+            # Tổng số được đọc từ cache theo tiêu chí đã chuẩn hóa; nếu chưa có thì
+            # truy vấn đếm chạy song song với truy vấn trang kết quả
+            count_params = {key: value for key, value in params.items() if key not in ("skip", "limit")}
+            cache_key = self._count_cache_key(count_params)
+            total = await self._get_cached_count(cache_key)
+            if total is None:
+                result, count_result = await asyncio.gather(
+                    self.neo4j.execute_query(page_query, params),
+                    self.neo4j.execute_query(count_query, count_params)
+                )
+                total = count_result[0][0] if count_result else 0
+                await self._set_cached_count(cache_key, total)
+            else:
+                result = await self.neo4j.execute_query(page_query, params)
+            
+            # Chuyển đổi Node thành dictionary
+            candidates = [dict(record[0].items()) for record in result or []]
             
             return candidates, total
             
         except Exception as e:
             self.logger.error(f"Error searching candidates: {str(e)}", exc_info=True)
+            # Lỗi được ném lại để service có thể tìm dự phòng trong PostgreSQL
+            raise
+    
+    async def find_candidates_exact(self, identifiers: Dict[str, str], page: int = 1, page_size: int = 10) -> Tuple[List[Dict], int]:
+        """
+        Tìm thí sinh theo giá trị chính xác của các mã định danh.
+        
+        Truy vấn bắt đầu bằng một lần tìm trên chỉ mục (ràng buộc duy nhất của
+        candidate_id, chỉ mục của id_number hoặc chỉ mục quan hệ của
+        ATTENDS_EXAM.registration_number), rồi kiểm tra các mã còn lại trên
+        các node tìm được.
+        
+        Args:
+            identifiers: Dictionary gồm candidate_id, id_number, registration_number
+                         và exam_id (chỉ dùng cùng registration_number)
+            page: Số trang
+            page_size: Kích thước trang
+            
+        Returns:
+            Tuple gồm danh sách thí sinh và tổng số kết quả
+        """
+        try:
+            if identifiers.get("candidate_id"):
+                source = "MATCH (c:Candidate) WHERE c.candidate_id = $candidate_id"
+            elif identifiers.get("id_number"):
+                source = "MATCH (c:Candidate) WHERE c.id_number = $id_number"
+            else:
+                source = """
+            MATCH (c:Candidate)-[r:ATTENDS_EXAM]->(e:Exam)
+            WHERE r.registration_number = $registration_number
+            WITH DISTINCT c
+            WHERE true
+            """
+            
+            query = source + """
+              AND c:OntologyInstance
+              AND ($candidate_id IS NULL OR c.candidate_id = $candidate_id)
+              AND ($id_number IS NULL OR c.id_number = $id_number)
+              AND ($registration_number IS NULL OR EXISTS {
+                   MATCH (c)-[r:ATTENDS_EXAM]->(e:Exam)
+                   WHERE r.registration_number = $registration_number
+                     AND ($exam_id IS NULL OR e.exam_id = $exam_id)
+              })
+            WITH c ORDER BY c.search_name
+            // Luôn trả về một dòng để biết tổng số kể cả khi trang yêu cầu trống
+            WITH collect(c) as matches
+            RETURN matches[$skip..($skip + $limit)] as page, size(matches) as total
+            """
+            
+            params = {
+                "candidate_id": identifiers.get("candidate_id"),
+                "id_number": identifiers.get("id_number"),
+                "registration_number": identifiers.get("registration_number"),
+                "exam_id": identifiers.get("exam_id"),
+                "skip": (page - 1) * page_size,
+                "limit": page_size
+            }
+            
+            result = await self.neo4j.execute_query(query, params)
+            
+            if not result:
+                return [], 0
+            
+            page_nodes, total = result[0][0], result[0][1]
+            return [dict(node.items()) for node in page_nodes], total
+            
+        except Exception as e:
+            self.logger.error(f"Error finding candidates by identifiers: {str(e)}", exc_info=True)
             return [], 0
     
+    @staticmethod
+    def _count_cache_key(count_params: Dict[str, Any]) -> str:
+        """Tạo khóa cache của tổng số kết quả từ các tham số truy vấn đếm đã chuẩn hóa."""
+        normalized = dict(count_params)
+        if not normalized.get("case_sensitive"):
+            # Khi không phân biệt hoa thường, tiêu chí văn bản chỉ có tác dụng qua
+            # truy vấn full-text (đã được chuẩn hóa), còn các mã được so sánh bằng toLower
+            for criterion in FULLTEXT_CRITERIA:
+                normalized.pop(criterion, None)
+            normalized = {key: value.lower() if isinstance(value, str) else value for key, value in normalized.items()}
+        signature = hashlib.sha1(json.dumps(normalized, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return f"{COUNT_KEY_PREFIX}:{signature}"
+    
+    async def _get_cached_count(self, cache_key: str) -> Optional[int]:
+        """Đọc tổng số kết quả đã cache, hoặc None nếu chưa có hay cache bị tắt."""
+        if settings.CANDIDATE_SEARCH_COUNT_CACHE_TTL_SECONDS <= 0:
+            return None
+        cached = await redis_cache.get(cache_key)
+        if isinstance(cached, dict) and "total" in cached:
+            return cached["total"]
+        return None
+    
+    async def _set_cached_count(self, cache_key: str, total: int) -> None:
+        """Lưu tổng số kết quả vào cache."""
+        if settings.CANDIDATE_SEARCH_COUNT_CACHE_TTL_SECONDS > 0:
+            await redis_cache.set(cache_key, {"total": total}, ex=settings.CANDIDATE_SEARCH_COUNT_CACHE_TTL_SECONDS)
+    
+    @staticmethod
+    def _build_fulltext_query(search_criteria: Dict[str, Any]) -> Optional[str]:
+        """
+        Xây dựng truy vấn Lucene cho chỉ mục full-text từ các tiêu chí văn bản.
+        
+        Mỗi từ phải khớp, nguyên từ (được ưu tiên điểm cao hơn) hoặc theo tiền tố;
+        các tiêu chí khác nhau đều phải khớp. Các stop word bị bỏ qua vì chỉ mục
+        không lưu chúng; với họ tên, chúng được kiểm tra riêng trên search_tokens.
+        
+        Args:
+            search_criteria: Dictionary chứa các tiêu chí tìm kiếm
+            
+        Returns:
+            Truy vấn Lucene, hoặc None nếu không có tiêu chí văn bản nào
+        """
+        clauses = []
+        for criterion, fields in FULLTEXT_CRITERIA.items():
+            terms = [escape_lucene(term) for term in search_terms(search_criteria.get(criterion))]
+            if not terms:
+                continue
+            terms_query = " AND ".join(f"({term}^2 OR {term}*)" for term in terms)
+            clauses.append("(" + " OR ".join(f"{field}:({terms_query})" for field in fields) + ")")
+        return " AND ".join(clauses) or None
+    
     async def get_candidate_education_info(self, candidate_id: str) -> Dict[str, List]:
         """
         Lấy thông tin học vấn của thí sinh, bao gồm trường học, ngành học, và bằng cấp.
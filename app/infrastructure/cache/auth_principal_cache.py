@@ -0,0 +1,142 @@
+"""
+Authentication principal cache module.
+
+This module caches what the admin authentication middleware needs to know about
+the holder of a token, so that authenticated requests do not query the database:
+- Principals (active flag, role and permissions) keyed by token ID with a short TTL
+- The token blacklist check, fetched in the same Redis round trip
+- Invalidation by user, by role, or of every cached principal
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from app.infrastructure.cache.redis_connection import RedisCache, redis_cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "auth_principal"
+
+
+class AuthPrincipalCache:
+    """
+    Redis cache of authenticated admin principals.
+
+    Each cached principal is also recorded in per-user and per-role index sets so
+    that changing a user, role or permission can drop every affected token.
+    """
+
+    def __init__(self, cache: RedisCache, ttl_seconds: int):
+        """
+        Initialize the cache.
+
+        Args:
+            cache: Redis cache handler
+            ttl_seconds: Lifetime of cached principals, or 0 to disable caching
+        """
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def token_id(token: str, payload: Dict[str, Any]) -> str:
+        """
+        Identify a token by its "jti" claim, or by a hash for tokens issued without one.
+
+        Args:
+            token: Encoded JWT
+            payload: Decoded JWT payload
+
+        Returns:
+            str: Token ID
+        """
+        return payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+
+    async def lookup(self, token: str, token_id: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Check the blacklist and fetch the cached principal in one round trip.
+
+        Args:
+            token: Encoded JWT
+            token_id: Token ID from `token_id`
+
+        Returns:
+            Tuple of (whether the token is blacklisted, cached principal or None)
+        """
+        keys = [f"blacklist:{token}"]
+        if self.ttl_seconds > 0:
+            keys.append(self._key(token_id))
+        values = await self.cache.get_many(*keys)
+        principal = values[1] if len(values) > 1 and isinstance(values[1], dict) else None
+        return values[0] is not None, principal
+
+    async def store(self, token_id: str, principal: Dict[str, Any]) -> None:
+        """
+        Cache a principal loaded from the database.
+
+        Args:
+            token_id: Token ID from `token_id`
+            principal: Dict with user_id, is_active, role, role_id and permissions
+        """
+        if self.ttl_seconds <= 0:
+            return
+        key = self._key(token_id)
+        await self.cache.set(key, principal, ex=self.ttl_seconds)
+        # Index sets outlive their members slightly so invalidation never misses one
+        await self.cache.add_to_set(self._user_index(principal["user_id"]), key, ex=self.ttl_seconds * 2)
+        if principal.get("role_id"):
+            await self.cache.add_to_set(self._role_index(principal["role_id"]), key, ex=self.ttl_seconds * 2)
+
+    async def invalidate_user(self, user_id: str) -> None:
+        """
+        Drop the cached principals of every token held by a user.
+
+        Call after a user is deactivated, deleted or has its role changed.
+
+        Args:
+            user_id: User ID
+        """
+        await self._invalidate_index(self._user_index(user_id))
+
+    async def invalidate_role(self, role_id: str) -> None:
+        """
+        Drop the cached principals of every user holding a role.
+
+        Call after the permissions granted to a role change.
+
+        Args:
+            role_id: Role ID
+        """
+        await self._invalidate_index(self._role_index(role_id))
+
+    async def clear(self) -> int:
+        """
+        Drop every cached principal, e.g. after permissions are reseeded.
+
+        Returns:
+            int: Number of keys deleted
+        """
+        return await self.cache.delete_pattern(f"{KEY_PREFIX}:*")
+
+    async def _invalidate_index(self, index_key: str) -> None:
+        """Delete the principals listed in an index set and the set itself."""
+        keys = await self.cache.get_set(index_key)
+        await self.cache.delete(*keys, index_key)
+        logger.info(f"Invalidated {len(keys)} cached principals for {index_key}")
+
+    @staticmethod
+    def _key(token_id: str) -> str:
+        return f"{KEY_PREFIX}:token:{token_id}"
+
+    @staticmethod
+    def _user_index(user_id: str) -> str:
+        return f"{KEY_PREFIX}:user:{user_id}"
+
+    @staticmethod
+    def _role_index(role_id: str) -> str:
+        return f"{KEY_PREFIX}:role:{role_id}"
+
+
+# Process-wide principal cache
+auth_principal_cache = AuthPrincipalCache(redis_cache, settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
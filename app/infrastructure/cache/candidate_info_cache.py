@@ -0,0 +1,188 @@
+"""
+Candidate info cache module.
+
+This module provides a Redis read-through cache for the candidate detail
+sections served by the search API, including:
+- One cache entry per candidate and section (basic, education, exams, achievements)
+- Single-flight loading within a worker and a short Redis lock across workers,
+  so a burst of requests for the same candidate triggers one Neo4j load
+- Invalidation hooks used by the sync services
+"""
+
+import asyncio
+import logging
+import random
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from app.config import settings
+from app.infrastructure.cache.redis_connection import RedisCache, redis_cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "candidate_info"
+
+# Sections of CandidateDetailedInfo that are cached independently
+SECTIONS = ("basic", "education", "exams", "achievements")
+
+# Sections derived from a candidate's relationships rather than its node
+RELATIONSHIP_SECTIONS = ("education", "exams", "achievements")
+
+
+class CandidateInfoCache:
+    """
+    Read-through cache of candidate detail sections.
+
+    Values are JSON-compatible dicts (or None for a missing candidate) wrapped in
+    an envelope so that cached misses can be told apart from absent keys. When
+    Redis is unavailable every call falls through to the loader.
+    """
+
+    def __init__(self, cache: RedisCache, ttl_seconds: int, miss_ttl_seconds: int,
+                 lock_seconds: int, wait_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            cache: Redis cache handler
+            ttl_seconds: Lifetime of cached sections, or 0 to disable caching
+            miss_ttl_seconds: Lifetime of cached "not found" results
+            lock_seconds: Lifetime of the cross-worker loading lock
+            wait_seconds: How long to wait for another worker's load before loading directly
+        """
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.miss_ttl_seconds = miss_ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.wait_seconds = wait_seconds
+        # Loads in progress in this worker, by cache key
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled."""
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def key(candidate_id: str, section: str) -> str:
+        """Cache key of one section of a candidate."""
+        return f"{KEY_PREFIX}:{candidate_id}:{section}"
+
+    async def get_or_load(self, candidate_id: str, section: str,
+                          loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """
+        Return a cached section, loading and caching it on a miss.
+
+        Concurrent callers for the same key in this worker share one load.
+
+        Args:
+            candidate_id: Candidate ID
+            section: One of SECTIONS
+            loader: Coroutine function returning the section as a JSON-compatible dict, or None
+
+        Returns:
+            The section data, or None if the candidate does not exist
+        """
+        if not self.enabled:
+            return await loader()
+
+        key = self.key(candidate_id, section)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._read_through(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the load other callers are waiting on
+        return await asyncio.shield(task)
+
+    async def invalidate(self, candidate_id: str, sections: Iterable[str] = SECTIONS) -> None:
+        """
+        Drop cached sections of a candidate.
+
+        Args:
+            candidate_id: Candidate ID
+            sections: Sections to drop, all of them by default
+        """
+        if not self.enabled or not candidate_id:
+            return
+        await self.cache.delete(*(self.key(candidate_id, section) for section in sections))
+
+    async def invalidate_relationships(self, candidate_id: str) -> None:
+        """
+        Drop the sections of a candidate that are built from its relationships.
+
+        Args:
+            candidate_id: Candidate ID
+        """
+        await self.invalidate(candidate_id, RELATIONSHIP_SECTIONS)
+
+    async def clear(self) -> int:
+        """
+        Drop every cached section, e.g. after a bulk sync.
+
+        Returns:
+            Number of keys deleted
+        """
+        if not self.enabled:
+            return 0
+        deleted = await self.cache.delete_pattern(f"{KEY_PREFIX}:*")
+        logger.info(f"Cleared {deleted} candidate info cache entries")
+        return deleted
+
+    async def _read_through(self, key: str,
+                            loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """Read a key, or load it while holding the cross-worker lock."""
+        cached = await self._get(key)
+        if cached is not None:
+            return cached["value"]
+
+        lock_key = f"{key}:lock"
+        token = f"lock-{uuid.uuid4().hex}"
+        acquired = await self.cache.set_if_absent(lock_key, token, ex=self.lock_seconds)
+        if acquired is None:
+            # Redis is unavailable; serve straight from the source
+            return await loader()
+
+        if not acquired:
+            # Another worker is loading this key; wait briefly for its result
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.wait_seconds
+            delay = 0.02
+            while loop.time() < deadline:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.2)
+                cached = await self._get(key)
+                if cached is not None:
+                    return cached["value"]
+            return await loader()
+
+        try:
+            value = await loader()
+            await self.cache.set(key, {"value": value}, ex=self._ttl(value))
+            return value
+        finally:
+            # Only release the lock if it has not expired and been taken over
+            if await self.cache.get(lock_key) == token:
+                await self.cache.delete(lock_key)
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cache envelope stored under a key, or None."""
+        cached = await self.cache.get(key)
+        if isinstance(cached, dict) and "value" in cached:
+            return cached
+        return None
+
+    def _ttl(self, value: Optional[Dict[str, Any]]) -> int:
+        """Expiry for a value, jittered so entries cached together do not expire together."""
+        ttl = self.ttl_seconds if value is not None else min(self.miss_ttl_seconds, self.ttl_seconds)
+        return max(1, int(ttl * random.uniform(0.9, 1.1)))
+
+
+# Process-wide candidate info cache
+candidate_info_cache = CandidateInfoCache(
+    redis_cache,
+    ttl_seconds=settings.CANDIDATE_INFO_CACHE_TTL_SECONDS,
+    miss_ttl_seconds=settings.CANDIDATE_INFO_CACHE_MISS_TTL_SECONDS,
+    lock_seconds=settings.CANDIDATE_INFO_CACHE_LOCK_SECONDS,
+    wait_seconds=settings.CANDIDATE_INFO_CACHE_WAIT_SECONDS
+)
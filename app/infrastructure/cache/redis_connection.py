@@ -4,6 +4,7 @@ Redis cache connection module.
 This module provides connection handling for Redis cache, including:
 - Connection setup and configuration
 - Cache operations (get, set, delete)
+- Atomic server-side Lua scripts
 - JSON serialization/deserialization for complex data types
 - FastAPI dependency for Redis cache injection
 """
@@ -28,6 +29,7 @@ class RedisCache:
         self._port = settings.REDIS_PORT
         self._db = settings.REDIS_DB
         self._password = settings.REDIS_PASSWORD
+        self._scripts = {}
 
     async def connect(self):
         """
@@ -127,25 +129,163 @@ class RedisCache:
             logging.error(f"Error setting data to Redis: {e}")
             return False
 
-    async def delete(self, key):
+    async def get_many(self, *keys):
+        """
+        Retrieve several keys in one round trip.
+        
+        Args:
+            *keys (str): The cache keys to retrieve
+            
+        Returns:
+            list: The cached data for each key (JSON deserialized where possible),
+                  with None for missing keys; all None if Redis is unavailable
+        """
+        try:
+            values = await self._client.mget(keys)
+        except Exception as e:
+            logging.error(f"Error getting data from Redis: {e}")
+            return [None] * len(keys)
+        results = []
+        for data in values:
+            try:
+                results.append(json.loads(data) if data else None)
+            except json.JSONDecodeError:
+                results.append(data)
+        return results
+
+    async def add_to_set(self, key, *members, ex=None):
+        """
+        Add members to a set, optionally refreshing its expiry.
+        
+        Args:
+            key (str): The set key
+            *members (str): Members to add
+            ex (int, optional): Expiration time in seconds. Defaults to None.
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.sadd(key, *members)
+                if ex is not None:
+                    pipe.expire(key, ex)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logging.error(f"Error adding to set in Redis: {e}")
+            return False
+
+    async def get_set(self, key):
+        """
+        Retrieve the members of a set.
+        
+        Args:
+            key (str): The set key
+            
+        Returns:
+            set: The members, or an empty set if missing or Redis is unavailable
+        """
+        try:
+            return await self._client.smembers(key)
+        except Exception as e:
+            logging.error(f"Error getting set from Redis: {e}")
+            return set()
+
+    async def set_if_absent(self, key, value, ex=None):
+        """
+        Store data only if the key does not exist yet.
+        
+        Useful as a lightweight lock shared by all workers.
+        
+        Args:
+            key (str): The cache key to store under
+            value (Any): The data to cache
+            ex (int, optional): Expiration time in seconds. Defaults to None.
+            
+        Returns:
+            bool: True if stored, False if the key already exists, or None if Redis is unavailable
+        """
+        try:
+            if isinstance(value, (dict, list, tuple)):
+                value = json.dumps(value)
+            return bool(await self._client.set(key, value, ex=ex, nx=True))
+        except Exception as e:
+            logging.error(f"Error setting data to Redis: {e}")
+            return None
+
+    async def delete(self, *keys):
         """
         Delete data from cache.
         
-        Removes data with the specified key from Redis.
+        Removes data with the specified keys from Redis.
         
         Args:
-            key (str): The cache key to delete
+            *keys (str): The cache keys to delete
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            await self._client.delete(key)
+            if keys:
+                await self._client.delete(*keys)
             return True
         except Exception as e:
             logging.error(f"Error deleting key from Redis: {e}")
             return False
 
+    async def delete_pattern(self, pattern):
+        """
+        Delete all keys matching a glob-style pattern.
+        
+        Keys are found with SCAN, so the server is not blocked on large keyspaces.
+        
+        Args:
+            pattern (str): Pattern such as "prefix:*"
+            
+        Returns:
+            int: Number of keys deleted
+        """
+        try:
+            deleted = 0
+            batch = []
+            async for key in self._client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= 1000:
+                    deleted += await self._client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self._client.unlink(*batch)
+            return deleted
+        except Exception as e:
+            logging.error(f"Error deleting keys from Redis: {e}")
+            return 0
+
+    async def run_script(self, script, keys, args):
+        """
+        Run a Lua script atomically on the server.
+        
+        Scripts are registered once per connection and then invoked by SHA,
+        falling back to sending the source if the server has not seen it.
+        
+        Args:
+            script (str): Lua source
+            keys (list): Keys the script accesses
+            args (list): Additional script arguments
+            
+        Returns:
+            Any: The script result, or None if Redis is unavailable
+        """
+        try:
+            registered = self._scripts.get(script)
+            if registered is None or registered.registered_client is not self._client:
+                registered = self._client.register_script(script)
+                self._scripts[script] = registered
+            return await registered(keys=keys, args=args)
+        except Exception as e:
+            logging.error(f"Error running script in Redis: {e}")
+            return None
+
     async def exists(self, key):
         """
         Check if a key exists in the cache.
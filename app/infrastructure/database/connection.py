@@ -11,7 +11,7 @@ This module provides the SQLAlchemy connection setup for PostgreSQL, including:
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import text, inspect
+from sqlalchemy import DDL, event, text, inspect
 from app.config import settings
 import logging
 import asyncio
@@ -41,6 +41,14 @@ async_session = sessionmaker(
 # Create base model class for SQLAlchemy models
 Base = declarative_base()
 
+# Extensions the model indexes depend on (gin_trgm_ops), created before the
+# tables when init_db builds a fresh schema with create_all
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
 async def check_database_exists():
     """
     Check if the target database exists, and create it if it doesn't.
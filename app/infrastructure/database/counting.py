@@ -0,0 +1,158 @@
+"""
+Total-count strategies for paginated list queries.
+
+Counting the rows matched by a list query costs about as much as reading them
+all, and list endpoints did it on every page request. This module lets each
+request choose how its total is obtained:
+- exact: count the rows of the same filtered query that is paginated
+- estimate: read the planner's row estimate (pg_class.reltuples) of the table
+  for unfiltered listings; filtered listings fall back to a cached count
+- cached: exact counts cached in Redis per table and filter signature for a
+  short time, so paging through one result set counts it once
+"""
+
+import hashlib
+import json
+import logging
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.infrastructure.cache.redis_connection import RedisCache, redis_cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "list_count"
+
+
+class CountStrategy(str, Enum):
+    """How the total of a list query is computed."""
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    CACHED = "cached"
+
+
+class ListCounter:
+    """
+    Computes list totals with a per-request strategy.
+    
+    When Redis is unavailable, cached counts are computed exactly on every
+    request instead.
+    """
+    
+    def __init__(self, cache: RedisCache, ttl_seconds: int, default_strategy: str):
+        """
+        Initialize the counter.
+        
+        Args:
+            cache: Redis cache handler
+            ttl_seconds: Lifetime of cached counts
+            default_strategy: Strategy used when a request does not choose one
+        """
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        try:
+            self.default_strategy = CountStrategy(default_strategy)
+        except ValueError:
+            logger.warning(f"Unknown list count strategy {default_strategy!r}, counting exactly")
+            self.default_strategy = CountStrategy.EXACT
+    
+    async def count(
+        self,
+        db: AsyncSession,
+        statement: Select,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        strategy: Optional[CountStrategy] = None
+    ) -> int:
+        """
+        Return the total number of rows matched by a list query.
+        
+        Args:
+            db: Database session
+            statement: The filtered list query, before ORDER BY and pagination
+            table: Main table of the query, for estimates and cache keys
+            filters: Active filters; empty or None for an unfiltered listing
+            strategy: Strategy to use, the default strategy if None
+        
+        Returns:
+            Exact or estimated number of rows
+        """
+        strategy = CountStrategy(strategy or self.default_strategy)
+        active = {key: value for key, value in (filters or {}).items() if value not in (None, "", [])}
+        
+        if strategy == CountStrategy.ESTIMATE:
+            if not active:
+                estimate = await self.estimate_table(db, table)
+                if estimate is not None:
+                    return estimate
+                return await self.count_exact(db, statement)
+            strategy = CountStrategy.CACHED
+        
+        if strategy == CountStrategy.CACHED and self.ttl_seconds > 0:
+            return await self._count_cached(db, statement, table, active)
+        return await self.count_exact(db, statement)
+    
+    @staticmethod
+    async def count_exact(db: AsyncSession, statement: Select) -> int:
+        """
+        Count the rows of a query.
+        
+        Args:
+            db: Database session
+            statement: Query to count
+        
+        Returns:
+            Number of rows
+        """
+        count_query = select(func.count()).select_from(statement.order_by(None).subquery())
+        return await db.scalar(count_query) or 0
+    
+    @staticmethod
+    async def estimate_table(db: AsyncSession, table: str) -> Optional[int]:
+        """
+        Read the planner's row estimate of a table.
+        
+        The estimate is refreshed by VACUUM, ANALYZE and autovacuum, so it
+        trails recent writes.
+        
+        Args:
+            db: Database session
+            table: Table name
+        
+        Returns:
+            Estimated number of rows, or None if the table was never analyzed
+        """
+        result = await db.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table}
+        )
+        reltuples = result.scalar()
+        # -1 (PostgreSQL 14+) means never analyzed; 0 is left to an exact count,
+        # which is cheap if the table really is empty
+        if reltuples is None or reltuples <= 0:
+            return None
+        return int(reltuples)
+    
+    async def _count_cached(self, db: AsyncSession, statement: Select, table: str, filters: Dict[str, Any]) -> int:
+        """Return a cached count for a filter signature, counting on a miss."""
+        signature = hashlib.sha1(json.dumps(filters, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        key = f"{KEY_PREFIX}:{table}:{signature}"
+        cached = await self.cache.get(key)
+        if isinstance(cached, dict) and "total" in cached:
+            return cached["total"]
+        
+        total = await self.count_exact(db, statement)
+        await self.cache.set(key, {"total": total}, ex=self.ttl_seconds)
+        return total
+
+
+# Process-wide list counter
+list_counter = ListCounter(
+    redis_cache,
+    ttl_seconds=settings.LIST_COUNT_CACHE_TTL_SECONDS,
+    default_strategy=settings.LIST_COUNT_STRATEGY
+)
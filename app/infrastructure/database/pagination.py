@@ -0,0 +1,140 @@
+"""
+Keyset pagination helpers for list endpoints.
+
+OFFSET pagination reads and discards every row before the requested page, so
+deep pages get slower as the table grows. Keyset pagination instead orders a
+query on an indexed, unique key and resumes after the last key of the previous
+page, which costs the same at any depth. The position is handed to clients as
+an opaque cursor string.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Select, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the key values of the last item of a page as an opaque cursor.
+    
+    Args:
+        values: Key values, in the order of the key columns
+    
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values],
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string
+        size: Expected number of key values
+    
+    Returns:
+        List of key values
+    
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return values
+
+
+def apply_cursor(
+    statement: Select,
+    key_columns: Sequence[Any],
+    cursor: Optional[str] = None,
+    descending: bool = False
+) -> Select:
+    """
+    Order a statement by its keyset and, given a cursor, start after it.
+    
+    The key columns must together be unique, e.g. end with the primary key,
+    and should be covered by an index in the same order.
+    
+    Args:
+        statement: Select to paginate, without ORDER BY
+        key_columns: Columns making up the key, most significant first
+        cursor: Cursor of the previous page, or None for the first page
+        descending: Whether to list items from the highest key down
+    
+    Returns:
+        The ordered, and possibly filtered, statement
+    
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if cursor:
+        values = [
+            _to_column_value(column, value)
+            for column, value in zip(key_columns, decode_cursor(cursor, len(key_columns)))
+        ]
+        if len(key_columns) == 1:
+            key, value = key_columns[0], values[0]
+        else:
+            # A row comparison, which PostgreSQL can answer from a composite index
+            key, value = tuple_(*key_columns), tuple_(*values)
+        statement = statement.where(key < value if descending else key > value)
+    return statement.order_by(*[column.desc() if descending else column.asc() for column in key_columns])
+
+
+def next_cursor(items: Sequence[Any], limit: int, keys: Sequence[str]) -> Optional[str]:
+    """
+    Build the cursor of the page following a list of items.
+    
+    A page shorter than the limit is the last one. A full page may be followed
+    by an empty one when the total is a multiple of the limit.
+    
+    Args:
+        items: Items of the current page, as objects or dictionaries
+        limit: Requested page size
+        keys: Names of the key fields, in the order of the key columns
+    
+    Returns:
+        Cursor of the next page, or None if there is none
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    if isinstance(last, dict):
+        return encode_cursor([last.get(key) for key in keys])
+    return encode_cursor([getattr(last, key, None) for key in keys])
+
+
+def _to_column_value(column: Any, value: Any) -> Any:
+    """Convert a decoded cursor value back to the column's Python type."""
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+    except ValueError as e:
+        raise InvalidCursorError(f"Invalid cursor value: {value}") from e
+    return value
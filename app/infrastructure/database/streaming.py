@@ -0,0 +1,87 @@
+"""
+Streaming readers for large PostgreSQL result sets.
+
+This module provides async generators that read a query in bounded chunks
+instead of loading it whole or paging it with OFFSET, whose cost grows with
+the offset. Keyset reads page on an indexed, unique key and stay cheap at any
+depth; server-side cursor reads run the query once and fetch rows as they are
+consumed, which suits joins that are expensive to re-plan per page.
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def stream_keyset(
+    db: AsyncSession,
+    statement: Select,
+    key_column: Any,
+    chunk_size: int,
+    limit: Optional[int] = None
+) -> AsyncIterator[List[Any]]:
+    """
+    Read the ORM entities selected by a statement in chunks ordered by a unique key.
+    
+    Each chunk is one query of the form "... WHERE key > :last ORDER BY key
+    LIMIT :chunk_size", so eager-loading options and filters on the statement
+    are kept, and rows inserted behind the cursor are not read twice.
+    
+    Args:
+        db: Database session
+        statement: Select of a single ORM entity, without ORDER BY or LIMIT
+        key_column: Unique, indexed column of the entity, e.g. Candidate.candidate_id
+        chunk_size: Maximum number of entities per chunk
+        limit: Optional maximum number of entities to read in total
+    
+    Yields:
+        Non-empty lists of entities
+    """
+    last_key = None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        page = statement.order_by(key_column).limit(size)
+        if last_key is not None:
+            page = page.where(key_column > last_key)
+        result = await db.execute(page)
+        rows = list(result.scalars().unique().all())
+        if not rows:
+            return
+        yield rows
+        if len(rows) < size:
+            return
+        last_key = getattr(rows[-1], key_column.key)
+        if remaining is not None:
+            remaining -= len(rows)
+
+
+async def stream_partitions(
+    db: AsyncSession,
+    statement: Any,
+    params: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 1000
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Read the rows of a query in chunks through a server-side cursor.
+    
+    The query runs once; rows are fetched from the cursor as chunks are
+    consumed, so memory use is bounded by the chunk size. The session's
+    connection stays busy until the generator is exhausted or closed.
+    
+    Args:
+        db: Database session
+        statement: Query to run, e.g. a text() statement
+        params: Bind parameters
+        chunk_size: Maximum number of rows per chunk
+    
+    Yields:
+        Non-empty lists of rows as dictionaries
+    """
+    result = await db.stream(statement, params or {})
+    try:
+        async for partition in result.mappings().partitions(chunk_size):
+            yield [dict(row) for row in partition]
+    finally:
+        await result.close()
@@ -0,0 +1,10 @@
+"""
+Face index package.
+
+This package provides process-resident indexes over candidate face embeddings
+used to answer face similarity searches without scanning the database.
+"""
+
+from app.infrastructure.face_index.face_index import FaceIndex, face_index
+
+__all__ = ['FaceIndex', 'face_index']
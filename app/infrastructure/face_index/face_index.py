@@ -0,0 +1,490 @@
+"""
+In-memory face index module.
+
+This module provides a process-resident index over candidate face embeddings, including:
+- A contiguous float32 matrix of L2-normalised embeddings
+- A parallel array of candidate IDs
+- Vectorized top-k and threshold similarity queries
+- Incremental insert, update and removal of single embeddings
+- Versioned on-disk snapshots that worker processes memory-map and share
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Name of the file holding the latest complete snapshot version
+SNAPSHOT_POINTER = "CURRENT"
+
+
+class FaceIndex:
+    """
+    Exact (brute-force) cosine similarity index over face embeddings.
+    
+    Embeddings are L2-normalised on insertion so cosine similarity reduces to a
+    single matrix-vector product against the query vector. Rows are kept
+    contiguous: removing a candidate moves the last row into the freed slot.
+    
+    Subclasses can restrict the rows scanned by a query by overriding
+    `_probe_rows` and keep per-row state in step through the `_on_*` hooks.
+    """
+    
+    backend = "exact"
+    
+    def __init__(self, dimension: int = 512, initial_capacity: int = 1024):
+        """
+        Initialize an empty face index.
+        
+        Args:
+            dimension: Length of the embedding vectors
+            initial_capacity: Number of rows to pre-allocate
+        """
+        self.dimension = dimension
+        self._matrix = np.zeros((initial_capacity, dimension), dtype=np.float32)
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        # Guards row data; held briefly by queries and incremental updates
+        self._lock = threading.RLock()
+        # Serializes full reloads, snapshot restores and retraining
+        self._rebuild_lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._snapshot_version: Optional[str] = None
+        # Changes made since the last snapshot was written, by candidate ID
+        self._journal: Dict[str, Optional[np.ndarray]] = {}
+    
+    @property
+    def size(self) -> int:
+        """Number of embeddings currently held by the index."""
+        return len(self._ids)
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index has been populated from the database or a snapshot."""
+        return self._loaded_at is not None
+    
+    @property
+    def is_stale(self) -> bool:
+        """
+        Whether the index should be reloaded from the database.
+        
+        Updates made by other worker processes are not visible to this index,
+        so it is periodically rebuilt after FACE_INDEX_REFRESH_SECONDS.
+        """
+        if self._loaded_at is None:
+            return True
+        refresh_seconds = settings.FACE_INDEX_REFRESH_SECONDS
+        return refresh_seconds > 0 and time.monotonic() - self._loaded_at > refresh_seconds
+    
+    @staticmethod
+    def normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        """
+        Convert an embedding to an L2-normalised float32 vector.
+        
+        Args:
+            embedding: Face embedding as a list of floats or numpy array
+            
+        Returns:
+            Normalised vector, or None if the embedding has zero norm
+        """
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vector)
+        if not np.isfinite(norm) or norm == 0:
+            return None
+        return vector / norm
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Describe the current state of the index.
+        
+        Returns:
+            Dictionary with backend name, size and load state
+        """
+        return {
+            "backend": self.backend,
+            "size": self.size,
+            "dimension": self.dimension,
+            "loaded": self.is_loaded,
+            "stale": self.is_stale,
+            "snapshot_version": self._snapshot_version,
+            "unsaved_changes": len(self._journal)
+        }
+    
+    def load(self, entries: Iterable[Tuple[str, Sequence[float]]]) -> int:
+        """
+        Replace the index contents with the given embeddings.
+        
+        This is CPU-bound for large tables; call it from a worker thread.
+        
+        Args:
+            entries: Iterable of (candidate_id, embedding) pairs
+            
+        Returns:
+            Number of embeddings loaded
+        """
+        with self._rebuild_lock:
+            matrix, ids = self._build_matrix(entries)
+            state = self._prepare_rows(matrix[:len(ids)], ids)
+            with self._lock:
+                self._install(matrix, ids, state)
+                self._loaded_at = time.monotonic()
+                # The database is authoritative; nothing earlier is left to persist
+                self._journal = {}
+        
+        logger.info(f"Loaded {len(ids)} face embeddings into the {self.backend} face index")
+        return len(ids)
+    
+    def upsert(self, candidate_id: str, embedding: Sequence[float]) -> bool:
+        """
+        Insert or replace the embedding of a single candidate.
+        
+        Args:
+            candidate_id: Candidate ID
+            embedding: Face embedding vector
+            
+        Returns:
+            True if the index was updated, False if the embedding is invalid
+        """
+        vector = self.normalize(embedding)
+        if vector is None or vector.shape[0] != self.dimension:
+            logger.warning(f"Refusing to index invalid face embedding for candidate {candidate_id}")
+            return False
+        
+        with self._lock:
+            row = self._positions.get(candidate_id)
+            if row is None:
+                row = len(self._ids)
+                if row >= self._matrix.shape[0]:
+                    capacity = self._matrix.shape[0] * 2
+                    grown = np.zeros((capacity, self.dimension), dtype=np.float32)
+                    grown[:row] = self._matrix[:row]
+                    self._matrix = grown
+                    self._on_grow(capacity)
+                self._ids.append(candidate_id)
+                self._positions[candidate_id] = row
+            self._matrix[row] = vector
+            self._on_row_updated(row, candidate_id, vector)
+            self._journal[candidate_id] = vector
+        return True
+    
+    def remove(self, candidate_id: str) -> bool:
+        """
+        Remove a candidate's embedding from the index.
+        
+        Args:
+            candidate_id: Candidate ID
+            
+        Returns:
+            True if the candidate was indexed, False otherwise
+        """
+        with self._lock:
+            row = self._positions.pop(candidate_id, None)
+            if row is None:
+                return False
+            last = len(self._ids) - 1
+            if row != last:
+                moved_id = self._ids[last]
+                self._matrix[row] = self._matrix[last]
+                self._ids[row] = moved_id
+                self._positions[moved_id] = row
+                self._on_row_moved(last, row, moved_id)
+            self._ids.pop()
+            self._on_row_removed(candidate_id)
+            self._journal[candidate_id] = None
+        return True
+    
+    def search(self, query: Sequence[float], threshold: float = 0.0,
+               top_k: Optional[int] = None, nprobe: Optional[int] = None,
+               exact: bool = False) -> List[Tuple[str, float]]:
+        """
+        Find the indexed candidates most similar to a query embedding.
+        
+        Args:
+            query: Query face embedding
+            threshold: Minimum cosine similarity (0-1)
+            top_k: Maximum number of results, or None for all above threshold
+            nprobe: Approximate backends only; overrides the configured search breadth
+            exact: Force a full scan even on approximate backends
+            
+        Returns:
+            List of (candidate_id, similarity) pairs, highest similarity first
+        """
+        vector = self.normalize(query)
+        if vector is None or vector.shape[0] != self.dimension:
+            return []
+        
+        with self._lock:
+            size = len(self._ids)
+            if size == 0:
+                return []
+            rows = None if exact else self._probe_rows(vector, size, nprobe)
+            if rows is None:
+                scores = self._matrix[:size] @ vector
+            else:
+                scores = self._matrix[rows] @ vector
+            ids = self._ids
+            
+            selected = np.flatnonzero(scores >= threshold)
+            if top_k is not None and selected.size > top_k:
+                partition = np.argpartition(scores[selected], -top_k)[-top_k:]
+                selected = selected[partition]
+            selected = selected[np.argsort(scores[selected])[::-1]]
+            matched_rows = selected if rows is None else rows[selected]
+            return [(ids[row], float(score)) for row, score in zip(matched_rows, scores[selected])]
+    
+    @property
+    def snapshot_version(self) -> Optional[str]:
+        """Version of the snapshot the index was last loaded from or saved to."""
+        return self._snapshot_version
+    
+    @staticmethod
+    def current_snapshot_version(directory: str) -> Optional[str]:
+        """
+        Read the version of the latest complete snapshot in a directory.
+        
+        Args:
+            directory: Snapshot directory
+            
+        Returns:
+            The version named by the CURRENT pointer file, or None if there is none
+        """
+        try:
+            with open(os.path.join(directory, SNAPSHOT_POINTER)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+    
+    def take_journal(self) -> Dict[str, Optional[np.ndarray]]:
+        """
+        Detach the changes made since the last snapshot was written.
+        
+        Returns:
+            Mapping of candidate ID to its normalised vector, or None for a removal
+        """
+        with self._lock:
+            journal = self._journal
+            self._journal = {}
+        return journal
+    
+    def restore_journal(self, journal: Dict[str, Optional[np.ndarray]]) -> None:
+        """
+        Put back changes that could not be written; newer changes take precedence.
+        
+        Args:
+            journal: Changes previously returned by `take_journal`
+        """
+        with self._lock:
+            self._journal = {**journal, **self._journal}
+    
+    def apply_journal(self, journal: Dict[str, Optional[np.ndarray]]) -> None:
+        """
+        Apply recorded changes to this index.
+        
+        Args:
+            journal: Mapping of candidate ID to vector, or None for a removal
+        """
+        for candidate_id, vector in journal.items():
+            if vector is None:
+                self.remove(candidate_id)
+            else:
+                self.upsert(candidate_id, vector)
+    
+    def save_snapshot(self, directory: str) -> str:
+        """
+        Write the index contents as a new snapshot version.
+        
+        The matrix is written as a .npy file with spare rows so that workers can
+        memory-map it and still append a few rows without copying. The CURRENT
+        pointer is replaced with a rename only after all files are complete, so
+        readers never observe a partial snapshot. Changes recorded in the journal
+        are part of the written state and the journal is cleared.
+        
+        Args:
+            directory: Snapshot directory
+            
+        Returns:
+            The version that was written
+        """
+        with self._lock:
+            size = len(self._ids)
+            vectors = self._matrix[:size].copy()
+            ids = np.asarray(self._ids, dtype=str)
+            state = self._snapshot_state(size)
+            journal = self._journal
+            self._journal = {}
+        
+        try:
+            os.makedirs(directory, exist_ok=True)
+            version = str(time.time_ns())
+            matrix_path = os.path.join(directory, f"matrix-{version}.npy")
+            meta_path = os.path.join(directory, f"meta-{version}.npz")
+            
+            capacity = size + max(1024, size // 20)
+            matrix = np.lib.format.open_memmap(
+                f"{matrix_path}.tmp", mode="w+", dtype=np.float32, shape=(capacity, self.dimension)
+            )
+            matrix[:size] = vectors
+            matrix.flush()
+            del matrix
+            os.replace(f"{matrix_path}.tmp", matrix_path)
+            
+            with open(f"{meta_path}.tmp", "wb") as f:
+                np.savez(f, backend=np.asarray(self.backend), size=np.asarray(size), ids=ids, **state)
+            os.replace(f"{meta_path}.tmp", meta_path)
+            
+            pointer_path = os.path.join(directory, SNAPSHOT_POINTER)
+            with open(f"{pointer_path}.{os.getpid()}.tmp", "w") as f:
+                f.write(version)
+            os.replace(f"{pointer_path}.{os.getpid()}.tmp", pointer_path)
+        except Exception:
+            self.restore_journal(journal)
+            raise
+        
+        self._snapshot_version = version
+        self._remove_old_snapshots(directory, keep=version)
+        logger.info(f"Saved face index snapshot {version} with {size} embeddings to {directory}")
+        return version
+    
+    def load_snapshot(self, directory: str) -> bool:
+        """
+        Replace the index contents with the latest snapshot in a directory.
+        
+        The matrix is memory-mapped copy-on-write: every worker process shares
+        the same page cache and only rows it modifies become private. Changes
+        recorded in this index's journal are re-applied on top of the snapshot.
+        
+        Args:
+            directory: Snapshot directory
+            
+        Returns:
+            True if a snapshot was loaded, False if missing or incompatible
+        """
+        with self._rebuild_lock:
+            version = self.current_snapshot_version(directory)
+            if version is None:
+                return False
+            
+            matrix = np.load(os.path.join(directory, f"matrix-{version}.npy"), mmap_mode="c")
+            if matrix.ndim != 2 or matrix.shape[1] != self.dimension:
+                logger.warning(f"Ignoring face index snapshot {version} with shape {matrix.shape}")
+                return False
+            with np.load(os.path.join(directory, f"meta-{version}.npz"), allow_pickle=False) as data:
+                size = int(data["size"])
+                ids = data["ids"].tolist()
+                arrays = {key: data[key] for key in data.files}
+            
+            state = self._restore_state(arrays, matrix[:size], ids)
+            with self._lock:
+                self._install(matrix, ids, state)
+                self._loaded_at = time.monotonic()
+                self._snapshot_version = version
+                journal = dict(self._journal)
+            
+            # Changes not yet written to any snapshot must survive the remap
+            if journal:
+                self.apply_journal(journal)
+        
+        logger.info(f"Loaded face index snapshot {version} with {size} embeddings from {directory}")
+        return True
+    
+    @staticmethod
+    def _remove_old_snapshots(directory: str, keep: str) -> None:
+        """
+        Delete snapshot files older than the given version.
+        
+        Workers that still map a deleted file keep reading it until they remap.
+        """
+        for name in os.listdir(directory):
+            stem, _, extension = name.partition(".")
+            prefix, _, version = stem.partition("-")
+            if prefix not in ("matrix", "meta") or not version.isdigit() or extension.endswith("tmp"):
+                continue
+            if int(version) < int(keep):
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+    
+    def _build_matrix(self, entries: Iterable[Tuple[str, Sequence[float]]]) -> Tuple[np.ndarray, List[str]]:
+        """Normalise entries into a padded matrix and a parallel, de-duplicated ID list."""
+        rows: Dict[str, np.ndarray] = {}
+        for candidate_id, embedding in entries:
+            vector = self.normalize(embedding)
+            if vector is None or vector.shape[0] != self.dimension:
+                logger.warning(f"Skipping invalid face embedding for candidate {candidate_id}")
+                continue
+            # Later duplicates win, matching the last-write semantics of upsert
+            rows[candidate_id] = vector
+        
+        ids = list(rows)
+        matrix = np.zeros((max(len(ids), 1024), self.dimension), dtype=np.float32)
+        if ids:
+            matrix[:len(ids)] = np.stack(list(rows.values()))
+        return matrix, ids
+    
+    def _install(self, matrix: np.ndarray, ids: List[str], state: Dict[str, Any]) -> None:
+        """Swap in new row data; called with the row lock held."""
+        self._matrix = matrix
+        self._ids = ids
+        self._positions = {candidate_id: row for row, candidate_id in enumerate(ids)}
+    
+    def _prepare_rows(self, vectors: np.ndarray, ids: List[str]) -> Dict[str, Any]:
+        """Compute backend-specific state for a full reload, outside the row lock."""
+        return {}
+    
+    def _snapshot_state(self, size: int) -> Dict[str, np.ndarray]:
+        """Backend-specific arrays to include in a snapshot."""
+        return {}
+    
+    def _restore_state(self, arrays: Dict[str, np.ndarray], vectors: np.ndarray,
+                       ids: List[str]) -> Dict[str, Any]:
+        """Rebuild backend-specific state from snapshot arrays."""
+        return self._prepare_rows(vectors, ids)
+    
+    def _probe_rows(self, vector: np.ndarray, size: int, nprobe: Optional[int]) -> Optional[np.ndarray]:
+        """Rows to score for a query, or None to scan every row."""
+        return None
+    
+    def _on_grow(self, capacity: int) -> None:
+        """Called after the row capacity has grown."""
+    
+    def _on_row_updated(self, row: int, candidate_id: str, vector: np.ndarray) -> None:
+        """Called after a row has been inserted or overwritten."""
+    
+    def _on_row_moved(self, source: int, target: int, candidate_id: str) -> None:
+        """Called after a row has been moved to fill a removed slot."""
+    
+    def _on_row_removed(self, candidate_id: str) -> None:
+        """Called after a candidate has been removed."""
+
+
+def create_face_index() -> FaceIndex:
+    """
+    Create the face index backend selected by FACE_INDEX_BACKEND.
+    
+    Returns:
+        FaceIndex: An exact index, or an IVF approximate index for "ivf"
+    """
+    backend = settings.FACE_INDEX_BACKEND.lower()
+    if backend == "ivf":
+        from app.infrastructure.face_index.ivf_index import IVFFaceIndex
+        return IVFFaceIndex(
+            dimension=settings.FACE_EMBEDDING_DIMENSION,
+            n_lists=settings.FACE_INDEX_IVF_LISTS,
+            nprobe=settings.FACE_INDEX_IVF_NPROBE,
+            min_size=settings.FACE_INDEX_IVF_MIN_SIZE
+        )
+    if backend != "exact":
+        logger.warning(f"Unknown FACE_INDEX_BACKEND '{settings.FACE_INDEX_BACKEND}', using exact search")
+    return FaceIndex(dimension=settings.FACE_EMBEDDING_DIMENSION)
+
+
+# Process-wide face index shared by all requests in this worker
+face_index = create_face_index()
@@ -0,0 +1,331 @@
+"""
+IVF approximate face index module.
+
+This module provides an inverted-file (IVF-flat) approximate nearest-neighbour
+index over face embeddings implemented with NumPy, including:
+- Spherical k-means training of coarse centroids on a sample of embeddings
+- Query-time probing of the `nprobe` closest inverted lists only
+- Incremental maintenance of list assignments for upserts and removals
+- Recall measurement against the exact brute-force result
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.config import settings
+from app.infrastructure.face_index.face_index import FaceIndex
+
+logger = logging.getLogger(__name__)
+
+# Rows scored per block when assigning embeddings to centroids
+ASSIGN_CHUNK_SIZE = 65536
+
+
+class IVFFaceIndex(FaceIndex):
+    """
+    Inverted-file approximate index over face embeddings.
+    
+    Every row is assigned to its closest centroid. A query scores only the rows
+    in its `nprobe` closest lists, trading recall for latency. Until the index
+    has been trained, or while it holds fewer than `min_size` rows, queries fall
+    back to an exact scan.
+    """
+    
+    backend = "ivf"
+    
+    def __init__(self, dimension: int = 512, n_lists: int = 0, nprobe: int = 16,
+                 min_size: int = 50000, initial_capacity: int = 1024):
+        """
+        Initialize an empty IVF index.
+        
+        Args:
+            dimension: Length of the embedding vectors
+            n_lists: Number of inverted lists, or 0 to derive it from the index size
+            nprobe: Number of lists scanned per query (the recall/latency knob)
+            min_size: Minimum number of rows before approximate search is used
+            initial_capacity: Number of rows to pre-allocate
+        """
+        super().__init__(dimension=dimension, initial_capacity=initial_capacity)
+        self.n_lists = n_lists
+        self.nprobe = nprobe
+        self.min_size = min_size
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(initial_capacity, dtype=np.int32)
+        # Candidate IDs touched while a training run is in progress
+        self._dirty: Optional[set] = None
+        self._trained_at: Optional[float] = None
+    
+    @property
+    def is_trained(self) -> bool:
+        """Whether coarse centroids are available."""
+        return self._centroids is not None
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Describe the current state of the index.
+        
+        Returns:
+            Dictionary with size, load state and IVF parameters
+        """
+        stats = super().stats()
+        stats.update({
+            "trained": self.is_trained,
+            "n_lists": 0 if self._centroids is None else int(self._centroids.shape[0]),
+            "nprobe": self.nprobe,
+            "min_size": self.min_size,
+            "approximate": self._centroids is not None and self.size >= self.min_size
+        })
+        return stats
+    
+    def train(self, sample_size: Optional[int] = None, iterations: Optional[int] = None) -> int:
+        """
+        Train coarse centroids with spherical k-means and reassign every row.
+        
+        Incremental updates and queries continue while training runs; rows
+        changed in the meantime are reassigned when the new centroids are installed.
+        This is CPU-bound; call it from a worker thread.
+        
+        Args:
+            sample_size: Number of rows used to fit centroids, defaults to FACE_INDEX_IVF_TRAIN_SAMPLE
+            iterations: Number of k-means iterations, defaults to FACE_INDEX_IVF_TRAIN_ITERATIONS
+            
+        Returns:
+            Number of inverted lists trained, or 0 if the index is empty
+        """
+        sample_size = sample_size or settings.FACE_INDEX_IVF_TRAIN_SAMPLE
+        iterations = iterations or settings.FACE_INDEX_IVF_TRAIN_ITERATIONS
+        
+        with self._rebuild_lock:
+            with self._lock:
+                size = len(self._ids)
+                if size == 0:
+                    return 0
+                matrix = self._matrix
+                ids = list(self._ids)
+                rng = np.random.default_rng()
+                sample_rows = np.sort(rng.choice(size, size=min(sample_size, size), replace=False))
+                sample = matrix[sample_rows].copy()
+                self._dirty = set()
+            
+            try:
+                started = time.monotonic()
+                n_lists = self._list_count(size, sample.shape[0])
+                centroids = self._kmeans(sample, n_lists, iterations, rng)
+                assignments = self._assign(matrix[:size], centroids)
+            except Exception:
+                with self._lock:
+                    self._dirty = None
+                raise
+            
+            with self._lock:
+                dirty = self._dirty
+                self._dirty = None
+                self._centroids = centroids
+                self._assignments = self._merge_assignments(ids, assignments, dirty)
+                self._trained_at = time.monotonic()
+        
+        logger.info(
+            f"Trained IVF face index with {n_lists} lists over {size} embeddings "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        return n_lists
+    
+    def evaluate_recall(self, sample_size: int = 100, top_k: int = 10,
+                        nprobe: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Measure recall of approximate search against the exact brute-force result.
+        
+        Indexed embeddings are used as queries; recall@k is the fraction of the
+        exact top-k neighbours that the approximate search also returns.
+        
+        Args:
+            sample_size: Number of query embeddings to sample
+            top_k: Number of neighbours compared per query
+            nprobe: Search breadth to evaluate, defaults to the configured nprobe
+            
+        Returns:
+            Dictionary with mean recall and mean latency of both searches
+        """
+        nprobe = nprobe or self.nprobe
+        with self._lock:
+            size = len(self._ids)
+            if size == 0:
+                return {"recall": None, "sample_size": 0, "top_k": top_k, "nprobe": nprobe}
+            rows = np.random.default_rng().choice(size, size=min(sample_size, size), replace=False)
+            queries = self._matrix[rows].copy()
+        
+        recalls: List[float] = []
+        exact_seconds = 0.0
+        approximate_seconds = 0.0
+        for query in queries:
+            started = time.perf_counter()
+            expected = self.search(query, threshold=-1.0, top_k=top_k, exact=True)
+            exact_seconds += time.perf_counter() - started
+            
+            started = time.perf_counter()
+            found = self.search(query, threshold=-1.0, top_k=top_k, nprobe=nprobe)
+            approximate_seconds += time.perf_counter() - started
+            
+            if expected:
+                expected_ids = {candidate_id for candidate_id, _ in expected}
+                found_ids = {candidate_id for candidate_id, _ in found}
+                recalls.append(len(expected_ids & found_ids) / len(expected_ids))
+        
+        count = len(queries)
+        return {
+            "recall": float(np.mean(recalls)) if recalls else None,
+            "sample_size": count,
+            "top_k": top_k,
+            "nprobe": nprobe,
+            "approximate": self._centroids is not None and size >= self.min_size,
+            "exact_latency_ms": exact_seconds * 1000 / count,
+            "approximate_latency_ms": approximate_seconds * 1000 / count
+        }
+    
+    def _list_count(self, size: int, sample_size: int) -> int:
+        """Number of inverted lists to train for an index of the given size."""
+        n_lists = self.n_lists or int(4 * np.sqrt(size))
+        # Keep enough sample points per centroid for k-means to be meaningful
+        return int(max(1, min(n_lists, sample_size // 32 or 1)))
+    
+    @staticmethod
+    def _kmeans(sample: np.ndarray, n_lists: int, iterations: int,
+                rng: np.random.Generator) -> np.ndarray:
+        """Fit unit-norm centroids to a sample with spherical k-means."""
+        centroids = sample[rng.choice(sample.shape[0], size=n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            labels = IVFFaceIndex._assign(sample, centroids)
+            counts = np.bincount(labels, minlength=n_lists)
+            order = np.argsort(labels, kind="stable")
+            populated = np.flatnonzero(counts)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[populated]
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+            centroids[populated] = sums
+            # Re-seed empty lists from random sample points
+            empty = np.flatnonzero(counts == 0)
+            if empty.size:
+                centroids[empty] = sample[rng.choice(sample.shape[0], size=empty.size)]
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            centroids /= np.maximum(norms, 1e-12)
+        return centroids.astype(np.float32)
+    
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Index of the closest centroid for every row."""
+        labels = np.empty(vectors.shape[0], dtype=np.int32)
+        for start in range(0, vectors.shape[0], ASSIGN_CHUNK_SIZE):
+            block = vectors[start:start + ASSIGN_CHUNK_SIZE]
+            labels[start:start + block.shape[0]] = np.argmax(block @ centroids.T, axis=1)
+        return labels
+    
+    def _merge_assignments(self, ids: List[str], assignments: np.ndarray,
+                           dirty: set) -> np.ndarray:
+        """
+        Combine assignments computed during training with rows changed since.
+        
+        Called with the row lock held.
+        """
+        size = len(self._ids)
+        merged = np.zeros(self._matrix.shape[0], dtype=np.int32)
+        trained_size = len(ids)
+        
+        if self._ids[:trained_size] == ids:
+            # No rows moved: keep the computed prefix, assign the appended tail
+            merged[:trained_size] = assignments
+            stale_rows = [self._positions[candidate_id] for candidate_id in dirty
+                          if candidate_id in self._positions and self._positions[candidate_id] < trained_size]
+            stale_rows.extend(range(trained_size, size))
+        else:
+            # Removals moved rows around: map assignments back by candidate ID
+            trained_rows = {candidate_id: row for row, candidate_id in enumerate(ids)}
+            stale_rows = []
+            for row, candidate_id in enumerate(self._ids):
+                trained_row = trained_rows.get(candidate_id)
+                if trained_row is None or candidate_id in dirty:
+                    stale_rows.append(row)
+                else:
+                    merged[row] = assignments[trained_row]
+        
+        if stale_rows:
+            stale_rows = np.asarray(stale_rows, dtype=np.int64)
+            merged[stale_rows] = self._assign(self._matrix[stale_rows], self._centroids)
+        return merged
+    
+    def _install(self, matrix: np.ndarray, ids: List[str], state: Dict[str, Any]) -> None:
+        """Swap in new row data together with its list assignments."""
+        super()._install(matrix, ids, state)
+        if "centroids" in state:
+            self._centroids = state["centroids"]
+        assignments = np.zeros(matrix.shape[0], dtype=np.int32)
+        if state.get("assignments") is not None:
+            assignments[:len(ids)] = state["assignments"]
+        self._assignments = assignments
+    
+    def _prepare_rows(self, vectors: np.ndarray, ids: List[str]) -> Dict[str, Any]:
+        """Assign reloaded rows to the current centroids, outside the row lock."""
+        centroids = self._centroids
+        if centroids is None:
+            return {}
+        return {"centroids": centroids, "assignments": self._assign(vectors, centroids)}
+    
+    def _snapshot_state(self, size: int) -> Dict[str, np.ndarray]:
+        """Include centroids and list assignments in snapshots."""
+        if self._centroids is None:
+            return {}
+        return {
+            "centroids": self._centroids.copy(),
+            "assignments": self._assignments[:size].copy()
+        }
+    
+    def _restore_state(self, arrays: Dict[str, np.ndarray], vectors: np.ndarray,
+                       ids: List[str]) -> Dict[str, Any]:
+        """Restore trained centroids from a snapshot when present."""
+        centroids = arrays.get("centroids")
+        assignments = arrays.get("assignments")
+        if centroids is None or centroids.shape[1] != self.dimension:
+            return self._prepare_rows(vectors, ids)
+        if assignments is None or assignments.shape[0] != len(ids):
+            assignments = self._assign(vectors, centroids)
+        return {"centroids": centroids.astype(np.float32), "assignments": assignments}
+    
+    def _probe_rows(self, vector: np.ndarray, size: int, nprobe: Optional[int]) -> Optional[np.ndarray]:
+        """Rows belonging to the `nprobe` lists closest to the query."""
+        centroids = self._centroids
+        if centroids is None or size < self.min_size:
+            return None
+        n_lists = centroids.shape[0]
+        nprobe = min(nprobe or self.nprobe, n_lists)
+        if nprobe >= n_lists:
+            return None
+        
+        closest = np.argpartition(centroids @ vector, -nprobe)[-nprobe:]
+        probed = np.zeros(n_lists, dtype=bool)
+        probed[closest] = True
+        return np.flatnonzero(probed[self._assignments[:size]])
+    
+    def _on_grow(self, capacity: int) -> None:
+        """Grow the assignment array alongside the matrix."""
+        grown = np.zeros(capacity, dtype=np.int32)
+        grown[:self._assignments.shape[0]] = self._assignments
+        self._assignments = grown
+    
+    def _on_row_updated(self, row: int, candidate_id: str, vector: np.ndarray) -> None:
+        """Assign an inserted or updated row to its closest list."""
+        if self._centroids is not None:
+            self._assignments[row] = int(np.argmax(self._centroids @ vector))
+        if self._dirty is not None:
+            self._dirty.add(candidate_id)
+    
+    def _on_row_moved(self, source: int, target: int, candidate_id: str) -> None:
+        """Carry the list assignment along with a moved row."""
+        self._assignments[target] = self._assignments[source]
+        if self._dirty is not None:
+            self._dirty.add(candidate_id)
+    
+    def _on_row_removed(self, candidate_id: str) -> None:
+        """Record removals that happen during training."""
+        if self._dirty is not None:
+            self._dirty.add(candidate_id)
@@ -0,0 +1,20 @@
+"""
+Face model package.
+
+This package owns the process-wide face analysis model so its weights are
+loaded once per worker process and shared by every request.
+"""
+
+from app.infrastructure.face_model.model_registry import FaceModelRegistry, face_model_registry
+from app.infrastructure.face_model.inference_executor import (
+    InferenceExecutor,
+    InferenceSaturatedError,
+    inference_executor
+)
+from app.infrastructure.face_model.micro_batcher import MicroBatcher
+
+__all__ = [
+    'FaceModelRegistry', 'face_model_registry',
+    'InferenceExecutor', 'InferenceSaturatedError', 'inference_executor',
+    'MicroBatcher'
+]
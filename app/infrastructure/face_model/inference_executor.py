@@ -0,0 +1,140 @@
+"""
+Face inference executor module.
+
+This module runs CPU-bound face model inference off the event loop, including:
+- A fixed-size thread pool dedicated to ONNX inference
+- A bounded admission queue that rejects work when saturated
+- Per-request timeouts
+- A Retry-After estimate derived from recent inference latency
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceSaturatedError(Exception):
+    """Raised when the inference queue is full."""
+    
+    def __init__(self, retry_after: int):
+        super().__init__(f"Face inference queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    """
+    Bounded thread pool for face model inference.
+    
+    At most `max_workers` inferences run at once and at most `max_queue` more
+    wait for a worker; further submissions fail fast with InferenceSaturatedError
+    instead of stalling the event loop or piling up unbounded work.
+    """
+    
+    def __init__(self, max_workers: int, max_queue: int, timeout_seconds: float):
+        """
+        Initialize the executor.
+        
+        Args:
+            max_workers: Number of inference threads
+            max_queue: Number of submissions allowed to wait for a free thread
+            timeout_seconds: Default per-request timeout
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="face-inference")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # Exponentially weighted average inference duration, in seconds
+        self._average_seconds = 1.0
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of submissions running or waiting for a thread."""
+        return self._in_flight
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Describe the executor load.
+        
+        Returns:
+            dict: Capacity, current load and average inference latency
+        """
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "average_ms": self._average_seconds * 1000
+        }
+    
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely to free up."""
+        waves = max(self._in_flight - self.max_workers + 1, 1) / self.max_workers
+        return max(1, math.ceil(waves * self._average_seconds))
+    
+    async def run(self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        Run a blocking inference function on the pool.
+        
+        Args:
+            func: Function to run
+            *args: Positional arguments for the function
+            timeout: Seconds to wait for the result, defaults to the executor timeout
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            The function's return value
+            
+        Raises:
+            InferenceSaturatedError: If the pool and its queue are full
+            asyncio.TimeoutError: If the result is not ready in time
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                raise InferenceSaturatedError(self.retry_after())
+            self._in_flight += 1
+        
+        try:
+            future = self._executor.submit(self._timed, partial(func, *args, **kwargs))
+        except Exception:
+            self._release(None)
+            raise
+        # Release the slot when the thread finishes, not when the caller gives up
+        future.add_done_callback(self._release)
+        
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout or self.timeout_seconds)
+    
+    def shutdown(self) -> None:
+        """Stop accepting work and let running inferences finish."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _timed(self, call: Callable[[], Any]) -> Any:
+        """Run a call and fold its duration into the latency average."""
+        started = time.monotonic()
+        try:
+            return call()
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._average_seconds = 0.8 * self._average_seconds + 0.2 * elapsed
+    
+    def _release(self, future) -> None:
+        """Free an in-flight slot."""
+        with self._lock:
+            self._in_flight -= 1
+
+
+inference_executor = InferenceExecutor(
+    max_workers=settings.FACE_INFERENCE_WORKERS,
+    max_queue=settings.FACE_INFERENCE_QUEUE_SIZE,
+    timeout_seconds=settings.FACE_INFERENCE_TIMEOUT_SECONDS
+)
@@ -0,0 +1,132 @@
+"""
+Micro-batching scheduler module.
+
+This module groups individually submitted inference items into small batches, including:
+- Collecting pending items until the batch is full or a short wait expires
+- Running each batch as one call on the inference executor
+- Resolving every submitter's future with its own result
+- Waiting out executor saturation instead of failing queued items
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+
+from app.infrastructure.face_model.inference_executor import (
+    InferenceExecutor,
+    InferenceSaturatedError
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Groups concurrent submissions into batched calls of a blocking function.
+    
+    `batch_fn` receives a list of items and must return a list of results in
+    the same order. The scheduler starts on first use inside the running
+    event loop.
+    """
+    
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], executor: InferenceExecutor,
+                 max_batch_size: int = 16, max_wait_seconds: float = 0.02,
+                 max_concurrent_batches: int = 1):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            batch_fn: Blocking function processing a list of items
+            executor: Inference executor the batches run on
+            max_batch_size: Maximum number of items per batch
+            max_wait_seconds: Maximum time to wait for a batch to fill up
+            max_concurrent_batches: Number of batches allowed to run at once
+        """
+        self.batch_fn = batch_fn
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_concurrent_batches = max_concurrent_batches
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+        
+        Waits while the queue is full, which applies back-pressure to bulk callers.
+        
+        Args:
+            item: Item to process
+            
+        Returns:
+            The result produced for this item
+        """
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+    
+    async def stop(self) -> None:
+        """Cancel the scheduler task."""
+        if self._task is None or self._task.done():
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+    
+    def _ensure_started(self) -> None:
+        """Start the scheduler task in the running loop if needed."""
+        if self._task is not None and not self._task.done():
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_batch_size * 4)
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._task = asyncio.create_task(self._run())
+    
+    async def _run(self) -> None:
+        """Collect batches and dispatch them until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Wait for a free slot first so items keep accumulating meanwhile
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            batch = [(item, future) for item, future in batch if not future.cancelled()]
+            if not batch:
+                self._slots.release()
+                continue
+            asyncio.create_task(self._execute(batch))
+    
+    async def _execute(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run one batch on the executor and resolve its futures."""
+        items = [item for item, _ in batch]
+        try:
+            while True:
+                try:
+                    results = await self.executor.run(self.batch_fn, items)
+                    break
+                except InferenceSaturatedError as e:
+                    # Interactive requests have priority; wait for the pool to drain
+                    await asyncio.sleep(e.retry_after)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            logger.error(f"Error running inference batch of {len(items)}: {str(e)}", exc_info=True)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._slots.release()
@@ -0,0 +1,182 @@
+"""
+Face model registry module.
+
+This module provides a process-wide registry for the InsightFace model, including:
+- One-time, thread-safe loading of the ONNX weights
+- Optional warm-up with a dummy inference
+- A readiness signal for health checks
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import onnxruntime
+from insightface.app import FaceAnalysis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class FaceModelRegistry:
+    """
+    Holds the single FaceAnalysis instance of this worker process.
+    
+    The model is loaded on first use or eagerly at startup; later callers
+    share the same weights, so memory use stays at one model per process.
+    """
+    
+    def __init__(self, model_name: str, det_size: int, modules: Optional[List[str]] = None,
+                 providers: Optional[List[str]] = None, intra_op_threads: int = 0):
+        """
+        Initialize the registry without loading the model.
+        
+        Args:
+            model_name: InsightFace model pack name (e.g. buffalo_l)
+            det_size: Square input size of the face detector
+            modules: InsightFace modules to load, or None for the whole pack
+            providers: ONNX Runtime execution providers
+            intra_op_threads: ONNX Runtime threads per inference, or 0 for the runtime default
+        """
+        self.model_name = model_name
+        self.det_size = det_size
+        self.modules = modules
+        self.providers = providers or ['CPUExecutionProvider']
+        self.intra_op_threads = intra_op_threads
+        self._analyzer: Optional[FaceAnalysis] = None
+        self._lock = threading.Lock()
+        self._warmed_up = False
+        self._loaded_at: Optional[datetime] = None
+        self._load_seconds: Optional[float] = None
+        self._error: Optional[str] = None
+    
+    @property
+    def is_ready(self) -> bool:
+        """Whether the model is loaded and can serve inference."""
+        return self._analyzer is not None
+    
+    def get(self) -> FaceAnalysis:
+        """
+        Get the shared model, loading it first if necessary.
+        
+        Returns:
+            FaceAnalysis: The prepared face analysis model
+        """
+        if self._analyzer is None:
+            self.load(warmup=False)
+        return self._analyzer
+    
+    def load(self, warmup: bool = True) -> FaceAnalysis:
+        """
+        Load and prepare the model once; subsequent calls return the same instance.
+        
+        This reads the ONNX weights from disk and is slow; call it from a
+        worker thread rather than the event loop.
+        
+        Args:
+            warmup: Run a dummy inference after loading
+            
+        Returns:
+            FaceAnalysis: The prepared face analysis model
+        """
+        with self._lock:
+            if self._analyzer is None:
+                started = time.monotonic()
+                try:
+                    analyzer = FaceAnalysis(
+                        name=self.model_name,
+                        allowed_modules=self.modules,
+                        providers=self.providers
+                    )
+                    if self.intra_op_threads > 0:
+                        self._configure_sessions(analyzer)
+                    analyzer.prepare(ctx_id=0, det_size=(self.det_size, self.det_size))
+                except Exception as e:
+                    self._error = str(e)
+                    logger.error(f"Failed to load face model {self.model_name}: {str(e)}", exc_info=True)
+                    raise
+                self._analyzer = analyzer
+                self._error = None
+                self._loaded_at = datetime.now()
+                self._load_seconds = time.monotonic() - started
+                logger.info(f"Loaded face model {self.model_name} in {self._load_seconds:.1f}s")
+            
+            if warmup and not self._warmed_up:
+                self._warmup()
+            return self._analyzer
+    
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the model state for health checks.
+        
+        Returns:
+            dict: Readiness ("up", "loading", "not_loaded" or "down"), timings and the last load error
+        """
+        if self.is_ready:
+            state = "up"
+        elif self._error:
+            state = "down"
+        elif self._lock.locked():
+            state = "loading"
+        else:
+            state = "not_loaded"
+        return {
+            "status": state,
+            "model": self.model_name,
+            "modules": self.modules,
+            "det_size": self.det_size,
+            "intra_op_threads": self.intra_op_threads,
+            "warmed_up": self._warmed_up,
+            "loaded_at": self._loaded_at.isoformat() if self._loaded_at else None,
+            "load_seconds": self._load_seconds,
+            "error": self._error
+        }
+    
+    def _configure_sessions(self, analyzer: FaceAnalysis) -> None:
+        """
+        Recreate each model's ONNX session with a bounded intra-op thread count.
+        
+        FaceAnalysis does not forward session options to its models, so the
+        sessions are rebuilt from the same model files after construction.
+        """
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = self.intra_op_threads
+        for model in analyzer.models.values():
+            if getattr(model, "session", None) is None or not getattr(model, "model_file", None):
+                continue
+            model.session = onnxruntime.InferenceSession(
+                model.model_file,
+                sess_options=session_options,
+                providers=self.providers
+            )
+    
+    def _warmup(self) -> None:
+        """Run one inference on a blank image so the first request pays no setup cost."""
+        started = time.monotonic()
+        try:
+            blank = np.zeros((self.det_size, self.det_size, 3), dtype=np.uint8)
+            self._analyzer.get(blank)
+            self._warmed_up = True
+            logger.info(f"Warmed up face model in {time.monotonic() - started:.1f}s")
+        except Exception as e:
+            logger.warning(f"Face model warm-up failed: {str(e)}")
+
+
+def _default_intra_op_threads() -> int:
+    """Split the CPU cores between the inference worker threads."""
+    if settings.FACE_INFERENCE_INTRA_OP_THREADS > 0:
+        return settings.FACE_INFERENCE_INTRA_OP_THREADS
+    return max(1, (os.cpu_count() or 1) // max(settings.FACE_INFERENCE_WORKERS, 1))
+
+
+face_model_registry = FaceModelRegistry(
+    model_name=settings.FACE_MODEL_NAME,
+    det_size=settings.FACE_MODEL_DET_SIZE,
+    modules=[module.strip() for module in settings.FACE_MODEL_MODULES.split(",") if module.strip()] or None,
+    intra_op_threads=_default_intra_op_threads()
+)
@@ -9,6 +9,13 @@ from app.infrastructure.ontology.neo4j_connection import neo4j_connection
 from app.infrastructure.ontology.ontology import CLASSES, RELATIONSHIPS
 import logging
 
+# Full-text index over the candidate properties searched by free text
+CANDIDATE_FULLTEXT_INDEX = "candidate_search"
+
+# Lowercases and folds accents ("Nguyễn" -> "nguyen"), so Vietnamese names match
+# whether or not they are typed with diacritics
+CANDIDATE_FULLTEXT_ANALYZER = "standard-folding"
+
 async def create_constraints_and_indexes():
     """
     Create Neo4j constraints and indexes for efficient queries.
@@ -57,6 +64,23 @@ async def create_constraints_and_indexes():
             FOR (c:Candidate) ON (c.email)
             """,
             
+            # Normalized (unaccented, lowercased) name, for prefix matches and ordering by name
+            """
+            CREATE INDEX candidate_search_name IF NOT EXISTS
+            FOR (c:Candidate) ON (c.search_name)
+            """,
+            
+            # Exact lookups by national ID number and exam registration number
+            """
+            CREATE INDEX candidate_id_number IF NOT EXISTS
+            FOR (c:Candidate) ON (c.id_number)
+            """,
+            
+            """
+            CREATE INDEX attends_exam_registration_number IF NOT EXISTS
+            FOR ()-[r:ATTENDS_EXAM]-() ON (r.registration_number)
+            """,
+            
             # School indexes
             """
             CREATE INDEX school_name IF NOT EXISTS
@@ -72,6 +96,16 @@ async def create_constraints_and_indexes():
             """
             CREATE INDEX exam_date IF NOT EXISTS
             FOR (e:Exam) ON (e.start_date)
+            """,
+            
+            # Candidate full-text search index
+            f"""
+            CREATE FULLTEXT INDEX {CANDIDATE_FULLTEXT_INDEX} IF NOT EXISTS
+            FOR (c:Candidate) ON EACH [
+                c.full_name, c.id_number, c.phone_number, c.email,
+                c.address, c.primary_address, c.secondary_address
+            ]
+            OPTIONS {{indexConfig: {{`fulltext.analyzer`: '{CANDIDATE_FULLTEXT_ANALYZER}'}}}}
             """
         ]
         
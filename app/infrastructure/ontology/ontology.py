@@ -86,7 +86,7 @@ CANDIDATE = {
         "id_card_image_url": "URL to ID card image",
         "candidate_card_image_url": "URL to candidate card image",
         "face_recognition_data_url": "URL to face recognition data",
-        "face_embedding": "Face embedding vector stored as JSON",
+        "face_embedding": "Face embedding vector in binary format (header + float32/float16/int8 payload)",
         "face_embedding_model": "Name of the model used to generate embedding",
         "face_embedding_date": "Date when the embedding was generated",
         "face_embedding_source": "Source of the image (id_card, candidate_card, direct_face)"
@@ -13,6 +13,13 @@ from app.core.routes import setup_routes
 import uvicorn
 from app.config import settings
 from app.infrastructure.ontology import initialize_ontology
+from app.services.face_index_service import start_face_index, stop_face_index
+from app.infrastructure.face_model import face_model_registry, inference_executor
+from app.services.security_log_writer import security_log_writer
+from app.services.graph_sync_queue import graph_sync_queue
+from app.services.sync.sync_job_manager import sync_job_manager
+import asyncio
+import logging
 
 # Configure logging
 setup_logging()
@@ -31,6 +38,28 @@ async def startup_db_client():
     await connect_to_db()
     # Initialize Neo4j ontology
     await initialize_ontology()
+    # Restore the face index snapshot and start its rebuild job
+    await start_face_index()
+    # Load the face model once per worker, off the event loop
+    if settings.FACE_MODEL_PRELOAD:
+        try:
+            await asyncio.to_thread(face_model_registry.load, warmup=settings.FACE_MODEL_WARMUP)
+        except Exception as e:
+            logging.error(f"Face model preload failed, it will be retried on first use: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_background_jobs():
+    """
+    Stop background jobs when the application shuts down.
+    """
+    await stop_face_index()
+    # Stop sync jobs running in this worker and record them as cancelled
+    await sync_job_manager.stop()
+    # Apply graph changes still waiting in the write-behind queue
+    await graph_sync_queue.stop()
+    inference_executor.shutdown()
+    # Write authentication logs still waiting in the buffer
+    await security_log_writer.stop()
 
 # Set up all routes
 setup_routes(app)
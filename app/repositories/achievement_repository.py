@@ -9,12 +9,14 @@ with filtering options.
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_
 from sqlalchemy.orm import joinedload
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from app.domain.models.achievement import Achievement
 from app.domain.models.candidate_exam import CandidateExam
 from datetime import date
 import logging
 from app.services.id_service import generate_model_id
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 class AchievementRepository:
     """Repository for Achievement database operations"""
@@ -107,6 +109,21 @@ class AchievementRepository:
             self.logger.error(f"Error in get_all: {e}")
             raise
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[Achievement]]:
+        """
+        Read all achievements in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of achievements per chunk
+            limit: Optional maximum number of achievements to read
+            
+        Yields:
+            Lists of achievements
+        """
+        query = select(Achievement)
+        async for chunk in stream_keyset(self.db, query, Achievement.achievement_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, achievement_id: str) -> Optional[Achievement]:
         """
         Get an achievement by ID
@@ -293,6 +310,7 @@ class AchievementRepository:
             self.logger.info(f"Successfully created achievement: {achievement.achievement_id}")
             
             # Return the fully loaded achievement with relationships
+            graph_sync_queue.track(self.db, "achievement", achievement.achievement_id)
             return await self.get_by_id(achievement.achievement_id)
         
         except Exception as e:
@@ -333,6 +351,7 @@ class AchievementRepository:
             
             # Get updated achievement
             updated_achievement = await self.get_by_id(achievement_id)
+            graph_sync_queue.track(self.db, "achievement", achievement_id)
             return updated_achievement
         
         except Exception as e:
@@ -363,6 +382,7 @@ class AchievementRepository:
             await self.db.execute(query)
             await self.db.flush()
             
+            graph_sync_queue.track(self.db, "achievement", achievement_id, DELETE)
             return True
         
         except Exception as e:
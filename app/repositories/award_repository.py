@@ -9,12 +9,14 @@ with filtering options.
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_
 from sqlalchemy.orm import joinedload
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from app.domain.models.award import Award
 from app.domain.models.candidate_exam import CandidateExam
 from datetime import date
 import logging
 from app.services.id_service import generate_model_id
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 class AwardRepository:
     """Repository for Award database operations"""
@@ -99,6 +101,21 @@ class AwardRepository:
             self.logger.error(f"Error in get_all: {e}")
             raise
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[Award]]:
+        """
+        Read all awards in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of awards per chunk
+            limit: Optional maximum number of awards to read
+            
+        Yields:
+            Lists of awards
+        """
+        query = select(Award)
+        async for chunk in stream_keyset(self.db, query, Award.award_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, award_id: str) -> Optional[Award]:
         """
         Get an award by ID
@@ -236,6 +253,7 @@ class AwardRepository:
             self.db.add(award)
             await self.db.flush()
             await self.db.refresh(award)
+            graph_sync_queue.track(self.db, "award", award.award_id)
             return award
         
         except Exception as e:
@@ -276,6 +294,7 @@ class AwardRepository:
             
             # Get updated award
             updated_award = await self.get_by_id(award_id)
+            graph_sync_queue.track(self.db, "award", award_id)
             return updated_award
         
         except Exception as e:
@@ -306,6 +325,7 @@ class AwardRepository:
             await self.db.execute(query)
             await self.db.flush()
             
+            graph_sync_queue.track(self.db, "award", award_id, DELETE)
             return True
         
         except Exception as e:
@@ -9,12 +9,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_
 from sqlalchemy.orm import joinedload
 from datetime import date
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 import logging
 
 from app.domain.models.candidate_credential import CandidateCredential, CredentialType
 from app.domain.models.candidate import Candidate
 from app.services.id_service import generate_model_id
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 class CandidateCredentialRepository:
     """Repository for interacting with the CandidateCredential table."""
@@ -111,6 +113,21 @@ class CandidateCredentialRepository:
             self.logger.error(f"Error getting candidate credentials: {str(e)}")
             raise
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[CandidateCredential]]:
+        """
+        Read all credentials in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of credentials per chunk
+            limit: Optional maximum number of credentials to read
+            
+        Yields:
+            Lists of credentials
+        """
+        query = select(CandidateCredential)
+        async for chunk in stream_keyset(self.db, query, CandidateCredential.credential_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, credential_id: str) -> Optional[CandidateCredential]:
         """
         Get a candidate credential by ID.
@@ -216,6 +233,7 @@ class CandidateCredentialRepository:
             credential = CandidateCredential(**credential_data)
             self.db.add(credential)
             await self.db.flush()
+            graph_sync_queue.track(self.db, "credential", credential.credential_id)
             await self.db.commit()  # Commit transaction
             
             # Get the created credential with related data
@@ -261,6 +279,7 @@ class CandidateCredentialRepository:
             # Get the updated credential
             updated_credential = await self.get_by_id(credential_id)
             
+            graph_sync_queue.track(self.db, "credential", credential_id)
             return updated_credential
             
         except Exception as e:
@@ -288,6 +307,7 @@ class CandidateCredentialRepository:
             stmt = delete(CandidateCredential).where(CandidateCredential.credential_id == credential_id)
             result = await self.db.execute(stmt)
             
+            graph_sync_queue.track(self.db, "credential", credential_id, DELETE)
             return result.rowcount > 0
             
         except Exception as e:
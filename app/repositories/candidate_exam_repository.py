@@ -18,6 +18,7 @@ from app.domain.models.candidate import Candidate
 from app.domain.models.exam import Exam
 from app.domain.models.exam_location import ExamLocation
 from app.domain.models.exam_room import ExamRoom
+from app.services.graph_sync_queue import graph_sync_queue, RELATIONSHIPS, REBUILD
 
 logger = logging.getLogger(__name__)
 
@@ -399,6 +400,7 @@ class CandidateExamRepository:
         
         # Add to session and commit
         self.db.add(new_registration)
+        graph_sync_queue.track(self.db, "candidate", new_registration.candidate_id, RELATIONSHIPS)
         await self.db.commit()
         await self.db.refresh(new_registration)
         
@@ -432,6 +434,7 @@ class CandidateExamRepository:
             .returning(CandidateExam)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "candidate", existing_registration.candidate_id, RELATIONSHIPS)
         await self.db.commit()
         
         updated_registration = result.scalar_one_or_none()
@@ -461,6 +464,7 @@ class CandidateExamRepository:
         # Delete the candidate exam registration
         delete_stmt = delete(CandidateExam).where(CandidateExam.candidate_exam_id == candidate_exam_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "candidate", existing_registration.candidate_id, REBUILD)
         await self.db.commit()
         
         logger.info(f"Deleted candidate exam registration with ID: {candidate_exam_id}")
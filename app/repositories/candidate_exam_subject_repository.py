@@ -22,6 +22,9 @@ from app.domain.models.exam_schedule import ExamSchedule
 from app.domain.models.exam_room import ExamRoom
 from app.domain.models.exam_location import ExamLocation
 from app.domain.models.exam_score import ExamScore
+from app.infrastructure.database.counting import CountStrategy, list_counter
+from app.infrastructure.database.pagination import apply_cursor
+from app.services.graph_sync_queue import graph_sync_queue, RELATIONSHIPS, REBUILD
 
 class CandidateExamSubjectRepository:
     """Repository for interacting with the CandidateExamSubject table."""
@@ -83,11 +86,16 @@ class CandidateExamSubjectRepository:
         subject_id: Optional[str] = None,
         candidate_exam_id: Optional[str] = None,
         exam_subject_id: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[CountStrategy] = None
     ) -> Tuple[List[CandidateExamSubject], int]:
         """
         Retrieve candidate exam subjects with pagination and filtering.
         
+        Registrations are ordered by ID. Given a cursor, the page starts after
+        it and `skip` is ignored.
+        
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
@@ -97,6 +105,8 @@ class CandidateExamSubjectRepository:
             candidate_exam_id: Filter by candidate exam ID
             exam_subject_id: Filter by exam subject ID
             status: Filter by status
+            cursor: Optional cursor of the previous page
+            count_strategy: How to compute the total, LIST_COUNT_STRATEGY by default
             
         Returns:
             Tuple of (list of candidate exam subjects, total count)
@@ -148,11 +158,27 @@ class CandidateExamSubjectRepository:
                 query = query.where(and_(*conditions))
             
             # Get total count
-            count_query = select(func.count()).select_from(query.subquery())
-            total = await self.db.scalar(count_query)
+            filters = {
+                "candidate_id": candidate_id,
+                "exam_id": exam_id,
+                "subject_id": subject_id,
+                "candidate_exam_id": candidate_exam_id,
+                "exam_subject_id": exam_subject_id,
+                "status": status
+            }
+            total = await list_counter.count(
+                self.db,
+                query.with_only_columns(CandidateExamSubject.candidate_exam_subject_id),
+                "candidate_exam_subject",
+                filters,
+                count_strategy
+            )
             
             # Apply pagination
-            query = query.offset(skip).limit(limit)
+            query = apply_cursor(query, [CandidateExamSubject.candidate_exam_subject_id], cursor)
+            if not cursor:
+                query = query.offset(skip)
+            query = query.limit(limit)
             
             # Execute query
             result = await self.db.execute(query)
@@ -573,6 +599,7 @@ class CandidateExamSubjectRepository:
             # Get the created instance with related data
             created = await self.get_by_id(candidate_exam_subject.candidate_exam_subject_id)
             
+            graph_sync_queue.track(self.db, "candidate", created.candidate_exam.candidate_id, RELATIONSHIPS)
             return created
             
         except Exception as e:
@@ -608,6 +635,7 @@ class CandidateExamSubjectRepository:
             # Get updated object
             updated = await self.get_by_id(candidate_exam_subject_id)
             
+            graph_sync_queue.track(self.db, "candidate", candidate_exam_subject.candidate_exam.candidate_id, RELATIONSHIPS)
             return updated
             
         except Exception as e:
@@ -637,6 +665,7 @@ class CandidateExamSubjectRepository:
             )
             result = await self.db.execute(stmt)
             
+            graph_sync_queue.track(self.db, "candidate", candidate_exam_subject.candidate_exam.candidate_id, REBUILD)
             return result.rowcount > 0
             
         except Exception as e:
@@ -1,12 +1,28 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, or_
+from sqlalchemy import select, update, delete, func, or_, union, union_all, literal
 from sqlalchemy.orm import joinedload
 from app.domain.models.candidate import Candidate
 from app.domain.models.personal_info import PersonalInfo
-from typing import List, Optional, Dict, Any
+from enum import Enum
+from typing import List, Optional, Dict, Any, AsyncIterator
 import logging
 from app.services.id_service import generate_model_id
 from sqlalchemy.future import select
+from app.infrastructure.database.pagination import apply_cursor
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
+from app.utilities.search_text import escape_like, name_tokens, search_key
+
+# Shortest term that trigram indexes can narrow down: a term has trigrams only from 3 characters on
+MIN_SIMILARITY_TERM_LENGTH = 3
+
+
+class CandidateSearchMode(str, Enum):
+    """How CandidateRepository.search matches a term."""
+    KEYS = "keys"  # normalized name prefix or name parts, exact IDs
+    SIMILARITY = "similarity"  # trigram substring and fuzzy matches, ranked by similarity
+    AUTO = "auto"  # keys, then similarity when nothing matches
+
 
 class CandidateRepository:
     """
@@ -51,6 +67,26 @@ class CandidateRepository:
             self.logger.error(f"Error getting all candidates: {e}")
             raise
     
+    async def stream_all(
+        self, chunk_size: int = 1000, limit: Optional[int] = None, include_personal_info: bool = False
+    ) -> AsyncIterator[List[Candidate]]:
+        """
+        Read all candidates in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of candidates per chunk
+            limit: Optional maximum number of candidates to read
+            include_personal_info: Whether to load personal info with each candidate
+            
+        Yields:
+            Lists of candidates
+        """
+        query = select(Candidate)
+        if include_personal_info:
+            query = query.options(joinedload(Candidate.personal_info))
+        async for chunk in stream_keyset(self.db_session, query, Candidate.candidate_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, candidate_id: str) -> Optional[Candidate]:
         """Get candidate information by ID"""
         try:
@@ -105,6 +141,7 @@ class CandidateRepository:
                 personal_info_obj = PersonalInfo(**personal_info)
                 self.db_session.add(personal_info_obj)
             
+            graph_sync_queue.track(self.db_session, "candidate", candidate.candidate_id)
             await self.db_session.commit()
             await self.db_session.refresh(candidate)
             
@@ -134,6 +171,11 @@ class CandidateRepository:
             # Handle personal_info separately
             personal_info = candidate_data.pop('personal_info', None)
             
+            # A bulk UPDATE bypasses the model's validators, so refresh the search keys here
+            if candidate_data.get('full_name') is not None:
+                candidate_data['search_name'] = search_key(candidate_data['full_name'])
+                candidate_data['search_tokens'] = name_tokens(candidate_data['full_name'])
+            
             # Update candidate
             query = update(Candidate).where(Candidate.candidate_id == candidate_id).values(**candidate_data)
             await self.db_session.execute(query)
@@ -145,6 +187,7 @@ class CandidateRepository:
                 ).values(**personal_info)
                 await self.db_session.execute(personal_info_query)
             
+            graph_sync_queue.track(self.db_session, "candidate", candidate_id)
             await self.db_session.commit()
             
             # Get updated candidate with personal info
@@ -194,6 +237,7 @@ class CandidateRepository:
                 )
                 self.db_session.add(new_personal_info)
             
+            graph_sync_queue.track(self.db_session, "candidate", candidate_id)
             await self.db_session.commit()
             
             # Fetch updated candidate with personal info
@@ -214,6 +258,7 @@ class CandidateRepository:
             query = delete(Candidate).where(Candidate.candidate_id == candidate_id)
             result = await self.db_session.execute(query)
             
+            graph_sync_queue.track(self.db_session, "candidate", candidate_id, DELETE)
             await self.db_session.commit()
             return result.rowcount > 0
         except Exception as e:
@@ -221,45 +266,43 @@ class CandidateRepository:
             self.logger.error(f"Error deleting candidate {candidate_id}: {e}")
             raise
     
-    async def search(self, search_term: str, skip: int = 0, limit: int = 100) -> List[Candidate]:
+    async def search(
+        self,
+        search_term: str,
+        skip: int = 0,
+        limit: int = 100,
+        mode: CandidateSearchMode = CandidateSearchMode.AUTO
+    ) -> List[Candidate]:
         """
         Search candidates by name, candidate_id, or id_number
         
+        Keyed search matches names accent- and case-insensitively through the
+        normalized search keys, by prefix of the whole name or by containing
+        every name part of the term, and IDs exactly. Similarity search uses
+        the pg_trgm indexes to find names and IDs containing the term, or names
+        resembling it despite typos, best matches first.
+        
         Args:
             search_term: Term to search for
             skip: Number of records to skip
             limit: Maximum number of records to return
+            mode: Matching mode; AUTO falls back to similarity search when the
+                  keyed search matches nothing
             
         Returns:
             List of candidates matching the search criteria
         """
         try:
-            # Build base query with personal info joined
-            query = select(Candidate).options(
-                joinedload(Candidate.personal_info)
-            )
-            
-            # Add search conditions
-            search_conditions = [
-                Candidate.full_name.ilike(f"%{search_term}%"),
-                Candidate.candidate_id.ilike(f"%{search_term}%")
-            ]
+            term = search_term.strip()
+            candidates = []
+            if mode != CandidateSearchMode.SIMILARITY:
+                candidates = await self._search_by_keys(term, skip, limit)
             
-            # Add personal info search if it exists
-            if hasattr(Candidate, 'personal_info'):
-                search_conditions.append(
-                    PersonalInfo.id_number.ilike(f"%{search_term}%")
-                )
-            
-            # Combine conditions with OR
-            query = query.where(or_(*search_conditions))
-            
-            # Add pagination
-            query = query.offset(skip).limit(limit)
-            
-            # Execute query
-            result = await self.db_session.execute(query)
-            candidates = list(result.scalars().unique().all())
+            if mode == CandidateSearchMode.SIMILARITY or (
+                mode == CandidateSearchMode.AUTO and not candidates
+                and (skip == 0 or not await self._has_key_matches(term))
+            ):
+                candidates = await self._search_by_similarity(term, skip, limit)
             
             self.logger.info(f"Found {len(candidates)} candidates matching search term '{search_term}'")
             return candidates
@@ -268,21 +311,109 @@ class CandidateRepository:
             self.logger.error(f"Error searching candidates with term '{search_term}': {e}")
             raise
     
-    async def get_all_with_personal_info(self, skip: int = 0, limit: int = 100) -> List[Candidate]:
+    def _key_matches(self, term: str):
+        """Build the UNION of candidate IDs matched by the normalized search keys."""
+        term_key = search_key(term)
+        tokens = name_tokens(term)
+        
+        # Candidate IDs matched by each indexed condition
+        matches = [
+            select(Candidate.candidate_id).where(Candidate.candidate_id == term),
+            select(PersonalInfo.candidate_id).where(PersonalInfo.id_number == term)
+        ]
+        if term_key:
+            matches.append(
+                select(Candidate.candidate_id).where(Candidate.search_name.like(f"{escape_like(term_key)}%", escape="\\"))
+            )
+        if tokens:
+            matches.append(
+                select(Candidate.candidate_id).where(Candidate.search_tokens.contains(tokens))
+            )
+        return union(*matches).subquery()
+    
+    async def _search_by_keys(self, term: str, skip: int, limit: int) -> List[Candidate]:
+        """Search candidates through the normalized search keys, ordered by name."""
+        matched_ids = self._key_matches(term)
+        query = (
+            select(Candidate)
+            .options(joinedload(Candidate.personal_info))
+            .where(Candidate.candidate_id.in_(select(matched_ids.c.candidate_id)))
+            .order_by(Candidate.search_name, Candidate.candidate_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db_session.execute(query)
+        return list(result.scalars().unique().all())
+    
+    async def _has_key_matches(self, term: str) -> bool:
+        """Check whether the keyed search matches any candidate."""
+        matched_ids = self._key_matches(term)
+        return bool(await self.db_session.scalar(select(select(matched_ids.c.candidate_id).exists())))
+    
+    async def _search_by_similarity(self, term: str, skip: int, limit: int) -> List[Candidate]:
+        """Search candidates through the trigram indexes, best matches first."""
+        term_key = search_key(term)
+        if len(term_key or "") < MIN_SIMILARITY_TERM_LENGTH:
+            return []
+        pattern = f"%{escape_like(term)}%"
+        
+        # Each branch is answered by its own GIN trigram index; an ID containing
+        # the term ranks as an exact hit, names by word similarity to the term
+        ranked = union_all(
+            select(
+                Candidate.candidate_id,
+                func.word_similarity(term_key, Candidate.search_name).label("rank")
+            ).where(or_(
+                Candidate.search_name.like(f"%{escape_like(term_key)}%", escape="\\"),
+                literal(term_key).op("<%")(Candidate.search_name)
+            )),
+            select(Candidate.candidate_id, literal(1.0).label("rank")).where(
+                Candidate.candidate_id.ilike(pattern, escape="\\")
+            ),
+            select(PersonalInfo.candidate_id, literal(1.0).label("rank")).where(
+                PersonalInfo.id_number.ilike(pattern, escape="\\")
+            )
+        ).subquery()
+        best = (
+            select(ranked.c.candidate_id, func.max(ranked.c.rank).label("rank"))
+            .group_by(ranked.c.candidate_id)
+            .subquery()
+        )
+        
+        query = (
+            select(Candidate)
+            .join(best, best.c.candidate_id == Candidate.candidate_id)
+            .options(joinedload(Candidate.personal_info))
+            .order_by(best.c.rank.desc(), Candidate.search_name, Candidate.candidate_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db_session.execute(query)
+        return list(result.scalars().unique().all())
+    
+    async def get_all_with_personal_info(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[Candidate]:
         """
-        Get list of candidates with personal information
+        Get list of candidates with personal information, ordered by ID
         
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip, ignored when a cursor is given
             limit: Maximum number of records to return
+            cursor: Optional cursor of the previous page
             
         Returns:
             List of candidates with personal information
         """
         try:
-            query = select(Candidate).options(
-                joinedload(Candidate.personal_info)
-            ).offset(skip).limit(limit)
+            query = apply_cursor(
+                select(Candidate).options(joinedload(Candidate.personal_info)),
+                [Candidate.candidate_id],
+                cursor
+            )
+            if not cursor:
+                query = query.offset(skip)
+            query = query.limit(limit)
             
             result = await self.db_session.execute(query)
             candidates = list(result.scalars().unique().all())
@@ -6,7 +6,7 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime, date
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,6 +22,8 @@ from app.domain.models.exam_score import ExamScore
 from app.domain.models.candidate_exam import CandidateExam
 from app.domain.models.exam_subject import ExamSubject
 from app.domain.models.subject import Subject
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +136,21 @@ class CertificateRepository:
         
         return certificates, total
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[Certificate]]:
+        """
+        Read all certificates in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of certificates per chunk
+            limit: Optional maximum number of certificates to read
+            
+        Yields:
+            Lists of certificates
+        """
+        query = select(Certificate)
+        async for chunk in stream_keyset(self.db, query, Certificate.certificate_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, certificate_id: str) -> Optional[Dict]:
         """
         Get a certificate by its ID, including related entity details.
@@ -300,6 +317,7 @@ class CertificateRepository:
         
         # Add to session and commit
         self.db.add(new_certificate)
+        graph_sync_queue.track(self.db, "certificate", new_certificate.certificate_id)
         await self.db.commit()
         await self.db.refresh(new_certificate)
         
@@ -335,6 +353,7 @@ class CertificateRepository:
             logger.warning(f"Certificate with ID {certificate_id} not found for update")
             return None
         
+        graph_sync_queue.track(self.db, "certificate", certificate_id)
         await self.db.commit()
         logger.info(f"Updated certificate with ID: {certificate_id}")
         return updated_certificate
@@ -363,6 +382,7 @@ class CertificateRepository:
             logger.warning(f"Certificate with ID {certificate_id} not found for deletion")
             return False
         
+        graph_sync_queue.track(self.db, "certificate", certificate_id, DELETE)
         await self.db.commit()
         logger.info(f"Deleted certificate with ID: {certificate_id}")
         return True
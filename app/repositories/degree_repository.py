@@ -13,8 +13,10 @@ from app.domain.models.major import Major
 from app.domain.models.candidate import Candidate
 from app.domain.models.education_history import EducationHistory
 from app.domain.models.education_level import EducationLevel
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 import logging
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE, REBUILD
 
 class DegreeRepository:
     """
@@ -115,6 +117,21 @@ class DegreeRepository:
             self.logger.error(f"Error getting all degrees: {e}")
             raise
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[Degree]]:
+        """
+        Read all degrees in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of degrees per chunk
+            limit: Optional maximum number of degrees to read
+            
+        Yields:
+            Lists of degrees
+        """
+        query = select(Degree).options(joinedload(Degree.major))
+        async for chunk in stream_keyset(self.db_session, query, Degree.degree_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, degree_id: str) -> Optional[Degree]:
         """
         Get a degree by its ID, including related major information
@@ -280,6 +297,7 @@ class DegreeRepository:
                 
             degree = Degree(**degree_data)
             self.db_session.add(degree)
+            graph_sync_queue.track(self.db_session, "degree", degree.degree_id)
             await self.db_session.commit()
             await self.db_session.refresh(degree)
             
@@ -322,6 +340,7 @@ class DegreeRepository:
             ).values(**degree_data)
             
             await self.db_session.execute(query)
+            graph_sync_queue.track(self.db_session, "degree", degree_id)
             await self.db_session.commit()
             
             # Retrieve updated degree with related data
@@ -349,6 +368,12 @@ class DegreeRepository:
             
             query = delete(Degree).where(Degree.degree_id == degree_id)
             result = await self.db_session.execute(query)
+            graph_sync_queue.track(self.db_session, "degree", degree_id, DELETE)
+            if degree_check.education_history:
+                # The degree's major backs the candidate's STUDIES_MAJOR edge
+                graph_sync_queue.track(
+                    self.db_session, "candidate", degree_check.education_history.candidate_id, REBUILD
+                )
             await self.db_session.commit()
             
             return result.rowcount > 0
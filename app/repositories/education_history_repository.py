@@ -14,6 +14,7 @@ from app.domain.models.school import School
 from app.domain.models.education_level import EducationLevel
 from typing import List, Optional, Dict, Any, Tuple
 import logging
+from app.services.graph_sync_queue import graph_sync_queue, RELATIONSHIPS, REBUILD
 
 class EducationHistoryRepository:
     """
@@ -222,6 +223,7 @@ class EducationHistoryRepository:
                 
             education_history = EducationHistory(**education_history_data)
             self.db_session.add(education_history)
+            graph_sync_queue.track(self.db_session, "candidate", education_history.candidate_id, RELATIONSHIPS)
             await self.db_session.commit()
             await self.db_session.refresh(education_history)
             
@@ -268,6 +270,7 @@ class EducationHistoryRepository:
             ).values(**education_history_data)
             
             await self.db_session.execute(query)
+            graph_sync_queue.track(self.db_session, "candidate", education_history_check.candidate_id, RELATIONSHIPS)
             await self.db_session.commit()
             
             # Retrieve updated education history with related data
@@ -295,6 +298,7 @@ class EducationHistoryRepository:
             
             query = delete(EducationHistory).where(EducationHistory.education_history_id == education_history_id)
             result = await self.db_session.execute(query)
+            graph_sync_queue.track(self.db_session, "candidate", education_history_check.candidate_id, REBUILD)
             await self.db_session.commit()
             
             return result.rowcount > 0
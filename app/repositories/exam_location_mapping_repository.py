@@ -16,6 +16,7 @@ from sqlalchemy.sql import expression
 from app.domain.models.exam_location_mapping import ExamLocationMapping
 from app.domain.models.exam_location import ExamLocation
 from app.domain.models.exam import Exam
+from app.services.graph_sync_queue import graph_sync_queue, RELATIONSHIPS, REBUILD
 
 logger = logging.getLogger(__name__)
 
@@ -268,6 +269,7 @@ class ExamLocationMappingRepository:
         
         # Add to session and commit
         self.db.add(new_mapping)
+        graph_sync_queue.track(self.db, "exam", new_mapping.exam_id, RELATIONSHIPS)
         await self.db.commit()
         await self.db.refresh(new_mapping)
         
@@ -305,6 +307,7 @@ class ExamLocationMappingRepository:
             .returning(ExamLocationMapping)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "exam", existing_mapping.exam_id, RELATIONSHIPS)
         await self.db.commit()
         
         updated_mapping = result.scalar_one_or_none()
@@ -334,6 +337,7 @@ class ExamLocationMappingRepository:
         # Delete the exam location mapping
         delete_stmt = delete(ExamLocationMapping).where(ExamLocationMapping.mapping_id == mapping_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "exam", existing_mapping.exam_id, REBUILD)
         await self.db.commit()
         
         logger.info(f"Deleted exam location mapping with ID: {mapping_id}")
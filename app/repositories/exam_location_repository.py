@@ -6,7 +6,7 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +16,8 @@ from sqlalchemy.sql import expression
 from app.domain.models.exam_location import ExamLocation
 from app.domain.models.exam import Exam
 from app.domain.models.exam_location_mapping import ExamLocationMapping
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +137,21 @@ class ExamLocationRepository:
         
         return exam_locations, total or 0
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[ExamLocation]]:
+        """
+        Read all exam locations in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of exam locations per chunk
+            limit: Optional maximum number of exam locations to read
+            
+        Yields:
+            Lists of exam locations
+        """
+        query = select(ExamLocation)
+        async for chunk in stream_keyset(self.db, query, ExamLocation.location_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, location_id: str) -> Optional[Dict]:
         """
         Get an exam location by its ID, including exam details.
@@ -288,6 +305,7 @@ class ExamLocationRepository:
             )
             self.db.add(mapping)
         
+        graph_sync_queue.track(self.db, "exam_location", new_exam_location.location_id)
         await self.db.commit()
         await self.db.refresh(new_exam_location)
         
@@ -351,6 +369,7 @@ class ExamLocationRepository:
                 )
                 self.db.add(mapping)
         
+        graph_sync_queue.track(self.db, "exam_location", location_id)
         await self.db.commit()
         
         updated_location = result.scalar_one_or_none()
@@ -385,6 +404,7 @@ class ExamLocationRepository:
         delete_stmt = delete(ExamLocation).where(ExamLocation.location_id == location_id)
         await self.db.execute(delete_stmt)
         
+        graph_sync_queue.track(self.db, "exam_location", location_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted exam location with ID: {location_id}")
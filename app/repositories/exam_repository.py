@@ -6,7 +6,7 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,6 +17,8 @@ from app.domain.models.exam import Exam
 from app.domain.models.exam_type import ExamType
 from app.domain.models.management_unit import ManagementUnit
 from app.services.id_service import generate_model_id
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +109,21 @@ class ExamRepository:
         
         return exams, total or 0
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[Exam]]:
+        """
+        Read all exams in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of exams per chunk
+            limit: Optional maximum number of exams to read
+            
+        Yields:
+            Lists of exams
+        """
+        query = select(Exam)
+        async for chunk in stream_keyset(self.db, query, Exam.exam_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, exam_id: str) -> Optional[Dict]:
         """
         Get an exam by its ID, including related entity names.
@@ -172,6 +189,7 @@ class ExamRepository:
         
         # Add to session and commit
         self.db.add(new_exam)
+        graph_sync_queue.track(self.db, "exam", new_exam.exam_id)
         await self.db.commit()
         await self.db.refresh(new_exam)
         
@@ -205,6 +223,7 @@ class ExamRepository:
             .returning(Exam)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "exam", exam_id)
         await self.db.commit()
         
         updated_exam = result.scalar_one_or_none()
@@ -234,6 +253,7 @@ class ExamRepository:
         # Delete the exam
         delete_stmt = delete(Exam).where(Exam.exam_id == exam_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "exam", exam_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted exam with ID: {exam_id}")
@@ -6,7 +6,7 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +18,8 @@ from app.domain.models.exam_location import ExamLocation
 from app.domain.models.exam_location_mapping import ExamLocationMapping
 from app.domain.models.exam import Exam
 from app.services.id_service import generate_model_id
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +127,21 @@ class ExamRoomRepository:
         
         return exam_rooms, total or 0
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[ExamRoom]]:
+        """
+        Read all exam rooms in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of exam rooms per chunk
+            limit: Optional maximum number of exam rooms to read
+            
+        Yields:
+            Lists of exam rooms
+        """
+        query = select(ExamRoom)
+        async for chunk in stream_keyset(self.db, query, ExamRoom.room_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, room_id: str) -> Optional[Dict]:
         """
         Get an exam room by its ID, including related details.
@@ -309,6 +326,7 @@ class ExamRoomRepository:
         
         # Add to session and commit
         self.db.add(new_exam_room)
+        graph_sync_queue.track(self.db, "exam_room", new_exam_room.room_id)
         await self.db.commit()
         await self.db.refresh(new_exam_room)
         
@@ -342,6 +360,7 @@ class ExamRoomRepository:
             .returning(ExamRoom)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "exam_room", room_id)
         await self.db.commit()
         
         updated_room = result.scalar_one_or_none()
@@ -371,6 +390,7 @@ class ExamRoomRepository:
         # Delete the exam room
         delete_stmt = delete(ExamRoom).where(ExamRoom.room_id == room_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "exam_room", room_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted exam room with ID: {room_id}")
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_, or_, between
 from sqlalchemy.orm import joinedload
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 import logging
 
 from app.domain.models.exam_schedule import ExamSchedule
@@ -18,6 +18,8 @@ from app.domain.models.exam import Exam
 from app.domain.models.subject import Subject
 from app.domain.models.exam_room import ExamRoom
 from app.domain.models.exam_location import ExamLocation
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 class ExamScheduleRepository:
     """Repository for interacting with the ExamSchedule table."""
@@ -135,6 +137,21 @@ class ExamScheduleRepository:
             self.logger.error(f"Error getting exam schedules: {str(e)}")
             raise
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[ExamSchedule]]:
+        """
+        Read all exam schedules in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of exam schedules per chunk
+            limit: Optional maximum number of exam schedules to read
+            
+        Yields:
+            Lists of exam schedules
+        """
+        query = select(ExamSchedule)
+        async for chunk in stream_keyset(self.db, query, ExamSchedule.exam_schedule_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, exam_schedule_id: str) -> Optional[ExamSchedule]:
         """
         Get an exam schedule by ID.
@@ -424,6 +441,7 @@ class ExamScheduleRepository:
             # Get the created exam schedule with related data
             created_schedule = await self.get_by_id(exam_schedule.exam_schedule_id)
             
+            graph_sync_queue.track(self.db, "exam_schedule", exam_schedule.exam_schedule_id)
             return created_schedule
             
         except Exception as e:
@@ -459,6 +477,7 @@ class ExamScheduleRepository:
             # Get the updated exam schedule
             updated_schedule = await self.get_by_id(exam_schedule_id)
             
+            graph_sync_queue.track(self.db, "exam_schedule", exam_schedule_id)
             return updated_schedule
             
         except Exception as e:
@@ -488,6 +507,7 @@ class ExamScheduleRepository:
             # Delete the exam schedule
             delete_stmt = delete(ExamSchedule).where(ExamSchedule.exam_schedule_id == exam_schedule_id)
             await self.db.execute(delete_stmt)
+            graph_sync_queue.track(self.db, "exam_schedule", exam_schedule_id, DELETE)
             await self.db.commit()
             
             self.logger.info(f"Deleted exam schedule with ID {exam_schedule_id}")
@@ -20,7 +20,10 @@ from app.domain.models.candidate_exam import CandidateExam
 from app.domain.models.candidate_exam_subject import CandidateExamSubject
 from app.domain.models.exam import Exam
 from app.domain.models.subject import Subject
+from app.infrastructure.database.counting import CountStrategy, list_counter
+from app.infrastructure.database.pagination import apply_cursor
 from app.services.id_service import generate_model_id
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -40,15 +43,22 @@ class ExamScoreRepository:
         self, 
         skip: int = 0, 
         limit: int = 100,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[CountStrategy] = None
     ) -> Tuple[List[Dict], int]:
         """
         Get all exam scores with pagination and optional filtering.
         
+        Scores are ordered by ID. Given a cursor, the page starts after it
+        and `skip` is ignored.
+        
         Args:
             skip: Number of records to skip (for pagination)
             limit: Maximum number of records to return
             filters: Optional dictionary of filter criteria
+            cursor: Optional cursor of the previous page
+            count_strategy: How to compute the total, LIST_COUNT_STRATEGY by default
             
         Returns:
             Tuple containing the list of exam scores with details and total count
@@ -118,12 +128,16 @@ class ExamScoreRepository:
             if filter_conditions:
                 query = query.filter(and_(*filter_conditions))
         
-        # Get total count using a simpler approach
-        count_query = select(func.count(func.distinct(ExamScore.exam_score_id))).select_from(ExamScore)
-        total = await self.db.scalar(count_query)
+        # Count the filtered scores; DISTINCT ON keeps one row per score
+        total = await list_counter.count(
+            self.db, query.with_only_columns(ExamScore.exam_score_id), "exam_score", filters, count_strategy
+        )
         
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
+        # Apply pagination; DISTINCT ON requires the ID to lead the ORDER BY
+        query = apply_cursor(query, [ExamScore.exam_score_id], cursor)
+        if not cursor:
+            query = query.offset(skip)
+        query = query.limit(limit)
         
         # Execute query
         result = await self.db.execute(query)
@@ -394,6 +408,7 @@ class ExamScoreRepository:
         
         # Add to session and commit
         self.db.add(new_score)
+        graph_sync_queue.track(self.db, "score", new_score.exam_score_id)
         await self.db.commit()
         await self.db.refresh(new_score)
         
@@ -431,6 +446,7 @@ class ExamScoreRepository:
             .returning(ExamScore)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "score", exam_score_id)
         await self.db.commit()
         
         updated_score = result.scalar_one_or_none()
@@ -460,6 +476,7 @@ class ExamScoreRepository:
         # Delete the exam score
         delete_stmt = delete(ExamScore).where(ExamScore.exam_score_id == exam_score_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "score", exam_score_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted exam score with ID: {exam_score_id}")
@@ -17,6 +17,7 @@ from app.domain.models.exam_subject import ExamSubject
 from app.domain.models.exam import Exam
 from app.domain.models.subject import Subject
 from app.services.id_service import generate_model_id
+from app.services.graph_sync_queue import graph_sync_queue, RELATIONSHIPS, REBUILD
 
 logger = logging.getLogger(__name__)
 
@@ -273,6 +274,7 @@ class ExamSubjectRepository:
         
         # Add to session and commit
         self.db.add(new_exam_subject)
+        graph_sync_queue.track(self.db, "exam", new_exam_subject.exam_id, RELATIONSHIPS)
         await self.db.commit()
         await self.db.refresh(new_exam_subject)
         
@@ -306,6 +308,7 @@ class ExamSubjectRepository:
             .returning(ExamSubject)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "exam", existing_exam_subject.exam_id, RELATIONSHIPS)
         await self.db.commit()
         
         updated_exam_subject = result.scalar_one_or_none()
@@ -335,6 +338,7 @@ class ExamSubjectRepository:
         # Delete the exam subject
         delete_stmt = delete(ExamSubject).where(ExamSubject.exam_subject_id == exam_subject_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "exam", existing_exam_subject.exam_id, REBUILD)
         await self.db.commit()
         
         logger.info(f"Deleted exam subject with ID: {exam_subject_id}")
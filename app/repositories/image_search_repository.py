@@ -4,7 +4,9 @@ Image Search Repository module.
 This module provides data access methods for face embedding storage and retrieval.
 """
 
+import asyncio
 import logging
+import numpy as np
 from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text, select
@@ -12,6 +14,9 @@ from sqlalchemy.orm import selectinload
 from app.domain.models.personal_info import PersonalInfo
 from app.domain.models.candidate import Candidate
 from app.services.image_processing_service import ImageProcessingService
+from app.services.face_index_service import ensure_face_index, face_index_snapshot_writer
+from app.infrastructure.face_index import face_index
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +58,7 @@ class ImageSearchRepository:
         """
         try:
             # Encode embedding for storage
-            encoded_embedding = self.image_processor.encode_embedding(face_embedding)
+            encoded_embedding = self.image_processor.encode_embedding(face_embedding, model=model)
             if not encoded_embedding:
                 logger.error(f"Failed to encode embedding for candidate {candidate_id}")
                 return False
@@ -76,6 +81,10 @@ class ImageSearchRepository:
             # Commit changes
             await self.db.commit()
             
+            # Keep the in-memory index in step with the stored embedding
+            face_index.upsert(candidate_id, face_embedding)
+            face_index_snapshot_writer.schedule()
+            
             logger.info(f"Updated face embedding for candidate {candidate_id}")
             return True
             
@@ -117,7 +126,7 @@ class ImageSearchRepository:
                 if row.face_embedding:
                     # Decode embedding
                     embedding = self.image_processor.decode_embedding(row.face_embedding)
-                    if embedding:
+                    if embedding is not None:
                         candidates.append({
                             "candidate_id": row.candidate_id,
                             "full_name": row.full_name,
@@ -133,46 +142,65 @@ class ImageSearchRepository:
             logger.error(f"Error retrieving candidates with embeddings: {str(e)}", exc_info=True)
             return []
     
-    async def search_by_face(self, face_embedding: List[float], threshold: float = 0.6) -> List[Dict[str, Any]]:
+    async def search_by_face(self, face_embedding: List[float], threshold: float = 0.6,
+                             top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Search for candidates by face embedding.
         
+        Similarity is computed against the in-memory face index with a single
+        matrix-vector product; only the matched candidates are read from the database.
+        
         Args:
             face_embedding: Face embedding to search for
             threshold: Similarity threshold (0-1)
+            top_k: Maximum number of matches, defaults to FACE_SEARCH_MAX_RESULTS
             
         Returns:
             List of candidates with similarity scores
         """
         try:
-            # Get all candidates with embeddings
-            candidates = await self.get_candidates_with_embeddings()
+            await ensure_face_index(self.db)
+            
+            # The similarity scan is CPU-bound; run it off the event loop
+            matches = await asyncio.to_thread(
+                face_index.search,
+                face_embedding,
+                threshold=threshold,
+                top_k=top_k or settings.FACE_SEARCH_MAX_RESULTS
+            )
+            if not matches:
+                return []
+            
+            # Fetch display fields for the matched candidates only
+            stmt = select(
+                Candidate.candidate_id,
+                Candidate.full_name,
+                PersonalInfo.face_embedding_date,
+                PersonalInfo.face_embedding_source
+            ).join(
+                PersonalInfo,
+                Candidate.candidate_id == PersonalInfo.candidate_id
+            ).where(
+                Candidate.candidate_id.in_([candidate_id for candidate_id, _ in matches])
+            )
+            result = await self.db.execute(stmt)
+            rows = {row.candidate_id: row for row in result}
             
-            # Calculate similarity scores
             results = []
-            for candidate in candidates:
-                if not candidate.get("face_embedding"):
-                    continue
-                    
-                # Decode embedding
-                candidate_embedding = self.image_processor.decode_embedding(candidate["face_embedding"])
-                if not candidate_embedding:
+            for candidate_id, similarity in matches:
+                row = rows.get(candidate_id)
+                if row is None:
+                    # Candidate was deleted since the index was loaded
+                    face_index.remove(candidate_id)
+                    face_index_snapshot_writer.schedule()
                     continue
-                    
-                # Calculate similarity using compare_faces
-                similarity = self.image_processor.compare_faces(face_embedding, candidate_embedding)
-                
-                if similarity >= threshold:
-                    results.append({
-                        "candidate_id": candidate["candidate_id"],
-                        "full_name": candidate["full_name"],
-                        "similarity": similarity,
-                        "face_embedding_source": candidate["source"],
-                        "face_embedding_date": candidate["date"] if candidate["date"] else None
-                    })
-            
-            # Sort by similarity (highest first)
-            results.sort(key=lambda x: x["similarity"], reverse=True)
+                results.append({
+                    "candidate_id": candidate_id,
+                    "full_name": row.full_name,
+                    "similarity": similarity,
+                    "face_embedding_source": row.face_embedding_source,
+                    "face_embedding_date": row.face_embedding_date
+                })
             
             return results
             
@@ -195,14 +223,17 @@ class ImageSearchRepository:
                 PersonalInfo.candidate_id == candidate_id
             )
             result = await self.db.execute(stmt)
-            row = result.scalar_one_or_none()
+            encoded = result.scalar_one_or_none()
             
-            if not row or not row.face_embedding:
+            if not encoded:
                 return None
             
             # Decode embedding
-            return self.image_processor.decode_embedding(row.face_embedding)
+            embedding = self.image_processor.decode_embedding(encoded)
+            if embedding is None:
+                return None
+            return np.asarray(embedding, dtype=float).tolist()
             
         except Exception as e:
             logger.error(f"Error getting face embedding: {str(e)}", exc_info=True)
-            return None 
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -6,7 +6,7 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +15,8 @@ from sqlalchemy.sql import expression
 
 from app.domain.models.major import Major
 from app.services.id_service import generate_model_id
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +71,21 @@ class MajorRepository:
         
         return majors, total or 0
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[Major]]:
+        """
+        Read all majors in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of majors per chunk
+            limit: Optional maximum number of majors to read
+            
+        Yields:
+            Lists of majors
+        """
+        query = select(Major)
+        async for chunk in stream_keyset(self.db, query, Major.major_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, major_id: str) -> Optional[Major]:
         """
         Get a major by its ID.
@@ -103,6 +120,7 @@ class MajorRepository:
         
         # Add to session and commit
         self.db.add(new_major)
+        graph_sync_queue.track(self.db, "major", new_major.major_id)
         await self.db.commit()
         await self.db.refresh(new_major)
         
@@ -133,6 +151,7 @@ class MajorRepository:
             .returning(Major)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "major", major_id)
         await self.db.commit()
         
         updated_major = result.scalar_one_or_none()
@@ -159,6 +178,7 @@ class MajorRepository:
         # Delete the major
         delete_stmt = delete(Major).where(Major.major_id == major_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "major", major_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted major with ID: {major_id}")
@@ -6,7 +6,7 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +14,8 @@ from sqlalchemy import select, update, delete, func
 from sqlalchemy.sql import expression
 
 from app.domain.models.management_unit import ManagementUnit
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +70,21 @@ class ManagementUnitRepository:
         
         return units, total or 0
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[ManagementUnit]]:
+        """
+        Read all management units in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of management units per chunk
+            limit: Optional maximum number of management units to read
+            
+        Yields:
+            Lists of management units
+        """
+        query = select(ManagementUnit)
+        async for chunk in stream_keyset(self.db, query, ManagementUnit.unit_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, unit_id: str) -> Optional[ManagementUnit]:
         """
         Get a management unit by its ID.
@@ -97,6 +114,7 @@ class ManagementUnitRepository:
         
         # Add to session and commit
         self.db.add(new_unit)
+        graph_sync_queue.track(self.db, "management_unit", new_unit.unit_id)
         await self.db.commit()
         await self.db.refresh(new_unit)
         
@@ -127,6 +145,7 @@ class ManagementUnitRepository:
             .returning(ManagementUnit)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "management_unit", unit_id)
         await self.db.commit()
         
         updated_unit = result.scalar_one_or_none()
@@ -153,6 +172,7 @@ class ManagementUnitRepository:
         # Delete the unit
         delete_stmt = delete(ManagementUnit).where(ManagementUnit.unit_id == unit_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "management_unit", unit_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted management unit with ID: {unit_id}")
@@ -9,7 +9,7 @@ with filtering options.
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_
 from sqlalchemy.orm import joinedload
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from app.domain.models.recognition import Recognition
 from app.domain.models.candidate_exam import CandidateExam
 from app.domain.models.candidate import Candidate
@@ -17,6 +17,8 @@ from app.domain.models.exam import Exam
 from datetime import date
 import logging
 from app.services.id_service import generate_model_id
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 class RecognitionRepository:
     """Repository for Recognition database operations"""
@@ -101,6 +103,21 @@ class RecognitionRepository:
             self.logger.error(f"Error in get_all: {e}")
             raise
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[Recognition]]:
+        """
+        Read all recognitions in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of recognitions per chunk
+            limit: Optional maximum number of recognitions to read
+            
+        Yields:
+            Lists of recognitions
+        """
+        query = select(Recognition)
+        async for chunk in stream_keyset(self.db, query, Recognition.recognition_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, recognition_id: str) -> Optional[Recognition]:
         """
         Get a recognition by ID
@@ -238,6 +255,7 @@ class RecognitionRepository:
             self.logger.info(f"Successfully created recognition: {recognition.recognition_id}")
             
             # Return the fully loaded recognition with relationships
+            graph_sync_queue.track(self.db, "recognition", recognition.recognition_id)
             return await self.get_by_id(recognition.recognition_id)
         
         except Exception as e:
@@ -278,6 +296,7 @@ class RecognitionRepository:
             
             # Get updated recognition
             updated_recognition = await self.get_by_id(recognition_id)
+            graph_sync_queue.track(self.db, "recognition", recognition_id)
             return updated_recognition
         
         except Exception as e:
@@ -308,6 +327,7 @@ class RecognitionRepository:
             await self.db.execute(query)
             await self.db.flush()
             
+            graph_sync_queue.track(self.db, "recognition", recognition_id, DELETE)
             return True
         
         except Exception as e:
@@ -16,6 +16,7 @@ from app.domain.models.school_major import SchoolMajor
 from app.domain.models.school import School
 from app.domain.models.major import Major
 from app.services.id_service import generate_model_id
+from app.services.graph_sync_queue import graph_sync_queue, RELATIONSHIPS, REBUILD
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +174,7 @@ class SchoolMajorRepository:
         
         # Add to session and commit
         self.db.add(new_school_major)
+        graph_sync_queue.track(self.db, "school", new_school_major.school_id, RELATIONSHIPS)
         await self.db.commit()
         await self.db.refresh(new_school_major)
         
@@ -206,6 +208,7 @@ class SchoolMajorRepository:
             .returning(SchoolMajor)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "school", existing_sm.school_id, RELATIONSHIPS)
         await self.db.commit()
         
         updated_school_major = result.scalar_one_or_none()
@@ -235,6 +238,7 @@ class SchoolMajorRepository:
         # Delete the school-major relationship
         delete_stmt = delete(SchoolMajor).where(SchoolMajor.school_major_id == school_major_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "school", existing_sm.school_id, REBUILD)
         await self.db.commit()
         
         logger.info(f"Deleted school-major relationship with ID: {school_major_id}")
@@ -6,7 +6,7 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +15,8 @@ from sqlalchemy.sql import expression
 
 from app.domain.models.school import School
 from app.services.id_service import generate_model_id
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +71,21 @@ class SchoolRepository:
         
         return schools, total or 0
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[School]]:
+        """
+        Read all schools in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of schools per chunk
+            limit: Optional maximum number of schools to read
+            
+        Yields:
+            Lists of schools
+        """
+        query = select(School)
+        async for chunk in stream_keyset(self.db, query, School.school_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, school_id: str) -> Optional[School]:
         """
         Get a school by its ID.
@@ -103,6 +120,7 @@ class SchoolRepository:
         
         # Add to session and commit
         self.db.add(new_school)
+        graph_sync_queue.track(self.db, "school", new_school.school_id)
         await self.db.commit()
         await self.db.refresh(new_school)
         
@@ -133,6 +151,7 @@ class SchoolRepository:
             .returning(School)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "school", school_id)
         await self.db.commit()
         
         updated_school = result.scalar_one_or_none()
@@ -159,6 +178,7 @@ class SchoolRepository:
         # Delete the school
         delete_stmt = delete(School).where(School.school_id == school_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "school", school_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted school with ID: {school_id}")
@@ -6,11 +6,11 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime, date
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, join, and_, or_
+from sqlalchemy import select, update, delete, join, and_, or_
 from sqlalchemy.sql import expression
 from sqlalchemy.orm import joinedload
 
@@ -22,6 +22,10 @@ from app.domain.models.candidate import Candidate
 from app.domain.models.exam import Exam
 from app.domain.models.subject import Subject
 from app.domain.models.user import User
+from app.infrastructure.database.counting import CountStrategy, list_counter
+from app.infrastructure.database.pagination import apply_cursor
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +45,22 @@ class ScoreReviewRepository:
         self, 
         skip: int = 0, 
         limit: int = 100,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[CountStrategy] = None
     ) -> Tuple[List[Dict], int]:
         """
         Get all score reviews with pagination and optional filtering.
         
+        Reviews are listed newest first, ties broken by ID. Given a cursor,
+        the page starts after it and `skip` is ignored.
+        
         Args:
             skip: Number of records to skip (for pagination)
             limit: Maximum number of records to return
             filters: Optional dictionary of filter criteria
+            cursor: Optional cursor of the previous page
+            count_strategy: How to compute the total, LIST_COUNT_STRATEGY by default
             
         Returns:
             Tuple containing the list of score reviews with details and total count
@@ -115,12 +126,20 @@ class ScoreReviewRepository:
                 created_before = datetime.fromisoformat(filters["created_before"])
                 query = query.filter(ScoreReview.created_at <= created_before)
         
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.db.scalar(count_query)
+        # Count distinct reviews, as the search joins can repeat a review
+        total = await list_counter.count(
+            self.db,
+            query.with_only_columns(ScoreReview.score_review_id).distinct(),
+            "score_review",
+            filters,
+            count_strategy
+        )
         
         # Apply pagination
-        query = query.offset(skip).limit(limit).order_by(ScoreReview.created_at.desc())
+        query = apply_cursor(query, [ScoreReview.created_at, ScoreReview.score_review_id], cursor, descending=True)
+        if not cursor:
+            query = query.offset(skip)
+        query = query.limit(limit)
         
         result = await self.db.execute(query)
         reviews = result.scalars().unique().all()
@@ -130,6 +149,21 @@ class ScoreReviewRepository:
         
         return reviews_dict, total or 0
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[ScoreReview]]:
+        """
+        Read all score reviews in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of score reviews per chunk
+            limit: Optional maximum number of score reviews to read
+            
+        Yields:
+            Lists of score reviews
+        """
+        query = select(ScoreReview)
+        async for chunk in stream_keyset(self.db, query, ScoreReview.score_review_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, score_review_id: str) -> Optional[Dict]:
         """
         Get a score review by its ID, including related entity details.
@@ -409,6 +443,7 @@ class ScoreReviewRepository:
         
         # Add to session and commit
         self.db.add(new_review)
+        graph_sync_queue.track(self.db, "score_review", new_review.score_review_id)
         await self.db.commit()
         await self.db.refresh(new_review)
         
@@ -442,6 +477,7 @@ class ScoreReviewRepository:
             .returning(ScoreReview)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "score_review", score_review_id)
         await self.db.commit()
         
         updated_review = result.scalar_one_or_none()
@@ -471,6 +507,7 @@ class ScoreReviewRepository:
         # Delete the score review
         delete_stmt = delete(ScoreReview).where(ScoreReview.score_review_id == score_review_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "score_review", score_review_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted score review with ID: {score_review_id}")
@@ -6,7 +6,7 @@ including CRUD operations and queries.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +14,8 @@ from sqlalchemy import select, update, delete, func
 from sqlalchemy.sql import expression
 
 from app.domain.models.subject import Subject
+from app.infrastructure.database.streaming import stream_keyset
+from app.services.graph_sync_queue import graph_sync_queue, DELETE
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +70,21 @@ class SubjectRepository:
         
         return subjects, total or 0
     
+    async def stream_all(self, chunk_size: int = 1000, limit: Optional[int] = None) -> AsyncIterator[List[Subject]]:
+        """
+        Read all subjects in chunks ordered by ID, without OFFSET.
+        
+        Args:
+            chunk_size: Maximum number of subjects per chunk
+            limit: Optional maximum number of subjects to read
+            
+        Yields:
+            Lists of subjects
+        """
+        query = select(Subject)
+        async for chunk in stream_keyset(self.db, query, Subject.subject_id, chunk_size, limit):
+            yield chunk
+    
     async def get_by_id(self, subject_id: str) -> Optional[Subject]:
         """
         Get a subject by its ID.
@@ -97,6 +114,7 @@ class SubjectRepository:
         
         # Add to session and commit
         self.db.add(new_subject)
+        graph_sync_queue.track(self.db, "subject", new_subject.subject_id)
         await self.db.commit()
         await self.db.refresh(new_subject)
         
@@ -127,6 +145,7 @@ class SubjectRepository:
             .returning(Subject)
         )
         result = await self.db.execute(update_stmt)
+        graph_sync_queue.track(self.db, "subject", subject_id)
         await self.db.commit()
         
         updated_subject = result.scalar_one_or_none()
@@ -153,6 +172,7 @@ class SubjectRepository:
         # Delete the subject
         delete_stmt = delete(Subject).where(Subject.subject_id == subject_id)
         await self.db.execute(delete_stmt)
+        graph_sync_queue.track(self.db, "subject", subject_id, DELETE)
         await self.db.commit()
         
         logger.info(f"Deleted subject with ID: {subject_id}")
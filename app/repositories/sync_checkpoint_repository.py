@@ -0,0 +1,156 @@
+"""
+Sync Checkpoint repository module.
+
+This module provides database operations for the incremental Neo4j sync:
+reading and saving per-stream checkpoints, and reading the changed and
+deleted rows that lie beyond a checkpoint.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.sync_checkpoint import SyncCheckpoint
+from app.domain.models.sync_deletion import SyncDeletion
+
+logger = logging.getLogger(__name__)
+
+class SyncCheckpointRepository:
+    """Repository for incremental sync checkpoints and change queries."""
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the repository with a database session.
+        
+        Args:
+            db: An async SQLAlchemy session
+        """
+        self.db = db
+    
+    async def get(self, stream: str) -> Optional[SyncCheckpoint]:
+        """
+        Get the checkpoint of a change stream.
+        
+        Args:
+            stream: Change stream name
+            
+        Returns:
+            The checkpoint, or None if the stream has never been synchronized
+        """
+        result = await self.db.execute(select(SyncCheckpoint).filter(SyncCheckpoint.stream == stream))
+        return result.scalar_one_or_none()
+    
+    async def get_all(self) -> List[SyncCheckpoint]:
+        """
+        Get the checkpoints of every change stream.
+        
+        Returns:
+            List of checkpoints ordered by stream name
+        """
+        result = await self.db.execute(select(SyncCheckpoint).order_by(SyncCheckpoint.stream))
+        return list(result.scalars().all())
+    
+    async def save(self, stream: str, **values: Any) -> None:
+        """
+        Create or update the checkpoint of a change stream and commit it.
+        
+        Args:
+            stream: Change stream name
+            **values: Columns to set (changed_at, last_key, last_deletion_id)
+        """
+        statement = insert(SyncCheckpoint).values(stream=stream, **values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[SyncCheckpoint.stream],
+            set_={**values, "updated_at": statement.excluded.updated_at}
+        )
+        await self.db.execute(statement)
+        await self.db.commit()
+    
+    async def get_changes(
+        self,
+        table: str,
+        key_column: str,
+        entity_expression: str,
+        after_changed_at: datetime,
+        after_key: str,
+        until: datetime,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get rows of a table changed after a checkpoint, oldest first.
+        
+        A row's change time is its updated_at, or created_at if it was never
+        updated. Rows are ordered by (change time, key) so that paging can resume
+        from the last row seen.
+        
+        Args:
+            table: Table name
+            key_column: Primary key column of the table
+            entity_expression: SQL expression over alias "t" giving the entity to re-sync
+            after_changed_at: Change time of the checkpoint
+            after_key: Key of the last row processed at that change time
+            until: Upper bound on change times, excluding still-open transactions
+            limit: Maximum number of rows to return
+            
+        Returns:
+            List of dicts with "key", "entity_id" and "changed_at"
+        """
+        query = text(f"""
+            SELECT t.{key_column} AS key, {entity_expression} AS entity_id,
+                   COALESCE(t.updated_at, t.created_at) AS changed_at
+            FROM {table} t
+            WHERE (COALESCE(t.updated_at, t.created_at), t.{key_column}) > (:after_changed_at, :after_key)
+              AND COALESCE(t.updated_at, t.created_at) <= :until
+            ORDER BY COALESCE(t.updated_at, t.created_at), t.{key_column}
+            LIMIT :limit
+        """)
+        result = await self.db.execute(query, {
+            "after_changed_at": after_changed_at,
+            "after_key": after_key,
+            "until": until,
+            "limit": limit
+        })
+        return [dict(row) for row in result.mappings().all()]
+    
+    async def get_deletions(self, entity_type: str, after_deletion_id: int, limit: int) -> List[SyncDeletion]:
+        """
+        Get deletions of an entity type recorded after a checkpoint, oldest first.
+        
+        Args:
+            entity_type: Entity type
+            after_deletion_id: Last deletion ID processed
+            limit: Maximum number of deletions to return
+            
+        Returns:
+            List of deletions
+        """
+        query = (
+            select(SyncDeletion)
+            .filter(SyncDeletion.entity_type == entity_type, SyncDeletion.deletion_id > after_deletion_id)
+            .order_by(SyncDeletion.deletion_id)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
+    async def purge_deletions(self, entity_type: str, up_to_deletion_id: int) -> int:
+        """
+        Remove deletions that have been applied to Neo4j.
+        
+        Args:
+            entity_type: Entity type
+            up_to_deletion_id: Last deletion ID applied
+            
+        Returns:
+            Number of rows removed
+        """
+        result = await self.db.execute(
+            delete(SyncDeletion)
+            .where(SyncDeletion.entity_type == entity_type, SyncDeletion.deletion_id <= up_to_deletion_id)
+        )
+        await self.db.commit()
+        return result.rowcount
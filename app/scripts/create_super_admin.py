@@ -23,6 +23,8 @@ from app.domain.models.role import Role
 from app.domain.models.permission import Permission
 from app.domain.models.role_permission import RolePermission
 from app.services.id_service import generate_model_id
+from app.infrastructure.cache.redis_connection import redis_cache
+from app.infrastructure.cache.auth_principal_cache import auth_principal_cache
 from sqlalchemy import select, and_
 
 # Configure logging
@@ -244,6 +246,15 @@ async def create_super_admin():
         logger.info("Committing changes to database...")
         await db.commit()
         logger.info(f"Super admin created successfully with email: {super_admin_email}")
+        
+        # Role permissions may have changed; drop principals cached by running workers
+        try:
+            await redis_cache.connect()
+            await auth_principal_cache.invalidate_role(super_admin_role.role_id)
+            await auth_principal_cache.invalidate_role(admin_role.role_id)
+            await redis_cache.close()
+        except Exception as e:
+            logger.warning(f"Could not invalidate cached admin principals: {str(e)}")
     
     except Exception as e:
         logger.error(f"Error creating super admin: {str(e)}")
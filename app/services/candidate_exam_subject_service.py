@@ -13,6 +13,8 @@ from app.repositories.candidate_exam_subject_repository import CandidateExamSubj
 from app.repositories.candidate_exam_repository import CandidateExamRepository
 from app.repositories.exam_subject_repository import ExamSubjectRepository
 from app.domain.models.candidate_exam_subject import RegistrationStatus
+from app.infrastructure.database.counting import CountStrategy
+from app.infrastructure.database.pagination import next_cursor
 
 class CandidateExamSubjectService:
     """Service for candidate exam subject registration operations."""
@@ -45,8 +47,10 @@ class CandidateExamSubjectService:
         subject_id: Optional[str] = None,
         candidate_exam_id: Optional[str] = None,
         exam_subject_id: Optional[str] = None,
-        status: Optional[str] = None
-    ) -> Tuple[List[Any], int]:
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[CountStrategy] = None
+    ) -> Tuple[List[Any], int, Optional[str]]:
         """
         Get all candidate exam subject registrations with optional filtering.
         
@@ -59,9 +63,11 @@ class CandidateExamSubjectService:
             candidate_exam_id: Filter by candidate exam ID
             exam_subject_id: Filter by exam subject ID
             status: Filter by registration status
+            cursor: Optional cursor of the previous page, used instead of skip
+            count_strategy: How to compute the total count, LIST_COUNT_STRATEGY by default
             
         Returns:
-            Tuple of (list of registrations, total count)
+            Tuple of (list of registrations, total count, cursor of the next page)
         """
         try:
             registrations, total = await self.repository.get_all(
@@ -72,9 +78,11 @@ class CandidateExamSubjectService:
                 subject_id=subject_id,
                 candidate_exam_id=candidate_exam_id,
                 exam_subject_id=exam_subject_id,
-                status=status
+                status=status,
+                cursor=cursor,
+                count_strategy=count_strategy
             )
-            return registrations, total
+            return registrations, total, next_cursor(registrations, limit, ["candidate_exam_subject_id"])
         except Exception as e:
             self.logger.error(f"Error getting candidate exam subject registrations: {str(e)}")
             raise
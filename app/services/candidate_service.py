@@ -1,8 +1,9 @@
-from app.repositories.candidate_repository import CandidateRepository
+from app.repositories.candidate_repository import CandidateRepository, CandidateSearchMode
 # Temporarily comment out Neo4j imports so the application can start
 # from app.graph_repositories.candidate_graph_repository import CandidateGraphRepository
 # from app.domain.graph_models.candidate_node import CandidateNode
-from typing import List, Dict, Any, Optional
+from app.infrastructure.database.pagination import next_cursor
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 import logging
 
 class CandidateService:
@@ -38,6 +39,43 @@ class CandidateService:
             self.logger.error(f"Error getting all candidates: {e}")
             raise
     
+    async def get_candidates_page(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get a page of candidates ordered by ID, with the cursor of the next page
+        
+        Args:
+            skip: Number of records to skip, ignored when a cursor is given
+            limit: Maximum number of records to return
+            cursor: Optional cursor of the previous page
+            
+        Returns:
+            Tuple of (serialized candidates, cursor of the next page or None)
+        """
+        try:
+            candidates = await self.candidate_repo.get_all_with_personal_info(skip, limit, cursor)
+            return (
+                [self._serialize_candidate_with_details(candidate) for candidate in candidates],
+                next_cursor(candidates, limit, ["candidate_id"])
+            )
+        except Exception as e:
+            self.logger.error(f"Error getting candidates page: {e}")
+            raise
+    
+    async def stream_candidates(self, chunk_size: int = 1000) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Read all candidates in chunks, for exports
+        
+        Args:
+            chunk_size: Maximum number of candidates per chunk
+            
+        Yields:
+            Lists of serialized candidates with personal information
+        """
+        async for candidates in self.candidate_repo.stream_all(chunk_size=chunk_size, include_personal_info=True):
+            yield [self._serialize_candidate_with_details(candidate) for candidate in candidates]
+    
     async def get_candidate(self, candidate_id: str) -> Optional[Dict[str, Any]]:
         """
         Get candidate information by ID
@@ -151,7 +189,13 @@ class CandidateService:
             self.logger.error(f"Error deleting candidate {candidate_id}: {e}")
             raise
     
-    async def search_candidates(self, search_term: str, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    async def search_candidates(
+        self,
+        search_term: str,
+        skip: int = 0,
+        limit: int = 100,
+        mode: CandidateSearchMode = CandidateSearchMode.AUTO
+    ) -> List[Dict[str, Any]]:
         """
         Search candidates by keyword
         
@@ -159,12 +203,13 @@ class CandidateService:
             search_term: Search keyword
             skip: Number of records to skip (for pagination)
             limit: Maximum number of records to return
+            mode: Matching mode (keys, similarity, or keys with similarity fallback)
             
         Returns:
             List of candidates matching the keyword
         """
         try:
-            candidates = await self.candidate_repo.search(search_term, skip, limit)
+            candidates = await self.candidate_repo.search(search_term, skip, limit, mode)
             return [self._serialize_candidate(candidate) for candidate in candidates]
         except Exception as e:
             self.logger.error(f"Error searching candidates with term '{search_term}': {e}")
@@ -14,6 +14,8 @@ from app.repositories.exam_score_repository import ExamScoreRepository
 from app.repositories.candidate_exam_repository import CandidateExamRepository
 from app.repositories.exam_subject_repository import ExamSubjectRepository
 from app.domain.models.exam_score import ExamScore
+from app.infrastructure.database.counting import CountStrategy
+from app.infrastructure.database.pagination import next_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +55,10 @@ class ExamScoreService:
         min_score: Optional[float] = None,
         max_score: Optional[float] = None,
         score_date: Optional[str] = None,
-        graded_by: Optional[str] = None
-    ) -> Tuple[List[Dict], int]:
+        graded_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[CountStrategy] = None
+    ) -> Tuple[List[Dict], int, Optional[str]]:
         """
         Get all exam scores with pagination and optional filtering.
         
@@ -70,9 +74,11 @@ class ExamScoreService:
             max_score: Optional filter by maximum score
             score_date: Optional filter by score date (YYYY-MM-DD)
             graded_by: Optional filter by grader ID
+            cursor: Optional cursor of the previous page, used instead of skip
+            count_strategy: How to compute the total count, LIST_COUNT_STRATEGY by default
             
         Returns:
-            Tuple containing the list of exam scores and total count
+            Tuple containing the list of exam scores, total count and the cursor of the next page
         """
         filters = {}
         if search:
@@ -94,7 +100,10 @@ class ExamScoreService:
         if graded_by:
             filters["graded_by"] = graded_by
         
-        return await self.repository.get_all(skip=skip, limit=limit, filters=filters)
+        scores, total = await self.repository.get_all(
+            skip=skip, limit=limit, filters=filters, cursor=cursor, count_strategy=count_strategy
+        )
+        return scores, total, next_cursor(scores, limit, ["exam_score_id"])
     
     async def get_score_by_id(self, score_id: str) -> Optional[Dict]:
         """
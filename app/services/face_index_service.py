@@ -0,0 +1,396 @@
+"""
+Face Index Service module.
+
+This module keeps the process-wide face index in step with the database, including:
+- Lazy loading of the index on first use and after it goes stale
+- A background job that periodically reloads, retrains and snapshots the index
+- Memory-mapping the shared on-disk snapshot at startup and whenever another
+  worker publishes a newer version
+- Debounced snapshot refreshes after individual embeddings change
+"""
+
+import asyncio
+import fcntl
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.models.personal_info import PersonalInfo
+from app.infrastructure.database.connection import async_session
+from app.infrastructure.face_index import face_index
+from app.infrastructure.face_index.face_index import create_face_index
+from app.infrastructure.face_index.ivf_index import IVFFaceIndex
+from app.services.image_processing_service import ImageProcessingService
+
+logger = logging.getLogger(__name__)
+
+# Serializes face index reloads within this worker process
+_face_index_build_lock = asyncio.Lock()
+
+# Touched whenever a snapshot is built from a full database reload
+REBUILD_MARKER = "REBUILT"
+
+# Monotonic time of the last check for a newer snapshot version
+_snapshot_checked_at = 0.0
+
+
+@contextmanager
+def _snapshot_file_lock() -> Iterator[None]:
+    """
+    Hold an exclusive lock on the snapshot directory across worker processes.
+    
+    Blocks, so it must only be taken from a worker thread.
+    """
+    directory = settings.FACE_INDEX_SNAPSHOT_DIR
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, ".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _publish_snapshot() -> str:
+    """
+    Write the live index as a new snapshot version and remap it.
+    
+    Returns:
+        The version that was written
+    """
+    directory = settings.FACE_INDEX_SNAPSHOT_DIR
+    with _snapshot_file_lock():
+        version = face_index.save_snapshot(directory)
+        with open(os.path.join(directory, REBUILD_MARKER), "w") as f:
+            f.write(version)
+        # Swap the private matrix for the shared mapping of the file just written
+        face_index.load_snapshot(directory)
+    return version
+
+
+def _merge_snapshot() -> Optional[str]:
+    """
+    Fold this worker's unsaved changes into the latest snapshot version.
+    
+    Other workers may have published versions with their own changes since this
+    worker last loaded, so the changes are applied on top of the latest version
+    rather than writing this worker's possibly outdated matrix.
+    
+    Returns:
+        The version that was written, or None if there was nothing to write
+    """
+    directory = settings.FACE_INDEX_SNAPSHOT_DIR
+    with _snapshot_file_lock():
+        journal = face_index.take_journal()
+        if not journal:
+            return None
+        try:
+            merged = create_face_index()
+            if not merged.load_snapshot(directory):
+                # No snapshot yet: the live index is the only complete copy
+                face_index.restore_journal(journal)
+                return face_index.save_snapshot(directory)
+            merged.apply_journal(journal)
+            version = merged.save_snapshot(directory)
+        except Exception:
+            face_index.restore_journal(journal)
+            raise
+        face_index.load_snapshot(directory)
+    return version
+
+
+async def _load_from_database(db: AsyncSession) -> int:
+    """
+    Replace the face index contents with the embeddings stored in PostgreSQL.
+    
+    Decoding and normalisation run in a worker thread so the event loop keeps
+    serving requests during a reload.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Number of embeddings loaded
+    """
+    stmt = select(
+        PersonalInfo.candidate_id,
+        PersonalInfo.face_embedding
+    ).where(
+        PersonalInfo.face_embedding.isnot(None)
+    )
+    result = await db.execute(stmt)
+    rows = [(row.candidate_id, row.face_embedding) for row in result]
+    
+    def load() -> int:
+        return face_index.load(
+            (candidate_id, embedding)
+            for candidate_id, encoded in rows
+            if (embedding := ImageProcessingService.decode_embedding(encoded)) is not None
+        )
+    
+    return await asyncio.to_thread(load)
+
+
+async def _refresh_from_snapshot() -> None:
+    """Remap the face index if another worker has published a newer snapshot."""
+    global _snapshot_checked_at
+    
+    now = time.monotonic()
+    if now - _snapshot_checked_at < settings.FACE_INDEX_SNAPSHOT_POLL_SECONDS:
+        return
+    _snapshot_checked_at = now
+    
+    directory = settings.FACE_INDEX_SNAPSHOT_DIR
+    version = face_index.current_snapshot_version(directory)
+    if version is None or version == face_index.snapshot_version:
+        return
+    try:
+        await asyncio.to_thread(face_index.load_snapshot, directory)
+    except Exception as e:
+        logger.warning(f"Could not load face index snapshot {version}: {str(e)}")
+
+
+def _uses_snapshots() -> bool:
+    """Whether the face index is shared between workers through snapshots."""
+    return bool(settings.FACE_INDEX_SNAPSHOT_DIR)
+
+
+def _is_outdated() -> bool:
+    """Whether the face index must be loaded from the database before use."""
+    if _uses_snapshots():
+        # Snapshots are kept fresh by the writer and the rebuild job
+        return not face_index.is_loaded
+    return face_index.is_stale
+
+
+async def ensure_face_index(db: AsyncSession) -> None:
+    """
+    Make sure the face index is loaded and current before it is searched.
+    
+    With snapshots enabled the index follows the newest published snapshot
+    and is only loaded from the database when no snapshot exists; otherwise
+    it is reloaded from the database once it goes stale. Concurrent callers
+    share a single reload; the others wait for it and then use the freshly
+    loaded index.
+    
+    Args:
+        db: Database session
+    """
+    if _uses_snapshots():
+        await _refresh_from_snapshot()
+    if not _is_outdated():
+        return
+    async with _face_index_build_lock:
+        if not _is_outdated():
+            return
+        await _load_from_database(db)
+
+
+async def rebuild_face_index(db: AsyncSession) -> Dict[str, Any]:
+    """
+    Reload the face index, retrain it if approximate, and write a snapshot.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Index statistics after the rebuild
+    """
+    async with _face_index_build_lock:
+        await _load_from_database(db)
+        if isinstance(face_index, IVFFaceIndex) and face_index.size >= face_index.min_size:
+            await asyncio.to_thread(face_index.train)
+        if _uses_snapshots():
+            await asyncio.to_thread(_publish_snapshot)
+    return face_index.stats()
+
+
+class FaceIndexSnapshotWriter:
+    """
+    Debounced writer that publishes single-embedding changes as new snapshots.
+    
+    Uploads change embeddings one at a time; rewriting the snapshot for each of
+    them would be wasteful, so changes are collected for a short delay and
+    then merged into the latest snapshot in one write.
+    """
+    
+    def __init__(self, debounce_seconds: float):
+        """
+        Initialize the writer.
+        
+        Args:
+            debounce_seconds: Delay between the first unsaved change and the write
+        """
+        self.debounce_seconds = debounce_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.last_version: Optional[str] = None
+        self.last_error: Optional[str] = None
+    
+    def schedule(self) -> None:
+        """Request a snapshot write unless one is already pending."""
+        if not _uses_snapshots() or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._write_later())
+    
+    async def flush(self) -> None:
+        """Write pending changes immediately, e.g. during shutdown."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if _uses_snapshots():
+            await self._write()
+    
+    async def _write_later(self) -> None:
+        """Wait for the debounce delay, then write."""
+        await asyncio.sleep(self.debounce_seconds)
+        await self._write()
+    
+    async def _write(self) -> None:
+        """Merge unsaved changes into a new snapshot version."""
+        try:
+            version = await asyncio.to_thread(_merge_snapshot)
+            if version is not None:
+                self.last_version = version
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Error writing face index snapshot: {str(e)}", exc_info=True)
+
+
+face_index_snapshot_writer = FaceIndexSnapshotWriter(settings.FACE_INDEX_SNAPSHOT_DEBOUNCE_SECONDS)
+
+
+class FaceIndexRebuildJob:
+    """
+    Background job that rebuilds the face index on a fixed interval.
+    
+    The job runs inside the worker's event loop; the CPU-heavy parts of each
+    rebuild are delegated to worker threads. A rebuild can also be requested
+    immediately with `trigger`.
+    """
+    
+    def __init__(self, interval_seconds: int):
+        """
+        Initialize the job.
+        
+        Args:
+            interval_seconds: Seconds between rebuilds, or 0 to only rebuild on demand
+        """
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+        self.last_error: Optional[str] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the background task is active."""
+        return self._task is not None and not self._task.done()
+    
+    def start(self) -> None:
+        """Start the background task if it is not already running."""
+        if self.is_running:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Started face index rebuild job (interval: {self.interval_seconds}s)")
+    
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if not self.is_running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Stopped face index rebuild job")
+    
+    def trigger(self) -> None:
+        """Request an immediate rebuild."""
+        if not self.is_running:
+            self.start()
+        self._wakeup.set()
+    
+    def _snapshot_is_recent(self) -> bool:
+        """Whether any worker published a full rebuild within the last interval."""
+        if not _uses_snapshots():
+            return False
+        try:
+            rebuilt_at = os.path.getmtime(os.path.join(settings.FACE_INDEX_SNAPSHOT_DIR, REBUILD_MARKER))
+        except OSError:
+            return False
+        return time.time() - rebuilt_at < self.interval_seconds
+    
+    async def run_once(self) -> Dict[str, Any]:
+        """
+        Rebuild the face index using a dedicated database session.
+        
+        Returns:
+            Index statistics after the rebuild
+        """
+        async with async_session() as db:
+            return await rebuild_face_index(db)
+    
+    async def _run(self) -> None:
+        """Rebuild on every interval or trigger until cancelled."""
+        while True:
+            timeout = self.interval_seconds or None
+            triggered = True
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                triggered = False
+            self._wakeup.clear()
+            
+            if not triggered and self._snapshot_is_recent():
+                # Another worker rebuilt within the interval; follow its snapshot instead
+                await _refresh_from_snapshot()
+                continue
+            
+            try:
+                self.last_result = await self.run_once()
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Error rebuilding face index: {str(e)}", exc_info=True)
+
+
+face_index_rebuild_job = FaceIndexRebuildJob(settings.FACE_INDEX_REBUILD_INTERVAL_SECONDS)
+
+
+async def start_face_index() -> None:
+    """
+    Map the face index snapshot and start the rebuild job.
+    
+    This function is called during application startup. A missing or unreadable
+    snapshot is not fatal; the index is then loaded from the database on first use.
+    """
+    restored = False
+    if _uses_snapshots():
+        try:
+            restored = await asyncio.to_thread(face_index.load_snapshot, settings.FACE_INDEX_SNAPSHOT_DIR)
+        except Exception as e:
+            logger.warning(f"Could not load face index snapshot: {str(e)}")
+    if settings.FACE_INDEX_REBUILD_INTERVAL_SECONDS > 0:
+        face_index_rebuild_job.start()
+        if not restored:
+            # Build the first snapshot (and IVF centroids) without waiting a full interval
+            face_index_rebuild_job.trigger()
+
+
+async def stop_face_index() -> None:
+    """Stop the face index background jobs and persist unsaved changes during shutdown."""
+    await face_index_rebuild_job.stop()
+    await face_index_snapshot_writer.flush()
@@ -0,0 +1,307 @@
+"""
+Graph Sync Queue module.
+
+This module keeps Neo4j up to date with create, update and delete operations
+made through the repositories, without adding Neo4j latency to the request.
+Repositories record lightweight change events on their session; once the
+session commits, the events are queued and a background task coalesces them
+and applies them to the graph in batches.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
+from app.infrastructure.database.connection import async_session
+from app.infrastructure.ontology.neo4j_connection import neo4j_connection
+
+logger = logging.getLogger(__name__)
+
+# Change actions, from the entity's point of view
+NODE = "node"  # the entity row was inserted or updated: sync its node and relationships
+RELATIONSHIPS = "relationships"  # a dependent row changed: sync only the entity's relationships
+DELETE = "delete"  # the entity row was deleted: remove its node
+REBUILD = "rebuild"  # a dependent row was deleted: sync the node, drop its dependent edges and merge them again
+
+# Session.info key holding the changes recorded in the current transaction
+PENDING_KEY = "graph_sync_changes"
+
+# Queued by stop(); the consumer applies its pending batch and exits on it
+_STOP = object()
+
+
+def _coalesce(previous: Optional[str], action: str) -> str:
+    """Combine two changes to the same entity into the one that covers both."""
+    if action == RELATIONSHIPS and previous in (NODE, REBUILD, DELETE):
+        return previous
+    if action == NODE and previous == REBUILD:
+        return previous
+    if action == REBUILD and previous == DELETE:
+        return previous
+    return action
+
+
+class GraphSyncQueue:
+    """
+    Write-behind queue of entity changes to apply to Neo4j.
+    
+    Changes are collected for up to `window_seconds` (or until `batch_size`
+    distinct entities are waiting), repeated changes to the same entity are
+    merged into one, and the batch is applied on a single session: deletions
+    first, then nodes in dependency order, then relationships. The queue is
+    best effort: a change that fails or is dropped because the queue is full
+    is picked up by the next incremental sync.
+    """
+    
+    def __init__(self, enabled: bool, window_seconds: float, batch_size: int, queue_size: int):
+        """
+        Initialize the queue.
+        
+        Args:
+            enabled: Whether changes are recorded at all
+            window_seconds: Maximum time a change waits before being applied
+            batch_size: Maximum number of distinct entities applied per batch
+            queue_size: Maximum number of changes waiting to be applied
+        """
+        self.enabled = enabled
+        self.window_seconds = window_seconds
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.applied = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.failed = 0
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the background task is active."""
+        return self._task is not None and not self._task.done()
+    
+    def track(self, db: AsyncSession, entity_type: str, entity_id: str, action: str = NODE) -> None:
+        """
+        Record a change made in the session's current transaction.
+        
+        The change is queued when the transaction commits and discarded if it
+        rolls back, so callers may record it before or after committing.
+        
+        Args:
+            db: Session the change was made in
+            entity_type: Entity type, as used by MainSyncService
+            entity_id: ID of the changed entity
+            action: NODE, RELATIONSHIPS, REBUILD or DELETE
+        """
+        if not self.enabled or not entity_id:
+            return
+        db.info.setdefault(PENDING_KEY, []).append((entity_type, entity_id, action))
+    
+    def enqueue(self, entity_type: str, entity_id: str, action: str = NODE) -> None:
+        """
+        Queue a committed change, starting the consumer on first use.
+        
+        Args:
+            entity_type: Entity type, as used by MainSyncService
+            entity_id: ID of the changed entity
+            action: NODE, RELATIONSHIPS, REBUILD or DELETE
+        """
+        if not self.is_running:
+            self.start()
+        try:
+            self._queue.put_nowait((entity_type, entity_id, action))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(f"Graph sync queue is full; {self.dropped} changes dropped so far")
+    
+    def start(self) -> None:
+        """Start the background task if it is not already running."""
+        if self.is_running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the background task and apply any queued changes."""
+        if self.is_running:
+            # Not cancelled, so a batch being collected or applied is not lost
+            await self._queue.put(_STOP)
+            await self._task
+        if self._queue is not None:
+            # Changes committed after the consumer stopped
+            changes: Dict[Tuple[str, str], str] = {}
+            while not self._queue.empty():
+                self._add(changes, self._queue.get_nowait())
+            if changes:
+                await self._apply(changes)
+    
+    def stats(self) -> dict:
+        """Counters describing the queue's activity."""
+        return {
+            "enabled": self.enabled,
+            "running": self.is_running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "applied": self.applied,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "failed": self.failed
+        }
+    
+    def _add(self, changes: Dict[Tuple[str, str], str], change: Tuple[str, str, str]) -> None:
+        """Merge a change into a pending batch."""
+        entity_type, entity_id, action = change
+        key = (entity_type, entity_id)
+        if key in changes:
+            self.coalesced += 1
+        changes[key] = _coalesce(changes.get(key), action)
+    
+    async def _run(self) -> None:
+        """Collect changes into batches and apply them until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            change = await self._queue.get()
+            if change is _STOP:
+                return
+            changes: Dict[Tuple[str, str], str] = {}
+            self._add(changes, change)
+            deadline = loop.time() + self.window_seconds
+            while len(changes) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    change = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if change is _STOP:
+                    stopping = True
+                    break
+                self._add(changes, change)
+            await self._apply(changes)
+    
+    async def _apply(self, changes: Dict[Tuple[str, str], str]) -> None:
+        """Apply one batch of coalesced changes on a single session."""
+        # Imported here because the sync services import the repositories that record changes
+        from app.services.sync.main_sync_service import MainSyncService
+        
+        clear_cache = False
+        try:
+            async with async_session() as db:
+                services = MainSyncService(session=db, driver=neo4j_connection._driver).sync_services
+                applied, failed, clear_cache = await apply_changes(services, changes)
+            self.applied += applied
+            self.failed += failed
+        except Exception as e:
+            self.failed += len(changes)
+            logger.error(f"Error applying {len(changes)} graph changes: {str(e)}")
+        
+        # Shared nodes such as schools or exams, and deleted nodes, can appear
+        # in any candidate's cached info
+        if clear_cache:
+            await candidate_info_cache.clear()
+
+
+async def apply_changes(services: Dict[str, Any], changes: Dict[Tuple[str, str], str]) -> Tuple[int, int, bool]:
+    """
+    Apply coalesced changes to Neo4j through the sync services.
+    
+    Deletions run first, then every node in dependency order, then the
+    relationships, so relationships find the nodes they point at. A rebuild
+    deletes the entity's edges produced by dependent rows before merging its
+    relationships, so edges of deleted rows do not survive. A change that
+    fails is not retried in its later phases.
+    
+    Args:
+        services: Sync services by entity type
+        changes: Action by (entity_type, entity_id)
+    
+    Returns:
+        Tuple of (applied_count, failed_count, whether shared or deleted
+        nodes changed and cached candidate info should be cleared)
+    """
+    # Imported here because the sync services import the repositories that record changes
+    from app.services.sync.main_sync_service import CANDIDATE_OWNED_TYPES, NODE_SYNC_ORDER
+    
+    order = {entity_type: index for index, entity_type in enumerate(NODE_SYNC_ORDER)}
+    for entity_type in {entity_type for entity_type, _ in changes if entity_type not in order}:
+        logger.warning(f"Ignoring graph changes for unknown entity type {entity_type}")
+    ordered = sorted(
+        (item for item in changes.items() if item[0][0] in order),
+        key=lambda item: order[item[0][0]]
+    )
+    phases = [
+        (DELETE, [key for key, action in ordered if action == DELETE]),
+        (NODE, [key for key, action in ordered if action in (NODE, REBUILD)]),
+        (RELATIONSHIPS, [key for key, action in ordered if action != DELETE])
+    ]
+    rebuilds = {key for key, action in ordered if action == REBUILD}
+    failed = set()
+    clear_cache = False
+    for phase, keys in phases:
+        for key in keys:
+            entity_type, entity_id = key
+            if key in failed:
+                continue
+            action = REBUILD if phase == RELATIONSHIPS and key in rebuilds else phase
+            if not await _apply_change(services[entity_type], action, entity_type, entity_id):
+                failed.add(key)
+            elif phase == DELETE or entity_type not in CANDIDATE_OWNED_TYPES:
+                clear_cache = True
+    return (len(ordered) - len(failed), len(failed), clear_cache)
+
+
+async def _apply_change(service, phase: str, entity_type: str, entity_id: str) -> bool:
+    """Apply one phase of a change, returning whether it succeeded."""
+    # Imported here because the sync services import the repositories that record changes
+    from app.services.sync.incremental_sync_service import RELATIONSHIP_STREAMS
+    
+    try:
+        if phase == DELETE:
+            return await service.graph_repository.delete(entity_id)
+        if phase == NODE:
+            return await service.sync_node_by_id(entity_id)
+        if phase == REBUILD:
+            relationship_types = sorted({
+                relationship_type
+                for stream in RELATIONSHIP_STREAMS if stream.entity_type == entity_type
+                for relationship_type in stream.relationship_types
+            })
+            if relationship_types and not await service.graph_repository.delete_relationships(
+                entity_id, relationship_types
+            ):
+                return False
+        if hasattr(service, "sync_relationship_by_id"):
+            await service.sync_relationship_by_id(entity_id)
+        return True
+    except Exception as e:
+        logger.error(f"Error applying {phase} change to {entity_type} {entity_id}: {str(e)}")
+        return False
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_committed_changes(session: Session) -> None:
+    """Queue the changes recorded in a transaction once it commits."""
+    for change in session.info.pop(PENDING_KEY, ()):
+        graph_sync_queue.enqueue(*change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_changes(session: Session) -> None:
+    """Drop the changes recorded in a transaction that rolled back."""
+    session.info.pop(PENDING_KEY, None)
+
+
+graph_sync_queue = GraphSyncQueue(
+    enabled=settings.GRAPH_SYNC_QUEUE_ENABLED,
+    window_seconds=settings.GRAPH_SYNC_QUEUE_WINDOW_SECONDS,
+    batch_size=settings.GRAPH_SYNC_QUEUE_BATCH_SIZE,
+    queue_size=settings.GRAPH_SYNC_QUEUE_SIZE
+)
@@ -11,6 +11,7 @@ from neo4j import AsyncDriver
 import redis.asyncio as redis
 import logging
 from datetime import datetime
+from app.infrastructure.face_model import face_model_registry
 
 logger = logging.getLogger("api")
 
@@ -64,6 +65,12 @@ async def check_all_services(db: AsyncSession, neo4j_driver: AsyncDriver, redis_
     if redis_status["status"] == "down":
         health_info["status"] = "degraded"
     
+    # Check face model readiness
+    face_model_status = check_face_model()
+    health_info["services"]["face_model"] = face_model_status
+    if face_model_status["status"] == "down":
+        health_info["status"] = "degraded"
+    
     # Calculate response time
     end_time = datetime.now()
     health_info["response_time_ms"] = (end_time - start_time).total_seconds() * 1000
@@ -164,4 +171,13 @@ async def check_redis(redis_client):
         logger.error(f"Redis health check failed: {e}")
         result["error"] = str(e)
     
-    return result 
\ No newline at end of file
+    return result 
+
+def check_face_model():
+    """
+    Check whether the face analysis model is loaded in this worker.
+    
+    Returns:
+        dict: Face model readiness status ("up", "loading", "not_loaded" or "down")
+    """
+    return face_model_registry.status()
@@ -5,18 +5,28 @@ This module provides services for processing images and generating face embeddin
 for candidate identification and search.
 """
 
+import asyncio
 import logging
 import numpy as np
 import cv2
 from datetime import datetime
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Union
 from pathlib import Path
 import json
 import base64
 from io import BytesIO
 from PIL import Image
-import insightface
+from fastapi import HTTPException, status
 from insightface.app import FaceAnalysis
+from insightface.utils import face_align
+from app.config import settings
+from app.utilities import embedding_codec
+from app.infrastructure.face_model import (
+    face_model_registry,
+    inference_executor,
+    InferenceSaturatedError,
+    MicroBatcher
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,19 +41,25 @@ class ImageProcessingService:
     4. Image preprocessing and validation
     """
     
-    def __init__(self, model_name: str = "insightface"):
+    def __init__(self, model_name: str = "insightface", face_analyzer: Optional[FaceAnalysis] = None):
         """
         Initialize the image processing service.
         
         Args:
             model_name: Name of the face recognition model to use
+            face_analyzer: Prepared face analysis model, defaults to the process-wide shared model
         """
         self.model_name = model_name
-        self.face_analyzer = FaceAnalysis(
-            name="buffalo_l",  # Using buffalo_l model for better accuracy
-            providers=['CPUExecutionProvider']
+        self.face_analyzer = face_analyzer or face_model_registry.get()
+        self._detector = self.face_analyzer.models['detection']
+        self._recognizer = self.face_analyzer.models['recognition']
+        self._batcher = MicroBatcher(
+            self.process_images_batch,
+            inference_executor,
+            max_batch_size=settings.FACE_BATCH_MAX_SIZE,
+            max_wait_seconds=settings.FACE_BATCH_MAX_WAIT_MS / 1000,
+            max_concurrent_batches=max(1, settings.FACE_INFERENCE_WORKERS - 1)
         )
-        self.face_analyzer.prepare(ctx_id=0, det_size=(640, 640))
         logger.info(f"Initialized ImageProcessingService with model: {model_name}")
     
     def process_image(self, image_data: bytes, source: str) -> Dict[str, Any]:
@@ -57,41 +73,119 @@ class ImageProcessingService:
         Returns:
             Dictionary containing face embedding and metadata
         """
+        return self.process_images_batch([(image_data, source)])[0]
+    
+    def process_images_batch(self, items: List[Tuple[bytes, str]]) -> List[Dict[str, Any]]:
+        """
+        Process several images, embedding all detected faces in one model run.
+        
+        Face detection runs per image; the aligned crops of the first face of
+        every image are then passed to the recognition model as a single batch.
+        
+        Args:
+            items: List of (image_data, source) pairs
+            
+        Returns:
+            One result dictionary per item, in the same order as the input
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        detected = []
+        
+        for position, (image_data, source) in enumerate(items):
+            try:
+                # Convert binary data to numpy array
+                image = self._bytes_to_image(image_data)
+                if image is None:
+                    results[position] = {"error": "Invalid image data"}
+                    continue
+                
+                # Detect faces; the detector returns them highest score first
+                bboxes, kpss = self._detector.detect(image, max_num=0, metric='default')
+                if bboxes.shape[0] == 0:
+                    results[position] = {"error": "No face detected in the image"}
+                    continue
+                
+                # Align the first face found for the recognition model
+                crop = face_align.norm_crop(image, landmark=kpss[0], image_size=self._recognizer.input_size[0])
+                detected.append((position, crop, bboxes.shape[0], image.shape[:2]))
+                
+            except Exception as e:
+                logger.error(f"Error processing image: {str(e)}", exc_info=True)
+                results[position] = {"error": f"Error processing image: {str(e)}", "success": False}
+        
+        if detected:
+            try:
+                embeddings = self._recognizer.get_feat([crop for _, crop, _, _ in detected])
+            except Exception as e:
+                logger.error(f"Error generating face embeddings: {str(e)}", exc_info=True)
+                for position, _, _, _ in detected:
+                    results[position] = {"error": f"Error processing image: {str(e)}", "success": False}
+                return results
+            
+            for (position, _, face_count, image_size), embedding in zip(detected, embeddings):
+                source = items[position][1]
+                results[position] = {
+                    # Convert numpy array to list for JSON serialization
+                    "face_embedding": embedding.tolist(),
+                    "face_embedding_model": self.model_name,
+                    "face_embedding_date": datetime.now().isoformat(),
+                    "face_embedding_source": source,
+                    "face_count": face_count,
+                    "image_size": image_size,
+                    "success": True
+                }
+            
+            logger.info(f"Successfully processed {len(detected)} of {len(items)} images")
+        
+        return results
+    
+    async def process_image_async(self, image_data: bytes, source: str) -> Dict[str, Any]:
+        """
+        Process an image on the inference thread pool instead of the event loop.
+        
+        Args:
+            image_data: Binary image data
+            source: Source of the image (id_card, candidate_card, direct_face)
+            
+        Returns:
+            Dictionary containing face embedding and metadata
+            
+        Raises:
+            HTTPException: 503 with Retry-After if the inference queue is full,
+                504 if inference does not finish within the timeout
+        """
         try:
-            # Convert binary data to numpy array
-            image = self._bytes_to_image(image_data)
-            if image is None:
-                return {"error": "Invalid image data"}
-            
-            # Detect faces and get embeddings
-            faces = self.face_analyzer.get(image)
-            if not faces:
-                return {"error": "No face detected in the image"}
-            
-            # Use the first face found
-            face = faces[0]
-            face_embedding = face.embedding
-            
-            # Convert numpy array to list for JSON serialization
-            embedding_list = face_embedding.tolist()
-            
-            # Create result dictionary
-            result = {
-                "face_embedding": embedding_list,
-                "face_embedding_model": self.model_name,
-                "face_embedding_date": datetime.now().isoformat(),
-                "face_embedding_source": source,
-                "face_count": len(faces),
-                "image_size": image.shape[:2],
-                "success": True
-            }
-            
-            logger.info(f"Successfully processed image from source: {source}")
-            return result
+            return await inference_executor.run(self.process_image, image_data, source)
+        except InferenceSaturatedError as e:
+            logger.warning(f"Rejected image processing request: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Face recognition is busy. Please try again shortly.",
+                headers={"Retry-After": str(e.retry_after)}
+            )
+        except asyncio.TimeoutError:
+            logger.error("Image processing timed out")
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="Image processing timed out. Please try again."
+            )
+    
+    async def process_image_batched(self, image_data: bytes, source: str) -> Dict[str, Any]:
+        """
+        Process an image through the micro-batching scheduler.
+        
+        Concurrent submissions are grouped into one recognition model run. Use
+        this for bulk work; it waits for inference capacity instead of failing
+        with 503 when the pool is busy.
+        
+        Args:
+            image_data: Binary image data
+            source: Source of the image (id_card, candidate_card, direct_face)
             
-        except Exception as e:
-            logger.error(f"Error processing image: {str(e)}", exc_info=True)
-            return {"error": f"Error processing image: {str(e)}", "success": False}
+        Returns:
+            Dictionary containing face embedding and metadata
+        """
+        return await self._batcher.submit((image_data, source))
     
     def compare_faces(self, embedding1: List[float], embedding2: List[float]) -> float:
         """
@@ -181,40 +275,51 @@ class ImageProcessingService:
             logger.error(f"Error converting image data: {str(e)}", exc_info=True)
             return None
     
-    def encode_embedding(self, embedding: List[float]) -> str:
+    @staticmethod
+    def encode_embedding(embedding: List[float], model: str = "", dtype: Optional[str] = None) -> bytes:
         """
-        Encode face embedding to base64 string for storage.
+        Encode face embedding to the binary storage format.
         
         Args:
-            embedding: Face embedding as list of floats
+            embedding: Face embedding as list of floats or numpy array
+            model: Name of the model that produced the embedding
+            dtype: Storage precision, defaults to FACE_EMBEDDING_STORAGE_DTYPE
             
         Returns:
-            Base64 encoded string
+            Encoded bytes, or empty bytes if encoding fails
         """
         try:
-            # Convert to JSON string
-            json_str = json.dumps(embedding)
-            
-            # Encode to base64
-            encoded = base64.b64encode(json_str.encode()).decode()
-            
-            return encoded
+            return embedding_codec.encode_embedding(
+                embedding,
+                model=model,
+                dtype=dtype or settings.FACE_EMBEDDING_STORAGE_DTYPE
+            )
             
         except Exception as e:
             logger.error(f"Error encoding embedding: {str(e)}", exc_info=True)
-            return ""
+            return b""
     
-    def decode_embedding(self, encoded: Any) -> Optional[List[float]]:
+    @staticmethod
+    def decode_embedding(encoded: Any) -> Optional[Union[np.ndarray, List[float]]]:
         """
-        Decode face embedding from base64 string or list.
+        Decode a stored face embedding.
+        
+        Binary embeddings decode to a float32 numpy array (a zero-copy view for
+        float32 storage). The legacy formats, a list of floats or a base64
+        string of JSON, are still accepted.
         
         Args:
-            encoded: Base64 encoded string or list of floats
+            encoded: Binary embedding, base64 encoded string or list of floats
             
         Returns:
-            Face embedding as list of floats, or None if decoding fails
+            Face embedding as array or list of floats, or None if decoding fails
         """
         try:
+            # Current binary format
+            if embedding_codec.is_binary_embedding(encoded):
+                vector, _ = embedding_codec.decode_embedding(encoded)
+                return vector
+            
             # If already a list, return it directly
             if isinstance(encoded, list):
                 return encoded
@@ -225,10 +330,10 @@ class ImageProcessingService:
                 embedding = json.loads(json_str)
                 return embedding
                 
-            # If not a list or string, return None
+            # If not a supported format, return None
             logger.error(f"Invalid embedding format: {type(encoded)}")
             return None
             
         except Exception as e:
             logger.error(f"Error decoding embedding: {str(e)}", exc_info=True)
-            return None 
\ No newline at end of file
+            return None
@@ -5,17 +5,75 @@ This module provides services for storing and managing candidate images.
 """
 
 import os
+import asyncio
 import logging
 import uuid
+import zipfile
 from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator, List, Tuple
 from fastapi import UploadFile, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.domain.models.personal_info import PersonalInfo
 from app.services.image_processing_service import ImageProcessingService
+from app.infrastructure.face_index import face_index
+from app.services.face_index_service import face_index_snapshot_writer
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+def _candidate_id_from_filename(filename: str) -> str:
+    """Extract the candidate ID prefix from an uploaded file name."""
+    stem = os.path.splitext(filename)[0]
+    return stem.split("_", 1)[0].strip()
+
+class BatchUploadTooLarge(Exception):
+    """Raised when a batch upload exceeds the configured image count or size limits."""
+
+
+def _expand_batch_uploads(images: List[UploadFile]) -> List[Tuple[str, str, bytes]]:
+    """Blocking body of ImageStorageService.read_batch_uploads."""
+    max_images = settings.FACE_BATCH_MAX_IMAGES
+    max_image_bytes = settings.FACE_BATCH_MAX_IMAGE_BYTES
+    max_total_bytes = settings.FACE_BATCH_MAX_TOTAL_BYTES
+    items = []
+    total_bytes = 0
+    
+    def admit(name: str, size: int) -> None:
+        nonlocal total_bytes
+        if size > max_image_bytes:
+            raise BatchUploadTooLarge(f"Image {name} is larger than the {max_image_bytes} byte limit")
+        total_bytes += size
+        if total_bytes > max_total_bytes:
+            raise BatchUploadTooLarge(f"Images exceed the {max_total_bytes} byte limit per request")
+    
+    for upload in images:
+        filename = upload.filename or ""
+        upload.file.seek(0)
+        if filename.lower().endswith(".zip") or upload.content_type in ("application/zip", "application/x-zip-compressed"):
+            with zipfile.ZipFile(upload.file) as archive:
+                entries = [
+                    entry for entry in archive.infolist()
+                    if not entry.is_dir() and os.path.basename(entry.filename)
+                    and not os.path.basename(entry.filename).startswith(".")
+                ]
+                if len(items) + len(entries) > max_images:
+                    raise BatchUploadTooLarge(f"Too many images. Maximum per request is {max_images}")
+                for entry in entries:
+                    name = os.path.basename(entry.filename)
+                    # zipfile stops decompressing at the declared file_size, so
+                    # checking it bounds the memory used by each entry
+                    admit(name, entry.file_size)
+                    items.append((name, _candidate_id_from_filename(name), archive.read(entry)))
+        else:
+            if len(items) + 1 > max_images:
+                raise BatchUploadTooLarge(f"Too many images. Maximum per request is {max_images}")
+            name = os.path.basename(filename)
+            content = upload.file.read(max_image_bytes + 1)
+            admit(name, len(content))
+            items.append((name, _candidate_id_from_filename(name), content))
+    return items
+
 class ImageStorageService:
     """Service for handling image storage operations."""
     
@@ -68,18 +126,12 @@ class ImageStorageService:
             HTTPException: If saving fails
         """
         try:
-            # Generate unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{candidate_id}_{image_type}_{timestamp}_{uuid.uuid4().hex[:8]}.jpg"
-            filepath = os.path.join(self.upload_dir, filename)
-            
             # Save the file
-            with open(filepath, "wb") as f:
-                content = await image.read()
-                f.write(content)
+            content = await image.read()
+            relative_url = self._write_file(candidate_id, image_type, content)
             
             # Process image to get face embedding
-            result = self.image_processor.process_image(content, source)
+            result = await self.image_processor.process_image_async(content, source)
             
             if "error" in result:
                 raise HTTPException(status_code=400, detail=result["error"])
@@ -89,22 +141,14 @@ class ImageStorageService:
             if not personal_info:
                 raise HTTPException(status_code=404, detail="Candidate not found")
             
-            # Update image URL and face embedding
-            relative_url = f"/uploads/{filename}"
-            if image_type == "id_card":
-                personal_info.id_card_image_url = relative_url
-            elif image_type == "candidate_card":
-                personal_info.candidate_card_image_url = relative_url
-            elif image_type == "direct_face":
-                personal_info.face_recognition_data_url = relative_url
-            
-            personal_info.face_embedding = result["face_embedding"]
-            personal_info.face_embedding_model = result["face_embedding_model"]
-            personal_info.face_embedding_date = datetime.now()
-            personal_info.face_embedding_source = source
+            self._apply_image(personal_info, image_type, relative_url, result, source)
             
             await self.db.commit()
             
+            # Keep the in-memory index in step with the stored embedding
+            face_index.upsert(candidate_id, result["face_embedding"])
+            face_index_snapshot_writer.schedule()
+            
             return {
                 "message": "Image saved successfully",
                 "image_url": self._get_full_url(relative_url),
@@ -112,10 +156,138 @@ class ImageStorageService:
                 "source": source
             }
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error saving image: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
     
+    @staticmethod
+    async def read_batch_uploads(images: List[UploadFile]) -> List[Tuple[str, str, bytes]]:
+        """
+        Expand a batch upload into individual images.
+        
+        Each upload is either an image or a zip archive of images. The candidate
+        ID is taken from the file name up to the first underscore or dot, e.g.
+        `C2025313786.jpg` or `C2025313786_front.jpg`. Reading and unzipping run
+        in a worker thread, and the image count and sizes are checked before
+        anything is decompressed.
+        
+        Args:
+            images: Uploaded files
+            
+        Returns:
+            List of (file name, candidate ID, content) tuples
+            
+        Raises:
+            BatchUploadTooLarge: If the upload exceeds the count or size limits
+            zipfile.BadZipFile: If an archive cannot be read
+        """
+        return await asyncio.to_thread(_expand_batch_uploads, images)
+    
+    async def save_images_batch(
+        self,
+        items: List[Tuple[str, str, bytes]],
+        image_type: str,
+        source: str
+    ) -> AsyncIterator[dict]:
+        """
+        Save many candidate images, yielding each result as soon as it is ready.
+        
+        Images go through the micro-batching scheduler, so faces from many
+        uploads share recognition model runs. Only a bounded window of images
+        is in flight at once to cap memory use.
+        
+        Args:
+            items: List of (file name, candidate ID, content) tuples
+            image_type: Type of image (id_card, candidate_card, direct_face)
+            source: Source of the image (upload, camera, etc.)
+            
+        Yields:
+            dict: Outcome for one image, in completion order
+        """
+        window = settings.FACE_BATCH_MAX_SIZE * 2
+        pending = {}
+        remaining = iter(items)
+        
+        def schedule(count: int) -> None:
+            for item in islice(remaining, count):
+                task = asyncio.create_task(self.image_processor.process_image_batched(item[2], source))
+                pending[task] = item
+        
+        schedule(window)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    filename, candidate_id, content = pending.pop(task)
+                    yield await self._store_batch_result(task, filename, candidate_id, content, image_type, source)
+                schedule(len(done))
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def _store_batch_result(
+        self,
+        task: asyncio.Task,
+        filename: str,
+        candidate_id: str,
+        content: bytes,
+        image_type: str,
+        source: str
+    ) -> dict:
+        """Persist one processed image of a batch and describe the outcome."""
+        outcome = {"filename": filename, "candidate_id": candidate_id}
+        try:
+            result = task.result()
+            if "error" in result:
+                return {**outcome, "status": "error", "error": result["error"]}
+            
+            personal_info = await self.db.get(PersonalInfo, candidate_id)
+            if not personal_info:
+                return {**outcome, "status": "error", "error": "Candidate not found"}
+            
+            relative_url = self._write_file(candidate_id, image_type, content)
+            self._apply_image(personal_info, image_type, relative_url, result, source)
+            await self.db.commit()
+            
+            face_index.upsert(candidate_id, result["face_embedding"])
+            face_index_snapshot_writer.schedule()
+            return {**outcome, "status": "success", "image_url": self._get_full_url(relative_url)}
+            
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error saving batch image {filename}: {str(e)}", exc_info=True)
+            return {**outcome, "status": "error", "error": str(e)}
+    
+    def _write_file(self, candidate_id: str, image_type: str, content: bytes) -> str:
+        """Write image bytes under a unique name and return its relative URL."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{candidate_id}_{image_type}_{timestamp}_{uuid.uuid4().hex[:8]}.jpg"
+        filepath = os.path.join(self.upload_dir, filename)
+        with open(filepath, "wb") as f:
+            f.write(content)
+        return f"/uploads/{filename}"
+    
+    @staticmethod
+    def _apply_image(personal_info: PersonalInfo, image_type: str, relative_url: str,
+                     result: dict, source: str) -> None:
+        """Set the image URL and face embedding fields on a personal info record."""
+        if image_type == "id_card":
+            personal_info.id_card_image_url = relative_url
+        elif image_type == "candidate_card":
+            personal_info.candidate_card_image_url = relative_url
+        elif image_type == "direct_face":
+            personal_info.face_recognition_data_url = relative_url
+        
+        personal_info.face_embedding = ImageProcessingService.encode_embedding(
+            result["face_embedding"],
+            model=result["face_embedding_model"]
+        )
+        personal_info.face_embedding_model = result["face_embedding_model"]
+        personal_info.face_embedding_date = datetime.now()
+        personal_info.face_embedding_source = source
+    
     async def get_image_url(self, candidate_id: str, image_type: str) -> str:
         """
         Get the URL of a candidate's image.
@@ -15,6 +15,8 @@ from app.repositories.exam_score_repository import ExamScoreRepository
 from app.repositories.exam_score_history_repository import ExamScoreHistoryRepository
 from app.domain.models.score_review import ScoreReview
 from app.domain.models.exam_score import ExamScore
+from app.infrastructure.database.counting import CountStrategy
+from app.infrastructure.database.pagination import next_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -51,8 +53,10 @@ class ScoreReviewService:
         review_date_from: Optional[str] = None,
         review_date_to: Optional[str] = None,
         created_after: Optional[str] = None,
-        created_before: Optional[str] = None
-    ) -> Tuple[List[Dict], int]:
+        created_before: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[CountStrategy] = None
+    ) -> Tuple[List[Dict], int, Optional[str]]:
         """
         Get all score reviews with pagination and filtering.
         
@@ -68,9 +72,11 @@ class ScoreReviewService:
             review_date_to: Filter by review date to
             created_after: Filter by reviews created after date
             created_before: Filter by reviews created before date
+            cursor: Optional cursor of the previous page, used instead of skip
+            count_strategy: How to compute the total count, LIST_COUNT_STRATEGY by default
             
         Returns:
-            Tuple of (list of score reviews, total count)
+            Tuple of (list of score reviews, total count, cursor of the next page)
         """
         filters = {}
         
@@ -93,8 +99,10 @@ class ScoreReviewService:
         if created_before:
             filters["created_before"] = created_before
         
-        reviews, total = await self.repository.get_all(skip=skip, limit=limit, filters=filters)
-        return reviews, total
+        reviews, total = await self.repository.get_all(
+            skip=skip, limit=limit, filters=filters, cursor=cursor, count_strategy=count_strategy
+        )
+        return reviews, total, next_cursor(reviews, limit, ["created_at", "score_review_id"])
     
     async def get_review_by_id(self, score_review_id: str) -> Optional[Dict]:
         """
@@ -6,10 +6,13 @@ và phân nhóm thông tin kết quả.
 """
 
 import logging
+import re
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import date
 
 from app.graph_repositories.search.candidate_search_repository import CandidateSearchRepository
+from app.repositories.candidate_repository import CandidateRepository, CandidateSearchMode
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 from app.api.dto.candidate_search import (
     CandidateBasicInfo,
     CandidateDetailedInfo,
@@ -33,12 +36,28 @@ from app.api.dto.candidate_search import (
 
 logger = logging.getLogger(__name__)
 
+# Số CMND (9 chữ số) hoặc số CCCD (12 chữ số) đầy đủ
+FULL_ID_NUMBER = re.compile(r"\d{9}|\d{12}")
+
+# Tiêu chí được phép đi kèm một tìm kiếm chính xác theo mã định danh
+EXACT_CRITERIA = {"candidate_id", "id_number", "registration_number", "exam_id", "case_sensitive"}
+
+# Tiêu chí có thể tìm dự phòng trong PostgreSQL khi Neo4j lỗi, theo thứ tự ưu tiên
+FALLBACK_CRITERIA = ("candidate_id", "id_number", "full_name")
+
 class CandidateSearchService:
     """Service for searching and retrieving candidate information."""
     
-    def __init__(self, search_repo: CandidateSearchRepository):
-        """Initialize with search repository."""
+    def __init__(self, search_repo: CandidateSearchRepository, fallback_repo: Optional[CandidateRepository] = None):
+        """
+        Initialize with search repository.
+        
+        Args:
+            search_repo: Neo4j candidate search repository
+            fallback_repo: PostgreSQL candidate repository searched when Neo4j fails
+        """
         self.search_repo = search_repo
+        self.fallback_repo = fallback_repo
         self.logger = logging.getLogger(__name__)
     
     def _convert_neo4j_date(self, neo4j_date) -> Optional[date]:
@@ -60,8 +79,20 @@ class CandidateSearchService:
             CandidateSearchResult chứa danh sách thí sinh và thông tin phân trang
         """
         try:
-            # Gọi repository để thực hiện tìm kiếm
-            candidates, total = await self.search_repo.search_candidates(search_criteria, page, page_size)
+            # Tìm chính xác theo mã định danh trước; chỉ tìm gần đúng khi không có kết quả
+            candidates, total = [], 0
+            identifiers = self._exact_identifiers(search_criteria)
+            if identifiers:
+                candidates, total = await self.search_repo.find_candidates_exact(identifiers, page, page_size)
+            if not total:
+                try:
+                    candidates, total = await self.search_repo.search_candidates(search_criteria, page, page_size)
+                except Exception as e:
+                    fallback = await self._search_postgres(search_criteria, page, page_size)
+                    if fallback is None:
+                        raise
+                    self.logger.warning(f"Neo4j search failed ({e}), answered from PostgreSQL")
+                    candidates, total = fallback
             
             # Chuyển đổi kết quả sang DTO
             candidate_dtos = []
@@ -99,11 +130,90 @@ class CandidateSearchService:
                 page_size=page_size
             )
     
+    async def _search_postgres(self, search_criteria: Dict[str, Any], page: int, page_size: int) -> Optional[Tuple[List[Dict], int]]:
+        """
+        Tìm dự phòng trong PostgreSQL khi Neo4j không trả lời được.
+        
+        Chỉ áp dụng cho tìm kiếm theo một trong các tiêu chí mã thí sinh, số căn cước
+        hoặc họ tên, là các tiêu chí CandidateRepository.search hỗ trợ.
+        
+        Args:
+            search_criteria: Dictionary chứa các tiêu chí tìm kiếm
+            page: Số trang
+            page_size: Kích thước trang
+            
+        Returns:
+            Tuple gồm danh sách thí sinh (cùng dạng với kết quả Neo4j) và tổng số kết quả
+            đã biết, hoặc None nếu không thể tìm dự phòng
+        """
+        criteria = {key: value for key, value in search_criteria.items() if value not in (None, "") and key != "case_sensitive"}
+        if self.fallback_repo is None or len(criteria) != 1 or next(iter(criteria)) not in FALLBACK_CRITERIA:
+            return None
+        
+        skip = (page - 1) * page_size
+        models = await self.fallback_repo.search(str(next(iter(criteria.values()))), skip, page_size, CandidateSearchMode.AUTO)
+        candidates = []
+        for model in models:
+            personal_info = model.personal_info
+            candidates.append({
+                "candidate_id": model.candidate_id,
+                "full_name": model.full_name,
+                "birth_date": personal_info.birth_date if personal_info else None,
+                "id_number": personal_info.id_number if personal_info else None,
+                "phone_number": personal_info.phone_number if personal_info else None,
+                "email": personal_info.email if personal_info else None,
+                "primary_address": personal_info.primary_address if personal_info else None,
+                "secondary_address": personal_info.secondary_address if personal_info else None,
+                "id_card_image_url": personal_info.id_card_image_url if personal_info else None,
+                "candidate_card_image_url": personal_info.candidate_card_image_url if personal_info else None
+            })
+        # Tìm kiếm PostgreSQL không đếm tổng số; một trang đầy cho biết còn ít nhất một kết quả nữa
+        total = skip + len(candidates) + (1 if len(candidates) == page_size else 0)
+        return candidates, total
+    
+    @staticmethod
+    def _exact_identifiers(search_criteria: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        Nhận diện một tìm kiếm chỉ gồm các mã định danh đầy đủ.
+        
+        Đó là tìm kiếm theo candidate_id, số CMND/CCCD đủ 9 hoặc 12 chữ số, hoặc
+        số báo danh (có thể kèm mã kỳ thi), không kèm tiêu chí gần đúng nào khác.
+        
+        Args:
+            search_criteria: Dictionary chứa các tiêu chí tìm kiếm
+            
+        Returns:
+            Dictionary các mã định danh đã chuẩn hóa, hoặc None nếu phải tìm gần đúng
+        """
+        criteria = {
+            key: value.strip() if isinstance(value, str) else value
+            for key, value in search_criteria.items()
+            if value not in (None, "")
+        }
+        if not set(criteria) <= EXACT_CRITERIA:
+            return None
+        if criteria.get("id_number") and not FULL_ID_NUMBER.fullmatch(criteria["id_number"]):
+            return None
+        if criteria.get("exam_id") and not criteria.get("registration_number"):
+            return None
+        
+        identifiers = {
+            key: criteria[key]
+            for key in ("candidate_id", "id_number", "registration_number", "exam_id")
+            if criteria.get(key)
+        }
+        if not identifiers.keys() & {"candidate_id", "id_number", "registration_number"}:
+            return None
+        return identifiers
+    
     async def get_candidate_info(self, candidate_id: str, include_education: bool = False, 
                                include_exams: bool = False, include_achievements: bool = False) -> Optional[CandidateDetailedInfo]:
         """
         Lấy thông tin chi tiết của thí sinh theo ID, với các nhóm thông tin tùy chọn.
         
+        Mỗi nhóm thông tin được đọc qua cache Redis (read-through) nên các yêu cầu
+        lặp lại cho cùng một thí sinh không truy vấn lại Neo4j.
+        
         Args:
             candidate_id: ID của thí sinh
             include_education: Có bao gồm thông tin học vấn không
@@ -115,241 +225,24 @@ class CandidateSearchService:
         """
         try:
             # Lấy thông tin cơ bản của thí sinh
-            candidate_data = await self.search_repo.get_candidate_by_id(candidate_id)
-            if not candidate_data:
+            basic_info = await self._get_basic_info(candidate_id)
+            if not basic_info:
                 return None
             
-            # Tạo đối tượng thông tin cơ bản
-            basic_info = CandidateBasicInfo(
-                candidate_id=candidate_data.get("candidate_id"),
-                full_name=candidate_data.get("full_name"),
-                birth_date=self._convert_neo4j_date(candidate_data.get("birth_date")),
-                id_number=candidate_data.get("id_number"),
-                phone_number=candidate_data.get("phone_number"),
-                email=candidate_data.get("email"),
-                primary_address=candidate_data.get("primary_address") or candidate_data.get("address"),
-                secondary_address=candidate_data.get("secondary_address"),
-                id_card_image_url=candidate_data.get("id_card_image_url"),
-                candidate_card_image_url=candidate_data.get("candidate_card_image_url")
-            )
-            
             # Khởi tạo kết quả
             result = CandidateDetailedInfo(basic_info=basic_info)
             
             # Nếu yêu cầu thông tin học vấn
             if include_education:
-                education_data = await self.search_repo.get_candidate_education_info(candidate_id)
-                
-                # Chuyển đổi dữ liệu trường học
-                schools = [
-                    SchoolInfo(
-                        school_id=s.get("school_id"),
-                        school_name=s.get("school_name"),
-                        start_year=s.get("start_year"),
-                        end_year=s.get("end_year"),
-                        education_level=s.get("education_level"),
-                        academic_performance=s.get("academic_performance"),
-                        additional_info=s.get("additional_info")
-                    ) for s in education_data.get("schools", [])
-                    if s.get("school_id") is not None and s.get("school_name") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu ngành học
-                majors = [
-                    MajorInfo(
-                        major_id=m.get("major_id"),
-                        major_name=m.get("major_name"),
-                        school_id=m.get("school_id"),
-                        school_name=m.get("school_name"),
-                        start_year=m.get("start_year"),
-                        end_year=m.get("end_year")
-                    ) for m in education_data.get("majors", [])
-                    if m.get("major_id") is not None and m.get("major_name") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu bằng cấp
-                degrees = [
-                    DegreeInfo(
-                        degree_id=d.get("degree_id"),
-                        degree_name=d.get("degree_name"),
-                        issue_date=d.get("issue_date"),
-                        issuing_organization=d.get("issuing_organization"),
-                        major_id=d.get("major_id"),
-                        major_name=d.get("major_name"),
-                        school_id=d.get("school_id"),
-                        school_name=d.get("school_name")
-                    ) for d in education_data.get("degrees", [])
-                    if d.get("degree_id") is not None and d.get("degree_name") is not None
-                ]
-                
-                # Gán thông tin học vấn vào kết quả
-                result.education_info = EducationInfo(
-                    schools=schools,
-                    majors=majors,
-                    degrees=degrees
-                )
+                result.education_info = await self._get_education_info(candidate_id)
             
             # Nếu yêu cầu thông tin kỳ thi
             if include_exams:
-                exams_data = await self.search_repo.get_candidate_exams_info(candidate_id)
-                
-                # Chuyển đổi dữ liệu kỳ thi
-                exams = [
-                    ExamInfo(
-                        exam_id=e.get("exam_id"),
-                        exam_name=e.get("exam_name"),
-                        registration_number=e.get("registration_number"),
-                        registration_date=self._convert_neo4j_date(e.get("registration_date")),
-                        status=e.get("status")
-                    ) for e in exams_data.get("exams", [])
-                    if e.get("exam_id") is not None and e.get("exam_name") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu lịch thi
-                schedules = [
-                    ExamScheduleInfo(
-                        exam_schedule_id=s.get("exam_schedule_id"),
-                        exam_id=s.get("exam_id"),
-                        exam_name=s.get("exam_name"),
-                        subject_id=s.get("subject_id"),
-                        subject_name=s.get("subject_name"),
-                        room_id=s.get("room_id"),
-                        room_name=s.get("room_name"),
-                        exam_date=s.get("exam_date"),
-                        start_time=s.get("start_time"),
-                        end_time=s.get("end_time")
-                    ) for s in exams_data.get("schedules", [])
-                    if s.get("exam_schedule_id") is not None and s.get("exam_id") is not None 
-                    and s.get("exam_name") is not None and s.get("subject_id") is not None 
-                    and s.get("subject_name") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu điểm thi
-                scores = [
-                    ScoreInfo(
-                        exam_score_id=s.get("exam_score_id"),
-                        exam_id=s.get("exam_id"),
-                        exam_name=s.get("exam_name"),
-                        subject_id=s.get("subject_id"),
-                        subject_name=s.get("subject_name"),
-                        score=s.get("score", 0.0),
-                        max_score=s.get("max_score", 10.0),
-                        min_score=s.get("min_score", 0.0),
-                        is_final=s.get("is_final", True)
-                    ) for s in exams_data.get("scores", [])
-                    if s.get("exam_score_id") is not None and s.get("exam_id") is not None 
-                    and s.get("exam_name") is not None and s.get("subject_id") is not None 
-                    and s.get("subject_name") is not None and s.get("score") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu phúc khảo
-                reviews = [
-                    ScoreReviewInfo(
-                        review_id=r.get("review_id"),
-                        exam_score_id=r.get("exam_score_id"),
-                        subject_name=r.get("subject_name"),
-                        original_score=r.get("original_score", 0.0),
-                        reviewed_score=r.get("reviewed_score"),
-                        status=r.get("status"),
-                        request_date=r.get("request_date"),
-                        completion_date=r.get("completion_date")
-                    ) for r in exams_data.get("reviews", [])
-                    if r.get("review_id") is not None and r.get("exam_score_id") is not None 
-                    and r.get("subject_name") is not None and r.get("original_score") is not None 
-                    and r.get("status") is not None and r.get("request_date") is not None
-                ]
-                
-                # Gán thông tin kỳ thi vào kết quả
-                result.exams_info = ExamsInfo(
-                    exams=exams,
-                    schedules=schedules,
-                    scores=scores,
-                    reviews=reviews
-                )
+                result.exams_info = await self._get_exams_info(candidate_id)
             
             # Nếu yêu cầu thông tin thành tích
             if include_achievements:
-                achievements_data = await self.search_repo.get_candidate_achievements_info(candidate_id)
-                
-                # Chuyển đổi dữ liệu chứng chỉ
-                certificates = [
-                    CertificateInfo(
-                        certificate_id=c.get("certificate_id"),
-                        certificate_name=c.get("certificate_name"),
-                        issue_date=c.get("issue_date"),
-                        issuing_organization=c.get("issuing_organization"),
-                        expiry_date=c.get("expiry_date"),
-                        certificate_code=c.get("certificate_code")
-                    ) for c in achievements_data.get("certificates", [])
-                    if c.get("certificate_id") is not None and c.get("certificate_name") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu giấy tờ xác thực
-                credentials = [
-                    CredentialInfo(
-                        credential_id=c.get("credential_id"),
-                        title=c.get("title"),
-                        credential_type=c.get("credential_type"),
-                        issuing_organization=c.get("issuing_organization"),
-                        issue_date=c.get("issue_date"),
-                        expiry_date=c.get("expiry_date"),
-                        verification_status=c.get("verification_status")
-                    ) for c in achievements_data.get("credentials", [])
-                    if c.get("credential_id") is not None and c.get("title") is not None 
-                    and c.get("credential_type") is not None and c.get("issuing_organization") is not None 
-                    and c.get("issue_date") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu giải thưởng
-                awards = [
-                    AwardInfo(
-                        award_id=a.get("award_id"),
-                        award_name=a.get("award_name"),
-                        award_level=a.get("award_level"),
-                        issuing_organization=a.get("issuing_organization"),
-                        issue_date=a.get("issue_date"),
-                        description=a.get("description")
-                    ) for a in achievements_data.get("awards", [])
-                    if a.get("award_id") is not None and a.get("award_name") is not None 
-                    and a.get("award_level") is not None and a.get("issuing_organization") is not None 
-                    and a.get("issue_date") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu thành tích
-                achievements = [
-                    AchievementInfo(
-                        achievement_id=a.get("achievement_id"),
-                        achievement_name=a.get("achievement_name"),
-                        achievement_type=a.get("achievement_type"),
-                        description=a.get("description"),
-                        date_achieved=a.get("date_achieved"),
-                        issuing_organization=a.get("issuing_organization")
-                    ) for a in achievements_data.get("achievements", [])
-                    if a.get("achievement_id") is not None and a.get("achievement_name") is not None 
-                    and a.get("achievement_type") is not None and a.get("date_achieved") is not None
-                ]
-                
-                # Chuyển đổi dữ liệu công nhận
-                recognitions = [
-                    RecognitionInfo(
-                        recognition_id=r.get("recognition_id"),
-                        recognition_type=r.get("recognition_type"),
-                        description=r.get("description"),
-                        issue_date=r.get("issue_date"),
-                        issuing_organization=r.get("issuing_organization")
-                    ) for r in achievements_data.get("recognitions", [])
-                    if r.get("recognition_id") is not None and r.get("recognition_type") is not None 
-                    and r.get("issue_date") is not None
-                ]
-                
-                # Gán thông tin thành tích vào kết quả
-                result.achievements_info = AchievementsInfo(
-                    certificates=certificates,
-                    credentials=credentials,
-                    awards=awards,
-                    achievements=achievements,
-                    recognitions=recognitions
-                )
+                result.achievements_info = await self._get_achievements_info(candidate_id)
             
             return result
             
@@ -369,58 +262,10 @@ class CandidateSearchService:
         """
         try:
             # Kiểm tra xem thí sinh tồn tại không
-            candidate = await self.search_repo.get_candidate_by_id(candidate_id)
-            if not candidate:
+            if not await self._get_basic_info(candidate_id):
                 return None
             
-            # Lấy thông tin học vấn
-            education_data = await self.search_repo.get_candidate_education_info(candidate_id)
-            
-            # Chuyển đổi dữ liệu trường học
-            schools = [
-                SchoolInfo(
-                    school_id=s.get("school_id"),
-                    school_name=s.get("school_name"),
-                    start_year=s.get("start_year"),
-                    end_year=s.get("end_year"),
-                    education_level=s.get("education_level"),
-                    academic_performance=s.get("academic_performance"),
-                    additional_info=s.get("additional_info")
-                ) for s in education_data.get("schools", [])
-            ]
-            
-            # Chuyển đổi dữ liệu ngành học
-            majors = [
-                MajorInfo(
-                    major_id=m.get("major_id"),
-                    major_name=m.get("major_name"),
-                    school_id=m.get("school_id"),
-                    school_name=m.get("school_name"),
-                    start_year=m.get("start_year"),
-                    end_year=m.get("end_year")
-                ) for m in education_data.get("majors", [])
-            ]
-            
-            # Chuyển đổi dữ liệu bằng cấp
-            degrees = [
-                DegreeInfo(
-                    degree_id=d.get("degree_id"),
-                    degree_name=d.get("degree_name"),
-                    issue_date=d.get("issue_date"),
-                    issuing_organization=d.get("issuing_organization"),
-                    major_id=d.get("major_id"),
-                    major_name=d.get("major_name"),
-                    school_id=d.get("school_id"),
-                    school_name=d.get("school_name")
-                ) for d in education_data.get("degrees", [])
-            ]
-            
-            # Trả về kết quả
-            return EducationInfo(
-                schools=schools,
-                majors=majors,
-                degrees=degrees
-            )
+            return await self._get_education_info(candidate_id)
             
         except Exception as e:
             self.logger.error(f"Error getting education info for candidate {candidate_id}: {str(e)}", exc_info=True)
@@ -438,86 +283,10 @@ class CandidateSearchService:
         """
         try:
             # Kiểm tra xem thí sinh tồn tại không
-            candidate = await self.search_repo.get_candidate_by_id(candidate_id)
-            if not candidate:
+            if not await self._get_basic_info(candidate_id):
                 return None
             
-            # Lấy thông tin kỳ thi
-            exams_data = await self.search_repo.get_candidate_exams_info(candidate_id)
-            
-            # Chuyển đổi dữ liệu kỳ thi
-            exams = [
-                ExamInfo(
-                    exam_id=e.get("exam_id"),
-                    exam_name=e.get("exam_name"),
-                    registration_number=e.get("registration_number"),
-                    registration_date=self._convert_neo4j_date(e.get("registration_date")),
-                    status=e.get("status")
-                ) for e in exams_data.get("exams", [])
-                if e.get("exam_id") is not None and e.get("exam_name") is not None
-            ]
-            
-            # Chuyển đổi dữ liệu lịch thi
-            schedules = [
-                ExamScheduleInfo(
-                    exam_schedule_id=s.get("exam_schedule_id"),
-                    exam_id=s.get("exam_id"),
-                    exam_name=s.get("exam_name"),
-                    subject_id=s.get("subject_id"),
-                    subject_name=s.get("subject_name"),
-                    room_id=s.get("room_id"),
-                    room_name=s.get("room_name"),
-                    exam_date=s.get("exam_date"),
-                    start_time=s.get("start_time"),
-                    end_time=s.get("end_time")
-                ) for s in exams_data.get("schedules", [])
-                if s.get("exam_schedule_id") is not None and s.get("exam_id") is not None 
-                and s.get("exam_name") is not None and s.get("subject_id") is not None 
-                and s.get("subject_name") is not None
-            ]
-            
-            # Chuyển đổi dữ liệu điểm thi
-            scores = [
-                ScoreInfo(
-                    exam_score_id=s.get("exam_score_id"),
-                    exam_id=s.get("exam_id"),
-                    exam_name=s.get("exam_name"),
-                    subject_id=s.get("subject_id"),
-                    subject_name=s.get("subject_name"),
-                    score=s.get("score", 0.0),
-                    max_score=s.get("max_score", 10.0),
-                    min_score=s.get("min_score", 0.0),
-                    is_final=s.get("is_final", True)
-                ) for s in exams_data.get("scores", [])
-                if s.get("exam_score_id") is not None and s.get("exam_id") is not None 
-                and s.get("exam_name") is not None and s.get("subject_id") is not None 
-                and s.get("subject_name") is not None and s.get("score") is not None
-            ]
-            
-            # Chuyển đổi dữ liệu phúc khảo
-            reviews = [
-                ScoreReviewInfo(
-                    review_id=r.get("review_id"),
-                    exam_score_id=r.get("exam_score_id"),
-                    subject_name=r.get("subject_name"),
-                    original_score=r.get("original_score", 0.0),
-                    reviewed_score=r.get("reviewed_score"),
-                    status=r.get("status"),
-                    request_date=r.get("request_date"),
-                    completion_date=r.get("completion_date")
-                ) for r in exams_data.get("reviews", [])
-                if r.get("review_id") is not None and r.get("exam_score_id") is not None 
-                and r.get("subject_name") is not None and r.get("original_score") is not None 
-                and r.get("status") is not None and r.get("request_date") is not None
-            ]
-            
-            # Trả về kết quả
-            return ExamsInfo(
-                exams=exams,
-                schedules=schedules,
-                scores=scores,
-                reviews=reviews
-            )
+            return await self._get_exams_info(candidate_id)
             
         except Exception as e:
             self.logger.error(f"Error getting exams info for candidate {candidate_id}: {str(e)}", exc_info=True)
@@ -535,82 +304,267 @@ class CandidateSearchService:
         """
         try:
             # Kiểm tra xem thí sinh tồn tại không
-            candidate = await self.search_repo.get_candidate_by_id(candidate_id)
-            if not candidate:
+            if not await self._get_basic_info(candidate_id):
                 return None
             
-            # Lấy thông tin thành tích
-            achievements_data = await self.search_repo.get_candidate_achievements_info(candidate_id)
-            
-            # Chuyển đổi dữ liệu chứng chỉ
-            certificates = [
-                CertificateInfo(
-                    certificate_id=c.get("certificate_id"),
-                    certificate_name=c.get("certificate_name"),
-                    issue_date=c.get("issue_date"),
-                    issuing_organization=c.get("issuing_organization"),
-                    expiry_date=c.get("expiry_date"),
-                    certificate_code=c.get("certificate_code")
-                ) for c in achievements_data.get("certificates", [])
-            ]
-            
-            # Chuyển đổi dữ liệu giấy tờ xác thực
-            credentials = [
-                CredentialInfo(
-                    credential_id=c.get("credential_id"),
-                    title=c.get("title"),
-                    credential_type=c.get("credential_type"),
-                    issuing_organization=c.get("issuing_organization"),
-                    issue_date=c.get("issue_date"),
-                    expiry_date=c.get("expiry_date"),
-                    verification_status=c.get("verification_status")
-                ) for c in achievements_data.get("credentials", [])
-            ]
-            
-            # Chuyển đổi dữ liệu giải thưởng
-            awards = [
-                AwardInfo(
-                    award_id=a.get("award_id"),
-                    award_name=a.get("award_name"),
-                    award_level=a.get("award_level"),
-                    issuing_organization=a.get("issuing_organization"),
-                    issue_date=a.get("issue_date"),
-                    description=a.get("description")
-                ) for a in achievements_data.get("awards", [])
-            ]
-            
-            # Chuyển đổi dữ liệu thành tích
-            achievements = [
-                AchievementInfo(
-                    achievement_id=a.get("achievement_id"),
-                    achievement_name=a.get("achievement_name"),
-                    achievement_type=a.get("achievement_type"),
-                    description=a.get("description"),
-                    date_achieved=a.get("date_achieved"),
-                    issuing_organization=a.get("issuing_organization")
-                ) for a in achievements_data.get("achievements", [])
-            ]
-            
-            # Chuyển đổi dữ liệu công nhận
-            recognitions = [
-                RecognitionInfo(
-                    recognition_id=r.get("recognition_id"),
-                    recognition_type=r.get("recognition_type"),
-                    description=r.get("description"),
-                    issue_date=r.get("issue_date"),
-                    issuing_organization=r.get("issuing_organization")
-                ) for r in achievements_data.get("recognitions", [])
-            ]
-            
-            # Trả về kết quả
-            return AchievementsInfo(
-                certificates=certificates,
-                credentials=credentials,
-                awards=awards,
-                achievements=achievements,
-                recognitions=recognitions
-            )
+            return await self._get_achievements_info(candidate_id)
             
         except Exception as e:
             self.logger.error(f"Error getting achievements info for candidate {candidate_id}: {str(e)}", exc_info=True)
-            return None 
\ No newline at end of file
+            return None
+    
+    async def _get_basic_info(self, candidate_id: str) -> Optional[CandidateBasicInfo]:
+        """Thông tin cơ bản của thí sinh qua cache, hoặc None nếu không tồn tại."""
+        async def load() -> Optional[Dict[str, Any]]:
+            candidate_data = await self.search_repo.get_candidate_by_id(candidate_id)
+            if not candidate_data:
+                return None
+            return self._build_basic_info(candidate_data).model_dump(mode="json")
+        
+        data = await candidate_info_cache.get_or_load(candidate_id, "basic", load)
+        return CandidateBasicInfo.model_validate(data) if data is not None else None
+    
+    async def _get_education_info(self, candidate_id: str) -> EducationInfo:
+        """Thông tin học vấn của thí sinh qua cache."""
+        async def load() -> Dict[str, Any]:
+            education_data = await self.search_repo.get_candidate_education_info(candidate_id)
+            return self._build_education_info(education_data).model_dump(mode="json")
+        
+        return EducationInfo.model_validate(await candidate_info_cache.get_or_load(candidate_id, "education", load))
+    
+    async def _get_exams_info(self, candidate_id: str) -> ExamsInfo:
+        """Thông tin kỳ thi của thí sinh qua cache."""
+        async def load() -> Dict[str, Any]:
+            exams_data = await self.search_repo.get_candidate_exams_info(candidate_id)
+            return self._build_exams_info(exams_data).model_dump(mode="json")
+        
+        return ExamsInfo.model_validate(await candidate_info_cache.get_or_load(candidate_id, "exams", load))
+    
+    async def _get_achievements_info(self, candidate_id: str) -> AchievementsInfo:
+        """Thông tin thành tích của thí sinh qua cache."""
+        async def load() -> Dict[str, Any]:
+            achievements_data = await self.search_repo.get_candidate_achievements_info(candidate_id)
+            return self._build_achievements_info(achievements_data).model_dump(mode="json")
+        
+        return AchievementsInfo.model_validate(await candidate_info_cache.get_or_load(candidate_id, "achievements", load))
+    
+    def _build_basic_info(self, candidate_data: Dict[str, Any]) -> CandidateBasicInfo:
+        """Chuyển đổi dữ liệu thí sinh từ Neo4j sang CandidateBasicInfo."""
+        return CandidateBasicInfo(
+            candidate_id=candidate_data.get("candidate_id"),
+            full_name=candidate_data.get("full_name"),
+            birth_date=self._convert_neo4j_date(candidate_data.get("birth_date")),
+            id_number=candidate_data.get("id_number"),
+            phone_number=candidate_data.get("phone_number"),
+            email=candidate_data.get("email"),
+            primary_address=candidate_data.get("primary_address") or candidate_data.get("address"),
+            secondary_address=candidate_data.get("secondary_address"),
+            id_card_image_url=candidate_data.get("id_card_image_url"),
+            candidate_card_image_url=candidate_data.get("candidate_card_image_url")
+        )
+    
+    def _build_education_info(self, education_data: Dict[str, Any]) -> EducationInfo:
+        """Chuyển đổi dữ liệu học vấn từ Neo4j sang EducationInfo."""
+        # Chuyển đổi dữ liệu trường học
+        schools = [
+            SchoolInfo(
+                school_id=s.get("school_id"),
+                school_name=s.get("school_name"),
+                start_year=s.get("start_year"),
+                end_year=s.get("end_year"),
+                education_level=s.get("education_level"),
+                academic_performance=s.get("academic_performance"),
+                additional_info=s.get("additional_info")
+            ) for s in education_data.get("schools", [])
+            if s.get("school_id") is not None and s.get("school_name") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu ngành học
+        majors = [
+            MajorInfo(
+                major_id=m.get("major_id"),
+                major_name=m.get("major_name"),
+                school_id=m.get("school_id"),
+                school_name=m.get("school_name"),
+                start_year=m.get("start_year"),
+                end_year=m.get("end_year")
+            ) for m in education_data.get("majors", [])
+            if m.get("major_id") is not None and m.get("major_name") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu bằng cấp
+        degrees = [
+            DegreeInfo(
+                degree_id=d.get("degree_id"),
+                degree_name=d.get("degree_name"),
+                issue_date=d.get("issue_date"),
+                issuing_organization=d.get("issuing_organization"),
+                major_id=d.get("major_id"),
+                major_name=d.get("major_name"),
+                school_id=d.get("school_id"),
+                school_name=d.get("school_name")
+            ) for d in education_data.get("degrees", [])
+            if d.get("degree_id") is not None and d.get("degree_name") is not None
+        ]
+        
+        return EducationInfo(
+            schools=schools,
+            majors=majors,
+            degrees=degrees
+        )
+    
+    def _build_exams_info(self, exams_data: Dict[str, Any]) -> ExamsInfo:
+        """Chuyển đổi dữ liệu kỳ thi từ Neo4j sang ExamsInfo."""
+        # Chuyển đổi dữ liệu kỳ thi
+        exams = [
+            ExamInfo(
+                exam_id=e.get("exam_id"),
+                exam_name=e.get("exam_name"),
+                registration_number=e.get("registration_number"),
+                registration_date=self._convert_neo4j_date(e.get("registration_date")),
+                status=e.get("status")
+            ) for e in exams_data.get("exams", [])
+            if e.get("exam_id") is not None and e.get("exam_name") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu lịch thi
+        schedules = [
+            ExamScheduleInfo(
+                exam_schedule_id=s.get("exam_schedule_id"),
+                exam_id=s.get("exam_id"),
+                exam_name=s.get("exam_name"),
+                subject_id=s.get("subject_id"),
+                subject_name=s.get("subject_name"),
+                room_id=s.get("room_id"),
+                room_name=s.get("room_name"),
+                exam_date=s.get("exam_date"),
+                start_time=s.get("start_time"),
+                end_time=s.get("end_time")
+            ) for s in exams_data.get("schedules", [])
+            if s.get("exam_schedule_id") is not None and s.get("exam_id") is not None 
+            and s.get("exam_name") is not None and s.get("subject_id") is not None 
+            and s.get("subject_name") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu điểm thi
+        scores = [
+            ScoreInfo(
+                exam_score_id=s.get("exam_score_id"),
+                exam_id=s.get("exam_id"),
+                exam_name=s.get("exam_name"),
+                subject_id=s.get("subject_id"),
+                subject_name=s.get("subject_name"),
+                score=s.get("score", 0.0),
+                max_score=s.get("max_score", 10.0),
+                min_score=s.get("min_score", 0.0),
+                is_final=s.get("is_final", True)
+            ) for s in exams_data.get("scores", [])
+            if s.get("exam_score_id") is not None and s.get("exam_id") is not None 
+            and s.get("exam_name") is not None and s.get("subject_id") is not None 
+            and s.get("subject_name") is not None and s.get("score") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu phúc khảo
+        reviews = [
+            ScoreReviewInfo(
+                review_id=r.get("review_id"),
+                exam_score_id=r.get("exam_score_id"),
+                subject_name=r.get("subject_name"),
+                original_score=r.get("original_score", 0.0),
+                reviewed_score=r.get("reviewed_score"),
+                status=r.get("status"),
+                request_date=r.get("request_date"),
+                completion_date=r.get("completion_date")
+            ) for r in exams_data.get("reviews", [])
+            if r.get("review_id") is not None and r.get("exam_score_id") is not None 
+            and r.get("subject_name") is not None and r.get("original_score") is not None 
+            and r.get("status") is not None and r.get("request_date") is not None
+        ]
+        
+        return ExamsInfo(
+            exams=exams,
+            schedules=schedules,
+            scores=scores,
+            reviews=reviews
+        )
+    
+    def _build_achievements_info(self, achievements_data: Dict[str, Any]) -> AchievementsInfo:
+        """Chuyển đổi dữ liệu thành tích từ Neo4j sang AchievementsInfo."""
+        # Chuyển đổi dữ liệu chứng chỉ
+        certificates = [
+            CertificateInfo(
+                certificate_id=c.get("certificate_id"),
+                certificate_name=c.get("certificate_name"),
+                issue_date=c.get("issue_date"),
+                issuing_organization=c.get("issuing_organization"),
+                expiry_date=c.get("expiry_date"),
+                certificate_code=c.get("certificate_code")
+            ) for c in achievements_data.get("certificates", [])
+            if c.get("certificate_id") is not None and c.get("certificate_name") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu giấy tờ xác thực
+        credentials = [
+            CredentialInfo(
+                credential_id=c.get("credential_id"),
+                title=c.get("title"),
+                credential_type=c.get("credential_type"),
+                issuing_organization=c.get("issuing_organization"),
+                issue_date=c.get("issue_date"),
+                expiry_date=c.get("expiry_date"),
+                verification_status=c.get("verification_status")
+            ) for c in achievements_data.get("credentials", [])
+            if c.get("credential_id") is not None and c.get("title") is not None 
+            and c.get("credential_type") is not None and c.get("issuing_organization") is not None 
+            and c.get("issue_date") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu giải thưởng
+        awards = [
+            AwardInfo(
+                award_id=a.get("award_id"),
+                award_name=a.get("award_name"),
+                award_level=a.get("award_level"),
+                issuing_organization=a.get("issuing_organization"),
+                issue_date=a.get("issue_date"),
+                description=a.get("description")
+            ) for a in achievements_data.get("awards", [])
+            if a.get("award_id") is not None and a.get("award_name") is not None 
+            and a.get("award_level") is not None and a.get("issuing_organization") is not None 
+            and a.get("issue_date") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu thành tích
+        achievements = [
+            AchievementInfo(
+                achievement_id=a.get("achievement_id"),
+                achievement_name=a.get("achievement_name"),
+                achievement_type=a.get("achievement_type"),
+                description=a.get("description"),
+                date_achieved=a.get("date_achieved"),
+                issuing_organization=a.get("issuing_organization")
+            ) for a in achievements_data.get("achievements", [])
+            if a.get("achievement_id") is not None and a.get("achievement_name") is not None 
+            and a.get("achievement_type") is not None and a.get("date_achieved") is not None
+        ]
+        
+        # Chuyển đổi dữ liệu công nhận
+        recognitions = [
+            RecognitionInfo(
+                recognition_id=r.get("recognition_id"),
+                recognition_type=r.get("recognition_type"),
+                description=r.get("description"),
+                issue_date=r.get("issue_date"),
+                issuing_organization=r.get("issuing_organization")
+            ) for r in achievements_data.get("recognitions", [])
+            if r.get("recognition_id") is not None and r.get("recognition_type") is not None 
+            and r.get("issue_date") is not None
+        ]
+        
+        return AchievementsInfo(
+            certificates=certificates,
+            credentials=credentials,
+            awards=awards,
+            achievements=achievements,
+            recognitions=recognitions
+        )
@@ -0,0 +1,144 @@
+"""
+Security Log Writer module.
+
+This module provides a background writer that persists high-volume security log
+entries, such as per-request authentication successes, in batches instead of
+committing a row inside each request.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from app.config import settings
+from app.domain.models.security_log import SecurityLog
+from app.infrastructure.database.connection import async_session
+
+logger = logging.getLogger(__name__)
+
+# Queued by stop(); the writer writes its pending batch and exits on it
+_STOP = object()
+
+
+class SecurityLogWriter:
+    """
+    Buffered, batched writer for SecurityLog rows.
+
+    Entries are queued without blocking the caller and written by a background
+    task once `batch_size` entries are waiting or `flush_seconds` have passed.
+    When the queue is full, new entries are dropped and counted rather than
+    slowing down requests.
+    """
+
+    def __init__(self, batch_size: int, flush_seconds: float, queue_size: int):
+        """
+        Initialize the writer.
+
+        Args:
+            batch_size: Maximum number of entries written per transaction
+            flush_seconds: Maximum time an entry waits before being written
+            queue_size: Maximum number of entries waiting to be written
+        """
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background task is active."""
+        return self._task is not None and not self._task.done()
+
+    def log(self, entry: SecurityLog) -> None:
+        """
+        Queue an entry for writing, starting the writer on first use.
+
+        Args:
+            entry: Security log entry not attached to any session
+        """
+        if not self.is_running:
+            self.start()
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(f"Security log queue is full; {self.dropped} entries dropped so far")
+
+    def start(self) -> None:
+        """Start the background task if it is not already running."""
+        if self.is_running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and write any queued entries."""
+        if self.is_running:
+            # Not cancelled, so a batch being collected or written is not lost
+            await self._queue.put(_STOP)
+            await self._task
+        if self._queue is not None:
+            # Entries logged after the writer stopped
+            batch = []
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if batch:
+                await self._write(batch)
+
+    def stats(self) -> dict:
+        """Counters describing the writer's activity."""
+        return {
+            "running": self.is_running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed
+        }
+
+    async def _run(self) -> None:
+        """Collect entries into batches and write them until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await self._queue.get()
+            if entry is _STOP:
+                return
+            batch = [entry]
+            deadline = loop.time() + self.flush_seconds
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._write(batch)
+
+    async def _write(self, batch: List[SecurityLog]) -> None:
+        """Insert one batch in a single transaction."""
+        try:
+            async with async_session() as db:
+                db.add_all(batch)
+                await db.commit()
+            self.written += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Error writing {len(batch)} security log entries: {str(e)}")
+
+
+security_log_writer = SecurityLogWriter(
+    batch_size=settings.SECURITY_LOG_BATCH_SIZE,
+    flush_seconds=settings.SECURITY_LOG_FLUSH_SECONDS,
+    queue_size=settings.SECURITY_LOG_QUEUE_SIZE
+)
@@ -6,6 +6,7 @@ ensuring both databases maintain consistent data.
 """
 
 from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
 
 # Individual entity sync services
 from app.services.sync.subject_sync_service import SubjectSyncService
@@ -29,6 +30,8 @@ from app.services.sync.main_sync_service import MainSyncService
 
 __all__ = [
     "BaseSyncService",
+    "RelationshipSpec",
+    "RelationshipSyncEngine",
     "SubjectSyncService",
     "ScoreSyncService",
     "ScoreReviewSyncService", 
@@ -8,10 +8,13 @@ between PostgreSQL and Neo4j.
 import logging
 from typing import Any, Dict, List, Optional, Union, Tuple
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from neo4j import AsyncDriver
 
 from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 from app.repositories.achievement_repository import AchievementRepository
 from app.graph_repositories.achievement_graph_repository import AchievementGraphRepository
 from app.domain.graph_models.achievement_node import AchievementNode
@@ -19,6 +22,33 @@ from app.domain.models.achievement import Achievement
 
 logger = logging.getLogger(__name__)
 
+# Achievements covered by a full relationship sync; LIMIT NULL selects all of them
+ACHIEVEMENT_SCOPE_SQL = """
+WITH scope AS (
+    SELECT achievement_id FROM achievement ORDER BY achievement_id LIMIT :limit
+)
+"""
+
+# ACHIEVES is merged by the candidate relationship specs and left out here
+ACHIEVEMENT_RELATIONSHIP_SPECS = [
+    RelationshipSpec(
+        name="exam",
+        sql=ACHIEVEMENT_SCOPE_SQL + """
+        SELECT a.achievement_id, ce.exam_id
+        FROM achievement a
+        JOIN scope ON scope.achievement_id = a.achievement_id
+        JOIN candidate_exam ce ON ce.candidate_exam_id = a.candidate_exam_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (a:Achievement {achievement_id: row.achievement_id})
+        MATCH (e:Exam {exam_id: row.exam_id})
+        MERGE (a)-[r:ACHIEVEMENT_FOR_EXAM]->(e)
+        RETURN count(r)
+        """
+    )
+]
+
 class AchievementSyncService(BaseSyncService):
     """
     Service for synchronizing Achievement data between PostgreSQL and Neo4j.
@@ -94,38 +124,7 @@ class AchievementSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all achievement nodes (limit={limit})")
         
-        try:
-            # Get all achievements from SQL database
-            achievements, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for achievement in achievements:
-                try:
-                    # Sync only the achievement node - handle both ORM objects and dictionaries
-                    achievement_id = achievement.achievement_id if hasattr(achievement, 'achievement_id') else achievement.get("achievement_id")
-                    if not achievement_id:
-                        logger.error(f"Missing achievement_id in achievement object: {achievement}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(achievement_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get achievement_id safely for logging
-                    achievement_id = getattr(achievement, 'achievement_id', None) if hasattr(achievement, 'achievement_id') else achievement.get("achievement_id", "unknown")
-                    logger.error(f"Error syncing achievement node {achievement_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing achievement nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during achievement nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     def _convert_to_node(self, achievement: Achievement) -> AchievementNode:
         """
@@ -210,6 +209,7 @@ class AchievementSyncService(BaseSyncService):
                 success = await self.graph_repository.add_earned_by_relationship(achievement_id, candidate_id)
                 if success:
                     relationship_counts["candidate"] += 1
+                    await candidate_info_cache.invalidate(candidate_id, ("achievements",))
             
             # Sync FOR_EXAM relationship (achievement-exam)
             if exam_id:
@@ -228,6 +228,9 @@ class AchievementSyncService(BaseSyncService):
         """
         Synchronize relationships for all achievements.
         
+        The ACHIEVES edges are merged by the candidate relationship sync,
+        so only the remaining types are synchronized here.
+        
         Args:
             limit: Optional maximum number of achievements to process
             
@@ -237,58 +240,20 @@ class AchievementSyncService(BaseSyncService):
         logger.info(f"Synchronizing relationships for all achievements (limit={limit})")
         
         try:
-            # Get all achievements from SQL database
-            achievements, total_count = await self.sql_repository.get_all(limit=limit)
-            
-            total_achievements = len(achievements)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "candidate": 0,
-                "exam": 0
-            }
+            total_achievements = await self.db_session.scalar(
+                text(ACHIEVEMENT_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
+            )
             
-            # For each achievement, sync relationships
-            for achievement in achievements:
-                try:
-                    # Get achievement_id safely - handle both ORM objects and dictionaries
-                    achievement_id = achievement.achievement_id if hasattr(achievement, 'achievement_id') else achievement.get("achievement_id")
-                    if not achievement_id:
-                        logger.error(f"Missing achievement_id in achievement object: {achievement}")
-                        failure_count += 1
-                        continue
-                    
-                    # Verify achievement exists in Neo4j
-                    achievement_node = await self.graph_repository.get_by_id(achievement_id)
-                    if not achievement_node:
-                        logger.warning(f"Achievement {achievement_id} not found in Neo4j, skipping relationship sync")
-                        failure_count += 1
-                        continue
-                    
-                    # Sync relationships for this achievement
-                    results = await self.sync_relationship_by_id(achievement_id)
-                    
-                    # Update aggregated counts
-                    for key, value in results.items():
-                        if key in relationship_counts:
-                            relationship_counts[key] += value
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    # Get achievement_id safely for logging
-                    achievement_id = getattr(achievement, 'achievement_id', None) if hasattr(achievement, 'achievement_id') else achievement.get("achievement_id", "unknown")
-                    logger.error(f"Error synchronizing relationships for achievement {achievement_id}: {e}")
-                    failure_count += 1
+            # Each relationship type is streamed as one join and merged in UNWIND batches
+            engine = RelationshipSyncEngine(self.db_session, self.neo4j_driver)
+            type_results = await engine.sync(ACHIEVEMENT_RELATIONSHIP_SPECS, {"limit": limit})
             
             # Prepare final result
             result = {
                 "total_achievements": total_achievements,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": sum(counts["synced"] for counts in type_results.values()),
+                "failed": sum(counts["failed"] for counts in type_results.values()),
+                "relationships": {name: counts["synced"] for name, counts in type_results.items()}
             }
             
             logger.info(f"Completed synchronizing relationships for all achievements: {result}")
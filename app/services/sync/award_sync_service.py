@@ -9,8 +9,7 @@ import logging
 from typing import Optional, Tuple, List, Union, Dict
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import text
 from neo4j import AsyncDriver
 
 from app.domain.models.award import Award
@@ -18,10 +17,39 @@ from app.domain.graph_models.award_node import AwardNode
 from app.repositories.award_repository import AwardRepository
 from app.graph_repositories.award_graph_repository import AwardGraphRepository
 from app.services.sync.base_sync_service import BaseSyncService
-from app.domain.models.candidate_exam import CandidateExam
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 
 logger = logging.getLogger(__name__)
 
+# Awards covered by a full relationship sync; LIMIT NULL selects all of them
+AWARD_SCOPE_SQL = """
+WITH scope AS (
+    SELECT award_id FROM award ORDER BY award_id LIMIT :limit
+)
+"""
+
+# EARNS_AWARD is merged by the candidate relationship specs and left out here
+AWARD_RELATIONSHIP_SPECS = [
+    RelationshipSpec(
+        name="exam",
+        sql=AWARD_SCOPE_SQL + """
+        SELECT a.award_id, ce.exam_id
+        FROM award a
+        JOIN scope ON scope.award_id = a.award_id
+        JOIN candidate_exam ce ON ce.candidate_exam_id = a.candidate_exam_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (a:Award {award_id: row.award_id})
+        MATCH (e:Exam {exam_id: row.exam_id})
+        MERGE (a)-[r:AWARD_FOR_EXAM]->(e)
+        SET r.updated_at = datetime()
+        RETURN count(r)
+        """
+    )
+]
+
 class AwardSyncService(BaseSyncService):
     """
     Service for synchronizing Award data between PostgreSQL and Neo4j.
@@ -97,43 +125,7 @@ class AwardSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all award nodes (limit={limit})")
         
-        try:
-            # Get all awards from SQL database
-            query = select(Award)
-            if limit:
-                query = query.limit(limit)
-                
-            result = await self.session.execute(query)
-            awards = result.scalars().all()
-            
-            success_count = 0
-            failed_count = 0
-            
-            for award in awards:
-                try:
-                    # Sync only the award node - handle both ORM objects and dictionaries
-                    award_id = award.award_id if hasattr(award, 'award_id') else award.get("award_id")
-                    if not award_id:
-                        logger.error(f"Missing award_id in award object: {award}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(award_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get award_id safely for logging
-                    award_id = getattr(award, 'award_id', None) if hasattr(award, 'award_id') else award.get("award_id", "unknown")
-                    logger.error(f"Error syncing award node {award_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing award nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during award nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     def _convert_to_node(self, award: Award) -> AwardNode:
         """
@@ -237,6 +229,7 @@ class AwardSyncService(BaseSyncService):
                 success = await self.graph_repository.add_awarded_to_relationship(award_id, candidate_id)
                 if success:
                     relationship_counts["candidate"] += 1
+                    await candidate_info_cache.invalidate(candidate_id, ("achievements",))
                     logger.info(f"Successfully added EARNS_AWARD relationship: {candidate_id} -> {award_id}")
             
             # Sync AWARD_FOR_EXAM relationship (Award-Exam)
@@ -258,6 +251,9 @@ class AwardSyncService(BaseSyncService):
         """
         Synchronize relationships for all awards.
         
+        The EARNS_AWARD edges are merged by the candidate relationship sync,
+        so only the remaining types are synchronized here.
+        
         Args:
             limit: Optional maximum number of awards to process
             
@@ -267,66 +263,20 @@ class AwardSyncService(BaseSyncService):
         logger.info(f"Synchronizing relationships for all awards (limit={limit})")
         
         try:
-            # Get all awards from SQL database
-            query = select(Award).options(
-                # Use class-bound attributes directly instead of strings
-                joinedload(Award.candidate_exam).joinedload(CandidateExam.candidate),
-                joinedload(Award.candidate_exam).joinedload(CandidateExam.exam)
+            total_awards = await self.db_session.scalar(
+                text(AWARD_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
             )
-            if limit:
-                query = query.limit(limit)
-                
-            result = await self.session.execute(query)
-            awards = result.scalars().all()
-            
-            total_awards = len(awards)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "candidate": 0,
-                "exam": 0
-            }
             
-            # For each award, sync relationships
-            for award in awards:
-                try:
-                    # Get award_id safely - handle both ORM objects and dictionaries
-                    award_id = award.award_id if hasattr(award, 'award_id') else award.get("award_id")
-                    if not award_id:
-                        logger.error(f"Missing award_id in award object: {award}")
-                        failure_count += 1
-                        continue
-                    
-                    # Sync relationships for this award
-                    results = await self.sync_relationship_by_id(award_id)
-                    
-                    # Check if there was an error
-                    if 'error' in results:
-                        logger.warning(f"Encountered error for award {award_id}: {results['error']}")
-                        failure_count += 1
-                        continue
-                    
-                    # Update aggregated counts
-                    for key, value in results.items():
-                        if key in relationship_counts:
-                            relationship_counts[key] += value
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    # Get award_id safely for logging
-                    award_id = getattr(award, 'award_id', None) if hasattr(award, 'award_id') else award.get("award_id", "unknown")
-                    logger.error(f"Error synchronizing relationships for award {award_id}: {e}")
-                    failure_count += 1
+            # Each relationship type is streamed as one join and merged in UNWIND batches
+            engine = RelationshipSyncEngine(self.db_session, self.neo4j_driver)
+            type_results = await engine.sync(AWARD_RELATIONSHIP_SPECS, {"limit": limit})
             
             # Prepare final result
             result = {
                 "total_awards": total_awards,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": sum(counts["synced"] for counts in type_results.values()),
+                "failed": sum(counts["failed"] for counts in type_results.values()),
+                "relationships": {name: counts["synced"] for name, counts in type_results.items()}
             }
             
             logger.info(f"Completed synchronizing relationships for all awards: {result}")
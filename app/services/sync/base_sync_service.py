@@ -6,18 +6,65 @@ the interface for synchronization services between PostgreSQL and Neo4j.
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, TypeVar, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, TypeVar, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from neo4j import AsyncDriver
 
+from app.config import settings
+from app.infrastructure.ontology.ontology import RELATIONSHIPS
+from app.services.sync.sync_progress import report_rows
+
 # Type variables for generic repository types
 T = TypeVar('T')  # SQL model type
 N = TypeVar('N')  # Neo4j node type
 
 logger = logging.getLogger(__name__)
 
+INSTANCE_OF_REL = RELATIONSHIPS["INSTANCE_OF"]["type"]
+
+# Ontology class node matched by a node's INSTANCE_OF query, e.g. (class:OntologyClass {id: 'score-class'})
+_ONTOLOGY_CLASS_PATTERN = re.compile(r"\(\s*\w+((?::\w+)*:OntologyClass)\s*\{\s*id:\s*'([^']+)'\s*\}\s*\)")
+
+
+@lru_cache(maxsize=None)
+def build_batch_node_query(create_query: str, instance_of_query: str) -> str:
+    """
+    Build a query that writes a batch of nodes and their INSTANCE_OF relationships.
+    
+    The node's single-row MERGE query is applied to every element of the `$rows`
+    parameter, with `$param` references rewritten to `row.param`.
+    
+    Args:
+        create_query: Node query of the form "MERGE (x:Label {...}) ON CREATE SET ... RETURN x"
+        instance_of_query: Node query that matches its ontology class node
+    
+    Returns:
+        Cypher query taking `$rows` and returning the number of nodes written
+    """
+    merge = re.sub(r"\s+RETURN\s+\w+\s*$", "", create_query.strip())
+    node_var = re.match(r"MERGE\s*\(\s*(\w+)", merge).group(1)
+    merge = re.sub(r"\$(\w+)", r"row.\1", merge)
+    
+    class_match = _ONTOLOGY_CLASS_PATTERN.search(instance_of_query)
+    if not class_match:
+        raise ValueError("INSTANCE_OF query does not match an ontology class by id")
+    labels, class_id = class_match.groups()
+    
+    # The class node is looked up once per batch; nodes are still written if it is missing
+    return f"""
+        OPTIONAL MATCH (class{labels} {{id: '{class_id}'}})
+        UNWIND $rows AS row
+        {merge}
+        FOREACH (_ IN CASE WHEN class IS NULL THEN [] ELSE [1] END |
+            MERGE ({node_var})-[:{INSTANCE_OF_REL}]->(class))
+        RETURN count({node_var})
+    """
+
+
 class BaseSyncService(ABC):
     """
     Abstract base class for synchronization services.
@@ -25,6 +72,10 @@ class BaseSyncService(ABC):
     This class provides the common structure and utility methods for services
     that synchronize data between PostgreSQL and Neo4j, with clear separation 
     between node synchronization and relationship synchronization.
+    
+    Subclasses get a batched node sync (`sync_nodes_in_batches`) that reads
+    source rows page by page and writes each page with a single UNWIND query.
+    The outcome of each batch of the last run is kept in `batch_results`.
     """
     
     def __init__(
@@ -47,6 +98,7 @@ class BaseSyncService(ABC):
         self.neo4j_driver = neo4j_driver
         self.sql_repository = sql_repository
         self.graph_repository = graph_repository
+        self.batch_results: List[Dict[str, int]] = []
     
     @abstractmethod
     async def sync_node_by_id(self, entity_id: str) -> bool:
@@ -149,4 +201,163 @@ class BaseSyncService(ABC):
                 return records
         except Exception as e:
             logger.error(f"Error executing Neo4j query: {str(e)}")
-            raise 
\ No newline at end of file
+            raise 
+    
+    async def sync_nodes_in_batches(self, limit: Optional[int] = None, batch_size: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Synchronize all nodes of this type in batches, without relationships (except INSTANCE_OF).
+        
+        Each chunk of source rows read by `_iter_node_pages` is converted to
+        nodes and written with one query. When a batch write fails, its rows
+        are retried one at a time so that a single bad row does not fail the
+        whole batch.
+        
+        Args:
+            limit: Optional maximum number of entities to sync
+            batch_size: Rows per batch, SYNC_BATCH_SIZE by default
+        
+        Returns:
+            Tuple of (success_count, failed_count)
+        """
+        batch_size = batch_size or settings.SYNC_BATCH_SIZE
+        entity_type = type(self).__name__.replace("SyncService", "")
+        self.batch_results = []
+        success_count = 0
+        failed_count = 0
+        offset = 0
+        
+        try:
+            async for records in self._iter_node_pages(batch_size, limit):
+                batch_success, batch_failed = await self._write_node_batch(records)
+                self.batch_results.append({
+                    "batch": len(self.batch_results) + 1,
+                    "offset": offset,
+                    "size": len(records),
+                    "success": batch_success,
+                    "failed": batch_failed
+                })
+                logger.info(
+                    f"{entity_type} batch {len(self.batch_results)}: {batch_success} successful, "
+                    f"{batch_failed} failed"
+                )
+                success_count += batch_success
+                failed_count += batch_failed
+                report_rows(batch_success, batch_failed)
+                offset += len(records)
+        except Exception as e:
+            logger.error(f"Error synchronizing {entity_type} nodes after {offset} rows: {e}", exc_info=True)
+        
+        self._log_sync_result(entity_type, success_count, failed_count, success_count + failed_count)
+        return (success_count, failed_count)
+    
+    async def _iter_node_pages(self, batch_size: int, limit: Optional[int]) -> AsyncIterator[List[Any]]:
+        """
+        Read the source rows for the batched node sync in bounded chunks.
+        
+        Repositories with a `stream_all` reader are read by keyset on their
+        primary key; others fall back to OFFSET pages from `_fetch_node_page`.
+        
+        Args:
+            batch_size: Maximum number of rows per chunk
+            limit: Optional maximum number of rows to read
+        
+        Yields:
+            Lists of rows accepted by `_to_batch_node`
+        """
+        if hasattr(self.sql_repository, "stream_all"):
+            async for records in self.sql_repository.stream_all(chunk_size=batch_size, limit=limit):
+                yield records
+            return
+        
+        skip = 0
+        while limit is None or skip < limit:
+            page_size = batch_size if limit is None else min(batch_size, limit - skip)
+            records = await self._fetch_node_page(skip, page_size)
+            if not records:
+                return
+            yield records
+            skip += len(records)
+            if len(records) < page_size:
+                return
+    
+    async def _fetch_node_page(self, skip: int, limit: int) -> List[Any]:
+        """
+        Read one page of source rows for services whose repository has no `stream_all` reader.
+        
+        Args:
+            skip: Number of rows to skip
+            limit: Maximum number of rows to return
+        
+        Returns:
+            Rows accepted by `_to_batch_node`
+        """
+        records = await self.sql_repository.get_all(skip=skip, limit=limit)
+        if isinstance(records, tuple):
+            records, _ = records
+        return list(records)
+    
+    def _to_batch_node(self, record: Any) -> Any:
+        """
+        Convert a source row read by `_iter_node_pages` to a graph node.
+        
+        Args:
+            record: Source row
+        
+        Returns:
+            Graph node instance
+        """
+        return self._convert_to_node(record)
+    
+    def _batch_node_query(self, node: Any) -> str:
+        """
+        Return the batch write query for nodes of the given node's type.
+        
+        Args:
+            node: Any node of the batch
+        
+        Returns:
+            Cypher query taking `$rows`
+        """
+        return build_batch_node_query(node.create_query(), node.create_instance_of_relationship_query())
+    
+    async def _write_node_batch(self, records: List[Any]) -> Tuple[int, int]:
+        """
+        Convert and write one batch of source rows.
+        
+        Args:
+            records: Source rows
+        
+        Returns:
+            Tuple of (success_count, failed_count)
+        """
+        nodes = []
+        failed_count = 0
+        for record in records:
+            try:
+                nodes.append(self._to_batch_node(record))
+            except Exception as e:
+                logger.error(f"Error converting row for batch sync: {e}")
+                failed_count += 1
+        if not nodes:
+            return (0, failed_count)
+        
+        query = self._batch_node_query(nodes[0])
+        rows = [node.to_dict() for node in nodes]
+        try:
+            result = await self.execute_neo4j_query(query, {"rows": rows})
+            written = result[0][0] if result else 0
+            return (written, failed_count + len(rows) - written)
+        except Exception as e:
+            logger.warning(f"Batch write of {len(rows)} nodes failed, retrying row by row: {e}")
+        
+        success_count = 0
+        for row in rows:
+            try:
+                result = await self.execute_neo4j_query(query, {"rows": [row]})
+                if result and result[0][0]:
+                    success_count += 1
+                else:
+                    failed_count += 1
+            except Exception:
+                failed_count += 1
+        return (success_count, failed_count)
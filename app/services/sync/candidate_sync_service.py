@@ -6,12 +6,15 @@ between PostgreSQL and Neo4j.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, Tuple
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from neo4j import AsyncDriver
 
 from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 from app.repositories.candidate_repository import CandidateRepository
 from app.repositories.candidate_exam_repository import CandidateExamRepository
 from app.repositories.education_history_repository import EducationHistoryRepository
@@ -30,6 +33,261 @@ from app.domain.models.candidate import Candidate
 
 logger = logging.getLogger(__name__)
 
+# Candidates covered by a full relationship sync; LIMIT NULL selects all of them
+CANDIDATE_SCOPE_SQL = """
+WITH scope AS (
+    SELECT candidate_id FROM candidate ORDER BY candidate_id LIMIT :limit
+)
+"""
+
+# One SQL row per edge and one batched MERGE per relationship type, matching
+# the properties written by CandidateGraphRepository for a single candidate
+CANDIDATE_RELATIONSHIP_SPECS = [
+    RelationshipSpec(
+        name="schools",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT eh.candidate_id, eh.school_id, eh.start_year, eh.end_year,
+               el.name AS education_level, eh.academic_performance, eh.additional_info
+        FROM education_history eh
+        JOIN scope ON scope.candidate_id = eh.candidate_id
+        LEFT JOIN education_level el ON el.education_level_id = eh.education_level_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (s:School {school_id: row.school_id})
+        MERGE (c)-[r:STUDIES_AT]->(s)
+        SET r.start_year = row.start_year,
+            r.end_year = row.end_year,
+            r.education_level = row.education_level,
+            r.academic_performance = row.academic_performance,
+            r.additional_info = row.additional_info,
+            r.updated_at = datetime()
+        RETURN count(r)
+        """
+    ),
+    # A candidate studies the major of each degree linked to one of their
+    # education histories; sync_relationship_by_id follows the same rule
+    RelationshipSpec(
+        name="majors",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT eh.candidate_id, d.major_id, d.start_year, d.end_year,
+               el.name AS education_level, d.academic_performance, d.additional_info,
+               eh.school_id, s.school_name
+        FROM degree d
+        JOIN education_history eh ON eh.education_history_id = d.education_history_id
+        JOIN scope ON scope.candidate_id = eh.candidate_id
+        LEFT JOIN education_level el ON el.education_level_id = eh.education_level_id
+        LEFT JOIN school s ON s.school_id = eh.school_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (m:Major {major_id: row.major_id})
+        MERGE (c)-[r:STUDIES_MAJOR]->(m)
+        SET r.start_year = row.start_year,
+            r.end_year = row.end_year,
+            r.education_level = row.education_level,
+            r.academic_performance = row.academic_performance,
+            r.school_id = row.school_id,
+            r.school_name = row.school_name,
+            r.additional_info = row.additional_info,
+            r.updated_at = datetime()
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="degrees",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT eh.candidate_id, d.degree_id, d.start_year, d.end_year,
+               d.academic_performance, el.name AS education_level,
+               eh.school_id, s.school_name, d.additional_info
+        FROM degree d
+        JOIN education_history eh ON eh.education_history_id = d.education_history_id
+        JOIN scope ON scope.candidate_id = eh.candidate_id
+        LEFT JOIN education_level el ON el.education_level_id = eh.education_level_id
+        LEFT JOIN school s ON s.school_id = eh.school_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (d:Degree {degree_id: row.degree_id})
+        MERGE (c)-[r:HOLDS_DEGREE]->(d)
+        SET r.start_year = row.start_year,
+            r.end_year = row.end_year,
+            r.academic_performance = row.academic_performance,
+            r.education_level = row.education_level,
+            r.school_id = row.school_id,
+            r.school_name = row.school_name,
+            r.additional_info = row.additional_info,
+            r.updated_at = datetime()
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="exams",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT ce.candidate_id, ce.exam_id, ce.registration_number,
+               ce.registration_date, ce.status
+        FROM candidate_exam ce
+        JOIN scope ON scope.candidate_id = ce.candidate_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (e:Exam {exam_id: row.exam_id})
+        MERGE (c)-[r:ATTENDS_EXAM]->(e)
+        SET r.registration_number = row.registration_number,
+            r.registration_date = row.registration_date,
+            r.status = row.status,
+            r.updated_at = datetime()
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="scores",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT ce.candidate_id, es.exam_score_id AS score_id,
+               ex.exam_id, ex.exam_name, sub.subject_id, sub.subject_name
+        FROM exam_score es
+        JOIN candidate_exam_subject ces ON ces.candidate_exam_subject_id = es.candidate_exam_subject_id
+        JOIN candidate_exam ce ON ce.candidate_exam_id = ces.candidate_exam_id
+        JOIN scope ON scope.candidate_id = ce.candidate_id
+        JOIN exam_subject esub ON esub.exam_subject_id = es.exam_subject_id
+        JOIN exam ex ON ex.exam_id = esub.exam_id
+        JOIN subject sub ON sub.subject_id = esub.subject_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (s:Score {score_id: row.score_id})
+        MERGE (c)-[r:RECEIVES_SCORE]->(s)
+        SET r.exam_id = row.exam_id,
+            r.exam_name = row.exam_name,
+            r.subject_id = row.subject_id,
+            r.subject_name = row.subject_name,
+            r.registration_status = 'REGISTERED',
+            r.is_required = true,
+            r.updated_at = datetime()
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="schedules",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT DISTINCT ce.candidate_id, sch.exam_schedule_id AS schedule_id,
+               ex.exam_id, ex.exam_name, sub.subject_id, sub.subject_name,
+               esub.is_required, sch.room_id, er.room_name
+        FROM exam_schedule sch
+        JOIN exam_subject esub ON esub.exam_subject_id = sch.exam_subject_id
+        JOIN candidate_exam_subject ces ON ces.exam_subject_id = esub.exam_subject_id
+        JOIN candidate_exam ce ON ce.candidate_exam_id = ces.candidate_exam_id
+        JOIN scope ON scope.candidate_id = ce.candidate_id
+        JOIN exam ex ON ex.exam_id = esub.exam_id
+        JOIN subject sub ON sub.subject_id = esub.subject_id
+        LEFT JOIN exam_room er ON er.room_id = sch.room_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (s:ExamSchedule {schedule_id: row.schedule_id})
+        MERGE (c)-[r:HAS_EXAM_SCHEDULE]->(s)
+        SET r.exam_id = row.exam_id,
+            r.exam_name = row.exam_name,
+            r.subject_id = row.subject_id,
+            r.subject_name = row.subject_name,
+            r.registration_status = 'REGISTERED',
+            r.registration_date = null,
+            r.is_required = row.is_required,
+            r.room_id = row.room_id,
+            r.room_name = row.room_name,
+            r.seat_number = null,
+            r.assignment_date = null,
+            r.updated_at = datetime()
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="certificates",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT ce.candidate_id, cert.certificate_id
+        FROM certificate cert
+        JOIN candidate_exam ce ON ce.candidate_exam_id = cert.candidate_exam_id
+        JOIN scope ON scope.candidate_id = ce.candidate_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (cert:Certificate {certificate_id: row.certificate_id})
+        MERGE (c)-[r:EARNS_CERTIFICATE]->(cert)
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="credentials",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT cc.candidate_id, cc.credential_id
+        FROM candidate_credential cc
+        JOIN scope ON scope.candidate_id = cc.candidate_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (cr:Credential {credential_id: row.credential_id})
+        MERGE (c)-[r:PROVIDES_CREDENTIAL]->(cr)
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="awards",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT ce.candidate_id, a.award_id
+        FROM award a
+        JOIN candidate_exam ce ON ce.candidate_exam_id = a.candidate_exam_id
+        JOIN scope ON scope.candidate_id = ce.candidate_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (a:Award {award_id: row.award_id})
+        MERGE (c)-[r:EARNS_AWARD]->(a)
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="achievements",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT ce.candidate_id, a.achievement_id
+        FROM achievement a
+        JOIN candidate_exam ce ON ce.candidate_exam_id = a.candidate_exam_id
+        JOIN scope ON scope.candidate_id = ce.candidate_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (a:Achievement {achievement_id: row.achievement_id})
+        MERGE (c)-[r:ACHIEVES]->(a)
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="recognitions",
+        sql=CANDIDATE_SCOPE_SQL + """
+        SELECT ce.candidate_id, rec.recognition_id
+        FROM recognition rec
+        JOIN candidate_exam ce ON ce.candidate_exam_id = rec.candidate_exam_id
+        JOIN scope ON scope.candidate_id = ce.candidate_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (rec:Recognition {recognition_id: row.recognition_id})
+        MERGE (c)-[r:RECEIVES_RECOGNITION]->(rec)
+        RETURN count(r)
+        """
+    )
+]
+
 class CandidateSyncService(BaseSyncService):
     """
     Service for synchronizing Candidate data between PostgreSQL and Neo4j.
@@ -98,6 +356,8 @@ class CandidateSyncService(BaseSyncService):
             
             # Create or update node in Neo4j (this automatically creates the INSTANCE_OF relationship)
             result = await self.graph_repository.create_or_update(neo4j_data)
+            if result:
+                await candidate_info_cache.invalidate(candidate_id)
             
             logger.info(f"Successfully synchronized candidate node {candidate_id}")
             return result
@@ -118,32 +378,23 @@ class CandidateSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all candidate nodes (limit={limit})")
         
-        try:
-            # Get all candidates from SQL database with personal info
-            candidates = await self.sql_repository.get_all(limit=limit, include_personal_info=True)
-            if isinstance(candidates, tuple) and len(candidates) == 2:
-                candidates, _ = candidates
-            
-            success_count = 0
-            failed_count = 0
-            
-            for candidate in candidates:
-                try:
-                    # Sync only the candidate node
-                    if await self.sync_node_by_id(candidate.candidate_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    logger.error(f"Error syncing candidate node {candidate.candidate_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing candidate nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
+        return await self.sync_nodes_in_batches(limit=limit)
+    
+    async def _iter_node_pages(self, batch_size: int, limit: Optional[int]) -> AsyncIterator[List[Candidate]]:
+        """
+        Read candidates in chunks, with the personal info their nodes include.
+        
+        Args:
+            batch_size: Maximum number of candidates per chunk
+            limit: Optional maximum number of candidates to read
             
-        except Exception as e:
-            logger.error(f"Error during candidate nodes synchronization: {e}")
-            return (0, 0)
+        Yields:
+            Lists of candidates
+        """
+        async for candidates in self.sql_repository.stream_all(
+            chunk_size=batch_size, limit=limit, include_personal_info=True
+        ):
+            yield candidates
     
     async def sync_relationship_by_id(self, candidate_id: str) -> Dict[str, int]:
         """
@@ -197,7 +448,7 @@ class CandidateSyncService(BaseSyncService):
         }
         
         try:
-            # 1. Sync education histories (schools and majors)
+            # 1. Sync education histories (schools)
             education_histories, _ = await self.education_history_repository.get_by_candidate(candidate_id)
             for history in education_histories:
                 # Add STUDIES_AT relationship to school
@@ -213,29 +464,13 @@ class CandidateSyncService(BaseSyncService):
                 ):
                     results["schools"] += 1
                 
-                # Sync major relationships if available
-                if hasattr(history, "school") and hasattr(history.school, "majors"):
-                    for major in history.school.majors:
-                        major_rel_data = {
-                            "start_year": history.start_year,
-                            "end_year": history.end_year,
-                            "education_level": history.education_level.name if history.education_level else None,
-                            "academic_performance": history.academic_performance,
-                            "additional_info": history.additional_info,
-                            "school_id": history.school_id,
-                            "school_name": history.school.school_name if history.school else None
-                        }
-                        if await self.graph_repository.add_studies_major_relationship(
-                            candidate_id, major.major_id, major_rel_data
-                        ):
-                            results["majors"] += 1
-            
-            # 2. Sync degrees
+            # 2. Sync degrees and the majors they were earned in
             if not self.degree_repository:
                 from app.repositories.degree_repository import DegreeRepository
                 self.degree_repository = DegreeRepository(self.db_session)
                 
             degrees, total_degrees = await self.degree_repository.get_by_candidate(candidate_id)
+            histories_by_id = {history.education_history_id: history for history in education_histories}
             for degree in degrees:
                 # Add relationship to degree
                 if await self.graph_repository.add_holds_degree_relationship(
@@ -243,16 +478,21 @@ class CandidateSyncService(BaseSyncService):
                 ):
                     results["degrees"] += 1
                 
-                # If degree has a major, add relationship to that major too
-                if hasattr(degree, "major") and degree.major:
+                # Add STUDIES_MAJOR for the major of a degree linked to an education history,
+                # with the same properties the "majors" relationship spec writes
+                history = histories_by_id.get(degree.education_history_id)
+                if history:
                     major_rel_data = {
-                        "degree_id": degree.degree_id,
-                        "degree_name": degree.degree_name if hasattr(degree, "degree_name") else None,
-                        "school_id": degree.school_id if hasattr(degree, "school_id") else None,
-                        "school_name": degree.school_name if hasattr(degree, "school_name") else None
+                        "start_year": degree.start_year,
+                        "end_year": degree.end_year,
+                        "education_level": history.education_level.name if history.education_level else None,
+                        "academic_performance": degree.academic_performance,
+                        "additional_info": degree.additional_info,
+                        "school_id": history.school_id,
+                        "school_name": history.school.school_name if history.school else None
                     }
                     if await self.graph_repository.add_studies_major_relationship(
-                        candidate_id, degree.major.major_id, major_rel_data
+                        candidate_id, degree.major_id, major_rel_data
                     ):
                         results["majors"] += 1
             
@@ -314,7 +554,7 @@ class CandidateSyncService(BaseSyncService):
             if not candidate_exams:
                 logger.warning(f"No exam registrations found for candidate ID {candidate_id}")
                 candidate_exams = []
-
+            
             # 6. Sync certificates
             if not self.certificate_repository:
                 from app.repositories.certificate_repository import CertificateRepository
@@ -388,74 +628,41 @@ class CandidateSyncService(BaseSyncService):
         except Exception as e:
             logger.error(f"Error synchronizing relationships for candidate {candidate_id}: {str(e)}", exc_info=True)
             return results
+        
+        finally:
+            # Relationships may have changed even if the sync stopped part way
+            await candidate_info_cache.invalidate_relationships(candidate_id)
     
     async def sync_all_relationships(self, limit: Optional[int] = None) -> Dict[str, int]:
         """
         Synchronize relationships for all candidates.
         
+        Each relationship type is read as one streamed SQL join and merged in
+        UNWIND batches, instead of querying every candidate one by one.
+        
         Args:
             limit: Optional maximum number of candidates to process
             
         Returns:
-            Dictionary with counts of synced relationships by type
+            Dictionary with the number of candidates in scope, edges merged,
+            rows that failed and per-type counts of synced relationships
         """
         logger.info(f"Synchronizing relationships for all candidates (limit={limit})")
         
         try:
-            # Get all candidate IDs from database
-            candidates = await self.sql_repository.get_all(limit=limit)
-            if isinstance(candidates, tuple) and len(candidates) == 2:
-                candidates, _ = candidates
-                
-            total_candidates = len(candidates)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "schools": 0,
-                "majors": 0,
-                "degrees": 0,
-                "exams": 0,
-                "scores": 0,
-                "schedules": 0,
-                "certificates": 0,
-                "credentials": 0,
-                "awards": 0,
-                "achievements": 0,
-                "recognitions": 0
-            }
+            total_candidates = await self.db_session.scalar(
+                text(CANDIDATE_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
+            )
             
-            # For each candidate, sync relationships
-            for candidate in candidates:
-                try:
-                    # Verify candidate exists in Neo4j
-                    candidate_node = await self.graph_repository.get_by_id(candidate.candidate_id)
-                    if not candidate_node:
-                        logger.warning(f"Candidate {candidate.candidate_id} not found in Neo4j, skipping relationship sync")
-                        failure_count += 1
-                        continue
-                        
-                    # Sync relationships for this candidate
-                    results = await self.sync_relationship_by_id(candidate.candidate_id)
-                    
-                    # Update aggregated counts
-                    for key, value in results.items():
-                        if key in relationship_counts:
-                            relationship_counts[key] += value
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error synchronizing relationships for candidate {candidate.candidate_id}: {e}")
-                    failure_count += 1
+            engine = RelationshipSyncEngine(self.db_session, self.neo4j_driver)
+            type_results = await engine.sync(CANDIDATE_RELATIONSHIP_SPECS, {"limit": limit})
             
             # Prepare final result
             result = {
                 "total_candidates": total_candidates,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": sum(counts["synced"] for counts in type_results.values()),
+                "failed": sum(counts["failed"] for counts in type_results.values()),
+                "relationships": {name: counts["synced"] for name, counts in type_results.items()}
             }
             
             logger.info(f"Completed synchronizing relationships for all candidates: {result}")
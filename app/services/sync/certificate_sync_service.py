@@ -9,7 +9,7 @@ import logging
 from typing import Optional, Tuple, List, Dict, Any, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 from neo4j import AsyncDriver
 
 from app.domain.models.certificate import Certificate
@@ -17,9 +17,39 @@ from app.domain.graph_models.certificate_node import CertificateNode
 from app.repositories.certificate_repository import CertificateRepository
 from app.graph_repositories.certificate_graph_repository import CertificateGraphRepository
 from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 
 logger = logging.getLogger(__name__)
 
+# Certificates covered by a full relationship sync; LIMIT NULL selects all of them
+CERTIFICATE_SCOPE_SQL = """
+WITH scope AS (
+    SELECT certificate_id FROM certificate ORDER BY certificate_id LIMIT :limit
+)
+"""
+
+# EARNS_CERTIFICATE is merged by the candidate relationship specs and left out here
+CERTIFICATE_RELATIONSHIP_SPECS = [
+    RelationshipSpec(
+        name="exam",
+        sql=CERTIFICATE_SCOPE_SQL + """
+        SELECT cert.certificate_id, ce.exam_id
+        FROM certificate cert
+        JOIN scope ON scope.certificate_id = cert.certificate_id
+        JOIN candidate_exam ce ON ce.candidate_exam_id = cert.candidate_exam_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (cert:Certificate {certificate_id: row.certificate_id})
+        MATCH (e:Exam {exam_id: row.exam_id})
+        MERGE (cert)-[r:CERTIFICATE_FOR_EXAM]->(e)
+        SET r.updated_at = datetime()
+        RETURN count(r)
+        """
+    )
+]
+
 class CertificateSyncService(BaseSyncService):
     """
     Service for synchronizing Certificate data between PostgreSQL and Neo4j.
@@ -93,30 +123,7 @@ class CertificateSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all certificate nodes (limit={limit})")
         
-        try:
-            # Get all certificates from SQL database with details
-            certificates, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for certificate in certificates:
-                try:
-                    # Sync only the certificate node
-                    if await self.sync_node_by_id(certificate["certificate_id"]):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    logger.error(f"Error syncing certificate node {certificate['certificate_id']}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing certificate nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during certificate nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     async def sync_relationship_by_id(self, certificate_id: str) -> Dict[str, int]:
         """
@@ -180,6 +187,7 @@ class CertificateSyncService(BaseSyncService):
                     success = await self.graph_repository.add_issued_to_relationship(certificate_id, candidate_id)
                     if success:
                         relationship_counts["candidate"] += 1
+                        await candidate_info_cache.invalidate(candidate_id, ("achievements",))
                         logger.info(f"Successfully added EARNS_CERTIFICATE relationship between {candidate_id} and {certificate_id}")
                 except Exception as e:
                     logger.error(f"Error creating EARNS_CERTIFICATE relationship: {e}")
@@ -227,6 +235,9 @@ class CertificateSyncService(BaseSyncService):
         """
         Synchronize relationships for all certificates.
         
+        The EARNS_CERTIFICATE edges are merged by the candidate relationship sync,
+        so only the remaining types are synchronized here.
+        
         Args:
             limit: Optional maximum number of certificates to process
             
@@ -236,49 +247,20 @@ class CertificateSyncService(BaseSyncService):
         logger.info(f"Synchronizing relationships for all certificates (limit={limit})")
         
         try:
-            # Get all certificates from SQL database
-            certificates, total_count = await self.sql_repository.get_all(limit=limit)
-            
-            total_certificates = len(certificates)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "candidate": 0,
-                "exam": 0
-            }
+            total_certificates = await self.db_session.scalar(
+                text(CERTIFICATE_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
+            )
             
-            # For each certificate, sync relationships
-            for certificate in certificates:
-                try:
-                    # Verify certificate exists in Neo4j
-                    certificate_node = await self.graph_repository.get_by_id(certificate["certificate_id"])
-                    if not certificate_node:
-                        logger.warning(f"Certificate {certificate['certificate_id']} not found in Neo4j, skipping relationship sync")
-                        failure_count += 1
-                        continue
-                    
-                    # Sync relationships for this certificate
-                    results = await self.sync_relationship_by_id(certificate["certificate_id"])
-                    
-                    # Update aggregated counts
-                    for key, value in results.items():
-                        if key in relationship_counts:
-                            relationship_counts[key] += value
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error synchronizing relationships for certificate {certificate['certificate_id']}: {e}")
-                    failure_count += 1
+            # Each relationship type is streamed as one join and merged in UNWIND batches
+            engine = RelationshipSyncEngine(self.db_session, self.neo4j_driver)
+            type_results = await engine.sync(CERTIFICATE_RELATIONSHIP_SPECS, {"limit": limit})
             
             # Prepare final result
             result = {
                 "total_certificates": total_certificates,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": sum(counts["synced"] for counts in type_results.values()),
+                "failed": sum(counts["failed"] for counts in type_results.values()),
+                "relationships": {name: counts["synced"] for name, counts in type_results.items()}
             }
             
             logger.info(f"Completed synchronizing relationships for all certificates: {result}")
@@ -294,7 +276,7 @@ class CertificateSyncService(BaseSyncService):
                 "relationships": {}
             }
     
-    def _convert_to_node(self, certificate: Dict[str, Any]) -> CertificateNode:
+    def _convert_to_node(self, certificate: Union[Certificate, Dict[str, Any]]) -> CertificateNode:
         """
         Convert a SQL Certificate model or dictionary to a CertificateNode.
         
@@ -304,6 +286,17 @@ class CertificateSyncService(BaseSyncService):
         Returns:
             CertificateNode instance ready for Neo4j
         """
+        # Rows read by the repository's stream_all are models, not dictionaries
+        if isinstance(certificate, Certificate):
+            certificate = {
+                "certificate_id": certificate.certificate_id,
+                "certificate_number": certificate.certificate_number,
+                "issue_date": certificate.issue_date,
+                "expiry_date": certificate.expiry_date,
+                "additional_info": certificate.additional_info,
+                "certificate_image_url": certificate.certificate_image_url
+            }
+        
         try:
             # Tạo CertificateNode chỉ với thuộc tính cơ bản, không có thông tin relationship
             certificate_node = CertificateNode(
@@ -9,7 +9,7 @@ import logging
 from typing import Optional, Tuple, List, Dict, Any, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 from neo4j import AsyncDriver
 
 from app.domain.models.candidate_credential import CandidateCredential
@@ -17,9 +17,17 @@ from app.domain.graph_models.credential_node import CredentialNode
 from app.repositories.candidate_credential_repository import CandidateCredentialRepository
 from app.graph_repositories.credential_graph_repository import CredentialGraphRepository
 from app.services.sync.base_sync_service import BaseSyncService
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 
 logger = logging.getLogger(__name__)
 
+# Credentials covered by a full relationship sync; LIMIT NULL selects all of them
+CREDENTIAL_SCOPE_SQL = """
+WITH scope AS (
+    SELECT credential_id FROM candidate_credential ORDER BY credential_id LIMIT :limit
+)
+"""
+
 class CredentialSyncService(BaseSyncService):
     """
     Service for synchronizing Candidate Credential data between PostgreSQL and Neo4j.
@@ -95,38 +103,7 @@ class CredentialSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all credential nodes (limit={limit})")
         
-        try:
-            # Get all credentials from SQL database
-            credentials, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for credential in credentials:
-                try:
-                    # Sync only the credential node - handle both ORM objects and dictionaries
-                    credential_id = credential.credential_id if hasattr(credential, 'credential_id') else credential.get("credential_id")
-                    if not credential_id:
-                        logger.error(f"Missing credential_id in credential object: {credential}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(credential_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get credential_id safely for logging
-                    credential_id = getattr(credential, 'credential_id', None) if hasattr(credential, 'credential_id') else credential.get("credential_id", "unknown")
-                    logger.error(f"Error syncing credential node {credential_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing credential nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during credential nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     async def sync_relationship_by_id(self, credential_id: str) -> Dict[str, int]:
         """
@@ -170,6 +147,7 @@ class CredentialSyncService(BaseSyncService):
                 success = await self.graph_repository.add_belongs_to_relationship(credential_id, candidate_id)
                 if success:
                     relationship_counts["candidate"] += 1
+                    await candidate_info_cache.invalidate(candidate_id, ("achievements",))
             
             # Extract issuing_organization if available
             issuing_org = getattr(credential, 'issuing_organization', None)
@@ -189,6 +167,10 @@ class CredentialSyncService(BaseSyncService):
         """
         Synchronize relationships for all credentials.
         
+        PROVIDES_CREDENTIAL, the only relationship of a credential, is merged by
+        the candidate relationship sync and issuing organizations are not yet
+        modelled, so there is nothing to merge here.
+        
         Args:
             limit: Optional maximum number of credentials to process
             
@@ -198,58 +180,16 @@ class CredentialSyncService(BaseSyncService):
         logger.info(f"Synchronizing relationships for all credentials (limit={limit})")
         
         try:
-            # Get all credentials from SQL database
-            credentials, total_count = await self.sql_repository.get_all(limit=limit)
-            
-            total_credentials = len(credentials)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "candidate": 0,
-                "issuing_organization": 0
-            }
-            
-            # For each credential, sync relationships
-            for credential in credentials:
-                try:
-                    # Get credential_id safely - handle both ORM objects and dictionaries
-                    credential_id = credential.credential_id if hasattr(credential, 'credential_id') else credential.get("credential_id")
-                    if not credential_id:
-                        logger.error(f"Missing credential_id in credential object: {credential}")
-                        failure_count += 1
-                        continue
-                    
-                    # Verify credential exists in Neo4j
-                    credential_node = await self.graph_repository.get_by_id(credential_id)
-                    if not credential_node:
-                        logger.warning(f"Credential {credential_id} not found in Neo4j, skipping relationship sync")
-                        failure_count += 1
-                        continue
-                    
-                    # Sync relationships for this credential
-                    results = await self.sync_relationship_by_id(credential_id)
-                    
-                    # Update aggregated counts
-                    for key, value in results.items():
-                        if key in relationship_counts:
-                            relationship_counts[key] += value
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    # Get credential_id safely for logging
-                    credential_id = getattr(credential, 'credential_id', None) if hasattr(credential, 'credential_id') else credential.get("credential_id", "unknown")
-                    logger.error(f"Error synchronizing relationships for credential {credential_id}: {e}")
-                    failure_count += 1
+            total_credentials = await self.db_session.scalar(
+                text(CREDENTIAL_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
+            )
             
             # Prepare final result
             result = {
                 "total_credentials": total_credentials,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": 0,
+                "failed": 0,
+                "relationships": {}
             }
             
             logger.info(f"Completed synchronizing relationships for all credentials: {result}")
@@ -9,7 +9,7 @@ import logging
 from typing import Optional, Tuple, List, Dict, Any, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 from neo4j import AsyncDriver
 
 from app.domain.models.degree import Degree
@@ -17,9 +17,53 @@ from app.domain.graph_models.degree_node import DegreeNode
 from app.repositories.degree_repository import DegreeRepository
 from app.graph_repositories.degree_graph_repository import DegreeGraphRepository
 from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 
 logger = logging.getLogger(__name__)
 
+# Degrees covered by a full relationship sync; LIMIT NULL selects all of them
+DEGREE_SCOPE_SQL = """
+WITH scope AS (
+    SELECT degree_id FROM degree ORDER BY degree_id LIMIT :limit
+)
+"""
+
+# HOLDS_DEGREE is merged by the candidate relationship specs and left out here
+DEGREE_RELATIONSHIP_SPECS = [
+    RelationshipSpec(
+        name="school",
+        sql=DEGREE_SCOPE_SQL + """
+        SELECT d.degree_id, eh.school_id
+        FROM degree d
+        JOIN scope ON scope.degree_id = d.degree_id
+        JOIN education_history eh ON eh.education_history_id = d.education_history_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (d:Degree {degree_id: row.degree_id})
+        MATCH (s:School {school_id: row.school_id})
+        MERGE (d)-[r:ISSUED_BY]->(s)
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="major",
+        sql=DEGREE_SCOPE_SQL + """
+        SELECT d.degree_id, d.major_id
+        FROM degree d
+        JOIN scope ON scope.degree_id = d.degree_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (d:Degree {degree_id: row.degree_id})
+        MATCH (m:Major {major_id: row.major_id})
+        MERGE (d)-[r:RELATED_TO]->(m)
+        RETURN count(r)
+        """
+    )
+]
+
 class DegreeSyncService(BaseSyncService):
     """
     Service for synchronizing Degree data between PostgreSQL and Neo4j.
@@ -95,38 +139,7 @@ class DegreeSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all degree nodes (limit={limit})")
         
-        try:
-            # Get all degrees from SQL database
-            degrees, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for degree in degrees:
-                try:
-                    # Sync only the degree node - handle both ORM objects and dictionaries
-                    degree_id = degree.degree_id if hasattr(degree, 'degree_id') else degree.get("degree_id")
-                    if not degree_id:
-                        logger.error(f"Missing degree_id in degree object: {degree}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(degree_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get degree_id safely for logging
-                    degree_id = getattr(degree, 'degree_id', None) if hasattr(degree, 'degree_id') else degree.get("degree_id", "unknown")
-                    logger.error(f"Error syncing degree node {degree_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing degree nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during degree nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     async def sync_relationship_by_id(self, degree_id: str) -> Dict[str, int]:
         """
@@ -175,6 +188,7 @@ class DegreeSyncService(BaseSyncService):
                 success = await self.graph_repository.add_earned_by_relationship(degree_id, candidate_id)
                 if success:
                     relationship_counts["candidate"] += 1
+                    await candidate_info_cache.invalidate(candidate_id, ("education",))
             
             # Extract school_id if possible
             school_id = None
@@ -208,6 +222,9 @@ class DegreeSyncService(BaseSyncService):
         """
         Synchronize relationships for all degrees.
         
+        The HOLDS_DEGREE edges are merged by the candidate relationship sync,
+        so only the remaining types are synchronized here.
+        
         Args:
             limit: Optional maximum number of degrees to process
             
@@ -217,59 +234,20 @@ class DegreeSyncService(BaseSyncService):
         logger.info(f"Synchronizing relationships for all degrees (limit={limit})")
         
         try:
-            # Get all degrees from SQL database
-            degrees, total_count = await self.sql_repository.get_all(limit=limit)
-            
-            total_degrees = len(degrees)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "candidate": 0,
-                "school": 0,
-                "major": 0
-            }
+            total_degrees = await self.db_session.scalar(
+                text(DEGREE_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
+            )
             
-            # For each degree, sync relationships
-            for degree in degrees:
-                try:
-                    # Get degree_id safely - handle both ORM objects and dictionaries
-                    degree_id = degree.degree_id if hasattr(degree, 'degree_id') else degree.get("degree_id")
-                    if not degree_id:
-                        logger.error(f"Missing degree_id in degree object: {degree}")
-                        failure_count += 1
-                        continue
-                    
-                    # Verify degree exists in Neo4j
-                    degree_node = await self.graph_repository.get_by_id(degree_id)
-                    if not degree_node:
-                        logger.warning(f"Degree {degree_id} not found in Neo4j, skipping relationship sync")
-                        failure_count += 1
-                        continue
-                    
-                    # Sync relationships for this degree
-                    results = await self.sync_relationship_by_id(degree_id)
-                    
-                    # Update aggregated counts
-                    for key, value in results.items():
-                        if key in relationship_counts:
-                            relationship_counts[key] += value
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    # Get degree_id safely for logging
-                    degree_id = getattr(degree, 'degree_id', None) if hasattr(degree, 'degree_id') else degree.get("degree_id", "unknown")
-                    logger.error(f"Error synchronizing relationships for degree {degree_id}: {e}")
-                    failure_count += 1
+            # Each relationship type is streamed as one join and merged in UNWIND batches
+            engine = RelationshipSyncEngine(self.db_session, self.neo4j_driver)
+            type_results = await engine.sync(DEGREE_RELATIONSHIP_SPECS, {"limit": limit})
             
             # Prepare final result
             result = {
                 "total_degrees": total_degrees,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": sum(counts["synced"] for counts in type_results.values()),
+                "failed": sum(counts["failed"] for counts in type_results.values()),
+                "relationships": {name: counts["synced"] for name, counts in type_results.items()}
             }
             
             logger.info(f"Completed synchronizing relationships for all degrees: {result}")
@@ -0,0 +1,334 @@
+"""
+Drift Report Service module.
+
+This module measures how far Neo4j has drifted from PostgreSQL without running
+a sync. Each entity table is split into buckets of consecutive IDs, and both
+sides summarize every bucket: a row count, an order-independent checksum of the
+IDs and a version bound (the newest change in PostgreSQL, the oldest write in
+Neo4j). Only buckets whose summaries disagree are compared row by row, and a
+repair re-syncs or deletes just the rows found there, so repair work follows
+the size of the drift rather than the size of the data.
+"""
+
+import hashlib
+import logging
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from neo4j import AsyncDriver
+
+from app.config import settings
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
+from app.services.graph_sync_queue import DELETE, NODE, apply_changes
+from app.services.sync.sync_progress import report_rows, track_phase
+
+logger = logging.getLogger(__name__)
+
+
+class DriftTarget(NamedTuple):
+    """An entity table and the Neo4j nodes synchronized from it."""
+    entity_type: str
+    table: str
+    key_column: str
+    label: str
+    id_property: str
+
+
+# Entity types in node sync order, so a repair creates relationship targets first
+DRIFT_TARGETS = [
+    DriftTarget("subject", "subject", "subject_id", "Subject", "subject_id"),
+    DriftTarget("school", "school", "school_id", "School", "school_id"),
+    DriftTarget("major", "major", "major_id", "Major", "major_id"),
+    DriftTarget("management_unit", "management_unit", "unit_id", "ManagementUnit", "unit_id"),
+    DriftTarget("exam_location", "exam_location", "location_id", "ExamLocation", "location_id"),
+    DriftTarget("exam_room", "exam_room", "room_id", "ExamRoom", "room_id"),
+    DriftTarget("exam", "exam", "exam_id", "Exam", "exam_id"),
+    DriftTarget("candidate", "candidate", "candidate_id", "Candidate", "candidate_id"),
+    DriftTarget("exam_schedule", "exam_schedule", "exam_schedule_id", "ExamSchedule", "schedule_id"),
+    DriftTarget("score", "exam_score", "exam_score_id", "Score", "score_id"),
+    DriftTarget("score_review", "score_review", "score_review_id", "ScoreReview", "review_id"),
+    DriftTarget("achievement", "achievement", "achievement_id", "Achievement", "achievement_id"),
+    DriftTarget("award", "award", "award_id", "Award", "award_id"),
+    DriftTarget("certificate", "certificate", "certificate_id", "Certificate", "certificate_id"),
+    DriftTarget("credential", "candidate_credential", "credential_id", "Credential", "credential_id"),
+    DriftTarget("degree", "degree", "degree_id", "Degree", "degree_id"),
+    DriftTarget("recognition", "recognition", "recognition_id", "Recognition", "recognition_id"),
+]
+
+# Buckets are numbered by position in byte order (COLLATE "C"), which is the
+# order Python and Neo4j compare strings in. The checksum is a sum of the first
+# 60 bits of each ID's MD5, so both sides can compute it in any row order.
+_BUCKETED_ROWS_SQL = """
+    SELECT
+        {key_column} COLLATE "C" AS key,
+        COALESCE(updated_at, created_at) AS version,
+        (row_number() OVER (ORDER BY {key_column} COLLATE "C") - 1) / :bucket_size AS bucket
+    FROM {table}
+"""
+
+_SUMMARY_SQL = """
+    SELECT
+        bucket,
+        count(*) AS row_count,
+        min(key) AS first_id,
+        max(key) AS last_id,
+        sum(('x' || substr(md5(key), 1, 15))::bit(60)::bigint) AS checksum,
+        max(version) AS newest
+    FROM ({rows}) t
+    GROUP BY bucket
+    ORDER BY bucket
+"""
+
+_DETAIL_SQL = """
+    SELECT key, version, bucket
+    FROM ({rows}) t
+    WHERE bucket IN :buckets
+"""
+
+
+def id_checksum(entity_id: str) -> int:
+    """Checksum contribution of one ID, matching the SQL expression in _SUMMARY_SQL."""
+    return int(hashlib.md5(entity_id.encode("utf-8")).hexdigest()[:15], 16)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Convert a Neo4j or PostgreSQL timestamp to an aware datetime, or None."""
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    elif isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class DriftReportService:
+    """
+    Compares PostgreSQL rows with Neo4j nodes bucket by bucket.
+    
+    A Neo4j node's updated_at (or created_at) is the time it was last written
+    by a sync, so a row changed in PostgreSQL after that time is stale. IDs are
+    checksummed without timestamps, since the two sides record different ones.
+    """
+    
+    def __init__(self, session: AsyncSession, driver: AsyncDriver, sync_services: Dict[str, Any], bucket_size: Optional[int] = None):
+        """
+        Initialize the service.
+        
+        Args:
+            session: SQLAlchemy async session
+            driver: Neo4j async driver
+            sync_services: Sync services by entity type, used by repairs
+            bucket_size: Rows per bucket, SYNC_DRIFT_BUCKET_SIZE by default
+        """
+        self.session = session
+        self.driver = driver
+        self.sync_services = sync_services
+        self.bucket_size = bucket_size or settings.SYNC_DRIFT_BUCKET_SIZE
+    
+    async def check(self, entity_types: Optional[List[str]] = None, repair: bool = False) -> Dict[str, Any]:
+        """
+        Report the drift of each entity type and optionally repair it.
+        
+        Args:
+            entity_types: Entity types to check, all of them by default
+            repair: Whether to re-sync missing and stale rows and delete extra nodes
+        
+        Returns:
+            Dictionary with a report per entity type, overall totals and, for
+            repairs, the repair counts
+        """
+        targets = [target for target in DRIFT_TARGETS if entity_types is None or target.entity_type in entity_types]
+        entities = {}
+        changes: Dict[Tuple[str, str], str] = {}
+        for target in targets:
+            with track_phase(f"drift:{target.entity_type}"):
+                try:
+                    entities[target.entity_type], target_changes = await self.check_entity(target)
+                    changes.update(target_changes)
+                except Exception as e:
+                    logger.error(f"Error checking {target.entity_type} drift: {e}", exc_info=True)
+                    await self.session.rollback()
+                    entities[target.entity_type] = {"error": str(e)}
+        
+        results = {
+            "entities": entities,
+            "totals": {
+                field: sum(report.get(field, 0) for report in entities.values())
+                for field in ("missing", "extra", "stale")
+            },
+            "repair": None
+        }
+        if repair:
+            results["repair"] = await self.repair(changes)
+        return results
+    
+    async def check_entity(self, target: DriftTarget) -> Tuple[Dict[str, Any], Dict[Tuple[str, str], str]]:
+        """
+        Report the drift of one entity type.
+        
+        Args:
+            target: Entity table and node label to compare
+        
+        Returns:
+            Tuple of (report, changes that would repair the drift)
+        """
+        rows_sql = _BUCKETED_ROWS_SQL.format(key_column=target.key_column, table=target.table)
+        result = await self.session.execute(
+            text(_SUMMARY_SQL.format(rows=rows_sql)),
+            {"bucket_size": self.bucket_size}
+        )
+        postgres = {
+            row.bucket: {
+                "rows": row.row_count,
+                "first_id": row.first_id,
+                "last_id": row.last_id,
+                "checksum": int(row.checksum or 0),
+                "newest": _to_datetime(row.newest)
+            }
+            for row in result
+        }
+        boundaries = [postgres[bucket]["first_id"] for bucket in sorted(postgres)]
+        
+        graph = await self._summarize_nodes(target, boundaries)
+        divergent = sorted(
+            bucket for bucket in set(postgres) | set(graph)
+            if self._diverges(postgres.get(bucket), graph.get(bucket))
+        )
+        
+        report = {
+            "postgres_rows": sum(summary["rows"] for summary in postgres.values()),
+            "neo4j_nodes": sum(summary["nodes"] for summary in graph.values()),
+            "buckets": max(len(postgres), len(graph)),
+            "divergent_buckets": [],
+            "missing": 0,
+            "extra": 0,
+            "stale": 0
+        }
+        report_rows(report["postgres_rows"])
+        if not divergent:
+            return report, {}
+        
+        postgres_rows = await self._read_rows(rows_sql, divergent)
+        changes = {}
+        for bucket in divergent:
+            graph_rows = await self._read_nodes(target, boundaries, bucket)
+            source_rows = postgres_rows.get(bucket, {})
+            missing = [entity_id for entity_id in source_rows if entity_id not in graph_rows]
+            extra = [entity_id for entity_id in graph_rows if entity_id not in source_rows]
+            stale = [
+                entity_id for entity_id, version in source_rows.items()
+                if entity_id in graph_rows and version is not None
+                and graph_rows[entity_id] is not None and version > graph_rows[entity_id]
+            ]
+            for entity_id in missing + stale:
+                changes[(target.entity_type, entity_id)] = NODE
+            for entity_id in extra:
+                changes[(target.entity_type, entity_id)] = DELETE
+            
+            summary = postgres.get(bucket, {})
+            report["divergent_buckets"].append({
+                "bucket": bucket,
+                "first_id": summary.get("first_id"),
+                "last_id": summary.get("last_id"),
+                "postgres_rows": len(source_rows),
+                "neo4j_nodes": len(graph_rows),
+                "missing": len(missing),
+                "extra": len(extra),
+                "stale": len(stale)
+            })
+            report["missing"] += len(missing)
+            report["extra"] += len(extra)
+            report["stale"] += len(stale)
+        
+        logger.info(
+            f"{target.entity_type} drift: {len(divergent)} of {report['buckets']} buckets differ, "
+            f"{report['missing']} missing, {report['extra']} extra, {report['stale']} stale"
+        )
+        return report, changes
+    
+    async def repair(self, changes: Dict[Tuple[str, str], str]) -> Dict[str, int]:
+        """
+        Apply the changes found by a drift check.
+        
+        Args:
+            changes: Action by (entity_type, entity_id)
+        
+        Returns:
+            Dictionary with "applied" and "failed" counts
+        """
+        with track_phase("drift:repair"):
+            applied, failed, clear_cache = await apply_changes(self.sync_services, changes)
+            report_rows(applied, failed)
+        
+        # Shared nodes such as schools or exams, and deleted nodes, can appear
+        # in any candidate's cached info
+        if clear_cache:
+            await candidate_info_cache.clear()
+        return {"applied": applied, "failed": failed}
+    
+    @staticmethod
+    def _diverges(postgres: Optional[Dict[str, Any]], graph: Optional[Dict[str, Any]]) -> bool:
+        """Whether the summaries of one bucket disagree."""
+        if postgres is None or graph is None:
+            return True
+        if postgres["rows"] != graph["nodes"] or postgres["checksum"] != graph["checksum"]:
+            return True
+        # Some row changed after the oldest write of the bucket's nodes
+        return postgres["newest"] is not None and graph["oldest"] is not None and postgres["newest"] > graph["oldest"]
+    
+    async def _summarize_nodes(self, target: DriftTarget, boundaries: List[str]) -> Dict[int, Dict[str, Any]]:
+        """Stream a label's node IDs once and summarize them by bucket."""
+        query = f"""
+        MATCH (n:{target.label}) WHERE n.{target.id_property} IS NOT NULL
+        RETURN toString(n.{target.id_property}) AS id, coalesce(n.updated_at, n.created_at) AS version
+        """
+        summaries: Dict[int, Dict[str, Any]] = {}
+        async with self.driver.session() as session:
+            result = await session.run(query)
+            async for record in result:
+                bucket = max(bisect_right(boundaries, record["id"]) - 1, 0)
+                summary = summaries.setdefault(bucket, {"nodes": 0, "checksum": 0, "oldest": None})
+                summary["nodes"] += 1
+                summary["checksum"] += id_checksum(record["id"])
+                version = _to_datetime(record["version"])
+                if version is not None and (summary["oldest"] is None or version < summary["oldest"]):
+                    summary["oldest"] = version
+        return summaries
+    
+    async def _read_rows(self, rows_sql: str, buckets: List[int]) -> Dict[int, Dict[str, Optional[datetime]]]:
+        """Read the IDs and versions of the given buckets from PostgreSQL."""
+        statement = text(_DETAIL_SQL.format(rows=rows_sql)).bindparams(bindparam("buckets", expanding=True))
+        result = await self.session.execute(statement, {"bucket_size": self.bucket_size, "buckets": buckets})
+        rows: Dict[int, Dict[str, Optional[datetime]]] = {}
+        for key, version, bucket in ((row.key, row.version, row.bucket) for row in result):
+            rows.setdefault(bucket, {})[key] = _to_datetime(version)
+        return rows
+    
+    async def _read_nodes(self, target: DriftTarget, boundaries: List[str], bucket: int) -> Dict[str, Optional[datetime]]:
+        """Read the IDs and versions of one bucket's nodes through an ID range."""
+        conditions = [f"n.{target.id_property} IS NOT NULL"]
+        params = {}
+        # The first and last buckets are open-ended, to catch nodes outside the source ID range
+        if 0 < bucket < len(boundaries):
+            conditions.append(f"n.{target.id_property} >= $low")
+            params["low"] = boundaries[bucket]
+        if bucket + 1 < len(boundaries):
+            conditions.append(f"n.{target.id_property} < $high")
+            params["high"] = boundaries[bucket + 1]
+        query = f"""
+        MATCH (n:{target.label}) WHERE {' AND '.join(conditions)}
+        RETURN toString(n.{target.id_property}) AS id, coalesce(n.updated_at, n.created_at) AS version
+        """
+        nodes = {}
+        async with self.driver.session() as session:
+            result = await session.run(query, params)
+            async for record in result:
+                nodes[record["id"]] = _to_datetime(record["version"])
+        return nodes
@@ -95,49 +95,30 @@ class ExamLocationSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all exam location nodes (limit={limit})")
         
-        try:
-            # Get all exam locations from SQL database
-            locations, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for location in locations:
-                try:
-                    # Sync only the location node - handle both ORM objects and dictionaries
-                    location_id = location.location_id if hasattr(location, 'location_id') else location.get("location_id")
-                    if not location_id:
-                        logger.error(f"Missing location_id in location object: {location}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(location_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get location_id safely for logging
-                    location_id = getattr(location, 'location_id', None) if hasattr(location, 'location_id') else location.get("location_id", "unknown")
-                    logger.error(f"Error syncing location node {location_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing exam location nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during exam location nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
-    def _convert_to_node(self, location: Dict[str, Any]) -> ExamLocationNode:
+    def _convert_to_node(self, location: Union[ExamLocation, Dict[str, Any]]) -> ExamLocationNode:
         """
         Convert a SQL ExamLocation model to an ExamLocationNode.
         
         Args:
-            location: SQL ExamLocation dictionary
+            location: SQL ExamLocation model or dictionary
             
         Returns:
             ExamLocationNode instance ready for Neo4j
         """
+        # Rows read by the repository's stream_all are models, not dictionaries
+        if isinstance(location, ExamLocation):
+            location = {
+                "location_id": location.location_id,
+                "location_name": location.location_name,
+                "address": location.address,
+                "capacity": location.capacity,
+                "is_active": location.is_active,
+                "contact_info": location.contact_info,
+                "additional_info": location.additional_info
+            }
+        
         try:
             # Create the exam location node
             location_node = ExamLocationNode(
@@ -209,47 +209,7 @@ class ExamRoomSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all exam room nodes (limit={limit})")
         
-        try:
-            # Get all exam rooms from SQL database
-            rooms, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for room in rooms:
-                try:
-                    # Get room_id based on input type
-                    if isinstance(room, ExamRoom):
-                        room_id = room.room_id
-                    elif isinstance(room, dict):
-                        room_id = room.get("room_id")
-                    else:
-                        logger.warning(f"Unexpected room data type: {type(room)}")
-                        failed_count += 1
-                        continue
-                    
-                    # Sync only the exam room node
-                    if await self.sync_node_by_id(room_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get room_id safely for logging
-                    if isinstance(room, ExamRoom):
-                        room_id = room.room_id
-                    elif isinstance(room, dict):
-                        room_id = room.get("room_id", "unknown")
-                    else:
-                        room_id = "unknown"
-                    logger.error(f"Error syncing exam room node {room_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing exam room nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during exam room nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     async def sync_all_relationships(self, limit: Optional[int] = None) -> Dict[str, int]:
         """
@@ -94,38 +94,7 @@ class ExamScheduleSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all exam schedule nodes (limit={limit})")
         
-        try:
-            # Get all exam schedules from SQL database
-            schedules, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for schedule in schedules:
-                try:
-                    # Sync only the schedule node - handle both ORM objects and dictionaries
-                    schedule_id = schedule.exam_schedule_id if hasattr(schedule, 'exam_schedule_id') else schedule.get("exam_schedule_id")
-                    if not schedule_id:
-                        logger.error(f"Missing exam_schedule_id in schedule object: {schedule}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(schedule_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get schedule_id safely for logging
-                    schedule_id = getattr(schedule, 'exam_schedule_id', None) if hasattr(schedule, 'exam_schedule_id') else schedule.get("exam_schedule_id", "unknown")
-                    logger.error(f"Error syncing schedule node {schedule_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing exam schedule nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during exam schedule nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     async def sync_relationship_by_id(self, schedule_id: str) -> Dict[str, int]:
         """
@@ -349,38 +349,7 @@ class ExamSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all exam nodes (limit={limit})")
         
-        try:
-            # Get all exams from SQL database
-            exams, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for exam in exams:
-                try:
-                    # Sync only the exam node
-                    exam_id = exam.exam_id if hasattr(exam, 'exam_id') else exam.get("exam_id")
-                    if not exam_id:
-                        logger.error(f"Missing exam_id in exam object: {exam}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(exam_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get exam_id safely for logging
-                    exam_id = getattr(exam, 'exam_id', None) if hasattr(exam, 'exam_id') else exam.get("exam_id", "unknown")
-                    logger.error(f"Error syncing exam node {exam_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing exam nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during exam nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     async def sync_all_relationships(self, limit: Optional[int] = None) -> Dict[str, int]:
         """
@@ -0,0 +1,346 @@
+"""
+Incremental Sync Service module.
+
+This module provides change-data-capture synchronization from PostgreSQL to
+Neo4j. Instead of re-walking every table, each run pushes only the rows
+inserted or updated since the last checkpoint (tracked by updated_at/created_at
+watermarks) and the rows deleted since then (recorded in sync_deletion by a
+database trigger). Deleting a row that only backs candidate relationships, such
+as an exam registration, records the candidate under a relationship stream, and
+the candidate's edges of the affected types are deleted and merged again.
+Checkpoints are committed after every page, so a run that crashes resumes where
+it stopped.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.repositories.sync_checkpoint_repository import SyncCheckpointRepository
+from app.services.sync.sync_progress import report_rows, track_phase
+
+logger = logging.getLogger(__name__)
+
+# Watermark of a stream that has never been synchronized
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class ChangeStream(NamedTuple):
+    """
+    A table whose changes require re-synchronizing an entity.
+    
+    `entity_expression` is evaluated over the changed row (alias "t") and gives
+    the ID of the entity to re-sync. Streams over the entity's own table re-sync
+    the node and its relationships; streams over dependent tables, such as a
+    candidate's exam registrations, only re-sync its relationships.
+    """
+    name: str
+    entity_type: str
+    table: str
+    key_column: str
+    entity_expression: str
+    sync_node: bool = True
+
+
+def _entity_stream(entity_type: str, table: str, key_column: str) -> ChangeStream:
+    return ChangeStream(entity_type, entity_type, table, key_column, f"t.{key_column}")
+
+
+# Change streams in dependency order, so that relationship targets exist before
+# the relationships pointing at them are synchronized
+CHANGE_STREAMS = [
+    _entity_stream("subject", "subject", "subject_id"),
+    _entity_stream("school", "school", "school_id"),
+    _entity_stream("major", "major", "major_id"),
+    _entity_stream("management_unit", "management_unit", "unit_id"),
+    _entity_stream("exam_location", "exam_location", "location_id"),
+    _entity_stream("exam_room", "exam_room", "room_id"),
+    _entity_stream("exam", "exam", "exam_id"),
+    _entity_stream("candidate", "candidate", "candidate_id"),
+    ChangeStream("candidate.personal_info", "candidate", "personal_info", "candidate_id", "t.candidate_id"),
+    _entity_stream("exam_schedule", "exam_schedule", "exam_schedule_id"),
+    _entity_stream("score", "exam_score", "exam_score_id"),
+    _entity_stream("score_review", "score_review", "score_review_id"),
+    _entity_stream("achievement", "achievement", "achievement_id"),
+    _entity_stream("award", "award", "award_id"),
+    _entity_stream("certificate", "certificate", "certificate_id"),
+    _entity_stream("credential", "candidate_credential", "credential_id"),
+    _entity_stream("degree", "degree", "degree_id"),
+    _entity_stream("recognition", "recognition", "recognition_id"),
+    ChangeStream(
+        "candidate.education_history", "candidate", "education_history", "education_history_id",
+        "t.candidate_id", sync_node=False
+    ),
+    ChangeStream(
+        "candidate.candidate_exam", "candidate", "candidate_exam", "candidate_exam_id",
+        "t.candidate_id", sync_node=False
+    ),
+    ChangeStream(
+        "candidate.candidate_exam_subject", "candidate", "candidate_exam_subject", "candidate_exam_subject_id",
+        "(SELECT ce.candidate_id FROM candidate_exam ce WHERE ce.candidate_exam_id = t.candidate_exam_id)",
+        sync_node=False
+    ),
+    ChangeStream(
+        "candidate.degree", "candidate", "degree", "degree_id",
+        "(SELECT eh.candidate_id FROM education_history eh WHERE eh.education_history_id = t.education_history_id)",
+        sync_node=False
+    ),
+    ChangeStream("exam.exam_subject", "exam", "exam_subject", "exam_subject_id", "t.exam_id", sync_node=False),
+    ChangeStream(
+        "exam.exam_location_mapping", "exam", "exam_location_mapping", "mapping_id", "t.exam_id", sync_node=False
+    ),
+    ChangeStream("school.school_major", "school", "school_major", "school_major_id", "t.school_id", sync_node=False)
+]
+
+
+
+class RelationshipStream(NamedTuple):
+    """
+    A table whose deleted rows leave stale relationships on an entity.
+    
+    The record_sync_relationship_deletion() trigger on the table stores the
+    owning entity's ID in sync_deletion with `name` as its entity type.
+    `relationship_types` are the entity's outgoing edges the rows produce.
+    """
+    name: str
+    entity_type: str
+    relationship_types: Tuple[str, ...]
+
+
+# Relationship streams; Score, Degree and other nodes deleted along with these
+# rows are removed by their own deletion streams, with their edges
+RELATIONSHIP_STREAMS = [
+    RelationshipStream("candidate.education_history", "candidate", ("STUDIES_AT", "STUDIES_MAJOR", "HOLDS_DEGREE")),
+    RelationshipStream("candidate.candidate_exam", "candidate", ("ATTENDS_EXAM", "RECEIVES_SCORE", "HAS_EXAM_SCHEDULE")),
+    RelationshipStream("candidate.candidate_exam_subject", "candidate", ("RECEIVES_SCORE", "HAS_EXAM_SCHEDULE")),
+    RelationshipStream("candidate.degree", "candidate", ("STUDIES_MAJOR",)),
+    RelationshipStream("exam.exam_subject", "exam", ("INCLUDES_SUBJECT",)),
+    RelationshipStream("exam.exam_location_mapping", "exam", ("HELD_AT",)),
+    RelationshipStream("school.school_major", "school", ("OFFERS_MAJOR",))
+]
+
+class IncrementalSyncService:
+    """
+    Pushes changes made since the last checkpoint from PostgreSQL to Neo4j.
+    
+    Changed entities are synchronized through their sync service's
+    sync_node_by_id and sync_relationship_by_id. A stream stops at the first
+    entity that fails and keeps its checkpoint there, so the change is retried
+    by the next run rather than skipped.
+    
+    Only deletions are tracked for relationship streams. An update that moves a
+    dependent row to another parent, such as changing a registration's exam,
+    re-merges the new edge but leaves the old one until a full sync.
+    """
+    
+    def __init__(self, session: AsyncSession, sync_services: Dict[str, Any], page_size: Optional[int] = None):
+        """
+        Initialize the service.
+        
+        Args:
+            session: SQLAlchemy async session
+            sync_services: Sync services by entity type
+            page_size: Changes read per query, SYNC_BATCH_SIZE by default
+        """
+        self.sync_services = sync_services
+        self.checkpoints = SyncCheckpointRepository(session)
+        self.page_size = page_size or settings.SYNC_BATCH_SIZE
+    
+    async def sync(self, limit: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Push all pending changes, stream by stream.
+        
+        Args:
+            limit: Optional maximum number of changed rows to process per stream
+            
+        Returns:
+            Dictionary of {"synced", "failed"} counts by stream name, including
+            one "<entity_type>.deletions" stream per entity type and one
+            "<relationship stream>.deletions" stream per relationship stream
+        """
+        # Rows stamped in the last few seconds may belong to transactions that
+        # have not committed yet; leave them for the next run
+        until = datetime.now(timezone.utc) - timedelta(seconds=settings.SYNC_INCREMENTAL_LAG_SECONDS)
+        logger.info(f"Starting incremental synchronization of changes up to {until.isoformat()}")
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        # Deletions first, so an entity deleted and re-created since the last
+        # run ends up present
+        for entity_type in dict.fromkeys(stream.entity_type for stream in CHANGE_STREAMS):
+            with track_phase(f"incremental:{entity_type}.deletions"):
+                results[f"{entity_type}.deletions"] = await self._sync_deletions(entity_type, limit)
+        
+        for stream in CHANGE_STREAMS:
+            with track_phase(f"incremental:{stream.name}"):
+                results[stream.name] = await self._sync_stream(stream, until, limit)
+        
+        # Relationship deletions last, so the edges merged again can reach
+        # nodes created by this run
+        for relationship_stream in RELATIONSHIP_STREAMS:
+            with track_phase(f"incremental:{relationship_stream.name}.deletions"):
+                results[f"{relationship_stream.name}.deletions"] = await self._sync_relationship_deletions(
+                    relationship_stream, limit
+                )
+        
+        synced = sum(result["synced"] for result in results.values())
+        failed = sum(result["failed"] for result in results.values())
+        logger.info(f"Incremental synchronization complete. Synced: {synced}, Failed: {failed}")
+        return results
+    
+    async def get_status(self) -> List[Dict[str, Any]]:
+        """
+        Describe the checkpoint of every stream that has been synchronized.
+        
+        Returns:
+            List of dicts with the stream name, watermark and last deletion ID
+        """
+        return [
+            {
+                "stream": checkpoint.stream,
+                "changed_at": checkpoint.changed_at.isoformat() if checkpoint.changed_at else None,
+                "last_key": checkpoint.last_key,
+                "last_deletion_id": checkpoint.last_deletion_id,
+                "updated_at": checkpoint.updated_at.isoformat() if checkpoint.updated_at else None
+            }
+            for checkpoint in await self.checkpoints.get_all()
+        ]
+    
+    async def _sync_stream(self, stream: ChangeStream, until: datetime, limit: Optional[int]) -> Dict[str, Any]:
+        """Push the inserts and updates of one stream, committing the checkpoint after each page."""
+        service = self.sync_services[stream.entity_type]
+        checkpoint = await self.checkpoints.get(stream.name)
+        changed_at = checkpoint.changed_at if checkpoint and checkpoint.changed_at else EPOCH
+        last_key = checkpoint.last_key if checkpoint and checkpoint.last_key else ""
+        
+        result = {"synced": 0, "failed": 0}
+        processed = 0
+        while limit is None or processed < limit:
+            page_size = self.page_size if limit is None else min(self.page_size, limit - processed)
+            rows = await self.checkpoints.get_changes(
+                stream.table, stream.key_column, stream.entity_expression,
+                changed_at, last_key, until, page_size
+            )
+            if not rows:
+                break
+            
+            # An entity changed several times in the page is synchronized once
+            synced_ids = set()
+            for row in rows:
+                entity_id = row["entity_id"]
+                if entity_id is not None and entity_id not in synced_ids:
+                    if not await self._sync_entity(service, stream, entity_id):
+                        result["failed"] += 1
+                        result["error"] = f"Failed to synchronize {stream.entity_type} {entity_id}"
+                        break
+                    synced_ids.add(entity_id)
+                    result["synced"] += 1
+                changed_at, last_key = row["changed_at"], row["key"]
+                processed += 1
+            
+            await self.checkpoints.save(stream.name, changed_at=changed_at, last_key=last_key)
+            report_rows(len(rows))
+            if result["failed"] or len(rows) < page_size:
+                break
+        
+        if result["synced"] or result["failed"]:
+            logger.info(f"Stream {stream.name}: {result['synced']} synced, {result['failed']} failed")
+        return result
+    
+    async def _sync_entity(self, service: Any, stream: ChangeStream, entity_id: str) -> bool:
+        """Re-synchronize one changed entity, returning whether it succeeded."""
+        try:
+            if stream.sync_node and not await service.sync_node_by_id(entity_id):
+                return False
+            if hasattr(service, "sync_relationship_by_id"):
+                await service.sync_relationship_by_id(entity_id)
+            return True
+        except Exception as e:
+            logger.error(f"Error synchronizing {stream.entity_type} {entity_id} from stream {stream.name}: {e}")
+            return False
+    
+    async def _sync_deletions(self, entity_type: str, limit: Optional[int]) -> Dict[str, Any]:
+        """Remove nodes of one entity type deleted since the checkpoint, then purge the applied deletions."""
+        service = self.sync_services[entity_type]
+        stream = f"{entity_type}.deletions"
+        checkpoint = await self.checkpoints.get(stream)
+        last_deletion_id = checkpoint.last_deletion_id if checkpoint else 0
+        
+        result = {"synced": 0, "failed": 0}
+        processed = 0
+        while limit is None or processed < limit:
+            page_size = self.page_size if limit is None else min(self.page_size, limit - processed)
+            deletions = await self.checkpoints.get_deletions(entity_type, last_deletion_id, page_size)
+            if not deletions:
+                break
+            
+            for deletion in deletions:
+                if not await service.graph_repository.delete(deletion.entity_id):
+                    result["failed"] += 1
+                    result["error"] = f"Failed to delete {entity_type} {deletion.entity_id}"
+                    break
+                result["synced"] += 1
+                last_deletion_id = deletion.deletion_id
+                processed += 1
+            
+            await self.checkpoints.save(stream, last_deletion_id=last_deletion_id)
+            report_rows(len(deletions))
+            await self.checkpoints.purge_deletions(entity_type, last_deletion_id)
+            if result["failed"] or len(deletions) < page_size:
+                break
+        
+        if result["synced"] or result["failed"]:
+            logger.info(f"Deletions of {entity_type}: {result['synced']} applied, {result['failed']} failed")
+        return result
+    
+    async def _sync_relationship_deletions(self, stream: RelationshipStream, limit: Optional[int]) -> Dict[str, Any]:
+        """Rebuild the edges of entities whose dependent rows were deleted since the checkpoint."""
+        service = self.sync_services[stream.entity_type]
+        checkpoint_stream = f"{stream.name}.deletions"
+        checkpoint = await self.checkpoints.get(checkpoint_stream)
+        last_deletion_id = checkpoint.last_deletion_id if checkpoint else 0
+        
+        result = {"synced": 0, "failed": 0}
+        processed = 0
+        while limit is None or processed < limit:
+            page_size = self.page_size if limit is None else min(self.page_size, limit - processed)
+            deletions = await self.checkpoints.get_deletions(stream.name, last_deletion_id, page_size)
+            if not deletions:
+                break
+            
+            # An entity with several deleted rows in the page is rebuilt once
+            rebuilt_ids = set()
+            for deletion in deletions:
+                entity_id = deletion.entity_id
+                if entity_id not in rebuilt_ids:
+                    if not await self._rebuild_relationships(service, stream, entity_id):
+                        result["failed"] += 1
+                        result["error"] = f"Failed to rebuild relationships of {stream.entity_type} {entity_id}"
+                        break
+                    rebuilt_ids.add(entity_id)
+                    result["synced"] += 1
+                last_deletion_id = deletion.deletion_id
+                processed += 1
+            
+            await self.checkpoints.save(checkpoint_stream, last_deletion_id=last_deletion_id)
+            report_rows(len(deletions))
+            await self.checkpoints.purge_deletions(stream.name, last_deletion_id)
+            if result["failed"] or len(deletions) < page_size:
+                break
+        
+        if result["synced"] or result["failed"]:
+            logger.info(f"Deletions of {stream.name}: {result['synced']} rebuilt, {result['failed']} failed")
+        return result
+    
+    async def _rebuild_relationships(self, service: Any, stream: RelationshipStream, entity_id: str) -> bool:
+        """Delete an entity's edges of the stream's types and merge them again from PostgreSQL."""
+        try:
+            if not await service.graph_repository.delete_relationships(entity_id, stream.relationship_types):
+                return False
+            await service.sync_relationship_by_id(entity_id)
+            return True
+        except Exception as e:
+            logger.error(f"Error rebuilding {stream.name} relationships of {stream.entity_type} {entity_id}: {e}")
+            return False
@@ -11,7 +11,14 @@ from typing import Any, Dict, List, Optional, Union, Tuple, Literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from neo4j import AsyncDriver
 
+from app.config import settings
+from app.infrastructure.database.connection import async_session
 from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.sync_scheduler import SyncTask, run_tasks
+from app.services.sync.sync_progress import track_phase
+from app.services.sync.incremental_sync_service import IncrementalSyncService
+from app.services.sync.drift_report_service import DriftReportService
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 from app.services.sync.subject_sync_service import SubjectSyncService
 from app.services.sync.score_sync_service import ScoreSyncService
 from app.services.sync.score_review_sync_service import ScoreReviewSyncService
@@ -32,6 +39,49 @@ from app.services.sync.school_sync_service import SchoolSyncService
 
 logger = logging.getLogger(__name__)
 
+# Entity types whose sync services invalidate the affected candidates' cached info themselves
+CANDIDATE_OWNED_TYPES = {"candidate", "score", "score_review", "achievement", "award", "certificate", "credential", "degree", "recognition"}
+
+# Node sync order, also the order in which results are reported
+NODE_SYNC_ORDER = ["subject", "school", "major", "management_unit", "exam_location", "exam_room", "exam", "candidate", "exam_schedule", "score", "score_review", "achievement", "award", "certificate", "credential", "degree", "recognition"]
+
+# Node types each entity type's relationships connect; a relationship phase
+# starts once the nodes of all of these types are synchronized
+RELATIONSHIP_ENDPOINTS = {
+    "subject": {"subject", "exam", "score"},
+    "school": {"school", "major"},
+    "major": {"major", "school", "degree"},
+    "management_unit": {"management_unit", "exam", "exam_location"},
+    "exam_location": {"exam_location", "exam", "exam_room"},
+    "exam_room": {"exam_room", "exam_schedule"},
+    "exam": {"exam", "subject", "exam_location", "exam_schedule", "management_unit"},
+    "candidate": {"candidate", "school", "major", "degree", "exam", "score", "exam_schedule", "certificate", "credential", "award", "achievement", "recognition"},
+    "exam_schedule": {"exam_schedule", "exam", "subject", "exam_room", "exam_location", "candidate"},
+    "score": {"score", "candidate", "exam", "subject", "score_review"},
+    "score_review": {"score_review", "score", "subject", "candidate"},
+    "achievement": {"achievement", "exam"},
+    "award": {"award", "exam"},
+    "certificate": {"certificate", "exam"},
+    "credential": {"credential"},
+    "degree": {"degree", "school", "major"},
+    "recognition": {"recognition", "exam"}
+}
+
+# Relationship types merged by more than one entity type's relationship phase;
+# phases sharing one never run at the same time
+RELATIONSHIP_LOCKS = {
+    "subject": {"INCLUDES_SUBJECT", "FOR_SUBJECT"},
+    "school": {"OFFERS_MAJOR"},
+    "major": {"OFFERS_MAJOR"},
+    "management_unit": {"ORGANIZED_BY"},
+    "exam_location": {"HELD_AT"},
+    "exam": {"INCLUDES_SUBJECT", "HELD_AT", "FOLLOWS_SCHEDULE", "ORGANIZED_BY"},
+    "candidate": {"RECEIVES_SCORE", "HAS_EXAM_SCHEDULE"},
+    "exam_schedule": {"FOLLOWS_SCHEDULE", "HAS_EXAM_SCHEDULE"},
+    "score": {"RECEIVES_SCORE", "FOR_SUBJECT"},
+    "score_review": {"FOR_SUBJECT"}
+}
+
 EntityType = Literal["subject", "score", "score_review", "exam", "candidate", "achievement", "award", "certificate", "credential", "degree", "exam_location", "exam_room", "exam_schedule", "major", "management_unit", "recognition", "school"]
 
 class MainSyncService:
@@ -89,6 +139,8 @@ class MainSyncService:
             recognition_sync_service: Optional RecognitionSyncService instance
             school_sync_service: Optional SchoolSyncService instance
         """
+        self.driver = driver
+        
         # Initialize individual sync services if not provided
         self.subject_sync_service = subject_sync_service or SubjectSyncService(session, driver)
         self.score_sync_service = score_sync_service or ScoreSyncService(session, driver)
@@ -128,11 +180,17 @@ class MainSyncService:
             "recognition": self.recognition_sync_service,
             "school": self.school_sync_service
         }
+        
+        self.incremental_sync_service = IncrementalSyncService(session, self.sync_services)
+        self.drift_report_service = DriftReportService(session, driver, self.sync_services)
 
     async def sync_all_nodes(self, limit: Optional[int] = None) -> Dict[str, Dict[str, int]]:
         """
         Synchronize all entity nodes between PostgreSQL and Neo4j without their relationships.
         
+        Entity types are independent at this stage, so up to SYNC_CONCURRENCY
+        of them are synchronized at once, each on its own database session.
+        
         Args:
             limit: Optional limit on the number of entities to sync for each type
         
@@ -141,169 +199,17 @@ class MainSyncService:
         """
         logger.info("Starting synchronization of all entity nodes")
         
-        # Sync in order of dependencies
-        results: Dict[str, Dict[str, int]] = {}
-        
-        # First sync base entities
-        logger.info("Synchronizing subjects")
-        subject_result = await self.subject_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(subject_result, tuple) and len(subject_result) >= 2:
-            results["subject"] = {"success": subject_result[0], "failed": subject_result[1]}
-        elif isinstance(subject_result, dict):
-            results["subject"] = subject_result
-        else:
-            results["subject"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing schools")
-        school_result = await self.school_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(school_result, tuple) and len(school_result) >= 2:
-            results["school"] = {"success": school_result[0], "failed": school_result[1]}
-        elif isinstance(school_result, dict):
-            results["school"] = school_result
-        else:
-            results["school"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing majors")
-        major_result = await self.major_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(major_result, tuple) and len(major_result) >= 2:
-            results["major"] = {"success": major_result[0], "failed": major_result[1]}
-        elif isinstance(major_result, dict):
-            results["major"] = major_result
-        else:
-            results["major"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing management units")
-        management_unit_result = await self.management_unit_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(management_unit_result, tuple) and len(management_unit_result) >= 2:
-            results["management_unit"] = {"success": management_unit_result[0], "failed": management_unit_result[1]}
-        elif isinstance(management_unit_result, dict):
-            results["management_unit"] = management_unit_result
-        else:
-            results["management_unit"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing exam locations")
-        exam_location_result = await self.exam_location_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(exam_location_result, tuple) and len(exam_location_result) >= 2:
-            results["exam_location"] = {"success": exam_location_result[0], "failed": exam_location_result[1]}
-        elif isinstance(exam_location_result, dict):
-            results["exam_location"] = exam_location_result
-        else:
-            results["exam_location"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing exam rooms")
-        exam_room_result = await self.exam_room_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(exam_room_result, tuple) and len(exam_room_result) >= 2:
-            results["exam_room"] = {"success": exam_room_result[0], "failed": exam_room_result[1]}
-        elif isinstance(exam_room_result, dict):
-            results["exam_room"] = exam_room_result
-        else:
-            results["exam_room"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing exams")
-        exam_result = await self.exam_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(exam_result, tuple) and len(exam_result) >= 2:
-            results["exam"] = {"success": exam_result[0], "failed": exam_result[1]}
-        elif isinstance(exam_result, dict):
-            results["exam"] = exam_result
-        else:
-            results["exam"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing candidates")
-        candidate_result = await self.candidate_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(candidate_result, tuple) and len(candidate_result) >= 2:
-            results["candidate"] = {"success": candidate_result[0], "failed": candidate_result[1]}
-        elif isinstance(candidate_result, dict):
-            results["candidate"] = candidate_result
-        else:
-            results["candidate"] = {"success": 0, "failed": 0}
-        
-        # Then sync entities that depend on base entities
-        logger.info("Synchronizing exam schedules")
-        exam_schedule_result = await self.exam_schedule_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(exam_schedule_result, tuple) and len(exam_schedule_result) >= 2:
-            results["exam_schedule"] = {"success": exam_schedule_result[0], "failed": exam_schedule_result[1]}
-        elif isinstance(exam_schedule_result, dict):
-            results["exam_schedule"] = exam_schedule_result
-        else:
-            results["exam_schedule"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing scores")
-        score_result = await self.score_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(score_result, tuple) and len(score_result) >= 2:
-            results["score"] = {"success": score_result[0], "failed": score_result[1]}
-        elif isinstance(score_result, dict):
-            results["score"] = score_result
-        else:
-            results["score"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing score reviews")
-        score_review_result = await self.score_review_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(score_review_result, tuple) and len(score_review_result) >= 2:
-            results["score_review"] = {"success": score_review_result[0], "failed": score_review_result[1]}
-        elif isinstance(score_review_result, dict):
-            results["score_review"] = score_review_result
-        else:
-            results["score_review"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing achievements")
-        achievement_result = await self.achievement_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(achievement_result, tuple) and len(achievement_result) >= 2:
-            results["achievement"] = {"success": achievement_result[0], "failed": achievement_result[1]}
-        elif isinstance(achievement_result, dict):
-            results["achievement"] = achievement_result
-        else:
-            results["achievement"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing awards")
-        award_result = await self.award_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(award_result, tuple) and len(award_result) >= 2:
-            results["award"] = {"success": award_result[0], "failed": award_result[1]}
-        elif isinstance(award_result, dict):
-            results["award"] = award_result
-        else:
-            results["award"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing certificates")
-        certificate_result = await self.certificate_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(certificate_result, tuple) and len(certificate_result) >= 2:
-            results["certificate"] = {"success": certificate_result[0], "failed": certificate_result[1]}
-        elif isinstance(certificate_result, dict):
-            results["certificate"] = certificate_result
-        else:
-            results["certificate"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing credentials")
-        credential_result = await self.credential_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(credential_result, tuple) and len(credential_result) >= 2:
-            results["credential"] = {"success": credential_result[0], "failed": credential_result[1]}
-        elif isinstance(credential_result, dict):
-            results["credential"] = credential_result
-        else:
-            results["credential"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing degrees")
-        degree_result = await self.degree_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(degree_result, tuple) and len(degree_result) >= 2:
-            results["degree"] = {"success": degree_result[0], "failed": degree_result[1]}
-        elif isinstance(degree_result, dict):
-            results["degree"] = degree_result
-        else:
-            results["degree"] = {"success": 0, "failed": 0}
-        
-        logger.info("Synchronizing recognitions")
-        recognition_result = await self.recognition_sync_service.sync_all_nodes(limit=limit)
-        if isinstance(recognition_result, tuple) and len(recognition_result) >= 2:
-            results["recognition"] = {"success": recognition_result[0], "failed": recognition_result[1]}
-        elif isinstance(recognition_result, dict):
-            results["recognition"] = recognition_result
-        else:
-            results["recognition"] = {"success": 0, "failed": 0}
+        results = await run_tasks(self._node_tasks(limit), settings.SYNC_CONCURRENCY)
+        results = {etype: self._node_counts(result) for etype, result in results.items()}
         
         # Log summary
         total_success = sum(result["success"] for result in results.values())
         total_failed = sum(result["failed"] for result in results.values())
         logger.info(f"Node synchronization complete. Total: {total_success + total_failed}, Success: {total_success}, Failed: {total_failed}")
         
+        # Bulk syncs can touch any candidate; drop all cached candidate info
+        await candidate_info_cache.clear()
+        
         return results
     
     async def sync_all_relationships(self, entity_type: Optional[EntityType] = None, limit: Optional[int] = None) -> Dict[str, Any]:
@@ -312,7 +218,8 @@ class MainSyncService:
         
         This method synchronizes relationships between entities without re-creating
         the entity nodes themselves. Useful for repairing or updating the graph
-        after structure changes.
+        after structure changes. When all entity types are synchronized, up to
+        SYNC_CONCURRENCY of them run at once.
         
         Args:
             entity_type: Optional entity type to sync relationships for.
@@ -340,12 +247,10 @@ class MainSyncService:
                 results[entity_type] = await self.sync_services[entity_type].sync_all_relationships(limit=limit)
             else:
                 # Sync all entity types with relationship support
-                for etype, service in self.sync_services.items():
-                    if hasattr(service, "sync_all_relationships"):
-                        logger.info(f"Synchronizing relationships for all {etype} entities")
-                        results[etype] = await service.sync_all_relationships(limit=limit)
+                results = await run_tasks(self._relationship_tasks(limit), settings.SYNC_CONCURRENCY)
                 
             logger.info(f"Relationship synchronization complete for {len(results)} entity types")
+            await candidate_info_cache.clear()
             return results
             
         except Exception as e:
@@ -354,6 +259,108 @@ class MainSyncService:
                 "error": str(e)
             }
     
+    async def sync_full(self, limit: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Synchronize all nodes and relationships as one dependency graph.
+        
+        Each entity type's relationship phase starts as soon as the nodes of
+        every type it connects are synchronized, rather than after all nodes.
+        
+        Args:
+            limit: Optional limit on the number of entities to sync for each type
+            
+        Returns:
+            Dictionary with "nodes" and "relationships" results by entity type
+        """
+        logger.info("Starting full synchronization of nodes and relationships")
+        
+        tasks = self._node_tasks(limit) + self._relationship_tasks(limit, after_nodes=True)
+        results = await run_tasks(tasks, settings.SYNC_CONCURRENCY)
+        
+        await candidate_info_cache.clear()
+        
+        return {
+            "nodes": {etype: self._node_counts(results[etype]) for etype in NODE_SYNC_ORDER},
+            "relationships": {
+                name.split(":", 1)[1]: result for name, result in results.items() if name.startswith("relationships:")
+            }
+        }
+    
+    def _node_tasks(self, limit: Optional[int]) -> List[SyncTask]:
+        """Build one independent node sync task per entity type."""
+        return [
+            SyncTask(name=etype, run=lambda etype=etype: self._run_on_own_session(etype, "sync_all_nodes", limit))
+            for etype in NODE_SYNC_ORDER
+        ]
+    
+    def _relationship_tasks(self, limit: Optional[int], after_nodes: bool = False) -> List[SyncTask]:
+        """Build one relationship sync task per entity type, optionally waiting for its endpoint node tasks."""
+        return [
+            SyncTask(
+                name=f"relationships:{etype}" if after_nodes else etype,
+                run=lambda etype=etype: self._run_on_own_session(etype, "sync_all_relationships", limit),
+                depends_on=frozenset(RELATIONSHIP_ENDPOINTS.get(etype, {etype})) if after_nodes else frozenset(),
+                locks=frozenset(RELATIONSHIP_LOCKS.get(etype, ()))
+            )
+            for etype, service in self.sync_services.items()
+            if hasattr(service, "sync_all_relationships")
+        ]
+    
+    async def _run_on_own_session(self, entity_type: str, method: str, limit: Optional[int]) -> Any:
+        """Run a bulk sync method of an entity type's service on a new database session."""
+        stage = "nodes" if method == "sync_all_nodes" else "relationships"
+        with track_phase(f"{stage}:{entity_type}"):
+            async with async_session() as session:
+                service = type(self.sync_services[entity_type])(session, self.driver)
+                return await getattr(service, method)(limit=limit)
+    
+    @staticmethod
+    def _node_counts(result: Any) -> Dict[str, int]:
+        """Normalize a sync_all_nodes result to a {"success", "failed"} dict."""
+        if isinstance(result, tuple) and len(result) >= 2:
+            return {"success": result[0], "failed": result[1]}
+        if isinstance(result, dict) and "success" in result and "failed" in result:
+            return result
+        return {"success": 0, "failed": 0, **(result if isinstance(result, dict) else {})}
+    
+    async def sync_incremental(self, limit: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Push only the inserts, updates and deletes made since the last incremental sync.
+        
+        Progress is checkpointed durably per change stream, so an interrupted run
+        resumes where it stopped. A full sync does not move the checkpoints.
+        
+        Args:
+            limit: Optional maximum number of changed rows to process per stream
+            
+        Returns:
+            Dictionary with sync results by change stream
+        """
+        results = await self.incremental_sync_service.sync(limit=limit)
+        
+        # Changes to shared nodes such as schools or exams, and deleted nodes,
+        # can appear in any candidate's cached info
+        if any(
+            result["synced"] and (name.endswith(".deletions") or name.split(".")[0] not in CANDIDATE_OWNED_TYPES)
+            for name, result in results.items()
+        ):
+            await candidate_info_cache.clear()
+        
+        return results
+    
+    async def check_drift(self, repair: bool = False, entity_types: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Report where Neo4j has drifted from PostgreSQL, and optionally repair it.
+        
+        Args:
+            repair: Whether to re-sync or delete the divergent rows found
+            entity_types: Optional entity types to check, all of them by default
+            
+        Returns:
+            Dictionary with the drift report by entity type, totals and repair counts
+        """
+        return await self.drift_report_service.check(entity_types=entity_types, repair=repair)
+    
     async def sync_nodes_by_type(self, entity_type: EntityType, limit: Optional[int] = None) -> Tuple[int, int]:
         """
         Synchronize all nodes of a specific entity type.
@@ -384,6 +391,7 @@ class MainSyncService:
             success_count, failed_count = result["success"], result["failed"]
         
         logger.info(f"{entity_type} node synchronization complete. Success: {success_count}, Failed: {failed_count}")
+        await candidate_info_cache.clear()
         
         return (success_count, failed_count)
     
@@ -414,6 +422,7 @@ class MainSyncService:
         result = await self.sync_services[entity_type].sync_all_relationships(limit=limit)
         
         logger.info(f"{entity_type} relationship synchronization complete")
+        await candidate_info_cache.clear()
         return result
     
     async def sync_node_by_id(self, entity_type: EntityType, entity_id: str) -> bool:
@@ -438,6 +447,9 @@ class MainSyncService:
         
         if result:
             logger.info(f"Successfully synchronized {entity_type} node with ID {entity_id}")
+            if entity_type not in CANDIDATE_OWNED_TYPES:
+                # Shared nodes such as schools or exams appear in many candidates' info
+                await candidate_info_cache.clear()
         else:
             logger.warning(f"Failed to synchronize {entity_type} node with ID {entity_id}")
             
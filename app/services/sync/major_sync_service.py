@@ -94,38 +94,7 @@ class MajorSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all major nodes (limit={limit})")
         
-        try:
-            # Get all majors from SQL database
-            majors, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for major in majors:
-                try:
-                    # Sync only the major node - handle both ORM objects and dictionaries
-                    major_id = major.major_id if hasattr(major, 'major_id') else major.get("major_id")
-                    if not major_id:
-                        logger.error(f"Missing major_id in major object: {major}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(major_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get major_id safely for logging
-                    major_id = getattr(major, 'major_id', None) if hasattr(major, 'major_id') else major.get("major_id", "unknown")
-                    logger.error(f"Error syncing major node {major_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing major nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during major nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     def _convert_to_node(self, major: Major) -> MajorNode:
         """
@@ -94,38 +94,7 @@ class ManagementUnitSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all management unit nodes (limit={limit})")
         
-        try:
-            # Get all management units from SQL database
-            units, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for unit in units:
-                try:
-                    # Sync only the management unit node - handle both ORM objects and dictionaries
-                    unit_id = unit.unit_id if hasattr(unit, 'unit_id') else unit.get("unit_id")
-                    if not unit_id:
-                        logger.error(f"Missing unit_id in management unit object: {unit}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(unit_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get unit_id safely for logging
-                    unit_id = getattr(unit, 'unit_id', None) if hasattr(unit, 'unit_id') else unit.get("unit_id", "unknown")
-                    logger.error(f"Error syncing management unit node {unit_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing management unit nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during management unit nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     def _convert_to_node(self, unit: ManagementUnit) -> ManagementUnitNode:
         """
@@ -8,6 +8,7 @@ data between PostgreSQL and Neo4j.
 import logging
 from typing import Optional, Tuple, List, Dict, Any, Union
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from neo4j import AsyncDriver
 
@@ -16,9 +17,39 @@ from app.domain.graph_models.recognition_node import RecognitionNode
 from app.repositories.recognition_repository import RecognitionRepository
 from app.graph_repositories.recognition_graph_repository import RecognitionGraphRepository
 from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 
 logger = logging.getLogger(__name__)
 
+# Recognitions covered by a full relationship sync; LIMIT NULL selects all of them
+RECOGNITION_SCOPE_SQL = """
+WITH scope AS (
+    SELECT recognition_id FROM recognition ORDER BY recognition_id LIMIT :limit
+)
+"""
+
+# RECEIVES_RECOGNITION is merged by the candidate relationship specs and left out here
+RECOGNITION_RELATIONSHIP_SPECS = [
+    RelationshipSpec(
+        name="exam",
+        sql=RECOGNITION_SCOPE_SQL + """
+        SELECT rec.recognition_id, ce.exam_id
+        FROM recognition rec
+        JOIN scope ON scope.recognition_id = rec.recognition_id
+        JOIN candidate_exam ce ON ce.candidate_exam_id = rec.candidate_exam_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (rec:Recognition {recognition_id: row.recognition_id})
+        MATCH (e:Exam {exam_id: row.exam_id})
+        MERGE (rec)-[rel:RECOGNITION_FOR_EXAM]->(e)
+        SET rel.updated_at = datetime()
+        RETURN count(rel)
+        """
+    )
+]
+
 class RecognitionSyncService(BaseSyncService):
     """
     Service for synchronizing Recognition data between PostgreSQL and Neo4j.
@@ -94,38 +125,7 @@ class RecognitionSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all recognition nodes (limit={limit})")
         
-        try:
-            # Get all recognitions from SQL database
-            recognitions, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for recognition in recognitions:
-                try:
-                    # Sync only the recognition node - handle both ORM objects and dictionaries
-                    recognition_id = recognition.recognition_id if hasattr(recognition, 'recognition_id') else recognition.get("recognition_id")
-                    if not recognition_id:
-                        logger.error(f"Missing recognition_id in recognition object: {recognition}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(recognition_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get recognition_id safely for logging
-                    recognition_id = getattr(recognition, 'recognition_id', None) if hasattr(recognition, 'recognition_id') else recognition.get("recognition_id", "unknown")
-                    logger.error(f"Error syncing recognition node {recognition_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing recognition nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during recognition nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     def _convert_to_node(self, recognition: Recognition) -> RecognitionNode:
         """
@@ -214,6 +214,7 @@ class RecognitionSyncService(BaseSyncService):
                 success = await self.graph_repository.add_received_by_relationship(recognition_id, candidate_id)
                 if success:
                     relationship_counts["candidate"] += 1
+                    await candidate_info_cache.invalidate(candidate_id, ("achievements",))
                     logger.info(f"Successfully added RECEIVES_RECOGNITION relationship for candidate {candidate_id}")
                 else:
                     logger.warning(f"Failed to add RECEIVES_RECOGNITION relationship for candidate {candidate_id}")
@@ -242,6 +243,9 @@ class RecognitionSyncService(BaseSyncService):
         """
         Synchronize relationships for all recognitions.
         
+        The RECEIVES_RECOGNITION edges are merged by the candidate relationship sync,
+        so only the remaining types are synchronized here.
+        
         Args:
             limit: Optional maximum number of recognitions to process
             
@@ -251,77 +255,20 @@ class RecognitionSyncService(BaseSyncService):
         logger.info(f"Synchronizing relationships for all recognitions (limit={limit})")
         
         try:
-            # Import text for SQL queries
-            from sqlalchemy import text
-            
-            # Get all recognition IDs with related candidate and exam IDs in a single query
-            sql_query = """
-                SELECT r.recognition_id, ce.candidate_id, ce.exam_id 
-                FROM recognition r
-                JOIN candidate_exam ce ON r.candidate_exam_id = ce.candidate_exam_id
-            """
-            if limit:
-                sql_query += f" LIMIT {limit}"
-            
-            query = text(sql_query)
-            result = await self.db_session.execute(query)
-            recognition_data = [(row[0], row[1], row[2]) for row in result.fetchall()]
-            
-            total_recognitions = len(recognition_data)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "candidate": 0,
-                "exam": 0
-            }
+            total_recognitions = await self.db_session.scalar(
+                text(RECOGNITION_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
+            )
             
-            # For each recognition, sync relationships directly
-            for recognition_id, candidate_id, exam_id in recognition_data:
-                try:
-                    # Verify recognition exists in Neo4j
-                    recognition_node = await self.graph_repository.get_by_id(recognition_id)
-                    if not recognition_node:
-                        logger.warning(f"Recognition {recognition_id} not found in Neo4j, skipping relationship sync")
-                        failure_count += 1
-                        continue
-                    
-                    # Track relationships for this recognition
-                    recognition_relationships = {
-                        "candidate": 0,
-                        "exam": 0
-                    }
-                    
-                    # Sync RECEIVED_BY relationship (recognition-candidate)
-                    if candidate_id:
-                        success = await self.graph_repository.add_received_by_relationship(recognition_id, candidate_id)
-                        if success:
-                            recognition_relationships["candidate"] += 1
-                            relationship_counts["candidate"] += 1
-                            logger.debug(f"Added RECEIVES_RECOGNITION relationship for candidate {candidate_id}")
-                    
-                    # Sync FOR_EXAM relationship (recognition-exam)
-                    if exam_id:
-                        success = await self.graph_repository.add_for_exam_relationship(recognition_id, exam_id)
-                        if success:
-                            recognition_relationships["exam"] += 1
-                            relationship_counts["exam"] += 1
-                            logger.debug(f"Added RECOGNITION_FOR_EXAM relationship for exam {exam_id}")
-                    
-                    logger.info(f"Recognition {recognition_id} relationships: {recognition_relationships}")
-                    success_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error synchronizing relationships for recognition {recognition_id}: {e}")
-                    failure_count += 1
+            # Each relationship type is streamed as one join and merged in UNWIND batches
+            engine = RelationshipSyncEngine(self.db_session, self.neo4j_driver)
+            type_results = await engine.sync(RECOGNITION_RELATIONSHIP_SPECS, {"limit": limit})
             
             # Prepare final result
             result = {
                 "total_recognitions": total_recognitions,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": sum(counts["synced"] for counts in type_results.values()),
+                "failed": sum(counts["failed"] for counts in type_results.values()),
+                "relationships": {name: counts["synced"] for name, counts in type_results.items()}
             }
             
             logger.info(f"Completed synchronizing relationships for all recognitions: {result}")
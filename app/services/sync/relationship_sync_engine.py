@@ -0,0 +1,148 @@
+"""
+Relationship Sync Engine module.
+
+This module provides set-based synchronization of graph relationships. Each
+relationship type is described by one SQL query returning a row per edge and
+one Cypher query that merges a batch of those rows, so a full relationship sync
+costs a few round trips per batch instead of several per entity.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from neo4j import AsyncDriver
+
+from app.config import settings
+from app.infrastructure.database.streaming import stream_partitions
+from app.services.sync.sync_progress import report_rows
+
+logger = logging.getLogger(__name__)
+
+
+class RelationshipSpec(NamedTuple):
+    """
+    A relationship type synchronized as a set.
+
+    `sql` returns one row per edge, with columns named after the `row.*`
+    fields used by `cypher`. `cypher` receives the rows as `$rows`, typically
+    as "UNWIND $rows AS row MATCH ... MATCH ... MERGE ...", and returns the
+    number of edges it merged.
+    """
+    name: str
+    sql: str
+    cypher: str
+
+
+class RelationshipSyncEngine:
+    """
+    Streams edge rows from PostgreSQL and merges them into Neo4j in batches.
+
+    Rows are read through a server-side cursor, so memory use is bounded by
+    the batch size regardless of table size. Edges whose endpoint nodes are
+    missing in Neo4j are skipped by the MATCH clauses and not counted.
+    """
+
+    def __init__(self, db_session: AsyncSession, neo4j_driver: AsyncDriver, batch_size: Optional[int] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            db_session: SQLAlchemy async session
+            neo4j_driver: Neo4j async driver
+            batch_size: Edges per Cypher batch, SYNC_BATCH_SIZE by default
+        """
+        self.db_session = db_session
+        self.neo4j_driver = neo4j_driver
+        self.batch_size = batch_size or settings.SYNC_BATCH_SIZE
+
+    async def sync(self, specs: Iterable[RelationshipSpec], params: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Synchronize several relationship types, one after the other.
+
+        A failure reading one type is logged and does not stop the others.
+
+        Args:
+            specs: Relationship types to synchronize
+            params: Bind parameters shared by the SQL queries
+
+        Returns:
+            Dictionary of {"synced", "failed", "batches"} counts by relationship name
+        """
+        results = {}
+        for spec in specs:
+            try:
+                results[spec.name] = await self.sync_spec(spec, params)
+            except Exception as e:
+                logger.error(f"Error synchronizing {spec.name} relationships: {e}", exc_info=True)
+                # A failed query aborts the transaction; roll back so the next types can still read
+                await self.db_session.rollback()
+                results[spec.name] = {"synced": 0, "failed": 0, "batches": 0, "error": str(e)}
+        return results
+
+    async def sync_spec(self, spec: RelationshipSpec, params: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+        """
+        Synchronize one relationship type.
+
+        Args:
+            spec: Relationship type to synchronize
+            params: Bind parameters for the SQL query
+
+        Returns:
+            Dictionary with "synced", "failed" and "batches" counts
+        """
+        counts = {"synced": 0, "failed": 0, "batches": 0}
+        async for partition in stream_partitions(self.db_session, text(spec.sql), params, self.batch_size):
+            rows = [self._to_params(row) for row in partition]
+            synced, failed = await self.write_batch(spec.cypher, rows)
+            counts["synced"] += synced
+            counts["failed"] += failed
+            counts["batches"] += 1
+            report_rows(synced, failed)
+        logger.info(
+            f"{spec.name} relationships synced: {counts['synced']} merged, "
+            f"{counts['failed']} failed in {counts['batches']} batches"
+        )
+        return counts
+
+    async def write_batch(self, query: str, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Run a `$rows` query, retrying row by row if the batch fails.
+
+        Args:
+            query: Cypher query taking `$rows` and returning a count
+            rows: Query rows
+
+        Returns:
+            Tuple of (merged_count, failed_count)
+        """
+        try:
+            return (await self._run(query, rows), 0)
+        except Exception as e:
+            logger.warning(f"Batch of {len(rows)} rows failed, retrying row by row: {e}")
+
+        merged_count = 0
+        failed_count = 0
+        for row in rows:
+            try:
+                merged_count += await self._run(query, [row])
+            except Exception:
+                failed_count += 1
+        return (merged_count, failed_count)
+
+    async def _run(self, query: str, rows: List[Dict[str, Any]]) -> int:
+        """Run a `$rows` query and return the count it reports."""
+        async with self.neo4j_driver.session() as session:
+            result = await session.run(query, {"rows": rows})
+            record = await result.single()
+            return record[0] if record else 0
+
+    @staticmethod
+    def _to_params(row: Any) -> Dict[str, Any]:
+        """Convert a result row to Neo4j parameters."""
+        return {
+            key: float(value) if isinstance(value, Decimal) else value
+            for key, value in row.items()
+        }
@@ -94,38 +94,7 @@ class SchoolSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all school nodes (limit={limit})")
         
-        try:
-            # Get all schools from SQL database
-            schools, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for school in schools:
-                try:
-                    # Sync only the school node - handle both ORM objects and dictionaries
-                    school_id = school.school_id if hasattr(school, 'school_id') else school.get("school_id")
-                    if not school_id:
-                        logger.error(f"Missing school_id in school object: {school}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(school_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get school_id safely for logging
-                    school_id = getattr(school, 'school_id', None) if hasattr(school, 'school_id') else school.get("school_id", "unknown")
-                    logger.error(f"Error syncing school node {school_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing school nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during school nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     def _convert_to_node(self, school: School) -> SchoolNode:
         """
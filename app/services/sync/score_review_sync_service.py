@@ -8,6 +8,7 @@ data between PostgreSQL and Neo4j.
 import logging
 from typing import Optional, Tuple, Dict, Any, Union
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from neo4j import AsyncDriver
 
@@ -16,9 +17,65 @@ from app.domain.graph_models.score_review_node import ScoreReviewNode
 from app.repositories.score_review_repository import ScoreReviewRepository
 from app.graph_repositories.score_review_graph_repository import ScoreReviewGraphRepository
 from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
 
 logger = logging.getLogger(__name__)
 
+# Score reviews covered by a full relationship sync; LIMIT NULL selects all of them
+SCORE_REVIEW_SCOPE_SQL = """
+WITH scope AS (
+    SELECT score_review_id FROM score_review ORDER BY score_review_id LIMIT :limit
+)
+"""
+
+# Score reviews joined to the score's candidate and subject
+SCORE_REVIEW_CONTEXT_SQL = SCORE_REVIEW_SCOPE_SQL + """
+SELECT sr.score_review_id AS review_id, sr.score_id, ce.candidate_id, esub.subject_id
+FROM score_review sr
+JOIN scope ON scope.score_review_id = sr.score_review_id
+JOIN exam_score es ON es.exam_score_id = sr.score_id
+JOIN candidate_exam_subject ces ON ces.candidate_exam_subject_id = es.candidate_exam_subject_id
+JOIN candidate_exam ce ON ce.candidate_exam_id = ces.candidate_exam_id
+JOIN exam_subject esub ON esub.exam_subject_id = es.exam_subject_id
+"""
+
+SCORE_REVIEW_RELATIONSHIP_SPECS = [
+    RelationshipSpec(
+        name="score",
+        sql=SCORE_REVIEW_CONTEXT_SQL,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (r:ScoreReview {review_id: row.review_id})
+        MATCH (s:Score {score_id: row.score_id})
+        MERGE (r)-[rel:REVIEWS]->(s)
+        RETURN count(rel)
+        """
+    ),
+    RelationshipSpec(
+        name="candidate",
+        sql=SCORE_REVIEW_CONTEXT_SQL,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (r:ScoreReview {review_id: row.review_id})
+        MERGE (c)-[rel:REQUESTS_REVIEW]->(r)
+        RETURN count(rel)
+        """
+    ),
+    RelationshipSpec(
+        name="subject",
+        sql=SCORE_REVIEW_CONTEXT_SQL,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (r:ScoreReview {review_id: row.review_id})
+        MATCH (s:Subject {subject_id: row.subject_id})
+        MERGE (r)-[rel:FOR_SUBJECT]->(s)
+        RETURN count(rel)
+        """
+    )
+]
+
 class ScoreReviewSyncService(BaseSyncService):
     """
     Service for synchronizing ScoreReview data between PostgreSQL and Neo4j.
@@ -94,55 +151,31 @@ class ScoreReviewSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all score review nodes (limit={limit})")
         
-        try:
-            # Get all score reviews from SQL database
-            reviews, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for review in reviews:
-                try:
-                    # Sync only the score review node - handle both ORM objects and dictionaries
-                    review_id = review.review_id if hasattr(review, 'review_id') else review.get("review_id")
-                    # Check for score_review_id if review_id is not found
-                    if not review_id:
-                        review_id = review.score_review_id if hasattr(review, 'score_review_id') else review.get("score_review_id")
-                    
-                    if not review_id:
-                        logger.error(f"Missing review_id/score_review_id in review object: {review}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(review_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get review_id safely for logging
-                    review_id = getattr(review, 'review_id', None) if hasattr(review, 'review_id') else review.get("review_id", None)
-                    if not review_id:
-                        review_id = getattr(review, 'score_review_id', None) if hasattr(review, 'score_review_id') else review.get("score_review_id", "unknown")
-                    logger.error(f"Error syncing score review node {review_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing score review nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during score review nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
-    def _convert_to_node(self, score_review_data: Dict[str, Any]) -> ScoreReviewNode:
+    def _convert_to_node(self, score_review_data: Union[ScoreReview, Dict[str, Any]]) -> ScoreReviewNode:
         """
         Convert SQL score review data to a ScoreReviewNode.
         
         Args:
-            score_review_data: Dictionary containing score review data from SQL database
+            score_review_data: ScoreReview model or dictionary containing score review data from SQL database
             
         Returns:
             ScoreReviewNode instance ready for Neo4j
         """
+        # Rows read by the repository's stream_all are models, not dictionaries
+        if isinstance(score_review_data, ScoreReview):
+            score_review_data = {
+                "score_review_id": score_review_data.score_review_id,
+                "review_status": score_review_data.review_status,
+                "request_date": score_review_data.request_date,
+                "review_date": score_review_data.review_date,
+                "original_score": score_review_data.original_score,
+                "reviewed_score": score_review_data.reviewed_score,
+                "review_result": score_review_data.review_result,
+                "additional_info": score_review_data.additional_info
+            }
+        
         try:
             # Extract the required fields from the score review data
             review_id = score_review_data["score_review_id"]
@@ -223,6 +256,7 @@ class ScoreReviewSyncService(BaseSyncService):
                 success = await self.graph_repository.add_requested_by_relationship(review_id, candidate_id)
                 if success:
                     relationship_counts["candidate"] += 1
+                    await candidate_info_cache.invalidate(candidate_id, ("exams",))
             
             # Sync FOR_SUBJECT relationship if we have subject data
             if review.get("subject_id"):
@@ -251,60 +285,20 @@ class ScoreReviewSyncService(BaseSyncService):
         logger.info(f"Synchronizing relationships for all score reviews (limit={limit})")
         
         try:
-            # Get all score reviews from SQL database
-            reviews, total_count = await self.sql_repository.get_all(limit=limit)
-            
-            total_reviews = len(reviews)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "score": 0,
-                "candidate": 0,
-                "subject": 0,
-                "exam": 0
-            }
+            total_reviews = await self.db_session.scalar(
+                text(SCORE_REVIEW_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
+            )
             
-            # For each score review, sync relationships
-            for review in reviews:
-                try:
-                    # Get review_id safely - handle both ORM objects and dictionaries
-                    review_id = review.review_id if hasattr(review, 'review_id') else review.get("review_id")
-                    if not review_id:
-                        logger.error(f"Missing review_id in review object: {review}")
-                        failure_count += 1
-                        continue
-                    
-                    # Verify score review exists in Neo4j
-                    review_node = await self.graph_repository.get_by_id(review_id)
-                    if not review_node:
-                        logger.warning(f"Score review {review_id} not found in Neo4j, skipping relationship sync")
-                        failure_count += 1
-                        continue
-                    
-                    # Sync relationships for this score review
-                    results = await self.sync_relationship_by_id(review_id)
-                    
-                    # Update aggregated counts
-                    for key, value in results.items():
-                        if key in relationship_counts:
-                            relationship_counts[key] += value
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    # Get review_id safely for logging
-                    review_id = getattr(review, 'review_id', None) if hasattr(review, 'review_id') else review.get("review_id", "unknown")
-                    logger.error(f"Error synchronizing relationships for score review {review_id}: {e}")
-                    failure_count += 1
+            # Each relationship type is streamed as one join and merged in UNWIND batches
+            engine = RelationshipSyncEngine(self.db_session, self.neo4j_driver)
+            type_results = await engine.sync(SCORE_REVIEW_RELATIONSHIP_SPECS, {"limit": limit})
             
             # Prepare final result
             result = {
                 "total_reviews": total_reviews,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": sum(counts["synced"] for counts in type_results.values()),
+                "failed": sum(counts["failed"] for counts in type_results.values()),
+                "relationships": {name: counts["synced"] for name, counts in type_results.items()}
             }
             
             logger.info(f"Completed synchronizing relationships for all score reviews: {result}")
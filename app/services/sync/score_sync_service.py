@@ -6,7 +6,7 @@ data between PostgreSQL and Neo4j.
 """
 
 import logging
-from typing import Optional, Tuple, Dict, Any, Union
+from typing import Optional, Tuple, Dict, Any, List, Union, AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from neo4j import AsyncDriver
@@ -16,10 +16,115 @@ from app.domain.models.exam_score import ExamScore
 from app.domain.graph_models.score_node import ScoreNode
 from app.repositories.exam_score_repository import ExamScoreRepository
 from app.graph_repositories.score_graph_repository import ScoreGraphRepository
-from app.services.sync.base_sync_service import BaseSyncService
+from app.services.sync.base_sync_service import BaseSyncService, build_batch_node_query
+from app.services.sync.relationship_sync_engine import RelationshipSpec, RelationshipSyncEngine
+from app.infrastructure.cache.candidate_info_cache import candidate_info_cache
+from app.infrastructure.database.streaming import stream_partitions
 
 logger = logging.getLogger(__name__)
 
+# Score node write used by full syncs, which also stores the score's relationship info
+SCORE_WITH_CONTEXT_QUERY = """
+MERGE (s:Score:OntologyInstance {score_id: $score_id})
+ON CREATE SET
+    s.exam_score_id = $score_id,
+    s.name = $name,
+    s.score_value = $score_value,
+    s.status = $status,
+    s.graded_by = $graded_by,
+    s.graded_at = $graded_at,
+    s.score_history = $score_history,
+    s.created_at = datetime(),
+    s.candidate_id = $candidate_id,
+    s.subject_id = $subject_id,
+    s.exam_id = $exam_id,
+    s.subject_name = $subject_name,
+    s.exam_name = $exam_name
+ON MATCH SET
+    s.exam_score_id = $score_id,
+    s.name = $name,
+    s.score_value = $score_value,
+    s.status = $status,
+    s.graded_by = $graded_by,
+    s.graded_at = $graded_at,
+    s.score_history = $score_history,
+    s.updated_at = datetime(),
+    s.candidate_id = $candidate_id,
+    s.subject_id = $subject_id,
+    s.exam_id = $exam_id,
+    s.subject_name = $subject_name,
+    s.exam_name = $exam_name
+RETURN s
+"""
+
+# Scores covered by a full relationship sync; LIMIT NULL selects all of them
+SCORE_SCOPE_SQL = """
+WITH scope AS (
+    SELECT exam_score_id FROM exam_score ORDER BY exam_score_id LIMIT :limit
+)
+"""
+
+# Scores joined to their candidate, exam and subject
+SCORE_CONTEXT_SQL = SCORE_SCOPE_SQL + """
+SELECT es.exam_score_id AS score_id, ce.candidate_id, esub.exam_id, esub.subject_id
+FROM exam_score es
+JOIN scope ON scope.exam_score_id = es.exam_score_id
+JOIN candidate_exam_subject ces ON ces.candidate_exam_subject_id = es.candidate_exam_subject_id
+JOIN candidate_exam ce ON ce.candidate_exam_id = ces.candidate_exam_id
+JOIN exam_subject esub ON esub.exam_subject_id = es.exam_subject_id
+"""
+
+SCORE_RELATIONSHIP_SPECS = [
+    RelationshipSpec(
+        name="candidate",
+        sql=SCORE_CONTEXT_SQL,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (c:Candidate {candidate_id: row.candidate_id})
+        MATCH (s:Score {score_id: row.score_id})
+        MERGE (c)-[r:RECEIVES_SCORE]->(s)
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="exam",
+        sql=SCORE_CONTEXT_SQL,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (s:Score {score_id: row.score_id})
+        MATCH (e:Exam {exam_id: row.exam_id})
+        MERGE (s)-[r:IN_EXAM]->(e)
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="subject",
+        sql=SCORE_CONTEXT_SQL,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (s:Score {score_id: row.score_id})
+        MATCH (subj:Subject {subject_id: row.subject_id})
+        MERGE (s)-[r:FOR_SUBJECT]->(subj)
+        RETURN count(r)
+        """
+    ),
+    RelationshipSpec(
+        name="reviews",
+        sql=SCORE_SCOPE_SQL + """
+        SELECT sr.score_id, sr.score_review_id AS review_id
+        FROM score_review sr
+        JOIN scope ON scope.exam_score_id = sr.score_id
+        """,
+        cypher="""
+        UNWIND $rows AS row
+        MATCH (s:Score {score_id: row.score_id})
+        MATCH (r:ScoreReview {review_id: row.review_id})
+        MERGE (s)-[rel:HAS_REVIEW]->(r)
+        RETURN count(rel)
+        """
+    )
+]
+
 class ScoreSyncService(BaseSyncService):
     """
     Service for synchronizing Score data between PostgreSQL and Neo4j.
@@ -74,7 +179,8 @@ class ScoreSyncService(BaseSyncService):
                     es.graded_at,
                     es.score_metadata,
                     sub.subject_name,
-                    ex.exam_name
+                    ex.exam_name,
+                    ce.candidate_id
                 FROM 
                     exam_score es
                 JOIN 
@@ -83,6 +189,10 @@ class ScoreSyncService(BaseSyncService):
                     exam ex ON esub.exam_id = ex.exam_id
                 JOIN 
                     subject sub ON esub.subject_id = sub.subject_id
+                LEFT JOIN 
+                    candidate_exam_subject ces ON es.candidate_exam_subject_id = ces.candidate_exam_subject_id
+                LEFT JOIN 
+                    candidate_exam ce ON ces.candidate_exam_id = ce.candidate_exam_id
                 WHERE 
                     es.exam_score_id = :score_id
             """
@@ -111,6 +221,9 @@ class ScoreSyncService(BaseSyncService):
             
             # Create or update node in Neo4j
             result = await self.graph_repository.create_or_update(neo4j_data)
+            if result and row[8]:
+                # Score values are shown in the candidate's cached exams section
+                await candidate_info_cache.invalidate(row[8], ("exams",))
             
             logger.info(f"Successfully synchronized score node {score_id}")
             return result
@@ -131,160 +244,118 @@ class ScoreSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all score nodes (limit={limit})")
         
-        try:
-            # Use direct SQL to get all scores with the necessary data in one query
-            sql_query = """
-                SELECT 
-                    es.exam_score_id, 
-                    es.score, 
-                    es.status, 
-                    es.graded_by, 
-                    es.graded_at,
-                    es.score_metadata,
-                    sub.subject_name,
-                    ex.exam_name,
-                    ce.candidate_id,
-                    sub.subject_id,
-                    ex.exam_id
-                FROM 
-                    exam_score es
-                JOIN 
-                    exam_subject esub ON es.exam_subject_id = esub.exam_subject_id
-                JOIN 
-                    exam ex ON esub.exam_id = ex.exam_id
-                JOIN 
-                    subject sub ON esub.subject_id = sub.subject_id
-                JOIN 
-                    candidate_exam_subject ces ON es.candidate_exam_subject_id = ces.candidate_exam_subject_id
-                JOIN 
-                    candidate_exam ce ON ces.candidate_exam_id = ce.candidate_exam_id
-            """
+        return await self.sync_nodes_in_batches(limit=limit)
+    
+    async def _iter_node_pages(self, batch_size: int, limit: Optional[int]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Read scores with the exam, subject and candidate they belong to, in chunks.
+        
+        The join runs once and is read through a server-side cursor, instead of
+        being re-run with a growing OFFSET for every page.
+        
+        Args:
+            batch_size: Maximum number of scores per chunk
+            limit: Optional maximum number of scores to read
             
-            if limit:
-                sql_query += f" LIMIT {limit}"
-                
-            result = await self.db_session.execute(text(sql_query))
+        Yields:
+            Lists of score dictionaries
+        """
+        # Use direct SQL to get the scores with the necessary data in one query
+        sql_query = """
+            SELECT 
+                es.exam_score_id, 
+                es.score, 
+                es.status, 
+                es.graded_by, 
+                es.graded_at,
+                es.score_metadata,
+                sub.subject_name,
+                ex.exam_name,
+                ce.candidate_id,
+                sub.subject_id,
+                ex.exam_id
+            FROM 
+                exam_score es
+            JOIN 
+                exam_subject esub ON es.exam_subject_id = esub.exam_subject_id
+            JOIN 
+                exam ex ON esub.exam_id = ex.exam_id
+            JOIN 
+                subject sub ON esub.subject_id = sub.subject_id
+            JOIN 
+                candidate_exam_subject ces ON es.candidate_exam_subject_id = ces.candidate_exam_subject_id
+            JOIN 
+                candidate_exam ce ON ces.candidate_exam_id = ce.candidate_exam_id
+            ORDER BY 
+                es.exam_score_id
+        """
+        params = {}
+        if limit is not None:
+            sql_query += " LIMIT :limit"
+            params["limit"] = limit
+        
+        async for rows in stream_partitions(self.db_session, text(sql_query), params, batch_size):
             scores = []
-            
-            for row in result.fetchall():
+            for row in rows:
                 # Convert empty dictionary to None for score_metadata
-                score_metadata = row[5]
+                score_metadata = row["score_metadata"]
                 if isinstance(score_metadata, dict) and not score_metadata:
                     score_metadata = None
                 
                 scores.append({
-                    "exam_score_id": row[0],
-                    "score": float(row[1]) if row[1] is not None else None,  # Convert Decimal to float
-                    "status": row[2],
-                    "graded_by": row[3],
-                    "graded_at": row[4],
+                    "exam_score_id": row["exam_score_id"],
+                    "score": float(row["score"]) if row["score"] is not None else None,  # Convert Decimal to float
+                    "status": row["status"],
+                    "graded_by": row["graded_by"],
+                    "graded_at": row["graded_at"],
                     "score_histories": score_metadata,  # Use processed score_metadata
-                    "subject_name": row[6],
-                    "exam_name": row[7],
-                    "candidate_id": row[8],
-                    "subject_id": row[9],
-                    "exam_id": row[10]
+                    "subject_name": row["subject_name"],
+                    "exam_name": row["exam_name"],
+                    "candidate_id": row["candidate_id"],
+                    "subject_id": row["subject_id"],
+                    "exam_id": row["exam_id"]
                 })
+            yield scores
+    
+    def _to_batch_node(self, score: Dict[str, Any]) -> ScoreNode:
+        """
+        Convert a score read by `_iter_node_pages` to a ScoreNode that keeps its relationship info.
+        
+        Args:
+            score: Score dictionary
             
-            success_count = 0
-            failed_count = 0
-            
-            for score in scores:
-                try:
-                    score_id = score["exam_score_id"]
-                    if not score_id:
-                        logger.error(f"Missing exam_score_id in score object: {score}")
-                        failed_count += 1
-                        continue
-                        
-                    # Create a more comprehensive ScoreNode with relationship info
-                    score_node = ScoreNode(
-                        score_id=score_id,
-                        score_value=score.get("score"),
-                        status=score.get("status"),
-                        graded_by=score.get("graded_by"),
-                        graded_at=score.get("graded_at"),
-                        score_history=score.get("score_histories"),
-                        name=f"{score.get('subject_name', '')} {score.get('score', '')}",
-                        candidate_id=score.get("candidate_id"),
-                        subject_id=score.get("subject_id"),
-                        exam_id=score.get("exam_id"),
-                        subject_name=score.get("subject_name"),
-                        exam_name=score.get("exam_name")
-                    )
-                    
-                    # Create or update node in Neo4j directly
-                    # Include all needed properties in a single operation
-                    query = """
-                    MERGE (s:Score:OntologyInstance {score_id: $score_id})
-                    ON CREATE SET
-                        s.exam_score_id = $score_id,
-                        s.name = $name,
-                        s.score_value = $score_value,
-                        s.status = $status,
-                        s.graded_by = $graded_by,
-                        s.graded_at = $graded_at,
-                        s.score_history = $score_history,
-                        s.created_at = datetime(),
-                        s.candidate_id = $candidate_id,
-                        s.subject_id = $subject_id,
-                        s.exam_id = $exam_id,
-                        s.subject_name = $subject_name,
-                        s.exam_name = $exam_name
-                    ON MATCH SET
-                        s.exam_score_id = $score_id,
-                        s.name = $name,
-                        s.score_value = $score_value,
-                        s.status = $status,
-                        s.graded_by = $graded_by,
-                        s.graded_at = $graded_at,
-                        s.score_history = $score_history,
-                        s.updated_at = datetime(),
-                        s.candidate_id = $candidate_id,
-                        s.subject_id = $subject_id,
-                        s.exam_id = $exam_id,
-                        s.subject_name = $subject_name,
-                        s.exam_name = $exam_name
-                    RETURN s
-                    """
-                    
-                    params = score_node.to_dict()
-                    # Ensure score_id is set as exam_score_id as well
-                    params["exam_score_id"] = score_id
-                    
-                    # Convert empty dictionary to None for score_history
-                    if isinstance(params.get("score_history"), dict) and not params["score_history"]:
-                        params["score_history"] = None
-                    
-                    result = await self.neo4j_driver.execute_query(query, params)
-                    if result and len(result) > 0:
-                        # Create INSTANCE_OF relationship using the method from ScoreNode
-                        instance_query = score_node.create_instance_of_relationship_query()
-                        instance_params = {"score_id": score_id}
-                        instance_result = await self.neo4j_driver.execute_query(instance_query, instance_params)
-                        
-                        if instance_result:
-                            logger.debug(f"Created INSTANCE_OF relationship for score {score_id}")
-                        else:
-                            logger.warning(f"Failed to create INSTANCE_OF relationship for score {score_id}")
-                        
-                        success_count += 1
-                        logger.debug(f"Successfully synchronized score node {score_id}")
-                    else:
-                        failed_count += 1
-                        logger.warning(f"Failed to synchronize score node {score_id}")
-                    
-                except Exception as e:
-                    score_id = score.get("exam_score_id", "unknown")
-                    logger.error(f"Error syncing score node {score_id}: {e}", exc_info=True)
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing score nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
+        Returns:
+            ScoreNode instance ready for Neo4j
+        """
+        if not score.get("exam_score_id"):
+            raise ValueError(f"Missing exam_score_id in score object: {score}")
+        
+        return ScoreNode(
+            score_id=score["exam_score_id"],
+            score_value=score.get("score"),
+            status=score.get("status"),
+            graded_by=score.get("graded_by"),
+            graded_at=score.get("graded_at"),
+            score_history=score.get("score_histories"),
+            name=f"{score.get('subject_name', '')} {score.get('score', '')}",
+            candidate_id=score.get("candidate_id"),
+            subject_id=score.get("subject_id"),
+            exam_id=score.get("exam_id"),
+            subject_name=score.get("subject_name"),
+            exam_name=score.get("exam_name")
+        )
+    
+    def _batch_node_query(self, node: ScoreNode) -> str:
+        """
+        Return the batch write query for scores, which also stores their relationship info.
+        
+        Args:
+            node: Any node of the batch
             
-        except Exception as e:
-            logger.error(f"Error during score nodes synchronization: {e}", exc_info=True)
-            return (0, 0)
+        Returns:
+            Cypher query taking `$rows`
+        """
+        return build_batch_node_query(SCORE_WITH_CONTEXT_QUERY, node.create_instance_of_relationship_query())
     
     def _convert_to_node(self, score_data: Dict[str, Any]) -> ScoreNode:
         """
@@ -403,6 +474,7 @@ class ScoreSyncService(BaseSyncService):
                 success = await self.graph_repository.add_achieved_by_relationship(score_id, candidate_id)
                 if success:
                     relationship_counts["candidate"] += 1
+                    await candidate_info_cache.invalidate(candidate_id, ("exams",))
                     logger.info(f"Added RECEIVES_SCORE relationship between candidate {candidate_id} and score {score_id}")
             
             # Sync FOR_EXAM relationship (score-exam)
@@ -456,133 +528,20 @@ class ScoreSyncService(BaseSyncService):
         logger.info(f"Synchronizing relationships for all scores (limit={limit})")
         
         try:
-            # Use direct SQL query to get all required IDs in one query
-            
-            # Get all score data with related entity IDs in a single query
-            sql_query = """
-                SELECT 
-                    es.exam_score_id, 
-                    ce.candidate_id, 
-                    es.exam_subject_id,
-                    sub.subject_id,
-                    ex.exam_id
-                FROM 
-                    exam_score es
-                JOIN 
-                    candidate_exam_subject ces ON es.candidate_exam_subject_id = ces.candidate_exam_subject_id
-                JOIN 
-                    candidate_exam ce ON ces.candidate_exam_id = ce.candidate_exam_id
-                JOIN 
-                    exam_subject esub ON es.exam_subject_id = esub.exam_subject_id
-                JOIN 
-                    exam ex ON esub.exam_id = ex.exam_id
-                JOIN 
-                    subject sub ON esub.subject_id = sub.subject_id
-            """
-            if limit:
-                sql_query += f" LIMIT {limit}"
-            
-            query = text(sql_query)
-            result = await self.db_session.execute(query)
-            
-            # Extract score data from result
-            score_data = []
-            for row in result.fetchall():
-                score_data.append({
-                    "score_id": row[0],  # exam_score_id
-                    "candidate_id": row[1],
-                    "exam_subject_id": row[2],
-                    "subject_id": row[3],
-                    "exam_id": row[4]
-                })
-            
-            total_scores = len(score_data)
-            success_count = 0
-            failure_count = 0
-            
-            # Aggregated counts for all relationship types
-            relationship_counts = {
-                "candidate": 0,
-                "exam": 0,
-                "subject": 0,
-                "reviews": 0
-            }
+            total_scores = await self.db_session.scalar(
+                text(SCORE_SCOPE_SQL + "SELECT count(*) FROM scope"), {"limit": limit}
+            )
             
-            # For each score, sync relationships directly
-            for score in score_data:
-                try:
-                    score_id = score["score_id"]
-                    
-                    # Verify score exists in Neo4j
-                    score_node = await self.graph_repository.get_by_id(score_id)
-                    if not score_node:
-                        logger.warning(f"Score {score_id} not found in Neo4j, skipping relationship sync")
-                        failure_count += 1
-                        continue
-                    
-                    # Track relationships for this score
-                    score_relationships = {
-                        "candidate": 0,
-                        "exam": 0,
-                        "subject": 0,
-                        "reviews": 0
-                    }
-                    
-                    # Sync ACHIEVED_BY relationship (score-candidate)
-                    if score["candidate_id"]:
-                        success = await self.graph_repository.add_achieved_by_relationship(score_id, score["candidate_id"])
-                        if success:
-                            score_relationships["candidate"] += 1
-                            relationship_counts["candidate"] += 1
-                            logger.debug(f"Added RECEIVES_SCORE relationship for candidate {score['candidate_id']}")
-                    
-                    # Sync FOR_EXAM relationship (score-exam)
-                    if score["exam_id"]:
-                        success = await self.graph_repository.add_for_exam_relationship(score_id, score["exam_id"])
-                        if success:
-                            score_relationships["exam"] += 1
-                            relationship_counts["exam"] += 1
-                            logger.debug(f"Added IN_EXAM relationship for exam {score['exam_id']}")
-                    
-                    # Sync FOR_SUBJECT relationship (score-subject)
-                    if score["subject_id"]:
-                        success = await self.graph_repository.add_for_subject_relationship(score_id, score["subject_id"])
-                        if success:
-                            score_relationships["subject"] += 1
-                            relationship_counts["subject"] += 1
-                            logger.debug(f"Added FOR_SUBJECT relationship for subject {score['subject_id']}")
-                    
-                    # Sync HAS_REVIEW relationships (score-review)
-                    review_query = """
-                        SELECT score_review_id 
-                        FROM score_review 
-                        WHERE score_id = :score_id
-                    """
-                    review_result = await self.db_session.execute(text(review_query), {"score_id": score_id})
-                    reviews = review_result.fetchall()
-                    
-                    for review_row in reviews:
-                        review_id = review_row[0]
-                        if review_id:
-                            success = await self.graph_repository.add_has_review_relationship(score_id, review_id)
-                            if success:
-                                score_relationships["reviews"] += 1
-                                relationship_counts["reviews"] += 1
-                                logger.debug(f"Added HAS_REVIEW relationship for review {review_id}")
-                    
-                    logger.info(f"Score {score_id} relationships: {score_relationships}")
-                    success_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error synchronizing relationships for score {score.get('score_id', 'unknown')}: {e}")
-                    failure_count += 1
+            # Each relationship type is streamed as one join and merged in UNWIND batches
+            engine = RelationshipSyncEngine(self.db_session, self.neo4j_driver)
+            type_results = await engine.sync(SCORE_RELATIONSHIP_SPECS, {"limit": limit})
             
             # Prepare final result
             result = {
                 "total_scores": total_scores,
-                "success": success_count,
-                "failed": failure_count,
-                "relationships": relationship_counts
+                "success": sum(counts["synced"] for counts in type_results.values()),
+                "failed": sum(counts["failed"] for counts in type_results.values()),
+                "relationships": {name: counts["synced"] for name, counts in type_results.items()}
             }
             
             logger.info(f"Completed synchronizing relationships for all scores: {result}")
@@ -98,38 +98,7 @@ class SubjectSyncService(BaseSyncService):
         """
         logger.info(f"Synchronizing all subject nodes (limit={limit})")
         
-        try:
-            # Get all subjects from SQL database
-            subjects, _ = await self.sql_repository.get_all(limit=limit)
-            
-            success_count = 0
-            failed_count = 0
-            
-            for subject in subjects:
-                try:
-                    # Sync only the subject node - handle both ORM objects and dictionaries
-                    subject_id = subject.subject_id if hasattr(subject, 'subject_id') else subject.get("subject_id")
-                    if not subject_id:
-                        logger.error(f"Missing subject_id in subject object: {subject}")
-                        failed_count += 1
-                        continue
-                        
-                    if await self.sync_node_by_id(subject_id):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    # Get subject_id safely for logging
-                    subject_id = getattr(subject, 'subject_id', None) if hasattr(subject, 'subject_id') else subject.get("subject_id", "unknown")
-                    logger.error(f"Error syncing subject node {subject_id}: {e}")
-                    failed_count += 1
-            
-            logger.info(f"Completed synchronizing subject nodes: {success_count} successful, {failed_count} failed")
-            return (success_count, failed_count)
-            
-        except Exception as e:
-            logger.error(f"Error during subject nodes synchronization: {e}")
-            return (0, 0)
+        return await self.sync_nodes_in_batches(limit=limit)
     
     async def sync_relationship_by_id(self, subject_id: str) -> Dict[str, int]:
         """
@@ -0,0 +1,338 @@
+"""
+Sync Job Manager module.
+
+This module runs bulk Neo4j synchronizations as background jobs instead of
+inside HTTP requests. Job state lives in Redis so that any worker can report
+status or accept a cancel request, and a Redis lock guarantees that only one
+bulk sync runs at a time across all workers.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.infrastructure.cache.redis_connection import RedisCache, redis_cache
+from app.infrastructure.database.connection import async_session
+from app.infrastructure.ontology.neo4j_connection import neo4j_connection
+from app.services.sync.incremental_sync_service import CHANGE_STREAMS
+from app.services.sync.main_sync_service import NODE_SYNC_ORDER, MainSyncService
+from app.services.sync.sync_progress import SyncProgress, bind_progress
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "sync_job"
+LOCK_KEY = f"{KEY_PREFIX}:lock"
+
+SYNC_MODES = ("full", "nodes", "relationships", "incremental", "drift", "repair")
+
+# Source table of each entity type's nodes, used to estimate progress totals
+ENTITY_TABLES = {stream.entity_type: stream.table for stream in CHANGE_STREAMS if stream.name == stream.entity_type}
+
+# Delete the lock only if it still belongs to the finishing job
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Extend the lock only if it still belongs to the running job
+RENEW_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class SyncJobConflict(Exception):
+    """Raised when a sync job is submitted while another one is active."""
+    
+    def __init__(self, active_job_id: Optional[str]):
+        super().__init__(f"Sync job {active_job_id} is already running")
+        self.active_job_id = active_job_id
+
+
+class SyncJobManager:
+    """
+    Submits, tracks and cancels background sync jobs.
+    
+    A job runs as an asyncio task in the worker that accepted it. While it
+    runs, a heartbeat publishes its progress to Redis, renews the single-job
+    lock and picks up cancel requests made through any worker.
+    """
+    
+    def __init__(self, cache: RedisCache, ttl_seconds: int, lock_seconds: int, heartbeat_seconds: float):
+        """
+        Initialize the manager.
+        
+        Args:
+            cache: Redis cache handler
+            ttl_seconds: How long finished job records are kept
+            lock_seconds: Lifetime of the single-job lock without a heartbeat
+            heartbeat_seconds: Interval between progress updates
+        """
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._progress: Dict[str, SyncProgress] = {}
+    
+    async def submit(
+        self,
+        mode: str,
+        limit: Optional[int] = None,
+        submitted_by: Optional[str] = None,
+        entity_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Start a sync job in the background.
+        
+        Args:
+            mode: One of SYNC_MODES
+            limit: Optional limit on the number of entities per type
+            submitted_by: ID of the admin submitting the job
+            entity_type: Optional entity type to restrict a "relationships" job to
+            
+        Returns:
+            The job record
+            
+        Raises:
+            ValueError: If the mode or entity type is unknown, or an entity type
+                is given for another mode
+            SyncJobConflict: If another sync job is active
+        """
+        if mode not in SYNC_MODES:
+            raise ValueError(f"Invalid sync mode: {mode}. Valid modes are: {', '.join(SYNC_MODES)}")
+        if entity_type is not None:
+            if mode != "relationships":
+                raise ValueError(f"An entity type can only be given for relationships jobs, not {mode}")
+            if entity_type not in NODE_SYNC_ORDER:
+                raise ValueError(f"Invalid entity type: {entity_type}. Valid types are: {', '.join(NODE_SYNC_ORDER)}")
+        
+        job_id = str(uuid.uuid4())
+        acquired = await self.cache.set_if_absent(LOCK_KEY, job_id, ex=self.lock_seconds)
+        if acquired is None:
+            # Redis is unavailable; only this worker's jobs can be checked
+            if self._tasks:
+                raise SyncJobConflict(next(iter(self._tasks)))
+        elif not acquired:
+            raise SyncJobConflict(await self.cache.get(LOCK_KEY))
+        
+        job = {
+            "job_id": job_id,
+            "mode": mode,
+            "entity_type": entity_type,
+            "limit": limit,
+            "status": "queued",
+            "submitted_by": submitted_by,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "heartbeat_at": time.time(),
+            "progress": None,
+            "results": None,
+            "error": None
+        }
+        await self._save(job)
+        self._tasks[job_id] = asyncio.create_task(self._run(job))
+        logger.info(f"Submitted {mode} sync job {job_id}" + (f" for {entity_type}" if entity_type else ""))
+        return job
+    
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job record, with live progress if the job runs in this worker.
+        
+        A job whose heartbeat stopped, because its worker died, is reported as
+        "interrupted".
+        
+        Args:
+            job_id: Job ID
+            
+        Returns:
+            The job record, or None if unknown or expired
+        """
+        job = self._jobs.get(job_id) or await self.cache.get(self._key(job_id))
+        if not isinstance(job, dict):
+            return None
+        if job_id in self._progress:
+            job = {**job, "progress": self._progress[job_id].snapshot()}
+        if job["status"] in ("queued", "running") and time.time() - job["heartbeat_at"] > self.lock_seconds:
+            job = {**job, "status": "interrupted"}
+        return job
+    
+    async def get_active(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the job holding the single-job lock, if any.
+        
+        Returns:
+            The active job record, or None
+        """
+        job_id = await self.cache.get(LOCK_KEY)
+        if job_id is None and self._tasks:
+            job_id = next(iter(self._tasks))
+        return await self.get(job_id) if job_id else None
+    
+    async def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Request cancellation of a job.
+        
+        The job stops at its next await point: immediately if it runs in this
+        worker, otherwise at its worker's next heartbeat. Work already written
+        to Neo4j is kept.
+        
+        Args:
+            job_id: Job ID
+            
+        Returns:
+            The job record, or None if unknown
+        """
+        job = await self.get(job_id)
+        if job is None or job["status"] not in ("queued", "running"):
+            return job
+        await self.cache.set(self._cancel_key(job_id), "1", ex=self.ttl_seconds)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+        logger.info(f"Cancellation requested for sync job {job_id}")
+        return {**job, "cancel_requested": True}
+    
+    async def stop(self) -> None:
+        """Cancel the jobs running in this worker, e.g. during shutdown."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _run(self, job: Dict[str, Any]) -> None:
+        """Execute a job and record its outcome."""
+        job_id = job["job_id"]
+        progress = SyncProgress()
+        self._progress[job_id] = progress
+        # The tracker is bound to this task and inherited by the tasks it starts
+        bind_progress(progress)
+        heartbeat = asyncio.create_task(self._heartbeat(job, progress))
+        try:
+            async with async_session() as db:
+                for phase, total in (await self._estimate_totals(db, job["mode"], job["limit"])).items():
+                    progress.phases[phase] = {"status": "pending", "processed": 0, "failed": 0, "total": total}
+                job.update(status="running", started_at=datetime.now(timezone.utc).isoformat())
+                await self._save(job)
+                
+                sync_service = MainSyncService(session=db, driver=neo4j_connection._driver)
+                job["results"] = await self._execute(sync_service, job["mode"], job["limit"], job["entity_type"])
+            job["status"] = "succeeded"
+        except asyncio.CancelledError:
+            # A job stopped because it lost the lock failed; otherwise it was cancelled on request
+            job["status"] = "failed" if job.get("error") else "cancelled"
+            logger.info(f"Sync job {job_id} {job['status']}")
+        except Exception as e:
+            job.update(status="failed", error=str(e))
+            logger.error(f"Sync job {job_id} failed: {e}", exc_info=True)
+        finally:
+            heartbeat.cancel()
+            job.update(progress=progress.snapshot(), finished_at=datetime.now(timezone.utc).isoformat())
+            await self._save(job)
+            await self.cache.run_script(RELEASE_LOCK_SCRIPT, [LOCK_KEY], [job_id])
+            await self.cache.delete(self._cancel_key(job_id))
+            self._tasks.pop(job_id, None)
+            self._jobs.pop(job_id, None)
+            self._progress.pop(job_id, None)
+            logger.info(f"Sync job {job_id} finished with status {job['status']}")
+    
+    @staticmethod
+    async def _execute(
+        sync_service: MainSyncService, mode: str, limit: Optional[int], entity_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the sync for a mode and return its results."""
+        if mode == "full":
+            return await sync_service.sync_full(limit=limit)
+        if mode == "nodes":
+            return await sync_service.sync_all_nodes(limit=limit)
+        if mode == "relationships":
+            return await sync_service.sync_all_relationships(entity_type=entity_type, limit=limit)
+        if mode in ("drift", "repair"):
+            return await sync_service.check_drift(repair=mode == "repair")
+        return await sync_service.sync_incremental(limit=limit)
+    
+    async def _heartbeat(self, job: Dict[str, Any], progress: SyncProgress) -> None:
+        """
+        Publish progress, renew the lock and watch for cancel requests until cancelled.
+        
+        The job is stopped if its lock was lost, i.e. expired and possibly taken
+        by another job. A Redis outage (no script result) does not stop it.
+        """
+        job_id = job["job_id"]
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            job["progress"] = progress.snapshot()
+            await self._save(job)
+            renewed = await self.cache.run_script(RENEW_LOCK_SCRIPT, [LOCK_KEY], [job_id, self.lock_seconds])
+            if renewed == 0:
+                # The lock expired during a stall and may now belong to another job,
+                # so this one must stop to keep syncs from running concurrently
+                logger.error(f"Sync job {job_id} lost the sync lock, stopping")
+                job["error"] = "Lost the sync lock after a stall"
+                task = self._tasks.get(job_id)
+                if task is not None:
+                    task.cancel()
+                return
+            if await self.cache.exists(self._cancel_key(job_id)):
+                task = self._tasks.get(job_id)
+                if task is not None:
+                    task.cancel()
+    
+    @staticmethod
+    async def _estimate_totals(db: AsyncSession, mode: str, limit: Optional[int]) -> Dict[str, int]:
+        """
+        Estimate the rows each node phase will process, from planner statistics.
+        
+        Only node phases have a known size; relationship and incremental phases
+        are reported without a total.
+        """
+        if mode not in ("full", "nodes"):
+            return {}
+        result = await db.execute(
+            text("SELECT relname, GREATEST(reltuples, 0)::bigint AS rows FROM pg_class WHERE relname = ANY(:tables) AND relkind = 'r'"),
+            {"tables": list(ENTITY_TABLES.values())}
+        )
+        rows_by_table = {row.relname: row.rows for row in result}
+        totals = {}
+        for entity_type, table in ENTITY_TABLES.items():
+            if table in rows_by_table:
+                rows = rows_by_table[table]
+                totals[f"nodes:{entity_type}"] = min(rows, limit) if limit is not None else rows
+        return totals
+    
+    async def _save(self, job: Dict[str, Any]) -> None:
+        """Store a job record in Redis and, while it runs here, locally."""
+        job["heartbeat_at"] = time.time()
+        if job["status"] in ("queued", "running"):
+            self._jobs[job["job_id"]] = job
+        await self.cache.set(self._key(job["job_id"]), job, ex=self.ttl_seconds)
+    
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"{KEY_PREFIX}:{job_id}"
+    
+    @staticmethod
+    def _cancel_key(job_id: str) -> str:
+        return f"{KEY_PREFIX}:{job_id}:cancel"
+
+
+# Process-wide sync job manager
+sync_job_manager = SyncJobManager(
+    redis_cache,
+    ttl_seconds=settings.SYNC_JOB_TTL_SECONDS,
+    lock_seconds=settings.SYNC_JOB_LOCK_SECONDS,
+    heartbeat_seconds=settings.SYNC_JOB_HEARTBEAT_SECONDS
+)
@@ -0,0 +1,144 @@
+"""
+Sync Progress module.
+
+This module tracks the progress of a running sync job. The job runner binds a
+SyncProgress to its task; sync phases then report processed rows through
+`report_rows` without having to pass the tracker through every service.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_current_progress: ContextVar[Optional["SyncProgress"]] = ContextVar("sync_progress", default=None)
+_current_phase: ContextVar[Optional[str]] = ContextVar("sync_phase", default=None)
+
+
+class SyncProgress:
+    """
+    Per-phase row counters of one sync job, with throughput and ETA.
+    
+    Phases are named "<stage>:<entity_type>", e.g. "nodes:candidate". The ETA
+    only covers phases whose total row count is known.
+    """
+    
+    def __init__(self, totals: Optional[Dict[str, int]] = None):
+        """
+        Initialize the tracker.
+        
+        Args:
+            totals: Estimated row counts by phase name
+        """
+        self.started_at = time.monotonic()
+        self.phases: Dict[str, Dict[str, Any]] = {
+            name: {"status": "pending", "processed": 0, "failed": 0, "total": total}
+            for name, total in (totals or {}).items()
+        }
+        self._phase_started: Dict[str, float] = {}
+    
+    def start_phase(self, name: str) -> None:
+        """Mark a phase as running."""
+        phase = self.phases.setdefault(name, {"status": "pending", "processed": 0, "failed": 0, "total": None})
+        phase["status"] = "running"
+        self._phase_started[name] = time.monotonic()
+    
+    def finish_phase(self, name: str, error: Optional[str] = None) -> None:
+        """Mark a phase as finished, or failed with an error."""
+        phase = self.phases[name]
+        phase["status"] = "failed" if error else "finished"
+        if error:
+            phase["error"] = error
+        phase["seconds"] = round(time.monotonic() - self._phase_started.get(name, self.started_at), 1)
+    
+    def add_rows(self, name: str, processed: int, failed: int = 0) -> None:
+        """Count rows handled by a phase."""
+        phase = self.phases.setdefault(name, {"status": "running", "processed": 0, "failed": 0, "total": None})
+        phase["processed"] += processed
+        phase["failed"] += failed
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Describe the progress so far.
+        
+        Returns:
+            Dict with total processed rows, rows per second, ETA in seconds
+            (None when unknown) and per-phase counters
+        """
+        elapsed = max(time.monotonic() - self.started_at, 1e-6)
+        processed = sum(phase["processed"] for phase in self.phases.values())
+        rate = processed / elapsed
+        
+        phases = {}
+        remaining = 0
+        estimated = False
+        for name, phase in self.phases.items():
+            phases[name] = dict(phase)
+            if phase["total"] is not None:
+                estimated = True
+                if phase["status"] in ("pending", "running"):
+                    remaining += max(phase["total"] - phase["processed"], 0)
+            if name in self._phase_started and phase["status"] == "running":
+                phase_elapsed = max(time.monotonic() - self._phase_started[name], 1e-6)
+                phases[name]["rows_per_second"] = round(phase["processed"] / phase_elapsed, 1)
+        
+        if not estimated:
+            eta = None
+        elif not remaining:
+            eta = 0
+        else:
+            eta = round(remaining / rate) if rate > 0 else None
+        
+        return {
+            "processed": processed,
+            "elapsed_seconds": round(elapsed, 1),
+            "rows_per_second": round(rate, 1),
+            "eta_seconds": eta,
+            "phases": phases
+        }
+
+
+def bind_progress(progress: Optional[SyncProgress]) -> None:
+    """Report the current task's sync phases to `progress`."""
+    _current_progress.set(progress)
+
+
+@contextmanager
+def track_phase(name: str) -> Iterator[None]:
+    """
+    Attribute rows reported inside the block to a phase.
+    
+    Does nothing when no tracker is bound to the current task.
+    
+    Args:
+        name: Phase name
+    """
+    progress = _current_progress.get()
+    if progress is None:
+        yield
+        return
+    token = _current_phase.set(name)
+    progress.start_phase(name)
+    try:
+        yield
+    except BaseException as e:
+        progress.finish_phase(name, error=str(e) or type(e).__name__)
+        raise
+    else:
+        progress.finish_phase(name)
+    finally:
+        _current_phase.reset(token)
+
+
+def report_rows(processed: int, failed: int = 0) -> None:
+    """
+    Count rows handled by the current phase, if a tracker is bound.
+    
+    Args:
+        processed: Rows written successfully
+        failed: Rows that failed
+    """
+    progress = _current_progress.get()
+    phase = _current_phase.get()
+    if progress is not None and phase is not None:
+        progress.add_rows(phase, processed, failed)
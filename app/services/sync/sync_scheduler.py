@@ -0,0 +1,81 @@
+"""
+Sync Scheduler module.
+
+This module provides a small dependency-aware scheduler for sync phases. Tasks
+start as soon as the tasks they depend on have finished, at most `concurrency`
+run at once, and tasks sharing a lock never overlap.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class SyncTask(NamedTuple):
+    """
+    A unit of sync work.
+    
+    `depends_on` names tasks that must finish (successfully or not) first.
+    `locks` names resources the task writes that another task also writes, such
+    as a relationship type merged by two services, since concurrent MERGEs of
+    the same pattern can create duplicate relationships.
+    """
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: FrozenSet[str] = frozenset()
+    locks: FrozenSet[str] = frozenset()
+
+
+async def run_tasks(tasks: Iterable[SyncTask], concurrency: int) -> Dict[str, Any]:
+    """
+    Run tasks concurrently in dependency order.
+    
+    A task that raises does not stop the others; its result is {"error": ...}.
+    
+    Args:
+        tasks: Tasks to run; dependencies must name tasks in the same call
+        concurrency: Maximum number of tasks running at once
+        
+    Returns:
+        Dictionary of task results by task name, in the order tasks were given
+        
+    Raises:
+        ValueError: If a task depends on an unknown task
+    """
+    tasks = list(tasks)
+    names = {task.name for task in tasks}
+    for task in tasks:
+        unknown = task.depends_on - names
+        if unknown:
+            raise ValueError(f"Sync task {task.name} depends on unknown tasks: {', '.join(sorted(unknown))}")
+    
+    finished = {task.name: asyncio.Event() for task in tasks}
+    locks = {name: asyncio.Lock() for task in tasks for name in task.locks}
+    slots = asyncio.Semaphore(max(1, concurrency))
+    results: Dict[str, Any] = {}
+    
+    async def run_one(task: SyncTask) -> None:
+        try:
+            for dependency in task.depends_on:
+                await finished[dependency].wait()
+            async with slots:
+                # Locks are always taken in the same order, so tasks cannot deadlock
+                held = [locks[name] for name in sorted(task.locks)]
+                for lock in held:
+                    await lock.acquire()
+                try:
+                    logger.info(f"Starting sync task {task.name}")
+                    results[task.name] = await task.run()
+                finally:
+                    for lock in reversed(held):
+                        lock.release()
+        except Exception as e:
+            logger.error(f"Sync task {task.name} failed: {e}", exc_info=True)
+            results[task.name] = {"error": str(e)}
+        finally:
+            finished[task.name].set()
+    
+    await asyncio.gather(*(run_one(task) for task in tasks))
+    return {task.name: results.get(task.name) for task in tasks}
@@ -0,0 +1,149 @@
+"""
+Embedding Codec module.
+
+This module provides the compact binary storage format for face embeddings.
+
+Layout (little-endian):
+- 12-byte header: magic b"FE", format version, dtype code, dimension,
+  model tag length, int8 scale
+- Model tag (ASCII), zero-padded to a 4-byte boundary
+- Payload: `dimension` values of the declared dtype
+
+float32 payloads decode with `np.frombuffer` without copying; float16 and
+int8 payloads trade precision for a 2x or 4x smaller row.
+"""
+
+import struct
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+MAGIC = b"FE"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<2sBBHHf")
+
+# Storage dtype names mapped to (header code, numpy dtype)
+DTYPES = {
+    "float32": (0, np.dtype("<f4")),
+    "float16": (1, np.dtype("<f2")),
+    "int8": (2, np.dtype("i1")),
+}
+_DTYPE_BY_CODE = {code: (name, dtype) for name, (code, dtype) in DTYPES.items()}
+
+
+class EmbeddingHeader(NamedTuple):
+    """Decoded header of a binary face embedding."""
+    version: int
+    dtype: str
+    dimension: int
+    model: str
+    scale: float
+    payload_offset: int
+
+
+def is_binary_embedding(data) -> bool:
+    """
+    Check whether a stored value uses the binary embedding format.
+    
+    Args:
+        data: Stored column value
+        
+    Returns:
+        bool: True if the value starts with the binary format magic
+    """
+    return isinstance(data, (bytes, bytearray, memoryview)) and bytes(data[:2]) == MAGIC
+
+
+def encode_embedding(embedding, model: str = "", dtype: str = "float32") -> bytes:
+    """
+    Encode a face embedding into the binary storage format.
+    
+    Args:
+        embedding: Face embedding as a list of floats or numpy array
+        model: Name of the model that produced the embedding
+        dtype: Storage precision, one of "float32", "float16" or "int8"
+        
+    Returns:
+        bytes: Header, model tag and payload
+        
+    Raises:
+        ValueError: If the dtype is unknown or the embedding is not one-dimensional
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+    code, np_dtype = DTYPES[dtype]
+    
+    vector = np.asarray(embedding, dtype=np.float32)
+    if vector.ndim != 1:
+        raise ValueError(f"Embedding must be one-dimensional, got shape {vector.shape}")
+    
+    scale = 1.0
+    if dtype == "int8":
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = peak / 127 if peak > 0 else 1.0
+        payload = np.clip(np.rint(vector / scale), -127, 127).astype(np_dtype)
+    else:
+        payload = vector.astype(np_dtype)
+    
+    tag = model.encode("ascii", errors="replace")[:255]
+    padding = b"\0" * (-(_HEADER.size + len(tag)) % 4)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, code, vector.shape[0], len(tag), scale)
+    return header + tag + padding + payload.tobytes()
+
+
+def read_header(data: bytes) -> EmbeddingHeader:
+    """
+    Parse the header of a binary face embedding.
+    
+    Args:
+        data: Encoded embedding
+        
+    Returns:
+        EmbeddingHeader: Parsed header fields
+        
+    Raises:
+        ValueError: If the data is not a supported binary embedding
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Embedding data is too short")
+    magic, version, code, dimension, tag_length, scale = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a binary face embedding")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported embedding format version: {version}")
+    if code not in _DTYPE_BY_CODE:
+        raise ValueError(f"Unknown embedding dtype code: {code}")
+    
+    tag_end = _HEADER.size + tag_length
+    model = bytes(data[_HEADER.size:tag_end]).decode("ascii", errors="replace")
+    payload_offset = tag_end + (-tag_end % 4)
+    return EmbeddingHeader(version, _DTYPE_BY_CODE[code][0], dimension, model, scale, payload_offset)
+
+
+def decode_embedding(data: bytes) -> Tuple[np.ndarray, EmbeddingHeader]:
+    """
+    Decode a binary face embedding to a float32 vector.
+    
+    float32 payloads are returned as a read-only view over `data`.
+    
+    Args:
+        data: Encoded embedding
+        
+    Returns:
+        Tuple of the float32 vector and the parsed header
+        
+    Raises:
+        ValueError: If the data is malformed or truncated
+    """
+    header = read_header(data)
+    np_dtype = DTYPES[header.dtype][1]
+    if len(data) < header.payload_offset + header.dimension * np_dtype.itemsize:
+        raise ValueError("Embedding payload is truncated")
+    
+    vector = np.frombuffer(data, dtype=np_dtype, count=header.dimension, offset=header.payload_offset)
+    if header.dtype == "int8":
+        return vector.astype(np.float32) * np.float32(header.scale), header
+    if header.dtype == "float16":
+        return vector.astype(np.float32), header
+    return vector, header
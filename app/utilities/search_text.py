@@ -0,0 +1,133 @@
+"""
+Search Text module.
+
+This module normalizes free text for accent-insensitive search. Vietnamese text
+is folded to lowercase ASCII ("Nguyễn Đức" -> "nguyen duc"), matching what the
+Neo4j "standard-folding" analyzer stores in full-text indexes, and split into
+terms the way that analyzer tokenizes.
+"""
+
+import re
+import unicodedata
+from typing import List, Optional
+
+# Separators between terms; dots stay inside terms like "gmail.com", as they do in the index
+_TERM_SEPARATORS = re.compile(r"[^\w.]+")
+
+# Stop words removed by the Lucene English analyzers, "standard-folding" included.
+# They are never indexed, so a query term among them matches nothing; Vietnamese
+# name parts fold onto some of them ("An" -> "an", "Tô" -> "to")
+FULLTEXT_STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "if", "in",
+    "into", "is", "it", "no", "not", "of", "on", "or", "such", "that", "the",
+    "their", "then", "there", "these", "they", "this", "to", "was", "will", "with"
+})
+
+# LIKE pattern characters that must be escaped to be matched literally
+_LIKE_SPECIAL = re.compile(r"([%_\\])")
+
+# Lucene query syntax characters that must be escaped inside a term
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+
+
+def fold_text(value: Optional[str]) -> Optional[str]:
+    """
+    Fold text to lowercase ASCII without diacritics.
+    
+    Args:
+        value: Text to fold
+    
+    Returns:
+        Folded text, or None if value is None
+    """
+    if value is None:
+        return None
+    # "đ" is a separate letter rather than "d" with a combining mark, so NFKD keeps it
+    value = value.replace("đ", "d").replace("Đ", "D")
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def split_terms(value: Optional[str]) -> List[str]:
+    """
+    Split text into folded terms.
+    
+    Args:
+        value: Text to split
+    
+    Returns:
+        List of non-empty folded terms
+    """
+    folded = fold_text(value) or ""
+    return [term.strip(".") for term in _TERM_SEPARATORS.split(folded) if term.strip(".")]
+
+
+def search_terms(value: Optional[str]) -> List[str]:
+    """
+    Split text into the folded terms a full-text index can match.
+    
+    Terms in FULLTEXT_STOP_WORDS are left out, as the index analyzer leaves
+    them out of the indexed text.
+    
+    Args:
+        value: Text to split
+    
+    Returns:
+        List of non-empty folded terms, without stop words
+    """
+    return [term for term in split_terms(value) if term not in FULLTEXT_STOP_WORDS]
+
+
+def search_key(value: Optional[str]) -> Optional[str]:
+    """
+    Build the normalized search key of a text: folded, with whitespace collapsed.
+    
+    Args:
+        value: Text to normalize, e.g. "  Nguyễn   Văn An "
+    
+    Returns:
+        Search key, e.g. "nguyen van an", or None if value is None
+    """
+    folded = fold_text(value)
+    if folded is None:
+        return None
+    return " ".join(folded.split())
+
+
+def name_tokens(value: Optional[str]) -> List[str]:
+    """
+    Split a name into its distinct folded parts.
+    
+    Args:
+        value: Name to split, e.g. "Nguyễn Văn An"
+    
+    Returns:
+        List of name parts in order of first appearance, e.g. ["nguyen", "van", "an"]
+    """
+    return list(dict.fromkeys(split_terms(value)))
+
+
+def escape_lucene(term: str) -> str:
+    """
+    Escape Lucene query syntax in a term.
+    
+    Args:
+        term: Term to escape
+    
+    Returns:
+        Term that is matched literally by a Lucene query parser
+    """
+    return _LUCENE_SPECIAL.sub(r"\\\1", term)
+
+
+def escape_like(value: str) -> str:
+    """
+    Escape LIKE pattern characters, using backslash as the escape character.
+    
+    Args:
+        value: Text to match literally
+    
+    Returns:
+        Text for a LIKE pattern with ESCAPE '\\'
+    """
+    return _LIKE_SPECIAL.sub(r"\\\1", value)